@@ -4,2533 +4,1605 @@ VibeLink Ghana Technical Documentation Generator
 Creates a comprehensive Word document with professional formatting
 """
 
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.style import WD_STYLE_TYPE
 from datetime import datetime
-
-def add_cover_page(doc):
-    """Add professional cover page"""
-    # Title
-    title = doc.add_paragraph()
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title_run = title.add_run('VibeLink Ghana\n')
-    title_run.font.size = Pt(36)
-    title_run.font.bold = True
-    title_run.font.color.rgb = RGBColor(26, 35, 126)  # Navy blue
-
-    # Subtitle
-    subtitle = doc.add_paragraph()
-    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    subtitle_run = subtitle.add_run('Technical Documentation\n\n')
-    subtitle_run.font.size = Pt(24)
-    subtitle_run.font.color.rgb = RGBColor(63, 81, 181)
-
-    # Description
-    desc = doc.add_paragraph()
-    desc.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    desc_run = desc.add_run('Digital Event Invitation Platform\n\n\n\n')
-    desc_run.font.size = Pt(18)
-    desc_run.font.italic = True
-
-    # Version info
-    info = doc.add_paragraph()
-    info.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    info_text = info.add_run(f'Version 1.0\n')
-    info_text.font.size = Pt(14)
-
-    date_text = info.add_run(f'January 28, 2026\n\n')
-    date_text.font.size = Pt(14)
-
-    logo_placeholder = info.add_run('[Logo Placeholder]\n\n')
-    logo_placeholder.font.size = Pt(12)
-    logo_placeholder.font.italic = True
-
-    website = info.add_run('https://vibelinkgh.com/')
-    website.font.size = Pt(12)
-    website.font.color.rgb = RGBColor(33, 150, 243)
-
-    doc.add_page_break()
-
-def add_table_of_contents(doc):
-    """Add table of contents placeholder"""
-    heading = doc.add_heading('TABLE OF CONTENTS', level=1)
-    heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    toc = doc.add_paragraph()
-    toc.add_run('[Table of Contents - Auto-generated in Word]\n\n')
-    toc.paragraph_format.line_spacing = 1.15
-
-    note = doc.add_paragraph()
-    note.add_run('Note: In Microsoft Word, place cursor here and go to References > Table of Contents > Automatic Table 1')
-    note.runs[0].font.italic = True
-    note.runs[0].font.size = Pt(10)
-
-    doc.add_page_break()
-
-def add_executive_summary(doc):
-    """Add executive summary section"""
-    doc.add_heading('EXECUTIVE SUMMARY', level=1)
-
-    doc.add_paragraph(
-        'VibeLink Ghana is a comprehensive digital event invitation platform designed specifically '
-        'for the Ghanaian market. The platform revolutionizes how Ghanaians create, manage, and '
-        'distribute invitations for various events including weddings, funerals, naming ceremonies, '
-        'graduations, and corporate events.'
-    )
-
-    doc.add_heading('Key Achievements', level=2)
-    achievements = [
-        'Fully functional digital invitation creation and management system',
-        'Integrated payment processing with Paystack for seamless transactions',
-        'Comprehensive admin dashboard with real-time analytics',
-        'Customer portal for order tracking and management',
-        'AI-powered chatbot using Google Gemini for customer support',
-        'Multi-channel communication via email and WhatsApp integration',
-        'SEO-optimized with Progressive Web App capabilities',
-        'Referral program to drive organic growth',
-        'Blog system for content marketing',
-        'Professional portfolio showcase'
-    ]
-
-    for achievement in achievements:
-        p = doc.add_paragraph(achievement, style='List Bullet')
-        p.paragraph_format.line_spacing = 1.15
-
-    doc.add_heading('Technology Highlights', level=2)
-    doc.add_paragraph(
-        'The platform leverages modern web technologies including React 18.3.1 with TypeScript '
-        'for type safety, Vite for blazing-fast builds, Tailwind CSS with shadcn-ui for beautiful '
-        'and accessible UI components, and Supabase as a complete backend-as-a-service solution '
-        'providing PostgreSQL database, authentication, and serverless functions.'
-    )
-
-    doc.add_paragraph(
-        'The architecture follows a modern three-tier deployment model: development on local PC, '
-        'version control via GitHub, and production deployment on a dedicated server at '
-        '/var/www/vibelinkgh.com/.'
-    )
-
-    doc.add_page_break()
-
-def add_project_overview(doc):
-    """Add project overview section"""
-    doc.add_heading('PROJECT OVERVIEW', level=1)
-
-    doc.add_heading('Business Purpose', level=2)
-    doc.add_paragraph(
-        'VibeLink Ghana addresses a critical need in the Ghanaian event planning ecosystem by '
-        'digitizing the invitation process. Traditional paper invitations are costly, time-consuming, '
-        'and environmentally unfriendly. VibeLink Ghana provides an eco-friendly, cost-effective, '
-        'and efficient alternative that allows event organizers to create beautiful digital '
-        'invitations, track RSVPs, and manage guest lists seamlessly.'
-    )
-
-    doc.add_heading('Target Market', level=2)
-    market_segments = [
-        ('Individual Event Planners', 'Couples planning weddings, families organizing funerals, '
-         'parents hosting naming ceremonies and graduations'),
-        ('Corporate Clients', 'Companies organizing product launches, conferences, team building '
-         'events, and corporate celebrations'),
-        ('Event Planning Agencies', 'Professional event planners managing multiple clients and '
-         'events simultaneously'),
-        ('Educational Institutions', 'Schools and universities for graduation ceremonies, '
-         'award nights, and institutional events')
-    ]
-
-    for segment, description in market_segments:
-        doc.add_paragraph().add_run(f'{segment}: ').bold = True
-        doc.paragraphs[-1].add_run(description)
-        doc.paragraphs[-1].paragraph_format.line_spacing = 1.15
-
-    doc.add_heading('Unique Value Proposition', level=2)
-    uvp_points = [
-        'Culturally Relevant: Designed specifically for Ghanaian events with appropriate templates '
-        'and cultural considerations',
-        'Affordable Pricing: Competitive pricing structure accessible to various market segments',
-        'Easy to Use: Intuitive interface requiring no technical expertise',
-        'Instant Delivery: Digital invitations delivered immediately via email and WhatsApp',
-        'Track Engagement: Real-time tracking of invitation views and RSVP responses',
-        'Professional Templates: Beautifully designed templates for all event types',
-        'Secure Payments: Integrated with Paystack for safe and reliable payment processing',
-        'Customer Support: AI-powered chatbot for 24/7 assistance'
-    ]
-
-    for point in uvp_points:
-        p = doc.add_paragraph(point, style='List Bullet')
-        p.paragraph_format.line_spacing = 1.15
-
-    doc.add_heading('Website Access', level=2)
-    table = doc.add_table(rows=3, cols=2)
-    table.style = 'Light Grid Accent 1'
-
-    table.cell(0, 0).text = 'Website URL'
-    table.cell(0, 1).text = 'https://vibelinkgh.com/'
-    table.cell(1, 0).text = 'GitHub Repository'
-    table.cell(1, 1).text = 'https://github.com/xboggg/vibe-link-ghana-3e5cfc20'
-    table.cell(2, 0).text = 'Production Server'
-    table.cell(2, 1).text = '/var/www/vibelinkgh.com/'
-
-    doc.add_page_break()
-
-def add_technical_architecture(doc):
-    """Add technical architecture section"""
-    doc.add_heading('TECHNICAL ARCHITECTURE', level=1)
-
-    doc.add_heading('System Architecture Overview', level=2)
-    doc.add_paragraph(
-        'VibeLink Ghana follows a modern, cloud-based architecture pattern with clear separation '
-        'of concerns between frontend presentation, backend business logic, and data persistence.'
-    )
-
-    # Architecture diagram description
-    doc.add_paragraph().add_run('[DIAGRAM: System Architecture]').bold = True
-    diagram_desc = doc.add_paragraph()
-    diagram_desc.add_run('Create a diagram showing:\n')
-    diagram_points = [
-        'Client Layer: Web Browser (React SPA)',
-        'CDN Layer: Static asset delivery',
-        'Application Layer: Vite-built React application',
-        'API Layer: Supabase Edge Functions',
-        'Database Layer: PostgreSQL (Supabase)',
-        'External Integrations: Paystack, WhatsApp, Gemini AI, Email Services',
-        'Storage: Supabase Storage for images and documents'
-    ]
-    for point in diagram_points:
-        p = doc.add_paragraph(point, style='List Bullet')
-        p.paragraph_format.left_indent = Inches(0.5)
-
-    doc.add_heading('Technology Stack Breakdown', level=2)
-
-    # Frontend Stack Table
-    doc.add_heading('Frontend Technologies', level=3)
-    frontend_table = doc.add_table(rows=9, cols=3)
-    frontend_table.style = 'Light List Accent 1'
-
-    frontend_data = [
-        ('Technology', 'Version', 'Purpose'),
-        ('React', '18.3.1', 'UI framework for building component-based interfaces'),
-        ('TypeScript', '5.8.3', 'Type safety and enhanced developer experience'),
-        ('Vite', '5.4.19', 'Fast build tool and development server'),
-        ('Tailwind CSS', '3.4.17', 'Utility-first CSS framework'),
-        ('shadcn-ui', 'Latest', 'Accessible UI component library'),
-        ('React Router', '6.30.1', 'Client-side routing'),
-        ('TanStack Query', '5.83.0', 'Data fetching and state management'),
-        ('Framer Motion', '12.23.26', 'Animation library')
-    ]
-
-    for i, (tech, version, purpose) in enumerate(frontend_data):
-        frontend_table.cell(i, 0).text = tech
-        frontend_table.cell(i, 1).text = version
-        frontend_table.cell(i, 2).text = purpose
-
-    # Backend Stack Table
-    doc.add_heading('Backend Technologies', level=3)
-    backend_table = doc.add_table(rows=7, cols=2)
-    backend_table.style = 'Light List Accent 1'
-
-    backend_data = [
-        ('Technology', 'Purpose'),
-        ('Supabase', 'Backend-as-a-Service platform'),
-        ('PostgreSQL 14.1', 'Relational database'),
-        ('Supabase Auth', 'Authentication and authorization'),
-        ('Supabase Edge Functions', 'Serverless functions'),
-        ('Supabase Storage', 'File storage'),
-        ('Row Level Security (RLS)', 'Database-level security')
-    ]
-
-    for i, (tech, purpose) in enumerate(backend_data):
-        backend_table.cell(i, 0).text = tech
-        backend_table.cell(i, 1).text = purpose
-
-    # Integration Stack
-    doc.add_heading('Third-Party Integrations', level=3)
-    integration_table = doc.add_table(rows=5, cols=2)
-    integration_table.style = 'Light List Accent 1'
-
-    integration_data = [
-        ('Service', 'Purpose'),
-        ('Paystack', 'Payment processing for Ghana'),
-        ('Google Gemini AI', 'AI chatbot for customer support'),
-        ('Email Service', 'Transactional emails and notifications'),
-        ('WhatsApp Business API', 'Direct WhatsApp invitation delivery')
-    ]
-
-    for i, (service, purpose) in enumerate(integration_data):
-        integration_table.cell(i, 0).text = service
-        integration_table.cell(i, 1).text = purpose
-
-    doc.add_heading('Frontend Architecture', level=2)
-    doc.add_paragraph(
-        'The frontend follows a component-based architecture with clear separation of concerns:'
-    )
-
-    architecture_components = [
-        ('Pages (src/pages/)', '32 page components representing different routes'),
-        ('Components (src/components/)', 'Reusable UI components organized by feature'),
-        ('UI Components (src/components/ui/)', 'Base shadcn-ui components'),
-        ('Hooks (src/hooks/)', 'Custom React hooks for shared logic'),
-        ('Integrations (src/integrations/)', 'Supabase client and type definitions'),
-        ('Data (src/data/)', 'Static data and configuration'),
-        ('Assets (src/assets/)', 'Images, icons, and static files')
-    ]
-
-    for component, description in architecture_components:
-        p = doc.add_paragraph()
-        p.add_run(f'{component}: ').bold = True
-        p.add_run(description)
-
-    doc.add_heading('Backend Architecture (Supabase)', level=2)
-    doc.add_paragraph(
-        'Supabase provides a complete backend infrastructure with the following components:'
-    )
-
-    backend_components = [
-        'PostgreSQL Database with 46 migration files for schema versioning',
-        'Automatic REST API generation from database schema',
-        'Real-time subscriptions for live data updates',
-        'Row Level Security (RLS) policies for fine-grained access control',
-        'Edge Functions for custom business logic',
-        'Storage buckets for file management',
-        'Built-in authentication with email, social providers'
-    ]
-
-    for component in backend_components:
-        doc.add_paragraph(component, style='List Bullet')
-
-    doc.add_heading('Database Structure Overview', level=2)
-    doc.add_paragraph(
-        'The database consists of multiple interconnected tables (see Database Schema section '
-        'for details). Key tables include:'
-    )
-
-    key_tables = [
-        'orders: Core order management',
-        'customers: Customer information',
-        'order_items: Individual items within orders',
-        'invitations: Digital invitation data',
-        'payments: Payment transaction records',
-        'referrals: Referral program tracking',
-        'blog_posts: Content management for blog',
-        'portfolio_items: Portfolio showcase',
-        'surveys: Customer feedback collection',
-        'abandoned_carts: Cart abandonment tracking',
-        'ai_generated_content: AI-generated content management',
-        'analytics_events: User interaction tracking'
-    ]
-
-    for table in key_tables:
-        doc.add_paragraph(table, style='List Bullet')
-
-    doc.add_heading('Deployment Architecture', level=2)
-    doc.add_paragraph(
-        'The deployment follows a modern CI/CD pattern with three distinct environments:'
-    )
-
-    # Deployment table
-    deploy_table = doc.add_table(rows=4, cols=3)
-    deploy_table.style = 'Medium Grid 1 Accent 1'
-
-    deploy_data = [
-        ('Environment', 'Location', 'Purpose'),
-        ('Development', 'C:\\Users\\CyberAware\\OneDrive\\...\\vibelink\\app\\',
-         'Local development and testing'),
-        ('Version Control', 'https://github.com/xboggg/vibe-link-ghana-3e5cfc20',
-         'Central repository and collaboration'),
-        ('Production', '/var/www/vibelinkgh.com/', 'Live production server')
-    ]
-
-    for i, (env, loc, purpose) in enumerate(deploy_data):
-        deploy_table.cell(i, 0).text = env
-        deploy_table.cell(i, 1).text = loc
-        deploy_table.cell(i, 2).text = purpose
-
-    doc.add_page_break()
-
-def add_development_workflow(doc):
-    """Add development workflow section"""
-    doc.add_heading('DEVELOPMENT WORKFLOW', level=1)
-
-    doc.add_heading('Three-Location Setup', level=2)
-    doc.add_paragraph(
-        'The development workflow is organized across three strategic locations, each serving '
-        'a specific purpose in the software development lifecycle:'
-    )
-
-    doc.add_heading('1. Local Development (PC)', level=3)
-    pc_details = [
-        'Location: C:\\Users\\CyberAware\\OneDrive - Government of Ghana - CAGD\\ZeroTrust\\Visual Studio Code Workspace\\vibelink\\app\\',
-        'Purpose: Active development, testing, and debugging',
-        'Tools: Visual Studio Code, Node.js, npm/bun, Git',
-        'Server: Vite dev server on localhost:8080',
-        'Hot Module Replacement (HMR) for instant feedback',
-        'Access to .env file for environment configuration'
-    ]
-
-    for detail in pc_details:
-        doc.add_paragraph(detail, style='List Bullet')
-
-    doc.add_heading('2. Version Control (GitHub)', level=3)
-    github_details = [
-        'Repository: https://github.com/xboggg/vibe-link-ghana-3e5cfc20',
-        'Purpose: Code versioning, collaboration, and backup',
-        'Branch Strategy: Main branch for production-ready code',
-        'Commit History: Complete audit trail of changes',
-        'Collaboration: Code reviews and team coordination',
-        'CI/CD Integration: Automated testing and deployment triggers'
-    ]
-
-    for detail in github_details:
-        doc.add_paragraph(detail, style='List Bullet')
-
-    doc.add_heading('3. Production Server', level=3)
-    server_details = [
-        'Location: /var/www/vibelinkgh.com/',
-        'Purpose: Live production environment',
-        'Web Server: Nginx/Apache serving static files',
-        'Domain: https://vibelinkgh.com/',
-        'SSL Certificate: HTTPS encryption enabled',
-        'Optimization: Minified and bundled production build'
-    ]
-
-    for detail in server_details:
-        doc.add_paragraph(detail, style='List Bullet')
-
-    doc.add_heading('Git Workflow Diagram', level=2)
-    doc.add_paragraph().add_run('[DIAGRAM: Git Workflow]').bold = True
-    workflow_desc = doc.add_paragraph()
-    workflow_desc.add_run('Create a flowchart showing:\n')
-    workflow_steps = [
-        '1. Developer writes code on Local PC',
-        '2. Git add and commit changes locally',
-        '3. Git push to GitHub repository',
-        '4. GitHub receives and stores code',
-        '5. GitHub Actions or deployment script triggers',
-        '6. Build process: npm run build creates optimized dist/ folder',
-        '7. Deployment script transfers dist/ contents to server',
-        '8. Server updates /var/www/vibelinkgh.com/',
-        '9. Website live with latest changes'
-    ]
-
-    for step in workflow_steps:
-        p = doc.add_paragraph(step, style='List Bullet')
-        p.paragraph_format.left_indent = Inches(0.5)
-
-    doc.add_heading('Build and Deployment Process', level=2)
-
-    doc.add_heading('Development Build', level=3)
-    doc.add_paragraph('Command: npm run dev or bun run dev')
-    dev_process = [
-        'Vite starts development server on port 8080',
-        'Hot Module Replacement (HMR) enabled',
-        'Source maps for debugging',
-        'Fast refresh for instant updates',
-        'Environment: Development mode'
-    ]
-    for item in dev_process:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Production Build', level=3)
-    doc.add_paragraph('Command: npm run build or bun run build')
-    prod_process = [
-        'TypeScript compilation and type checking',
-        'React component tree shaking',
-        'CSS purging and minification',
-        'JavaScript minification and uglification',
-        'Asset optimization (images, fonts)',
-        'Bundle splitting for optimal loading',
-        'Output: dist/ directory with production-ready files',
-        'Build time: ~30-60 seconds'
-    ]
-    for item in prod_process:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Deployment Steps', level=3)
-    deploy_steps = [
-        'Build the production bundle locally or in CI/CD',
-        'Test the build with: npm run preview',
-        'Transfer dist/ contents to /var/www/vibelinkgh.com/',
-        'Update file permissions on server',
-        'Clear server cache if applicable',
-        'Verify deployment by visiting vibelinkgh.com',
-        'Monitor error logs for any issues'
-    ]
-
-    for i, step in enumerate(deploy_steps, 1):
-        doc.add_paragraph(f'{i}. {step}')
-
-    doc.add_heading('Environment Setup', level=2)
-
-    doc.add_heading('Prerequisites', level=3)
-    prereqs = [
-        'Node.js (v18 or higher)',
-        'npm or bun package manager',
-        'Git for version control',
-        'Visual Studio Code (recommended IDE)',
-        'Supabase account and project',
-        'Paystack merchant account'
-    ]
-    for prereq in prereqs:
-        doc.add_paragraph(prereq, style='List Bullet')
-
-    doc.add_heading('Initial Setup', level=3)
-    setup_code = '''
-1. Clone repository:
-   git clone https://github.com/xboggg/vibe-link-ghana-3e5cfc20
-
-2. Navigate to project:
-   cd vibe-link-ghana-3e5cfc20/app
-
-3. Install dependencies:
-   npm install
-   (or: bun install)
-
-4. Configure environment:
-   Create .env file with:
-   VITE_SUPABASE_URL=your_supabase_url
-   VITE_SUPABASE_PUBLISHABLE_KEY=your_supabase_key
-   VITE_SUPABASE_PROJECT_ID=your_project_id
-
-5. Start development server:
-   npm run dev
-
-6. Open browser to:
-   http://localhost:8080
-'''
-
-    p = doc.add_paragraph(setup_code)
-    p.style = 'No Spacing'
-
-    doc.add_page_break()
-
-def add_features_specifications(doc):
-    """Add features and specifications section"""
-    doc.add_heading('FEATURES & SPECIFICATIONS', level=1)
-
-    doc.add_heading('Customer-Facing Features', level=2)
-
-    doc.add_heading('1. Digital Invitation Creation', level=3)
-    doc.add_paragraph(
-        'Customers can create beautiful, customized digital invitations through an intuitive '
-        'form-based interface:'
-    )
-    invitation_features = [
-        'Event type selection (Wedding, Funeral, Naming Ceremony, Graduation, Corporate)',
-        'Template gallery with culturally appropriate designs',
-        'Custom text and messaging',
-        'Event details: date, time, venue with map integration',
-        'Guest list management',
-        'RSVP tracking',
-        'Photo upload for personalization',
-        'Color scheme customization',
-        'Font selection',
-        'Preview before finalizing'
-    ]
-    for feature in invitation_features:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('2. Order Management', level=3)
-    order_features = [
-        'Order placement through "Get Started" page',
-        'Package selection (Basic, Standard, Premium)',
-        'Add-on services selection',
-        'Real-time price calculation',
-        'Order summary review',
-        'Secure payment processing',
-        'Order confirmation email',
-        'Order tracking with unique ID',
-        'Order history in customer portal',
-        'Invoice generation and download'
-    ]
-    for feature in order_features:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('3. Customer Portal', level=3)
-    doc.add_paragraph('Authenticated customers access a personalized dashboard featuring:')
-    portal_features = [
-        'Overview of all orders',
-        'Active orders with status tracking',
-        'Completed orders archive',
-        'Order details view',
-        'Invoice download',
-        'Payment history',
-        'Profile management',
-        'Saved templates',
-        'Referral code and earnings',
-        'Support ticket system'
-    ]
-    for feature in portal_features:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('4. Order Tracking', level=3)
-    tracking_features = [
-        'Track order by Order ID or Email',
-        'Real-time status updates',
-        'Status stages: Pending, Processing, Design Review, Completed',
-        'Estimated completion time',
-        'Email notifications on status changes',
-        'WhatsApp notifications (optional)',
-        'Design preview when ready',
-        'Revision request capability'
-    ]
-    for feature in tracking_features:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('5. Referral Program', level=3)
-    doc.add_paragraph(
-        'Customers can earn rewards by referring others to VibeLink Ghana:'
-    )
-    referral_features = [
-        'Unique referral code generation',
-        'Shareable referral link',
-        'Social media sharing buttons',
-        'Track referrals and conversions',
-        'Earnings dashboard',
-        'Automatic commission calculation',
-        'Withdrawal request system',
-        'Referral leaderboard',
-        'Bonus incentives for milestones'
-    ]
-    for feature in referral_features:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('Admin Features', level=2)
-
-    doc.add_heading('1. Admin Dashboard', level=3)
-    doc.add_paragraph('Comprehensive admin panel with real-time analytics and management:')
-    admin_dashboard = [
-        'Overview statistics (orders, revenue, customers)',
-        'Real-time order notifications',
-        'Quick action buttons',
-        'Recent orders list',
-        'Revenue charts and graphs',
-        'Customer growth metrics',
-        'Popular packages analysis',
-        'Peak usage times',
-        'Conversion rate tracking'
-    ]
-    for feature in admin_dashboard:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('2. Order Management System', level=3)
-    admin_orders = [
-        'All orders view with filtering',
-        'Order status management',
-        'Customer information access',
-        'Design upload and management',
-        'Revision handling',
-        'Communication with customers',
-        'Order priority setting',
-        'Bulk actions',
-        'Export to CSV/Excel',
-        'Print packing slips'
-    ]
-    for feature in admin_orders:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('3. Customer Management', level=3)
-    admin_customers = [
-        'Customer database with search',
-        'Customer profiles and history',
-        'Lifetime value calculation',
-        'Customer segmentation',
-        'Email customer directly',
-        'Add notes to customer profiles',
-        'Block/unblock customers',
-        'Export customer data',
-        'Customer activity logs'
-    ]
-    for feature in admin_customers:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('4. Content Management', level=3)
-    admin_content = [
-        'Blog post creation and editing (with TipTap rich text editor)',
-        'Portfolio item management',
-        'Image upload and gallery',
-        'SEO meta data editing',
-        'Publish/draft status',
-        'Scheduling capabilities',
-        'Categories and tags',
-        'Featured posts',
-        'Analytics per post'
-    ]
-    for feature in admin_content:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('5. Analytics & Reports', level=3)
-    admin_analytics = [
-        'Revenue reports (daily, weekly, monthly)',
-        'Order statistics',
-        'Customer acquisition reports',
-        'Referral program performance',
-        'Popular templates/packages',
-        'Conversion funnel analysis',
-        'Abandoned cart reports',
-        'Traffic source analytics',
-        'User behavior tracking',
-        'Export reports to PDF/Excel'
-    ]
-    for feature in admin_analytics:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('Payment Processing', level=2)
-    doc.add_paragraph(
-        'Integration with Paystack provides secure and reliable payment processing:'
-    )
-    payment_features = [
-        'Paystack payment gateway integration',
-        'Support for mobile money (MTN, Vodafone, AirtelTigo)',
-        'Card payments (Visa, Mastercard)',
-        'Bank transfer option',
-        'Secure payment page (PCI DSS compliant)',
-        'Automatic payment verification',
-        'Payment confirmation emails',
-        'Transaction history',
-        'Refund processing',
-        'Payment webhooks for real-time updates',
-        'Multi-currency support (GHS primary)',
-        'Test mode for development'
-    ]
-    for feature in payment_features:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('AI Chatbot Integration', level=2)
-    doc.add_paragraph(
-        'Google Gemini AI powers an intelligent chatbot for customer support:'
-    )
-    chatbot_features = [
-        'Natural language understanding',
-        '24/7 availability',
-        'Instant responses to common questions',
-        'Multi-language support',
-        'Contextual conversations',
-        'FAQs and knowledge base integration',
-        'Escalation to human support',
-        'Order status inquiries',
-        'Package recommendations',
-        'Troubleshooting assistance',
-        'Chat history',
-        'Feedback collection'
-    ]
-    for feature in chatbot_features:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('SEO Features', level=2)
-    seo_features = [
-        'React Helmet for dynamic meta tags',
-        'SEO-friendly URLs',
-        'Open Graph tags for social sharing',
-        'Twitter Card integration',
-        'Sitemap generation',
-        'Robots.txt configuration',
-        'Canonical URLs',
-        'Structured data (Schema.org)',
-        'Image optimization with alt tags',
-        'Fast page load times',
-        'Mobile responsiveness',
-        'HTTPS security',
-        'Internal linking structure'
-    ]
-    for feature in seo_features:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('Integration Points', level=2)
-
-    # Integration table
-    integration_table = doc.add_table(rows=6, cols=3)
-    integration_table.style = 'Light Grid Accent 1'
-
-    integration_data = [
-        ('Integration', 'Technology', 'Purpose'),
-        ('Payment Gateway', 'Paystack API', 'Process payments securely'),
-        ('AI Chatbot', 'Google Gemini AI', 'Intelligent customer support'),
-        ('Email Service', 'Supabase Email/SMTP', 'Transactional emails'),
-        ('WhatsApp', 'WhatsApp Business API', 'Direct message delivery'),
-        ('Analytics', 'Custom + Google Analytics', 'User behavior tracking')
-    ]
-
-    for i, (integration, tech, purpose) in enumerate(integration_data):
-        integration_table.cell(i, 0).text = integration
-        integration_table.cell(i, 1).text = tech
-        integration_table.cell(i, 2).text = purpose
-
-    doc.add_page_break()
-
-def add_user_interface(doc):
-    """Add user interface section"""
-    doc.add_heading('USER INTERFACE', level=1)
-
-    doc.add_heading('Page Descriptions', level=2)
-
-    # Public Pages
-    doc.add_heading('Public Pages', level=3)
-    public_pages = [
-        ('Index (Home)', 'Landing page with hero section, features showcase, testimonials, '
-         'pricing preview, call-to-action buttons, and recent portfolio items'),
-        ('About', 'Company story, mission, vision, team members, and values'),
-        ('Services', 'Detailed description of invitation services, event types covered, '
-         'customization options, and delivery methods'),
-        ('Pricing', 'Package comparison (Basic, Standard, Premium), pricing table, '
-         'add-on services, and clear call-to-action'),
-        ('Portfolio', 'Gallery of past invitation designs, filterable by event type, '
-         'searchable, with pagination'),
-        ('Portfolio Detail', 'Full view of individual portfolio items with multiple images, '
-         'description, and related items'),
-        ('How It Works', 'Step-by-step explanation of the process from order to delivery, '
-         'with visual timeline'),
-        ('Blog', 'Blog listing page with featured posts, categories, search, and pagination'),
-        ('Blog Detail', 'Individual blog post with rich content, sharing buttons, comments, '
-         'and related posts'),
-        ('Contact', 'Contact form, office location map, phone numbers, email, social media links'),
-        ('Get Started', 'Order form with package selection, event details input, '
-         'customization options, and checkout'),
-        ('Track Order', 'Order tracking by ID or email, status display, timeline view')
-    ]
-
-    for page_name, description in public_pages:
-        p = doc.add_paragraph()
-        p.add_run(f'{page_name}: ').bold = True
-        p.add_run(description)
-        p.paragraph_format.line_spacing = 1.15
-
-    # Customer Portal Pages
-    doc.add_heading('Customer Portal Pages (Authenticated)', level=3)
-    customer_pages = [
-        ('Customer Portal Dashboard', 'Overview of orders, recent activity, quick stats, '
-         'referral earnings, and navigation to other portal sections'),
-        ('Order Details', 'Complete order information, status timeline, design preview, '
-         'invoice download, revision request'),
-        ('Invoice View', 'Professional invoice with company details, order breakdown, '
-         'payment information, printable format')
-    ]
-
-    for page_name, description in customer_pages:
-        p = doc.add_paragraph()
-        p.add_run(f'{page_name}: ').bold = True
-        p.add_run(description)
-        p.paragraph_format.line_spacing = 1.15
-
-    # Admin Pages
-    doc.add_heading('Admin Pages (Admin Access Only)', level=3)
-    admin_pages = [
-        ('Admin Auth', 'Secure admin login with email/password, optional 2FA'),
-        ('Admin Dashboard', 'Comprehensive admin overview with analytics, charts, '
-         'recent orders, quick actions, and system health')
-    ]
-
-    for page_name, description in admin_pages:
-        p = doc.add_paragraph()
-        p.add_run(f'{page_name}: ').bold = True
-        p.add_run(description)
-        p.paragraph_format.line_spacing = 1.15
-
-    # Legal Pages
-    doc.add_heading('Legal & Policy Pages', level=3)
-    legal_pages = [
-        ('Privacy Policy', 'Data collection, usage, protection, and user rights'),
-        ('Terms of Service', 'User agreements, service terms, limitations, and disclaimers'),
-        ('Cookie Policy', 'Cookie usage, types, and user controls'),
-        ('Refund Policy', 'Refund conditions, process, and timelines')
-    ]
-
-    for page_name, description in legal_pages:
-        p = doc.add_paragraph()
-        p.add_run(f'{page_name}: ').bold = True
-        p.add_run(description)
-        p.paragraph_format.line_spacing = 1.15
-
-    # Other Pages
-    doc.add_heading('Other Pages', level=3)
-    other_pages = [
-        ('Survey', 'Customer feedback and satisfaction survey'),
-        ('Thank You', 'Order confirmation and thank you message'),
-        ('Multi-Language Support', 'Language selection interface'),
-        ('Not Found (404)', 'Custom 404 error page with navigation options')
-    ]
-
-    for page_name, description in other_pages:
-        p = doc.add_paragraph()
-        p.add_run(f'{page_name}: ').bold = True
-        p.add_run(description)
-        p.paragraph_format.line_spacing = 1.15
-
-    doc.add_heading('User Journeys', level=2)
-
-    doc.add_heading('Customer Journey: Ordering an Invitation', level=3)
-    customer_journey = [
-        '1. Visitor lands on homepage (Index.tsx)',
-        '2. Explores services and views portfolio',
-        '3. Checks pricing packages',
-        '4. Clicks "Get Started" CTA button',
-        '5. Fills out order form with event details',
-        '6. Selects package and customization options',
-        '7. Reviews order summary',
-        '8. Proceeds to payment',
-        '9. Completes payment via Paystack',
-        '10. Receives order confirmation email',
-        '11. Gets order tracking ID',
-        '12. Can track order status',
-        '13. Receives design for review',
-        '14. Approves or requests revisions',
-        '15. Receives final invitation',
-        '16. Downloads invoice from customer portal'
-    ]
-
-    for step in customer_journey:
-        doc.add_paragraph(step, style='List Bullet')
-
-    doc.add_heading('Admin Journey: Processing an Order', level=3)
-    admin_journey = [
-        '1. Admin logs in via AdminAuth.tsx',
-        '2. Sees new order notification on dashboard',
-        '3. Clicks to view order details',
-        '4. Reviews customer requirements',
-        '5. Changes order status to "Processing"',
-        '6. Creates invitation design',
-        '7. Uploads design to order',
-        '8. Changes status to "Design Review"',
-        '9. Customer receives notification',
-        '10. Customer reviews and provides feedback',
-        '11. Admin makes revisions if needed',
-        '12. Customer approves final design',
-        '13. Admin marks order as "Completed"',
-        '14. System sends final invitation to customer',
-        '15. Admin monitors customer satisfaction'
-    ]
-
-    for step in admin_journey:
-        doc.add_paragraph(step, style='List Bullet')
-
-    doc.add_heading('Navigation Structure', level=2)
-    doc.add_paragraph('The site navigation is organized hierarchically:')
-
-    doc.add_paragraph().add_run('Main Navigation:').bold = True
-    main_nav = ['Home', 'About', 'Services', 'Portfolio', 'Pricing', 'Blog',
-                'How It Works', 'Contact', 'Get Started', 'Track Order']
-    for item in main_nav:
-        p = doc.add_paragraph(item, style='List Bullet')
-        p.paragraph_format.left_indent = Inches(0.5)
-
-    doc.add_paragraph().add_run('Footer Navigation:').bold = True
-    footer_nav = ['About Us', 'Services', 'Contact', 'Privacy Policy', 'Terms of Service',
-                  'Cookie Policy', 'Refund Policy', 'Blog', 'FAQ']
-    for item in footer_nav:
-        p = doc.add_paragraph(item, style='List Bullet')
-        p.paragraph_format.left_indent = Inches(0.5)
-
-    doc.add_paragraph().add_run('Customer Portal Navigation:').bold = True
-    portal_nav = ['Dashboard', 'My Orders', 'Profile', 'Referrals', 'Support', 'Logout']
-    for item in portal_nav:
-        p = doc.add_paragraph(item, style='List Bullet')
-        p.paragraph_format.left_indent = Inches(0.5)
-
-    doc.add_paragraph().add_run('Admin Panel Navigation:').bold = True
-    admin_nav = ['Dashboard', 'Orders', 'Customers', 'Content', 'Analytics',
-                 'Settings', 'Logout']
-    for item in admin_nav:
-        p = doc.add_paragraph(item, style='List Bullet')
-        p.paragraph_format.left_indent = Inches(0.5)
-
-    doc.add_heading('Design System', level=2)
-
-    doc.add_heading('Color Palette', level=3)
-    colors = [
-        ('Navy Blue', '#1A237E', 'Primary brand color, headers, CTAs'),
-        ('Gold', '#FFD700', 'Accent color, highlights, premium features'),
-        ('Purple', '#7C3AED', 'Secondary accent, interactive elements'),
-        ('Mint', '#E8F5E9', 'Success states, positive feedback'),
-        ('White', '#FFFFFF', 'Backgrounds, cards'),
-        ('Gray Scale', '#F5F5F5 to #212121', 'Text, borders, backgrounds')
-    ]
-
-    color_table = doc.add_table(rows=len(colors) + 1, cols=3)
-    color_table.style = 'Light Grid Accent 1'
-    color_table.cell(0, 0).text = 'Color Name'
-    color_table.cell(0, 1).text = 'Hex Code'
-    color_table.cell(0, 2).text = 'Usage'
-
-    for i, (name, hex_code, usage) in enumerate(colors, 1):
-        color_table.cell(i, 0).text = name
-        color_table.cell(i, 1).text = hex_code
-        color_table.cell(i, 2).text = usage
-
-    doc.add_heading('Typography', level=3)
-    fonts = [
-        ('Poppins', 'Primary font for headings and titles', '600-700 weight'),
-        ('Inter', 'Body text and UI elements', '400-500 weight'),
-        ('Playfair Display', 'Decorative headings and special sections', '700 weight')
-    ]
-
-    font_table = doc.add_table(rows=len(fonts) + 1, cols=3)
-    font_table.style = 'Light Grid Accent 1'
-    font_table.cell(0, 0).text = 'Font Family'
-    font_table.cell(0, 1).text = 'Usage'
-    font_table.cell(0, 2).text = 'Weights'
-
-    for i, (family, usage, weights) in enumerate(fonts, 1):
-        font_table.cell(i, 0).text = family
-        font_table.cell(i, 1).text = usage
-        font_table.cell(i, 2).text = weights
-
-    doc.add_heading('Spacing System', level=3)
-    doc.add_paragraph('Consistent spacing using Tailwind CSS spacing scale:')
-    spacing = ['4px (1)', '8px (2)', '12px (3)', '16px (4)', '24px (6)',
-               '32px (8)', '48px (12)', '64px (16)', '96px (24)']
-    for space in spacing:
-        doc.add_paragraph(space, style='List Bullet')
-
-    doc.add_heading('Component Library', level=3)
-    doc.add_paragraph('UI components built with shadcn-ui and Radix UI:')
-    components = [
-        'Buttons (primary, secondary, outline, ghost)',
-        'Forms (inputs, selects, textareas, checkboxes, radio buttons)',
-        'Cards (content containers with shadows)',
-        'Modals and Dialogs',
-        'Dropdowns and Popovers',
-        'Tables (responsive data tables)',
-        'Tabs and Accordions',
-        'Toasts and Notifications',
-        'Progress Indicators',
-        'Avatars and Badges',
-        'Navigation (navbar, sidebar, breadcrumbs)',
-        'Charts and Graphs (Recharts)'
-    ]
-    for component in components:
-        doc.add_paragraph(component, style='List Bullet')
-
-    doc.add_page_break()
-
-def add_database_schema(doc):
-    """Add database schema section"""
-    doc.add_heading('DATABASE SCHEMA', level=1)
-
-    doc.add_heading('Database Overview', level=2)
-    doc.add_paragraph(
-        'VibeLink Ghana uses PostgreSQL 14.1 via Supabase with 46 migration files tracking '
-        'schema evolution. The database implements Row Level Security (RLS) for fine-grained '
-        'access control and uses foreign key constraints to maintain referential integrity.'
-    )
-
-    doc.add_heading('Core Tables', level=2)
-
-    # Orders Table
-    doc.add_heading('orders', level=3)
-    doc.add_paragraph('Core table for managing customer orders.')
-    orders_fields = [
-        ('id', 'UUID', 'Primary key, auto-generated'),
-        ('customer_id', 'UUID', 'Foreign key to customers table'),
-        ('order_number', 'VARCHAR', 'Unique human-readable order ID'),
-        ('event_type', 'VARCHAR', 'Wedding, Funeral, Naming, Graduation, Corporate'),
-        ('package_name', 'VARCHAR', 'Basic, Standard, Premium'),
-        ('status', 'VARCHAR', 'Pending, Processing, Design Review, Completed, Cancelled'),
-        ('total_price', 'DECIMAL', 'Total order amount in GHS'),
-        ('payment_status', 'VARCHAR', 'Pending, Paid, Refunded'),
-        ('created_at', 'TIMESTAMP', 'Order creation timestamp'),
-        ('updated_at', 'TIMESTAMP', 'Last update timestamp'),
-        ('completed_at', 'TIMESTAMP', 'Order completion timestamp'),
-        ('notes', 'TEXT', 'Admin notes and special instructions')
-    ]
-
-    orders_table = doc.add_table(rows=len(orders_fields) + 1, cols=3)
-    orders_table.style = 'Medium Grid 1 Accent 1'
-    orders_table.cell(0, 0).text = 'Field'
-    orders_table.cell(0, 1).text = 'Type'
-    orders_table.cell(0, 2).text = 'Description'
-
-    for i, (field, ftype, desc) in enumerate(orders_fields, 1):
-        orders_table.cell(i, 0).text = field
-        orders_table.cell(i, 1).text = ftype
-        orders_table.cell(i, 2).text = desc
-
-    # Customers Table
-    doc.add_heading('customers', level=3)
-    doc.add_paragraph('Stores customer account information.')
-    customers_fields = [
-        ('id', 'UUID', 'Primary key, matches Supabase auth.users.id'),
-        ('email', 'VARCHAR', 'Customer email (unique)'),
-        ('full_name', 'VARCHAR', 'Customer full name'),
-        ('phone', 'VARCHAR', 'Phone number'),
-        ('created_at', 'TIMESTAMP', 'Account creation date'),
-        ('updated_at', 'TIMESTAMP', 'Last profile update'),
-        ('total_orders', 'INTEGER', 'Count of orders placed'),
-        ('lifetime_value', 'DECIMAL', 'Total revenue from customer'),
-        ('referral_code', 'VARCHAR', 'Unique referral code'),
-        ('referred_by', 'UUID', 'Foreign key to customers (referrer)')
-    ]
-
-    customers_table = doc.add_table(rows=len(customers_fields) + 1, cols=3)
-    customers_table.style = 'Medium Grid 1 Accent 1'
-    customers_table.cell(0, 0).text = 'Field'
-    customers_table.cell(0, 1).text = 'Type'
-    customers_table.cell(0, 2).text = 'Description'
-
-    for i, (field, ftype, desc) in enumerate(customers_fields, 1):
-        customers_table.cell(i, 0).text = field
-        customers_table.cell(i, 1).text = ftype
-        customers_table.cell(i, 2).text = desc
-
-    # Payments Table
-    doc.add_heading('payments', level=3)
-    doc.add_paragraph('Tracks all payment transactions.')
-    payments_fields = [
-        ('id', 'UUID', 'Primary key'),
-        ('order_id', 'UUID', 'Foreign key to orders'),
-        ('amount', 'DECIMAL', 'Payment amount'),
-        ('currency', 'VARCHAR', 'GHS, USD, etc.'),
-        ('status', 'VARCHAR', 'Success, Pending, Failed'),
-        ('payment_method', 'VARCHAR', 'Card, Mobile Money, Bank Transfer'),
-        ('provider_reference', 'VARCHAR', 'Paystack transaction reference'),
-        ('created_at', 'TIMESTAMP', 'Payment initiation time'),
-        ('completed_at', 'TIMESTAMP', 'Payment completion time')
-    ]
-
-    payments_table = doc.add_table(rows=len(payments_fields) + 1, cols=3)
-    payments_table.style = 'Medium Grid 1 Accent 1'
-    payments_table.cell(0, 0).text = 'Field'
-    payments_table.cell(0, 1).text = 'Type'
-    payments_table.cell(0, 2).text = 'Description'
-
-    for i, (field, ftype, desc) in enumerate(payments_fields, 1):
-        payments_table.cell(i, 0).text = field
-        payments_table.cell(i, 1).text = ftype
-        payments_table.cell(i, 2).text = desc
-
-    doc.add_heading('Supporting Tables', level=2)
-
-    supporting_tables = [
-        ('order_items', 'Individual line items within an order (invitation designs, add-ons)'),
-        ('invitations', 'Stores invitation design data, templates, and customizations'),
-        ('referrals', 'Tracks referral relationships and commission earnings'),
-        ('blog_posts', 'Blog content with title, content, author, publish date, SEO data'),
-        ('portfolio_items', 'Portfolio showcase items with images and descriptions'),
-        ('surveys', 'Customer feedback surveys and responses'),
-        ('abandoned_carts', 'Tracks incomplete orders for recovery campaigns'),
-        ('ai_generated_content', 'AI-generated content for approval workflow'),
-        ('analytics_events', 'User interaction tracking for behavioral analysis'),
-        ('email_templates', 'Transactional email templates'),
-        ('notifications', 'System notifications for customers and admins'),
-        ('rate_limits', 'API rate limiting data'),
-        ('admin_users', 'Admin account information and permissions')
-    ]
-
-    for table_name, description in supporting_tables:
-        p = doc.add_paragraph()
-        p.add_run(f'{table_name}: ').bold = True
-        p.add_run(description)
-
-    doc.add_heading('Key Relationships', level=2)
-    doc.add_paragraph('Database relationships enforce data integrity:')
-
-    relationships = [
-        'customers 1:N orders (one customer can have many orders)',
-        'orders 1:N order_items (one order can have multiple items)',
-        'orders 1:N payments (one order can have multiple payment attempts)',
-        'customers 1:1 referral_code (unique referral code per customer)',
-        'customers 1:N referrals (one customer can refer many others)',
-        'orders 1:1 invitations (each order has one invitation design)',
-        'customers 1:N notifications (one customer receives many notifications)',
-        'customers 1:N abandoned_carts (tracking multiple cart abandonment events)'
-    ]
-
-    for relationship in relationships:
-        doc.add_paragraph(relationship, style='List Bullet')
-
-    doc.add_heading('Migration Strategy', level=2)
-    doc.add_paragraph(
-        'Database schema changes are managed through Supabase migrations with 46 migration '
-        'files tracking the evolution of the database schema.'
-    )
-
-    doc.add_heading('Migration Process', level=3)
-    migration_steps = [
-        'Create new migration file: supabase migration new migration_name',
-        'Write SQL DDL statements in migration file',
-        'Test migration in local development environment',
-        'Review migration for potential data loss or performance issues',
-        'Apply migration to staging environment',
-        'Verify migration success and data integrity',
-        'Apply migration to production environment',
-        'Monitor for errors and performance degradation',
-        'Document migration in changelog'
-    ]
-
-    for i, step in enumerate(migration_steps, 1):
-        doc.add_paragraph(f'{i}. {step}')
-
-    doc.add_heading('Example Migration Files', level=3)
-    example_migrations = [
-        '20241230_order_priority.sql - Added priority field to orders table',
-        '20241230_rate_limit_table.sql - Created rate limiting table',
-        '20251225000923_*.sql - Various schema enhancements'
-    ]
-
-    for migration in example_migrations:
-        doc.add_paragraph(migration, style='List Bullet')
-
-    doc.add_heading('Row Level Security (RLS)', level=3)
-    doc.add_paragraph(
-        'RLS policies ensure users can only access data they are authorized to see:'
-    )
-
-    rls_policies = [
-        'Customers can only view their own orders and profile',
-        'Admins have full access to all data',
-        'Public users can view portfolio and blog posts',
-        'Unauthenticated users cannot access customer or order data',
-        'Insert policies validate data before allowing creation',
-        'Update policies ensure users can only modify their own data',
-        'Delete policies restrict data deletion to authorized users'
-    ]
-
-    for policy in rls_policies:
-        doc.add_paragraph(policy, style='List Bullet')
-
-    doc.add_page_break()
-
-def add_api_integrations(doc):
-    """Add API and integrations section"""
-    doc.add_heading('API & INTEGRATIONS', level=1)
-
-    doc.add_heading('Supabase API Usage', level=2)
-    doc.add_paragraph(
-        'Supabase provides auto-generated RESTful API and real-time subscriptions for all '
-        'database tables. The frontend communicates with Supabase using the official '
-        'JavaScript client library.'
-    )
-
-    doc.add_heading('Authentication API', level=3)
-    auth_endpoints = [
-        ('signUp()', 'Create new user account with email/password'),
-        ('signIn()', 'Authenticate user and receive session token'),
-        ('signOut()', 'End user session'),
-        ('resetPassword()', 'Send password reset email'),
-        ('updateUser()', 'Update user profile information'),
-        ('getSession()', 'Retrieve current session information'),
-        ('onAuthStateChange()', 'Subscribe to authentication state changes')
-    ]
-
-    for method, description in auth_endpoints:
-        p = doc.add_paragraph()
-        p.add_run(f'{method}: ').bold = True
-        p.add_run(description)
-
-    doc.add_heading('Database API', level=3)
-    doc.add_paragraph('CRUD operations via Supabase client:')
-
-    crud_example = '''
-// Query orders
-const { data, error } = await supabase
-  .from('orders')
-  .select('*')
-  .eq('customer_id', userId)
-  .order('created_at', { ascending: false })
-
-// Insert new order
-const { data, error } = await supabase
-  .from('orders')
-  .insert({
-    customer_id: userId,
-    event_type: 'wedding',
-    package_name: 'premium',
-    total_price: 500
-  })
-
-// Update order status
-const { data, error } = await supabase
-  .from('orders')
-  .update({ status: 'completed' })
-  .eq('id', orderId)
-
-// Delete (soft delete preferred)
-const { data, error } = await supabase
-  .from('orders')
-  .update({ deleted_at: new Date() })
-  .eq('id', orderId)
-'''
-
-    p = doc.add_paragraph(crud_example)
-    p.style = 'No Spacing'
-
-    doc.add_heading('Real-time Subscriptions', level=3)
-    doc.add_paragraph('Subscribe to database changes for real-time updates:')
-
-    realtime_example = '''
-// Subscribe to new orders
-const subscription = supabase
-  .channel('orders')
-  .on('postgres_changes',
-    {
-      event: 'INSERT',
-      schema: 'public',
-      table: 'orders'
-    },
-    (payload) => {
-      console.log('New order:', payload.new)
-      // Update UI with new order
-    }
-  )
-  .subscribe()
-'''
-
-    p = doc.add_paragraph(realtime_example)
-    p.style = 'No Spacing'
-
-    doc.add_heading('Storage API', level=3)
-    storage_operations = [
-        ('upload()', 'Upload files to Supabase Storage buckets'),
-        ('download()', 'Download files from storage'),
-        ('createSignedUrl()', 'Generate temporary URL for private files'),
-        ('list()', 'List files in a bucket'),
-        ('remove()', 'Delete files from storage'),
-        ('getPublicUrl()', 'Get public URL for public bucket files')
-    ]
-
-    for method, description in storage_operations:
-        p = doc.add_paragraph()
-        p.add_run(f'{method}: ').bold = True
-        p.add_run(description)
-
-    doc.add_heading('Paystack Payment Integration', level=2)
-    doc.add_paragraph(
-        'Paystack is integrated for payment processing with support for multiple payment '
-        'methods popular in Ghana.'
-    )
-
-    doc.add_heading('Payment Flow', level=3)
-    payment_flow = [
-        '1. Customer completes order form',
-        '2. Frontend initiates payment with Paystack',
-        '3. Paystack popup opens with payment options',
-        '4. Customer selects payment method (card/mobile money)',
-        '5. Customer completes payment on Paystack',
-        '6. Paystack sends webhook to backend',
-        '7. Backend verifies payment with Paystack API',
-        '8. Order status updated to "Paid"',
-        '9. Customer receives confirmation email',
-        '10. Admin receives new order notification'
-    ]
-
-    for step in payment_flow:
-        doc.add_paragraph(step, style='List Bullet')
-
-    doc.add_heading('Paystack API Endpoints', level=3)
-    paystack_endpoints = [
-        ('Initialize Transaction', 'POST /transaction/initialize - Create payment session'),
-        ('Verify Transaction', 'GET /transaction/verify/:reference - Confirm payment'),
-        ('List Transactions', 'GET /transaction - Retrieve transaction history'),
-        ('Refund Transaction', 'POST /refund - Process refund'),
-        ('Mobile Money', 'POST /charge - Charge mobile money accounts')
-    ]
-
-    for endpoint, description in paystack_endpoints:
-        p = doc.add_paragraph()
-        p.add_run(f'{endpoint}: ').bold = True
-        p.add_run(description)
-
-    doc.add_heading('Payment Methods Supported', level=3)
-    payment_methods = [
-        'Visa/Mastercard credit and debit cards',
-        'MTN Mobile Money',
-        'Vodafone Cash',
-        'AirtelTigo Money',
-        'Bank transfer',
-        'USSD'
-    ]
-
-    for method in payment_methods:
-        doc.add_paragraph(method, style='List Bullet')
-
-    doc.add_heading('WhatsApp Integration', level=2)
-    doc.add_paragraph(
-        'WhatsApp Business API integration enables direct delivery of invitations and '
-        'notifications to customers.'
-    )
-
-    doc.add_heading('WhatsApp Features', level=3)
-    whatsapp_features = [
-        'Send invitation links directly to customer WhatsApp',
-        'Order status notifications',
-        'Payment confirmations',
-        'Design ready notifications',
-        'Support message delivery',
-        'Bulk WhatsApp messaging for campaigns',
-        'Message templates for compliance',
-        'Delivery status tracking'
-    ]
-
-    for feature in whatsapp_features:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('Implementation', level=3)
-    doc.add_paragraph(
-        'WhatsApp integration uses the WhatsApp Business API with message templates '
-        'approved by Meta. Messages are sent via Supabase Edge Functions to maintain '
-        'security and comply with WhatsApp policies.'
-    )
-
-    doc.add_heading('Google Gemini AI Integration', level=2)
-    doc.add_paragraph(
-        'Google Gemini AI powers the intelligent chatbot providing 24/7 customer support.'
-    )
-
-    doc.add_heading('Chatbot Capabilities', level=3)
-    chatbot_capabilities = [
-        'Answer frequently asked questions',
-        'Explain pricing and packages',
-        'Guide users through ordering process',
-        'Check order status',
-        'Provide design recommendations',
-        'Troubleshoot common issues',
-        'Escalate to human support when needed',
-        'Multi-turn conversations with context',
-        'Natural language understanding',
-        'Response in English and local languages'
-    ]
-
-    for capability in chatbot_capabilities:
-        doc.add_paragraph(capability, style='List Bullet')
-
-    doc.add_heading('Implementation', level=3)
-    doc.add_paragraph(
-        'The chatbot is implemented as a floating widget (ChatWidget.tsx) that appears on '
-        'all pages. It communicates with Google Gemini AI via Supabase Edge Functions '
-        'to protect API keys.'
-    )
-
-    gemini_flow = [
-        '1. User types message in chat widget',
-        '2. Frontend sends message to Supabase Edge Function',
-        '3. Edge Function calls Gemini AI API with message and context',
-        '4. Gemini AI processes message and generates response',
-        '5. Response sent back to Edge Function',
-        '6. Edge Function returns response to frontend',
-        '7. Chat widget displays response to user',
-        '8. Conversation history maintained for context'
-    ]
-
-    for step in gemini_flow:
-        doc.add_paragraph(step, style='List Bullet')
-
-    doc.add_heading('Email Services', level=2)
-    doc.add_paragraph(
-        'Email notifications are sent for various events throughout the customer journey.'
-    )
-
-    doc.add_heading('Email Types', level=3)
-    email_types = [
-        ('Welcome Email', 'Sent when customer creates account'),
-        ('Order Confirmation', 'Sent after successful order placement'),
-        ('Payment Confirmation', 'Sent after successful payment'),
-        ('Order Status Update', 'Sent when order status changes'),
-        ('Design Ready', 'Sent when design is ready for review'),
-        ('Order Completed', 'Sent when order is finalized'),
-        ('Abandoned Cart', 'Reminder for incomplete orders'),
-        ('Password Reset', 'Password reset link'),
-        ('Invoice', 'Order invoice attached'),
-        ('Referral Notifications', 'Referral commission updates')
-    ]
-
-    for email_type, description in email_types:
-        p = doc.add_paragraph()
-        p.add_run(f'{email_type}: ').bold = True
-        p.add_run(description)
-
-    doc.add_heading('Email Templates', level=3)
-    doc.add_paragraph(
-        'Email templates are stored in the database and support dynamic content insertion. '
-        'Templates are designed to be mobile-responsive with consistent branding.'
-    )
-
-    doc.add_heading('Sending Method', level=3)
-    doc.add_paragraph(
-        'Emails are sent via Supabase Edge Functions using SMTP or a transactional email '
-        'service like SendGrid or Mailgun.'
-    )
-
-    doc.add_page_break()
-
-def add_deployment_infrastructure(doc):
-    """Add deployment and infrastructure section"""
-    doc.add_heading('DEPLOYMENT & INFRASTRUCTURE', level=1)
-
-    doc.add_heading('Server Setup', level=2)
-    doc.add_paragraph(
-        'The production server hosts the VibeLink Ghana application with optimized '
-        'configuration for performance and security.'
-    )
-
-    doc.add_heading('Server Specifications', level=3)
-    server_specs = [
-        'Operating System: Linux (Ubuntu/Debian recommended)',
-        'Web Server: Nginx or Apache',
-        'Node.js: Not required (static site)',
-        'SSL/TLS: Let\'s Encrypt certificate',
-        'Document Root: /var/www/vibelinkgh.com/',
-        'Gzip Compression: Enabled',
-        'Caching: Browser caching headers configured'
-    ]
-
-    for spec in server_specs:
-        doc.add_paragraph(spec, style='List Bullet')
-
-    doc.add_heading('Nginx Configuration Example', level=3)
-    nginx_config = '''
-server {
-    listen 80;
-    listen [::]:80;
-    server_name vibelinkgh.com www.vibelinkgh.com;
-    return 301 https://$server_name$request_uri;
-}
-
-server {
-    listen 443 ssl http2;
-    listen [::]:443 ssl http2;
-    server_name vibelinkgh.com www.vibelinkgh.com;
-
-    root /var/www/vibelinkgh.com;
-    index index.html;
-
-    ssl_certificate /etc/letsencrypt/live/vibelinkgh.com/fullchain.pem;
-    ssl_certificate_key /etc/letsencrypt/live/vibelinkgh.com/privkey.pem;
-
-    # Gzip compression
-    gzip on;
-    gzip_types text/css application/javascript application/json image/svg+xml;
-    gzip_comp_level 6;
-
-    # Security headers
-    add_header X-Frame-Options "SAMEORIGIN" always;
-    add_header X-Content-Type-Options "nosniff" always;
-    add_header X-XSS-Protection "1; mode=block" always;
-
-    # Cache static assets
-    location ~* \\.(js|css|png|jpg|jpeg|gif|svg|ico|woff|woff2)$ {
-        expires 1y;
-        add_header Cache-Control "public, immutable";
-    }
-
-    # SPA routing - redirect all to index.html
-    location / {
-        try_files $uri $uri/ /index.html;
-    }
-}
-'''
-
-    p = doc.add_paragraph(nginx_config)
-    p.style = 'No Spacing'
-
-    doc.add_heading('Domain Configuration', level=2)
-    doc.add_paragraph('DNS records configuration for vibelinkgh.com:')
-
-    dns_table = doc.add_table(rows=5, cols=4)
-    dns_table.style = 'Light Grid Accent 1'
-
-    dns_data = [
-        ('Type', 'Name', 'Value', 'TTL'),
-        ('A', '@', 'Server IP Address', '3600'),
-        ('A', 'www', 'Server IP Address', '3600'),
-        ('CNAME', 'www', 'vibelinkgh.com', '3600'),
-        ('TXT', '@', 'SPF/DKIM records', '3600')
-    ]
-
-    for i, (record_type, name, value, ttl) in enumerate(dns_data):
-        dns_table.cell(i, 0).text = record_type
-        dns_table.cell(i, 1).text = name
-        dns_table.cell(i, 2).text = value
-        dns_table.cell(i, 3).text = ttl
-
-    doc.add_heading('SSL Certificates', level=2)
-    doc.add_paragraph(
-        'SSL/TLS certificates are obtained from Let\'s Encrypt for free, automatically '
-        'renewed HTTPS encryption.'
-    )
-
-    doc.add_heading('SSL Setup Steps', level=3)
-    ssl_steps = [
-        '1. Install Certbot: sudo apt install certbot python3-certbot-nginx',
-        '2. Run Certbot: sudo certbot --nginx -d vibelinkgh.com -d www.vibelinkgh.com',
-        '3. Follow prompts to configure certificate',
-        '4. Test renewal: sudo certbot renew --dry-run',
-        '5. Auto-renewal cron job: Certbot installs this automatically',
-        '6. Verify HTTPS: Visit https://vibelinkgh.com',
-        '7. Check SSL rating: Use SSL Labs test'
-    ]
-
-    for step in ssl_steps:
-        doc.add_paragraph(step, style='List Bullet')
-
-    doc.add_heading('Backup Strategy', level=2)
-    doc.add_paragraph(
-        'Comprehensive backup strategy ensures data protection and disaster recovery.'
-    )
-
-    doc.add_heading('Database Backups', level=3)
-    db_backups = [
-        'Supabase automatic daily backups (retained for 7 days on free tier)',
-        'Manual backups before major migrations',
-        'Export database to SQL file weekly',
-        'Store backups in separate location (cloud storage)',
-        'Test backup restoration quarterly',
-        'Point-in-time recovery available (paid tier)'
-    ]
-
-    for backup in db_backups:
-        doc.add_paragraph(backup, style='List Bullet')
-
-    doc.add_heading('Code Backups', level=3)
-    code_backups = [
-        'GitHub repository serves as primary code backup',
-        'Local git repository on development PC',
-        'Tagged releases for version milestones',
-        'Branch protection on main branch',
-        'Regular commits with meaningful messages'
-    ]
-
-    for backup in code_backups:
-        doc.add_paragraph(backup, style='List Bullet')
-
-    doc.add_heading('File Storage Backups', level=3)
-    storage_backups = [
-        'Supabase Storage automatic replication',
-        'Export uploaded files monthly',
-        'Store backups in AWS S3 or similar',
-        'Verify file integrity periodically'
-    ]
-
-    for backup in storage_backups:
-        doc.add_paragraph(backup, style='List Bullet')
-
-    doc.add_heading('Monitoring', level=2)
-    doc.add_paragraph(
-        'Proactive monitoring ensures system health and quick issue detection.'
-    )
-
-    doc.add_heading('Application Monitoring', level=3)
-    app_monitoring = [
-        'Supabase Dashboard: Database performance, API usage',
-        'Error tracking: Console errors logged',
-        'Performance metrics: Page load times, API response times',
-        'User analytics: Google Analytics or similar',
-        'Real-time user activity',
-        'Uptime monitoring: UptimeRobot or Pingdom'
-    ]
-
-    for item in app_monitoring:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Server Monitoring', level=3)
-    server_monitoring = [
-        'CPU and memory usage',
-        'Disk space utilization',
-        'Network bandwidth',
-        'Web server logs (access and error logs)',
-        'SSL certificate expiration',
-        'Security scan alerts'
-    ]
-
-    for item in server_monitoring:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Key Metrics to Monitor', level=3)
-    metrics_table = doc.add_table(rows=9, cols=3)
-    metrics_table.style = 'Light List Accent 1'
-
-    metrics_data = [
-        ('Metric', 'Target', 'Alert Threshold'),
-        ('Uptime', '>99.5%', '<99%'),
-        ('Page Load Time', '<2 seconds', '>3 seconds'),
-        ('API Response Time', '<500ms', '>1000ms'),
-        ('Error Rate', '<0.1%', '>1%'),
-        ('Database Connections', 'Normal range', '>80% capacity'),
-        ('Disk Space', '>20% free', '<10% free'),
-        ('SSL Expiry', '>30 days', '<14 days')
-    ]
-
-    for i, (metric, target, threshold) in enumerate(metrics_data):
-        metrics_table.cell(i, 0).text = metric
-        metrics_table.cell(i, 1).text = target
-        metrics_table.cell(i, 2).text = threshold
-
-    doc.add_heading('Deployment Checklist', level=2)
-    checklist = [
-        '☐ Code tested in development environment',
-        '☐ All tests passing',
-        '☐ Environment variables configured',
-        '☐ Build production bundle: npm run build',
-        '☐ Test production build locally: npm run preview',
-        '☐ Backup current production deployment',
-        '☐ Backup database',
-        '☐ Upload dist/ folder to server',
-        '☐ Clear server cache',
-        '☐ Verify website loads correctly',
-        '☐ Test critical user flows (order, payment)',
-        '☐ Check all integrations working',
-        '☐ Monitor error logs for 1 hour',
-        '☐ Update documentation',
-        '☐ Notify team of deployment'
-    ]
-
-    for item in checklist:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_page_break()
-
-def add_security(doc):
-    """Add security section"""
-    doc.add_heading('SECURITY', level=1)
-
-    doc.add_heading('Authentication', level=2)
-    doc.add_paragraph(
-        'Supabase Auth provides secure authentication with industry-standard practices.'
-    )
-
-    doc.add_heading('Authentication Methods', level=3)
-    auth_methods = [
-        'Email/Password authentication with secure password hashing (bcrypt)',
-        'Email verification required for new accounts',
-        'Password strength requirements enforced',
-        'Rate limiting on login attempts',
-        'Account lockout after failed attempts',
-        'Session management with JWT tokens',
-        'Token expiration and refresh mechanism',
-        'Secure password reset flow'
-    ]
-
-    for method in auth_methods:
-        doc.add_paragraph(method, style='List Bullet')
-
-    doc.add_heading('Password Requirements', level=3)
-    password_reqs = [
-        'Minimum 8 characters',
-        'At least one uppercase letter',
-        'At least one lowercase letter',
-        'At least one number',
-        'At least one special character (recommended)',
-        'Not a commonly used password',
-        'Not the same as email address'
-    ]
-
-    for req in password_reqs:
-        doc.add_paragraph(req, style='List Bullet')
-
-    doc.add_heading('Session Management', level=3)
-    session_mgmt = [
-        'JWT tokens stored in httpOnly cookies',
-        'Access token expires after 1 hour',
-        'Refresh token used to obtain new access token',
-        'Logout clears all session data',
-        'Automatic logout on token expiration',
-        'Session tracking in database',
-        'Device/browser fingerprinting (optional)'
-    ]
-
-    for item in session_mgmt:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Authorization', level=2)
-    doc.add_paragraph(
-        'Role-based access control (RBAC) ensures users can only access authorized resources.'
-    )
-
-    doc.add_heading('User Roles', level=3)
-    roles_table = doc.add_table(rows=4, cols=2)
-    roles_table.style = 'Medium Grid 1 Accent 1'
-
-    roles_data = [
-        ('Role', 'Permissions'),
-        ('Guest', 'View public pages, create account, place order'),
-        ('Customer', 'View own orders, update profile, access customer portal, track orders'),
-        ('Admin', 'Full access to all data, manage orders, manage customers, view analytics')
-    ]
-
-    for i, (role, permissions) in enumerate(roles_data):
-        roles_table.cell(i, 0).text = role
-        roles_table.cell(i, 1).text = permissions
-
-    doc.add_heading('Row Level Security (RLS)', level=3)
-    doc.add_paragraph(
-        'Database-level security ensures users can only access data they own:'
-    )
-
-    rls_examples = [
-        'Customers can SELECT only their own orders: auth.uid() = customer_id',
-        'Customers can UPDATE only their own profile',
-        'Admins bypass RLS with service role key (server-side only)',
-        'Public tables (blog, portfolio) allow SELECT for all',
-        'INSERT policies validate data before creation',
-        'DELETE operations restricted to admin or soft delete only'
-    ]
-
-    for example in rls_examples:
-        doc.add_paragraph(example, style='List Bullet')
-
-    doc.add_heading('Data Protection', level=2)
-
-    doc.add_heading('Data Encryption', level=3)
-    encryption = [
-        'All data in transit encrypted with TLS 1.3 (HTTPS)',
-        'Database connections encrypted',
-        'Supabase encrypts data at rest',
-        'Sensitive fields (passwords) hashed with bcrypt',
-        'Payment data never stored (handled by Paystack)',
-        'API keys stored in environment variables, never in code'
-    ]
-
-    for item in encryption:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Data Privacy', level=3)
-    privacy = [
-        'GDPR compliance considerations',
-        'Privacy policy clearly stated',
-        'Cookie consent implementation',
-        'User data deletion on request',
-        'Data export capability',
-        'Minimal data collection',
-        'No selling of user data',
-        'Third-party data sharing limited to necessary services'
-    ]
-
-    for item in privacy:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Input Validation', level=3)
-    validation = [
-        'Client-side validation with Zod schema',
-        'Server-side validation in database constraints',
-        'SQL injection prevention via parameterized queries',
-        'XSS protection via React\'s built-in escaping',
-        'CSRF protection with token validation',
-        'File upload validation (type, size)',
-        'Email format validation',
-        'Phone number format validation'
-    ]
-
-    for item in validation:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Payment Security', level=2)
-    doc.add_paragraph(
-        'Payment processing security is critical for customer trust and regulatory compliance.'
-    )
-
-    doc.add_heading('PCI DSS Compliance', level=3)
-    pci_compliance = [
-        'No card data stored on VibeLink servers',
-        'Paystack handles all card data (PCI DSS Level 1 certified)',
-        'Payment form hosted on Paystack domain',
-        'Tokenization of payment methods',
-        'Secure payment gateway connection',
-        'Regular security audits by Paystack'
-    ]
-
-    for item in pci_compliance:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Payment Flow Security', level=3)
-    payment_security = [
-        '1. Customer initiates payment',
-        '2. Frontend calls Paystack API with public key',
-        '3. Paystack popup opens (on Paystack domain)',
-        '4. Customer enters payment details on Paystack',
-        '5. Paystack processes payment',
-        '6. Paystack sends webhook to backend with transaction reference',
-        '7. Backend verifies transaction with Paystack API using secret key',
-        '8. Order status updated only after verification',
-        '9. Customer receives confirmation'
-    ]
-
-    for step in payment_security:
-        doc.add_paragraph(step, style='List Bullet')
-
-    doc.add_heading('API Security', level=3)
-    api_security = [
-        'API keys stored in environment variables',
-        'Supabase RLS policies protect database access',
-        'Rate limiting on API endpoints',
-        'CORS configured to allow only vibelinkgh.com',
-        'API authentication required for sensitive endpoints',
-        'Webhook signature verification',
-        'IP whitelisting for admin API access (optional)'
-    ]
-
-    for item in api_security:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Security Best Practices', level=2)
-    best_practices = [
-        'Regular security audits',
-        'Keep dependencies up to date (npm audit)',
-        'Monitor for security vulnerabilities',
-        'Secure server configuration',
-        'Regular backups',
-        'Incident response plan',
-        'Security training for team',
-        'Logging and monitoring',
-        'Penetration testing (annually)',
-        'Bug bounty program (future consideration)'
-    ]
-
-    for practice in best_practices:
-        doc.add_paragraph(practice, style='List Bullet')
-
-    doc.add_page_break()
-
-def add_maintenance_support(doc):
-    """Add maintenance and support section"""
-    doc.add_heading('MAINTENANCE & SUPPORT', level=1)
-
-    doc.add_heading('Update Procedures', level=2)
-
-    doc.add_heading('Application Updates', level=3)
-    doc.add_paragraph('Process for updating the VibeLink Ghana application:')
-
-    update_steps = [
-        '1. Review update requirements and plan changes',
-        '2. Create feature branch: git checkout -b feature/update-name',
-        '3. Make code changes in development environment',
-        '4. Test changes thoroughly locally',
-        '5. Commit changes: git commit -m "Description"',
-        '6. Push to GitHub: git push origin feature/update-name',
-        '7. Create pull request for review',
-        '8. Merge to main branch after approval',
-        '9. Build production: npm run build',
-        '10. Test production build: npm run preview',
-        '11. Deploy to production server',
-        '12. Monitor for issues post-deployment',
-        '13. Update documentation as needed'
-    ]
-
-    for step in update_steps:
-        doc.add_paragraph(step, style='List Bullet')
-
-    doc.add_heading('Dependency Updates', level=3)
-    dependency_updates = [
-        'Check for updates weekly: npm outdated',
-        'Read changelogs before updating',
-        'Update patch versions: npm update',
-        'Test after each update',
-        'Update minor versions with caution',
-        'Major version updates require thorough testing',
-        'Security updates prioritized',
-        'Lock file committed after updates'
-    ]
-
-    for item in dependency_updates:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Database Updates', level=3)
-    db_update_process = [
-        '1. Plan schema changes carefully',
-        '2. Create migration file: supabase migration new migration_name',
-        '3. Write SQL in migration file',
-        '4. Test in development: supabase db reset',
-        '5. Review for data loss or performance impact',
-        '6. Backup production database',
-        '7. Apply to production during low-traffic period',
-        '8. Verify migration success',
-        '9. Monitor database performance',
-        '10. Rollback if issues occur'
-    ]
-
-    for step in db_update_process:
-        doc.add_paragraph(step, style='List Bullet')
-
-    doc.add_heading('Backup Procedures', level=2)
-
-    doc.add_heading('Automated Backups', level=3)
-    auto_backups = [
-        'Supabase daily database backups (automatic)',
-        'GitHub commits for code versioning',
-        'Weekly database export to external storage',
-        'Monthly full system backup',
-        'Retention: Keep 7 daily, 4 weekly, 12 monthly backups'
-    ]
-
-    for backup in auto_backups:
-        doc.add_paragraph(backup, style='List Bullet')
-
-    doc.add_heading('Manual Backup Process', level=3)
-    manual_backup = '''
-1. Database Backup:
-   - Login to Supabase Dashboard
-   - Navigate to Database > Backups
-   - Click "Create Backup"
-   - Download SQL export
-   - Store in secure location
-
-2. Code Backup:
-   - Ensure all changes committed to Git
-   - git push origin main
-   - Create tagged release: git tag v1.0.0
-   - git push --tags
-
-3. File Storage Backup:
-   - Navigate to Supabase Storage
-   - Download all buckets
-   - Store in external backup location
-
-4. Configuration Backup:
-   - Export .env file (securely)
-   - Document configuration changes
-   - Store in encrypted location
-'''
-
-    p = doc.add_paragraph(manual_backup)
-    p.style = 'No Spacing'
-
-    doc.add_heading('Restore Procedures', level=3)
-    restore_steps = [
-        '1. Identify scope of restoration needed',
-        '2. Retrieve appropriate backup files',
-        '3. For database: Use Supabase restore or SQL import',
-        '4. For code: git checkout <tag> or deploy from backup',
-        '5. For files: Re-upload to Supabase Storage',
-        '6. Verify data integrity after restore',
-        '7. Test critical functionality',
-        '8. Monitor for issues',
-        '9. Document incident and restoration'
-    ]
-
-    for step in restore_steps:
-        doc.add_paragraph(step, style='List Bullet')
-
-    doc.add_heading('Troubleshooting', level=2)
-
-    doc.add_heading('Common Issues and Solutions', level=3)
-
-    # Issues table
-    issues_table = doc.add_table(rows=9, cols=2)
-    issues_table.style = 'Light Grid Accent 1'
-
-    issues_data = [
-        ('Issue', 'Solution'),
-        ('Build fails', 'Check for TypeScript errors, run npm install, clear cache'),
-        ('Page not loading', 'Check browser console, verify API connection, check RLS policies'),
-        ('Payment not processing', 'Verify Paystack credentials, check webhook configuration'),
-        ('Images not displaying', 'Check Supabase Storage permissions, verify file paths'),
-        ('Slow page load', 'Optimize images, check bundle size, enable caching'),
-        ('Database connection error', 'Verify Supabase credentials, check network, check quota'),
-        ('Authentication issues', 'Clear cookies, check session expiry, verify auth configuration'),
-        ('Deploy fails', 'Check server permissions, verify file paths, check disk space')
-    ]
-
-    for i, (issue, solution) in enumerate(issues_data):
-        issues_table.cell(i, 0).text = issue
-        issues_table.cell(i, 1).text = solution
-
-    doc.add_heading('Debugging Process', level=3)
-    debugging = [
-        '1. Reproduce the issue',
-        '2. Check browser console for errors',
-        '3. Check network tab for failed requests',
-        '4. Review server/database logs',
-        '5. Verify configuration settings',
-        '6. Test in isolation',
-        '7. Search for similar issues online',
-        '8. Consult documentation',
-        '9. Ask for help if stuck',
-        '10. Document solution for future reference'
-    ]
-
-    for step in debugging:
-        doc.add_paragraph(step, style='List Bullet')
-
-    doc.add_heading('Log Files', level=3)
-    log_files = [
-        'Browser Console: Frontend errors and warnings',
-        'Network Tab: API requests and responses',
-        'Supabase Logs: Database queries and errors',
-        'Server Logs: Web server access and error logs (/var/log/nginx/)',
-        'Build Logs: Vite build output',
-        'Git Logs: Code change history (git log)'
-    ]
-
-    for log in log_files:
-        doc.add_paragraph(log, style='List Bullet')
-
-    doc.add_heading('Support Channels', level=2)
-
-    support_channels = [
-        ('Technical Documentation', 'This document and inline code comments'),
-        ('GitHub Issues', 'Track bugs and feature requests'),
-        ('Team Communication', 'Slack, email, or team chat'),
-        ('Supabase Documentation', 'https://supabase.com/docs'),
-        ('React Documentation', 'https://react.dev'),
-        ('Community Forums', 'Stack Overflow, Reddit, Discord'),
-        ('Paystack Support', 'https://paystack.com/support'),
-        ('Vendor Support', 'Contact respective service providers')
-    ]
-
-    for channel, description in support_channels:
-        p = doc.add_paragraph()
-        p.add_run(f'{channel}: ').bold = True
-        p.add_run(description)
-
-    doc.add_heading('Maintenance Schedule', level=2)
-
-    maintenance_table = doc.add_table(rows=6, cols=2)
-    maintenance_table.style = 'Medium Grid 1 Accent 1'
-
-    maintenance_data = [
-        ('Frequency', 'Tasks'),
-        ('Daily', 'Monitor error logs, check uptime, respond to support tickets'),
-        ('Weekly', 'Review analytics, check for dependency updates, backup database'),
-        ('Monthly', 'Security audit, performance review, update documentation'),
-        ('Quarterly', 'Test backup restoration, penetration testing, user feedback review'),
-        ('Annually', 'Comprehensive security audit, architecture review, renewal of SSL/domains')
-    ]
-
-    for i, (freq, tasks) in enumerate(maintenance_data):
-        maintenance_table.cell(i, 0).text = freq
-        maintenance_table.cell(i, 1).text = tasks
-
-    doc.add_page_break()
-
-def add_future_enhancements(doc):
-    """Add future enhancements section"""
-    doc.add_heading('FUTURE ENHANCEMENTS', level=1)
-
-    doc.add_heading('Planned Features', level=2)
-
-    doc.add_heading('Short-term (3-6 months)', level=3)
-    short_term = [
-        'Mobile app (React Native) for iOS and Android',
-        'Advanced invitation editor with drag-and-drop',
-        'Video invitations',
-        'Live RSVP dashboard for event organizers',
-        'Guest list CSV import/export',
-        'SMS notifications for events',
-        'Integration with calendar apps (Google Calendar, Outlook)',
-        'Multi-language expansion (Twi, Ga, Ewe)',
-        'Social media auto-posting',
-        'Advanced analytics for admins'
-    ]
-
-    for feature in short_term:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('Medium-term (6-12 months)', level=3)
-    medium_term = [
-        'Event management features (seating charts, gift registries)',
-        'Vendor marketplace (photographers, caterers, decorators)',
-        'E-commerce for event supplies',
-        'Ticketing system for paid events',
-        'Live streaming integration for virtual events',
-        'Photo sharing and album creation',
-        'Guest check-in app with QR codes',
-        'Automated reminder system',
-        'Integration with event planning tools',
-        'White-label solution for event planners'
-    ]
-
-    for feature in medium_term:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('Long-term (12+ months)', level=3)
-    long_term = [
-        'AI-powered design generator',
-        'Voice invitations with AI text-to-speech',
-        'Augmented Reality (AR) invitations',
-        'Blockchain-based digital collectible invitations',
-        'International expansion to other African countries',
-        'Multi-vendor platform',
-        'Franchise model for regional partners',
-        'Corporate event management suite',
-        'Integration with government event registries',
-        'B2B SaaS offering for enterprises'
-    ]
-
-    for feature in long_term:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('Scalability Considerations', level=2)
-
-    doc.add_heading('Performance Optimization', level=3)
-    performance = [
-        'Implement CDN for static assets (Cloudflare, AWS CloudFront)',
-        'Image optimization and lazy loading',
-        'Code splitting for faster initial load',
-        'Caching strategies (Redis, service workers)',
-        'Database query optimization',
-        'API response caching',
-        'Bundle size reduction',
-        'Server-side rendering (SSR) consideration'
-    ]
-
-    for item in performance:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Infrastructure Scaling', level=3)
-    infrastructure = [
-        'Auto-scaling for traffic spikes',
-        'Load balancing across multiple servers',
-        'Database read replicas',
-        'Horizontal scaling of application servers',
-        'Queue system for background jobs (email, notifications)',
-        'Microservices architecture for specific features',
-        'Containerization with Docker',
-        'Kubernetes for orchestration'
-    ]
-
-    for item in infrastructure:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Database Scaling', level=3)
-    database_scaling = [
-        'Database connection pooling',
-        'Query optimization and indexing',
-        'Partitioning large tables',
-        'Archive old data to separate storage',
-        'Consider NoSQL for specific use cases',
-        'Implement caching layer (Redis)',
-        'Database monitoring and performance tuning',
-        'Upgrade to higher Supabase tier or self-hosted PostgreSQL'
-    ]
-
-    for item in database_scaling:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Business Growth Features', level=3)
-    business_features = [
-        'Subscription model for unlimited invitations',
-        'Premium templates marketplace',
-        'Partnership program with event venues',
-        'Affiliate marketing program expansion',
-        'Corporate packages with volume discounts',
-        'API for third-party integrations',
-        'Custom domain for premium customers',
-        'Dedicated account manager for enterprise clients'
-    ]
-
-    for feature in business_features:
-        doc.add_paragraph(feature, style='List Bullet')
-
-    doc.add_heading('Technology Upgrades', level=3)
-    tech_upgrades = [
-        'Migrate to Next.js for SSR/SSG capabilities',
-        'Implement GraphQL for more efficient data fetching',
-        'Add TypeScript strict mode',
-        'Upgrade to latest React version with concurrent features',
-        'Implement micro-frontends for team autonomy',
-        'Add E2E testing with Playwright or Cypress',
-        'CI/CD pipeline automation',
-        'Feature flags for gradual rollouts'
-    ]
-
-    for upgrade in tech_upgrades:
-        doc.add_paragraph(upgrade, style='List Bullet')
-
-    doc.add_page_break()
-
-def add_appendices(doc):
-    """Add appendices section"""
-    doc.add_heading('APPENDICES', level=1)
-
-    # Appendix A: Package Dependencies
-    doc.add_heading('Appendix A: Package Dependencies List', level=2)
-
-    doc.add_heading('Production Dependencies', level=3)
-    prod_deps = [
-        '@dnd-kit/core: 6.3.1 - Drag and drop functionality',
-        '@hookform/resolvers: 3.10.0 - Form validation resolvers',
-        '@radix-ui/react-*: Various - Accessible UI components',
-        '@supabase/supabase-js: 2.89.0 - Supabase client',
-        '@tanstack/react-query: 5.83.0 - Data fetching and state management',
-        '@tiptap/react: 3.14.0 - Rich text editor',
-        'react: 18.3.1 - UI library',
-        'react-dom: 18.3.1 - React DOM renderer',
-        'react-router-dom: 6.30.1 - Client-side routing',
-        'tailwindcss: 3.4.17 - CSS framework',
-        'framer-motion: 12.23.26 - Animation library',
-        'recharts: 2.15.4 - Chart library',
-        'zod: 3.25.76 - Schema validation',
-        'date-fns: 3.6.0 - Date utilities',
-        'lucide-react: 0.462.0 - Icon library'
-    ]
-
-    for dep in prod_deps:
-        doc.add_paragraph(dep, style='List Bullet')
-
-    doc.add_heading('Development Dependencies', level=3)
-    dev_deps = [
-        'typescript: 5.8.3 - TypeScript compiler',
-        'vite: 5.4.19 - Build tool',
-        '@vitejs/plugin-react-swc: 3.11.0 - Vite React plugin',
-        'eslint: 9.32.0 - Code linting',
-        'autoprefixer: 10.4.21 - CSS autoprefixer',
-        'postcss: 8.5.6 - CSS processor',
-        '@types/react: 18.3.23 - React TypeScript definitions',
-        '@types/node: 22.16.5 - Node.js TypeScript definitions'
-    ]
-
-    for dep in dev_deps:
-        doc.add_paragraph(dep, style='List Bullet')
-
-    # Appendix B: File Structure
-    doc.add_heading('Appendix B: File Structure', level=2)
-
-    file_structure = '''
-vibelink/app/
-├── public/                      # Static assets
-│   ├── images/                  # Image files
-│   ├── favicon.ico
-│   └── robots.txt
-├── src/
-│   ├── components/              # React components
-│   │   ├── admin/               # Admin-specific components
-│   │   ├── auth/                # Authentication components
-│   │   ├── customer/            # Customer portal components
-│   │   ├── layout/              # Layout components (Header, Footer)
-│   │   ├── order-form/          # Order form components
-│   │   ├── payment/             # Payment components
-│   │   ├── ui/                  # Base UI components (shadcn-ui)
-│   │   ├── ChatWidget.tsx       # AI chatbot widget
-│   │   ├── FloatingWhatsApp.tsx # WhatsApp button
-│   │   └── SEO.tsx              # SEO component
-│   ├── pages/                   # Page components (32 pages)
-│   │   ├── Index.tsx            # Homepage
-│   │   ├── About.tsx
-│   │   ├── Services.tsx
-│   │   ├── GetStarted.tsx       # Order form
-│   │   ├── Admin.tsx            # Admin dashboard
-│   │   └── ...
-│   ├── integrations/
-│   │   └── supabase/
-│   │       ├── client.ts        # Supabase client
-│   │       └── types.ts         # Database type definitions
-│   ├── hooks/                   # Custom React hooks
-│   ├── data/                    # Static data
-│   ├── lib/                     # Utility functions
-│   ├── assets/                  # Images, fonts
-│   ├── App.tsx                  # Main app component
-│   ├── main.tsx                 # Entry point
-│   └── index.css                # Global styles
-├── supabase/
-│   └── migrations/              # 46 database migration files
-├── dist/                        # Production build output
-├── package.json                 # Dependencies
-├── tsconfig.json                # TypeScript config
-├── tailwind.config.ts           # Tailwind config
-├── vite.config.ts               # Vite config
-├── .env                         # Environment variables
-└── README.md                    # Project documentation
-'''
-
-    p = doc.add_paragraph(file_structure)
-    p.style = 'No Spacing'
-
-    # Appendix C: Environment Variables
-    doc.add_heading('Appendix C: Environment Variables', level=2)
-
-    env_vars = [
-        ('VITE_SUPABASE_URL', 'Supabase project URL', 'Required', 'Public'),
-        ('VITE_SUPABASE_PUBLISHABLE_KEY', 'Supabase anon/public key', 'Required', 'Public'),
-        ('VITE_SUPABASE_PROJECT_ID', 'Supabase project ID', 'Required', 'Public'),
-        ('PAYSTACK_PUBLIC_KEY', 'Paystack public key', 'Required', 'Public'),
-        ('PAYSTACK_SECRET_KEY', 'Paystack secret key', 'Required', 'Secret - Server only'),
-        ('GEMINI_API_KEY', 'Google Gemini AI key', 'Required', 'Secret - Server only'),
-        ('WHATSAPP_API_KEY', 'WhatsApp Business API key', 'Optional', 'Secret - Server only'),
-        ('SMTP_HOST', 'Email SMTP host', 'Optional', 'Server only'),
-        ('SMTP_USER', 'Email SMTP username', 'Optional', 'Server only'),
-        ('SMTP_PASS', 'Email SMTP password', 'Optional', 'Secret - Server only')
-    ]
-
-    env_table = doc.add_table(rows=len(env_vars) + 1, cols=4)
-    env_table.style = 'Light Grid Accent 1'
-    env_table.cell(0, 0).text = 'Variable Name'
-    env_table.cell(0, 1).text = 'Description'
-    env_table.cell(0, 2).text = 'Required'
-    env_table.cell(0, 3).text = 'Visibility'
-
-    for i, (var, desc, req, vis) in enumerate(env_vars, 1):
-        env_table.cell(i, 0).text = var
-        env_table.cell(i, 1).text = desc
-        env_table.cell(i, 2).text = req
-        env_table.cell(i, 3).text = vis
-
-    # Appendix D: Deployment Checklist
-    doc.add_heading('Appendix D: Deployment Checklist', level=2)
-
-    doc.add_heading('Pre-Deployment', level=3)
-    pre_deploy = [
-        '☐ All features tested in development',
-        '☐ Code reviewed and approved',
-        '☐ TypeScript compilation successful (no errors)',
-        '☐ All environment variables configured',
-        '☐ Database migrations tested',
-        '☐ Security audit completed',
-        '☐ Performance optimization done',
-        '☐ SEO meta tags updated',
-        '☐ Backup current production',
-        '☐ Notify stakeholders of deployment'
-    ]
-
-    for item in pre_deploy:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('During Deployment', level=3)
-    during_deploy = [
-        '☐ Run production build: npm run build',
-        '☐ Test build locally: npm run preview',
-        '☐ Upload dist/ to server',
-        '☐ Apply database migrations if any',
-        '☐ Update environment variables on server',
-        '☐ Clear server cache',
-        '☐ Restart web server if needed',
-        '☐ Verify SSL certificate valid'
-    ]
-
-    for item in during_deploy:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading('Post-Deployment', level=3)
-    post_deploy = [
-        '☐ Verify website loads (https://vibelinkgh.com)',
-        '☐ Test user registration and login',
-        '☐ Place test order',
-        '☐ Test payment flow',
-        '☐ Verify email notifications sent',
-        '☐ Check admin dashboard accessible',
-        '☐ Test mobile responsiveness',
-        '☐ Monitor error logs for 1 hour',
-        '☐ Check analytics tracking',
-        '☐ Update documentation',
-        '☐ Notify team of successful deployment'
-    ]
-
-    for item in post_deploy:
-        doc.add_paragraph(item, style='List Bullet')
-
-    # Appendix E: Glossary
-    doc.add_heading('Appendix E: Glossary', level=2)
-
-    glossary = [
-        ('API', 'Application Programming Interface - Set of protocols for software communication'),
-        ('CDN', 'Content Delivery Network - Distributed server network for fast content delivery'),
-        ('CI/CD', 'Continuous Integration/Continuous Deployment - Automated software delivery'),
-        ('CRUD', 'Create, Read, Update, Delete - Basic database operations'),
-        ('DNS', 'Domain Name System - Translates domain names to IP addresses'),
-        ('HMR', 'Hot Module Replacement - Live code updates without full page reload'),
-        ('JWT', 'JSON Web Token - Secure token-based authentication'),
-        ('ORM', 'Object-Relational Mapping - Database abstraction layer'),
-        ('PWA', 'Progressive Web App - Web app with native-like features'),
-        ('RLS', 'Row Level Security - Database-level access control'),
-        ('RSVP', 'Répondez s\'il vous plaît - Please respond (invitation response)'),
-        ('SaaS', 'Software as a Service - Cloud-based software delivery'),
-        ('SEO', 'Search Engine Optimization - Improving search visibility'),
-        ('SPA', 'Single Page Application - Web app that loads once and updates dynamically'),
-        ('SQL', 'Structured Query Language - Database query language'),
-        ('SSL/TLS', 'Secure Sockets Layer/Transport Layer Security - Encryption protocols'),
-        ('UI/UX', 'User Interface/User Experience - Design and usability'),
-        ('Webhook', 'HTTP callback - Automated message from one system to another')
-    ]
-
-    for term, definition in glossary:
-        p = doc.add_paragraph()
-        p.add_run(f'{term}: ').bold = True
-        p.add_run(definition)
-
-    doc.add_paragraph('\n\n')
-    doc.add_paragraph('--- End of Document ---').alignment = WD_ALIGN_PARAGRAPH.CENTER
+import argparse
+import io
+import os
+import sys
+import threading
+import time
+
+# python-docx (and lxml behind it) is imported on first use by _load_docx(),
+# and asyncio by the functions that gather, so metadata-only commands such
+# as --list-sections and --check start fast.
+# Section modules are likewise imported only when their section is rendered.
+Document = Inches = Pt = RGBColor = parse_xml = qn = None
+
+from sections import STUBS, all_sections, load
+from sources import CACHE_DIR, COLLECTORS, REPO_ROOT, dependency_order, dependents
+
+def _load_docx():
+    """Import python-docx into module globals (no-op after the first call)"""
+    global Document, Inches, Pt, RGBColor, parse_xml, qn
+    if Document is not None:
+        return
+    from docx import Document
+    from docx.shared import Inches, Pt, RGBColor
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import qn
 
 def setup_styles(doc):
-    """Setup document styles"""
+    """Setup document styles, taking fonts and the heading colour from the site's design tokens"""
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.enum.text import WD_TAB_ALIGNMENT, WD_TAB_LEADER
+    from sections.toc import TOC_STYLES
+    from sections.xref import LINK_STYLE
+    from sources.design_tokens import document_theme, load_design_tokens
+
+    theme = document_theme(load_design_tokens())
+    heading_color = theme['heading_color']
     # Create styles for consistent formatting
     styles = doc.styles
 
     # Normal style modifications
     style = styles['Normal']
     font = style.font
-    font.name = 'Calibri'
+    font.name = theme['body_font'] or 'Calibri'
     font.size = Pt(11)
 
     # Heading styles
     for i in range(1, 4):
         heading_style = styles[f'Heading {i}']
-        heading_style.font.name = 'Cambria'
-        heading_style.font.color.rgb = RGBColor(26, 35, 126)  # Navy blue
-
-def main():
-    """Main function to create the document"""
-    print("Creating VibeLink Ghana Technical Documentation...")
-
-    # Create new document
+        heading_style.font.name = theme['heading_font'] or 'Cambria'
+        if heading_color:
+            heading_style.font.color.rgb = RGBColor.from_string(heading_color[1:])
+        else:
+            heading_style.font.color.rgb = RGBColor(26, 35, 126)  # Navy blue
+
+    # TOC entry styles (latent in the default template), indented per level
+    # with a dotted leader to the right-aligned page number
+    for i, name in enumerate(TOC_STYLES):
+        toc_style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        toc_style.base_style = styles['Normal']
+        toc_style.paragraph_format.left_indent = Inches(0.25 * i)
+        toc_style.paragraph_format.space_after = Pt(4)
+        toc_style.paragraph_format.tab_stops.add_tab_stop(Inches(6.5), WD_TAB_ALIGNMENT.RIGHT,
+                                                          WD_TAB_LEADER.DOTS)
+
+    # Cross-references in the text (see sections/xref.py)
+    link_style = styles.add_style(LINK_STYLE, WD_STYLE_TYPE.CHARACTER)
+    link_style.font.color.rgb = RGBColor(0x05, 0x63, 0xC1)
+    link_style.font.underline = True
+
+# python-docx rescans the body for w:sectPr on every add_paragraph, so the
+# legacy path is quadratic; past this many items it is timed on a prefix only.
+LEGACY_BENCH_LIMIT = 10_000
+
+def benchmark_list_emitter(count):
+    """Compare add_bullets against per-item doc.add_paragraph for `count` items"""
+    _load_docx()
+    from lxml import etree
+    from sections.common import add_bullets
+
+    items = [f'Bullet item {i} with <markup> & "quotes"' for i in range(count)]
+    legacy_items = items[:LEGACY_BENCH_LIMIT]
+
+    legacy_doc = Document()
+    start = time.perf_counter()
+    for item in legacy_items:
+        legacy_doc.add_paragraph(item, style='List Bullet')
+    legacy_time = time.perf_counter() - start
+
+    fast_doc = Document()
+    start = time.perf_counter()
+    add_bullets(fast_doc, items)
+    fast_time = time.perf_counter() - start
+
+    check_doc = Document()
+    add_bullets(check_doc, legacy_items)
+    identical = etree.tostring(legacy_doc.element.body) == etree.tostring(check_doc.element.body)
+
+    print(f"List items:        {count:,}")
+    print(f"add_bullets:       {fast_time:.3f}s ({count / fast_time:,.0f} items/s)")
+    print(f"doc.add_paragraph: {legacy_time:.3f}s for {len(legacy_items):,} items "
+          f"({len(legacy_items) / legacy_time:,.0f} items/s)")
+    if len(legacy_items) == count:
+        print(f"Speedup:           {legacy_time / fast_time:.1f}x")
+    else:
+        print(f"Speedup:           >{legacy_time / fast_time:.1f}x "
+              f"(legacy path stopped at {LEGACY_BENCH_LIMIT:,} items)")
+    print(f"Identical XML:     {'yes' if identical else 'NO'}")
+    return identical
+
+SECTIONS = all_sections()
+
+# Seconds a section may wait for its data before it falls back to its
+# last-good cached rendering (see --budget)
+DEFAULT_BUDGET = 60.0
+
+# Stand-in for the result of a collector that did not finish within budget
+STALLED = type('Stalled', (), {'__repr__': lambda self: 'STALLED'})()
+
+
+class CollectorError(Exception):
+    """Stand-in for the result of a collector that raised, like STALLED for one that timed out"""
+
+    def __init__(self, name, error):
+        self.name = name
+        self.error = error
+        super().__init__(f'{name}: {type(error).__name__}: {error}')
+
+OUTPUT_FORMATS = ('docx', 'pdf')
+DEFAULT_OUTPUT = os.path.join(REPO_ROOT, 'docs', 'VibeLink_Technical_Documentation.docx')
+
+def new_document():
+    """Create a document from the default template with our styles and margins"""
+    _load_docx()
     doc = Document()
-
-    # Setup styles
     setup_styles(doc)
 
     # Configure page setup
-    sections = doc.sections
-    for section in sections:
+    for section in doc.sections:
         section.top_margin = Inches(1)
         section.bottom_margin = Inches(1)
         section.left_margin = Inches(1)
         section.right_margin = Inches(1)
+    return doc
+
+def select_sections(only=None, skip=None):
+    """Resolve --only/--skip into (keys to render, keys to render as stubs)
+
+    A full build returns every key and no stubs. A partial build renders the
+    requested sections plus the cover and TOC as stubs, unless they were
+    requested explicitly (rendered in full) or skipped.
+    """
+    all_keys = [section.key for section in SECTIONS]
+    if not only and not skip:
+        return all_keys, set()
+    only = set(only or all_keys)
+    skip = set(skip or ())
+    keys = [key for key in all_keys if key in only and key not in skip]
+    stubs = {key for key in STUBS if key not in only and key not in skip}
+    return keys, stubs
+
+def _titles(keys):
+    """Display titles of the full sections in keys, for the stubs"""
+    return [section.label[0].upper() + section.label[1:] for section in SECTIONS
+            if (keys is None or section.key in keys) and section.key not in STUBS]
+
+def _in_daemon_thread(func, **kwargs):
+    """Run func in a daemon thread and return a future for its result
+
+    Unlike the default executor, a collector that never returns here cannot
+    keep asyncio.run() or the interpreter from exiting once the build has
+    moved on without it.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result, exc):
+        if future.done():
+            return
+        if exc is None:
+            future.set_result(result)
+        else:
+            future.set_exception(exc)
+
+    def run():
+        try:
+            result, exc = func(**kwargs), None
+        except Exception as e:
+            result, exc = None, e
+        try:
+            loop.call_soon_threadsafe(settle, result, exc)
+        except RuntimeError:
+            pass  # the event loop is gone: the build already finished without us
+
+    threading.Thread(target=run, name=f'collector-{func.__name__}', daemon=True).start()
+    return future
+
+async def _run_collector(name, deps, timings):
+    """Run one collector in its own thread once its needs are ready,
+    recording (duration, finish time)"""
+    kwargs = {dep: await future for dep, future in deps.items()}
+    start = time.perf_counter()
+    try:
+        result = await _in_daemon_thread(COLLECTORS[name].func, **kwargs)
+    except Exception as e:
+        raise CollectorError(name, e) from e
+    timings[name] = (time.perf_counter() - start, time.perf_counter())
+    return result
+
+async def _gather(names, timings, known=None):
+    """Schedule the named collectors and everything they need; returns {name: future}
+
+    Each collector runs at most once and starts as soon as its own needs are
+    ready. Results already in known are reused instead of re-collected.
+    """
+    import asyncio
+
+    known = known or {}
+    loop = asyncio.get_running_loop()
+    futures = {}
+    for name in dependency_order(names):
+        if name in known:
+            futures[name] = loop.create_future()
+            if known[name] is STALLED:
+                futures[name].set_exception(asyncio.TimeoutError(name))
+            elif isinstance(known[name], CollectorError):
+                futures[name].set_exception(known[name])
+            else:
+                futures[name].set_result(known[name])
+        else:
+            deps = {dep: futures[dep] for dep in COLLECTORS[name].needs}
+            futures[name] = asyncio.ensure_future(_run_collector(name, deps, timings))
+    return futures
+
+def gather_data(names, verbose=False, known=None, budget=None):
+    """Run the named collectors (and their needs) concurrently and return all results
+
+    Collectors still running after budget seconds are left behind and map
+    to STALLED, and collectors that raised (or needed one that did) map to
+    their CollectorError; sections that need them fall back to their cached
+    output.
+    """
+    import asyncio
+
+    async def run():
+        timings = {}
+        start = time.perf_counter()
+        tasks = await _gather(names, timings, known)
+        await asyncio.wait(tasks.values(), timeout=budget)
+        results = {}
+        for name, task in tasks.items():
+            if not task.done() or isinstance(task.exception(), asyncio.TimeoutError):
+                results[name] = STALLED
+            elif isinstance(task.exception(), CollectorError):
+                results[name] = task.exception()
+            else:
+                results[name] = task.result()
+        if verbose:
+            _report_gather(timings, start, [name for name in tasks if results[name] is STALLED])
+            _report_failures(results.values())
+        return results
+    return asyncio.run(run())
+
+def _report_gather(timings, start, stalled=()):
+    """Print total gather time against the slowest collector"""
+    if timings:
+        elapsed = max(finished for _, finished in timings.values()) - start
+        slowest = max(timings, key=lambda name: timings[name][0])
+        print(f"Gathered {len(timings)} data sources in {elapsed:.2f}s "
+              f"(slowest: {slowest} {timings[slowest][0]:.2f}s, "
+              f"sum of all: {sum(duration for duration, _ in timings.values()):.2f}s)")
+    if stalled:
+        print(f"Still running when the budget ran out: {', '.join(sorted(stalled))}")
+
+def _report_failures(results):
+    """Print the collectors that raised, once each (dependents carry the same error)"""
+    for error in dict.fromkeys(value for value in results if isinstance(value, CollectorError)):
+        print(f"Collector failed: {error}")
+
+def _report_fallbacks(fallbacks):
+    """Print the sections that were replaced by cached output, and why"""
+    for key, (stale_as_of, reason) in fallbacks.items():
+        print(f"Section {key}: data {reason}; "
+              + (f"used cached output from {stale_as_of}" if stale_as_of else 'no cached output, left a placeholder'))
+
+def fallback_reason(error, budget):
+    """Why a section's data is missing, as shown in its stale note: error is
+    the CollectorError or asyncio.TimeoutError its inputs raised"""
+    if isinstance(error, CollectorError):
+        return f'could not be collected ({error})'
+    return f'was not ready within {budget:g}s'
+
+def section_budget(budgets, key):
+    """Seconds section key may wait for its data (budgets as parsed from --budget)"""
+    budgets = budgets or {}
+    return budgets.get(key, budgets.get(None, DEFAULT_BUDGET))
+
+def gather_budget(budgets, sections):
+    """Budget for gathering the data of sections up front: the longest any of them may wait"""
+    return max((section_budget(budgets, section.key) for section in sections if section.needs),
+               default=None)
+
+async def _render_sections(doc, keys, stubs, cover, verbose, data, budgets, update_cache):
+    """Collect every input concurrently; render each section as soon as its inputs are ready"""
+    import asyncio
+
+    selected = [section for section in SECTIONS if keys is None or section.key in keys]
+    needed = {name for section in selected for name in section.needs}
+    timings = {}
+    start = time.perf_counter()
+    tasks = await _gather(needed, timings, data)
+    titles = _titles(keys)
+    fragments = {}
+    index = {}
+    fallbacks = {}
+
+    async def render(section):
+        inputs = {}
+        if section.needs:
+            # shield: a timed-out section must not cancel data other sections share
+            pending = asyncio.gather(*(asyncio.shield(tasks[name]) for name in section.needs))
+            remaining = section_budget(budgets, section.key) - (time.perf_counter() - start)
+            try:
+                inputs = dict(zip(section.needs, await asyncio.wait_for(pending, max(remaining, 0))))
+            except (asyncio.TimeoutError, CollectorError) as e:
+                reason = fallback_reason(e, section_budget(budgets, section.key))
+                fragments[section.key], stale_as_of = fallback_fragment(doc, section, reason)
+                fallbacks[section.key] = (stale_as_of, reason)
+                index[section.key] = index_section(section.key, fragments[section.key])
+                return
+        if verbose:
+            print(f"Adding {section.label}...")
+        kwargs = dict(inputs)
+        if section.key == 'cover' and cover:
+            kwargs.update(cover)
+        fragments[section.key] = render_fragment(doc, section.render, **kwargs)
+        index[section.key] = index_section(section.key, fragments[section.key])
+        if update_cache and section.needs:
+            save_cached_fragment(section.key, fragments[section.key])
+
+    async def render_stub(key):
+        fragments[key] = render_fragment(doc, load(STUBS[key]), titles)
+
+    await asyncio.gather(*[render_stub(section.key) for section in SECTIONS if section.key in stubs],
+                         *[render(section) for section in selected])
+    if verbose:
+        _report_gather(timings, start, [name for name, task in tasks.items() if not task.done()])
+    _report_fallbacks(fallbacks)
+    return link_fragments(doc, fragments, index, strict=len(selected) == len(SECTIONS) and not fallbacks)
+
+def build_document(doc, keys=None, cover=None, verbose=True, stubs=(), data=None,
+                   budgets=None, update_cache=True):
+    """Render the selected sections (all by default) into doc
+
+    Collectors run concurrently in threads while sections without inputs
+    render; doc doubles as the scratch document for each section's fragment,
+    and the fragments are put back in document order at the end. A section
+    whose data is not ready within its budget is replaced by its last-good
+    cached rendering, marked stale. Headings are bookmarked and indexed as
+    each section renders; the cross-references are then linked and the TOC
+    filled from that index (see link_fragments).
+    """
+    import asyncio
+
+    fragments = asyncio.run(_render_sections(doc, keys, stubs, cover, verbose, data or {},
+                                             budgets, update_cache))
+    sect_pr = doc.element.body.find(qn('w:sectPr'))
+    for fragment in fragments:
+        _attach_images(doc, fragment)
+        for el in fragment:
+            sect_pr.addprevious(el)
+    return doc
+
+def convert_to_pdf(docx_path, pdf_path):
+    """Convert a saved .docx to PDF with a headless LibreOffice"""
+    import shutil
+    import subprocess
+    import tempfile
+
+    soffice = shutil.which('soffice') or shutil.which('libreoffice')
+    if soffice is None:
+        raise RuntimeError('PDF output needs LibreOffice (soffice) on PATH')
+    with tempfile.TemporaryDirectory() as outdir:
+        subprocess.run([soffice, '--headless', '--convert-to', 'pdf', '--outdir', outdir, docx_path],
+                       check=True, capture_output=True)
+        converted = os.path.join(outdir, os.path.splitext(os.path.basename(docx_path))[0] + '.pdf')
+        shutil.move(converted, pdf_path)
+
+def save_document(doc, output_path, fmt='docx'):
+    """Save doc as output_path in the given format"""
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    if fmt == 'docx':
+        doc.save(output_path)
+        return
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as workdir:
+        docx_path = os.path.join(workdir, os.path.splitext(os.path.basename(output_path))[0] + '.docx')
+        doc.save(docx_path)
+        convert_to_pdf(docx_path, output_path)
+
+# Image bytes referenced by rendered fragments, by sha1
+_IMAGE_BLOBS = {}
+_IMAGE_TOKEN = 'sha1:'
+
+def _blips(elements):
+    """Every picture reference (a:blip) in elements"""
+    return [blip for el in elements for blip in el.iter(qn('a:blip'))]
+
+def render_fragment(scratch, add_section, *args, **kwargs):
+    """Render one section into the empty scratch document and detach its body elements
+
+    Pictures are relationships of the document they were added to, so their
+    references are swapped for content hashes that _attach_images() resolves
+    against whichever document the fragment finally lands in.
+    """
+    import hashlib
+
+    body = scratch.element.body
+    add_section(scratch, *args, **kwargs)
+    fragment = [el for el in body if el.tag != qn('w:sectPr')]
+    for el in fragment:
+        body.remove(el)
+    for blip in _blips(fragment):
+        rid = blip.get(qn('r:embed'))
+        if rid and not rid.startswith(_IMAGE_TOKEN):
+            blob = scratch.part.related_parts[rid].blob
+            digest = hashlib.sha1(blob).hexdigest()
+            _IMAGE_BLOBS[digest] = blob
+            blip.set(qn('r:embed'), _IMAGE_TOKEN + digest)
+    return fragment
+
+def _attach_images(doc, elements):
+    """Point the picture references in elements at image parts of doc"""
+    for blip in _blips(elements):
+        token = blip.get(qn('r:embed'))
+        if token and token.startswith(_IMAGE_TOKEN):
+            rid, _ = doc.part.get_or_add_image(io.BytesIO(_IMAGE_BLOBS[token[len(_IMAGE_TOKEN):]]))
+            blip.set(qn('r:embed'), rid)
+
+# Bookmark ids reserved for each section, by its position
+BOOKMARKS_PER_SECTION = 10_000
+
+def index_section(key, fragment):
+    """First cross-reference pass over section key's fragment (see sections/xref.py)"""
+    from sections.appendices import GLOSSARY
+    from sections.xref import index_fragment
+
+    position = next(i for i, section in enumerate(SECTIONS) if section.key == key)
+    return index_fragment(fragment, key, (position + 1) * BOOKMARKS_PER_SECTION,
+                          [term for term, _ in GLOSSARY])
+
+def link_fragments(doc, fragments, index, strict=False):
+    """The fragments in document order, cross-references linked and the TOC filled in
+
+    fragments and index map section keys to fragments and their index_section
+    records; references are linked in place, touching only the paragraphs
+    the index lists. The cover and TOC are neither linked nor listed. An
+    unresolved reference raises UnresolvedReferenceError when strict (every
+    section rendered in full) and stays plain text otherwise, as it may
+    point at a section the build leaves out.
+    """
+    from sections.toc import fill_table_of_contents
+    from sections.xref import UnresolvedReferenceError, resolve_references
+
+    order = [section.key for section in SECTIONS if section.key in fragments]
+    listed = [(key, fragments[key], index[key]) for key in order if key in index and key not in STUBS]
+    unresolved = resolve_references(listed)
+    if unresolved and strict:
+        raise UnresolvedReferenceError(unresolved)
+    entries = [entry for _, _, record in listed for entry in record['headings']]
+    return [fill_table_of_contents(doc, fragments[key], entries) if key == 'toc' else fragments[key]
+            for key in order]
+
+def _fragment_cache_path(key):
+    """Where the last-good rendering of section key is kept"""
+    return os.path.join(CACHE_DIR, 'sections', f'{key}.xml')
+
+def _image_cache_path(digest):
+    """Where an image used by a cached fragment is kept"""
+    return os.path.join(CACHE_DIR, 'sections', 'images', digest)
+
+def _write_atomic(path, chunks):
+    """Write chunks of bytes to path, replacing it only once complete"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp, path)
+
+def save_cached_fragment(key, fragment):
+    """Store a successfully rendered fragment as the section's last-good output"""
+    from lxml import etree
+    from sections.common import W_NS
+
+    for blip in _blips(fragment):
+        digest = blip.get(qn('r:embed'))[len(_IMAGE_TOKEN):]
+        if not os.path.exists(_image_cache_path(digest)):
+            _write_atomic(_image_cache_path(digest), [_IMAGE_BLOBS[digest]])
+    _write_atomic(_fragment_cache_path(key),
+                  [f'<w:body xmlns:w="{W_NS}">'.encode(),
+                   *(etree.tostring(el) for el in fragment),
+                   b'</w:body>'])
+
+def load_cached_fragment(key):
+    """The last-good fragment for section key and when it was rendered, or (None, None)"""
+    path = _fragment_cache_path(key)
+    try:
+        with open(path, 'rb') as f:
+            fragment = list(parse_xml(f.read()))
+        for blip in _blips(fragment):
+            digest = blip.get(qn('r:embed'))[len(_IMAGE_TOKEN):]
+            if digest not in _IMAGE_BLOBS:
+                with open(_image_cache_path(digest), 'rb') as f:
+                    _IMAGE_BLOBS[digest] = f.read()
+        rendered = datetime.fromtimestamp(os.path.getmtime(path))
+    except (OSError, ValueError):
+        return None, None
+    return fragment, rendered.strftime('%Y-%m-%d %H:%M')
+
+def add_stale_note(doc, label, reason, stale_as_of):
+    """Add the notice shown in place of, or above, a section whose data is missing
+    (reason as from fallback_reason)"""
+    note = doc.add_paragraph()
+    if stale_as_of:
+        run = note.add_run(f'Stale as of {stale_as_of}: the {label} data {reason}, '
+                           f'so the last successful version of this section is shown.')
+    else:
+        run = note.add_run(f'The {label} section was not generated: its data {reason} '
+                           f'and no earlier version is cached.')
+    run.italic = True
+    run.font.color.rgb = RGBColor(0xC0, 0x00, 0x00)
+
+def add_section_placeholder(doc, label, reason):
+    """Add a titled placeholder for a section whose data is missing with nothing cached"""
+    doc.add_heading(label.upper(), level=1)
+    add_stale_note(doc, label, reason, None)
+    doc.add_page_break()
 
-    # Add all sections
-    print("Adding cover page...")
-    add_cover_page(doc)
-
-    print("Adding table of contents...")
-    add_table_of_contents(doc)
-
-    print("Adding executive summary...")
-    add_executive_summary(doc)
-
-    print("Adding project overview...")
-    add_project_overview(doc)
-
-    print("Adding technical architecture...")
-    add_technical_architecture(doc)
-
-    print("Adding development workflow...")
-    add_development_workflow(doc)
-
-    print("Adding features and specifications...")
-    add_features_specifications(doc)
-
-    print("Adding user interface...")
-    add_user_interface(doc)
-
-    print("Adding database schema...")
-    add_database_schema(doc)
-
-    print("Adding API and integrations...")
-    add_api_integrations(doc)
-
-    print("Adding deployment and infrastructure...")
-    add_deployment_infrastructure(doc)
-
-    print("Adding security...")
-    add_security(doc)
-
-    print("Adding maintenance and support...")
-    add_maintenance_support(doc)
-
-    print("Adding future enhancements...")
-    add_future_enhancements(doc)
+def fallback_fragment(doc, section, reason):
+    """Fragment standing in for a section whose data is missing; returns (fragment, stale as of)"""
+    cached, stale_as_of = load_cached_fragment(section.key)
+    if cached is None:
+        return render_fragment(doc, add_section_placeholder, section.label, reason), None
+    # Keep the section heading first so the stale note sits under it
+    note = render_fragment(doc, add_stale_note, section.label, reason, stale_as_of)
+    return cached[:1] + note + cached[1:], stale_as_of
+
+def assemble_document(fragments, index, strict=False):
+    """Build a fresh document from rendered fragments (copied, so they can be reused)
+
+    fragments and index map section keys to fragments and their index
+    records; the copies are linked (see link_fragments), the originals are
+    left as they are.
+    """
+    import copy
+
+    doc = new_document()
+    sect_pr = doc.element.body.find(qn('w:sectPr'))
+    copies = {key: [copy.deepcopy(el) for el in fragment] for key, fragment in fragments.items()}
+    for fragment in link_fragments(doc, copies, index, strict):
+        _attach_images(doc, fragment)
+        for el in fragment:
+            sect_pr.addprevious(el)
+    return doc
+
+def _load_variants(path):
+    """Read and validate a batch variants file (JSON list of objects)"""
+    import inspect
+    import json
+
+    with open(path, encoding='utf-8') as f:
+        try:
+            variants = json.load(f)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f'{path}: {exc}') from exc
+    if not isinstance(variants, list):
+        raise ValueError(f'{path}: expected a JSON list of variants')
+    known = {section.key for section in SECTIONS}
+    for i, variant in enumerate(variants):
+        if 'output' not in variant:
+            raise ValueError(f'{path}: variant {i} has no "output"')
+        unknown = set(variant.get('sections', ())) - known
+        if unknown:
+            raise ValueError(f'{path}: variant {i} has unknown sections: {", ".join(sorted(unknown))}')
+        cover = variant.get('cover')
+        if cover is not None:
+            if not isinstance(cover, dict):
+                raise ValueError(f'{path}: variant {i} has a "cover" that is not an object')
+            cover_page = next(section for section in SECTIONS if section.key == 'cover').render
+            params = set(inspect.signature(cover_page).parameters) - {'doc'}
+            unknown = set(cover) - params
+            if unknown:
+                raise ValueError(f'{path}: variant {i} has unknown cover parameters: '
+                                 f'{", ".join(sorted(unknown))} (expected {", ".join(sorted(params))})')
+    return variants
+
+def _render_variant(doc, variant, data, budgets=None):
+    """Render one variant into doc (a private copy) and save it
+
+    A variant with cover parameters gets its full cover even when its
+    sections leave the cover out, so the parameters are never dropped.
+    """
+    sections = variant.get('sections')
+    keys = set(sections) if sections else None
+    if keys is not None and variant.get('cover'):
+        keys.add('cover')
+    build_document(doc, keys=keys,
+                   cover=variant.get('cover'), verbose=False, data=data,
+                   budgets=budgets, update_cache=False)
+    save_document(doc, variant['output'])
+
+def _fork_worker(doc, variant, data, budgets):
+    """Child entry point: doc and data are the parent's, shared copy-on-write"""
+    _render_variant(doc, variant, data, budgets)
+
+def run_batch(variants_path, jobs=None, budgets=None):
+    """Generate every variant in variants_path from a single primed template
+
+    The parent imports python-docx, loads the default template, applies
+    setup_styles and gathers collector data exactly once, then acts as a
+    fork server: each variant runs
+    in a forked child that inherits the primed document copy-on-write, so its
+    startup cost is a fork. Without fork (Windows) the primed template is
+    serialized once and reloaded from memory for each variant in-process.
+    """
+    import multiprocessing
+    import multiprocessing.connection
+
+    variants = _load_variants(variants_path)
+    jobs = jobs or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    base = new_document()
+    used = [section for section in SECTIONS
+            if any(not variant.get('sections') or section.key in variant['sections']
+                   for variant in variants)]
+    for section in used:
+        section.render  # import section modules once, before forking
+    data = gather_data({name for section in used for name in section.needs},
+                       budget=gather_budget(budgets, used))
+    stalled = [name for name, value in data.items() if value is STALLED]
+    if stalled:
+        print(f"Still running when the budget ran out: {', '.join(sorted(stalled))}; "
+              "sections needing them use cached output")
+    _report_failures(data.values())
+    prime_time = time.perf_counter() - start
+    print(f"Primed template in {prime_time * 1000:.0f}ms; rendering {len(variants)} variants...")
+
+    failures = []
+    start = time.perf_counter()
+    if 'fork' in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context('fork')
+        running = {}
+        pending = list(enumerate(variants))
+        while pending or running:
+            while pending and len(running) < jobs:
+                i, variant = pending.pop(0)
+                proc = ctx.Process(target=_fork_worker, args=(base, variant, data, budgets))
+                proc.start()
+                running[proc.sentinel] = (proc, variant)
+            for sentinel in multiprocessing.connection.wait(list(running)):
+                proc, variant = running.pop(sentinel)
+                proc.join()
+                if proc.exitcode != 0:
+                    failures.append(variant['output'])
+    else:
+        template = io.BytesIO()
+        base.save(template)
+        for variant in variants:
+            template.seek(0)
+            try:
+                _render_variant(Document(template), variant, data, budgets)
+            except Exception as exc:
+                print(f"Failed {variant['output']}: {exc}")
+                failures.append(variant['output'])
+    elapsed = time.perf_counter() - start
+
+    done = len(variants) - len(failures)
+    print(f"Generated {done}/{len(variants)} documents in {elapsed:.2f}s "
+          f"({done / elapsed if elapsed else 0:.1f} docs/s, {jobs} workers)")
+    for output in failures:
+        print(f"  FAILED: {output}")
+    return 1 if failures else 0
+
+# Documents --merge can personalize. The skeleton is the named section of the
+# source (or, without a heading, the text before its first heading starting
+# at `start`); each (text, field) pair turns that text into a {{field}}
+# placeholder that falls back to the original text. The source may also
+# contain {{field}} placeholders of its own, which every recipient must fill.
+MERGE_TEMPLATES = {
+    'proposal': {
+        'source': 'Church Partnership Proposal.docx',
+        'heading': 'Church Partnership Proposal',
+        'fields': [('Pastor / Church Leadership', 'salutation'), ('your church', 'church')],
+    },
+    'pitch': {
+        'source': 'WhatsApp Pitches.docx',
+        'heading': None,
+        'start': 'Good day Pastor',
+        'fields': [('Pastor', 'salutation')],
+    },
+}
+MERGE_PLACEHOLDER = r'\{\{\s*([\w.]+)\s*\}\}'
+DEFAULT_MERGE_DIR = os.path.join(REPO_ROOT, 'docs', 'merged')
+
+def _load_recipients(path):
+    """Read recipients from a CSV file (header row) or a JSON list of objects"""
+    import csv
+    import json
+
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            recipients = list(csv.DictReader(f))
+        else:
+            try:
+                recipients = json.load(f)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f'{path}: {exc}') from exc
+    if not isinstance(recipients, list) or not all(isinstance(r, dict) for r in recipients):
+        raise ValueError(f'{path}: expected a list of recipient objects')
+    return [{key: '' if value is None else str(value) for key, value in r.items()} for r in recipients]
+
+def _merge_skeleton(template):
+    """Render a MERGE_TEMPLATES entry once into a styled document; returns (doc, defaults)"""
+    import itertools
+    from sections.markdown import add_markdown
+    from sources.docx_reader import iter_docx, read_section
+
+    spec = MERGE_TEMPLATES[template]
+    path = os.path.join(REPO_ROOT, 'docs', spec['source'])
+    title = None
+    if spec.get('heading'):
+        section = read_section(path, spec['heading'])
+        if section is None:
+            raise ValueError(f"{spec['source']}: no section titled {spec['heading']!r}")
+        title, _, blocks = section
+    else:
+        blocks = list(itertools.takewhile(lambda block: block[0] != 'heading', iter_docx(path)))
+    if spec.get('start'):
+        blocks = list(itertools.dropwhile(
+            lambda block: block[0] != 'paragraph' or not block[1] or
+            not block[1][0][0].startswith(spec['start']), blocks))
+
+    defaults = {}
+
+    def seed(text):
+        for find, field in spec['fields']:
+            if find in text:
+                text = text.replace(find, '{{%s}}' % field)
+                defaults[field] = find
+        return text
+
+    def seed_spans(spans):
+        return [[seed(text), style, url] for text, style, url in spans]
+
+    for block in blocks:
+        if block[0] in ('paragraph', 'quote'):
+            block[1] = seed_spans(block[1])
+        elif block[0] == 'list':
+            block[1] = [[depth, marker, seed_spans(spans)] for depth, marker, spans in block[1]]
+        elif block[0] == 'table':
+            block[1] = [seed_spans(cell) for cell in block[1]]
+            block[2] = [[seed_spans(cell) for cell in row] for row in block[2]]
+        elif block[0] in ('heading', 'code'):
+            block[2] = seed(block[2])
+
+    doc = new_document()
+    if title:
+        doc.add_heading(title, level=1)
+    add_markdown(doc, blocks, level=2)
+    return doc, defaults
+
+def _template_package(doc):
+    """Save a template document as (base, document.xml text)
+
+    base is the saved zip without word/document.xml and with every other
+    part already compressed, so a copy only has to add its own document.xml
+    (see _write_package). Every {{placeholder}} must sit inside one text node.
+    """
+    import re
+    import zipfile
+
+    pattern = re.compile(MERGE_PLACEHOLDER)
+    in_text = sum(len(pattern.findall(t.text or '')) for t in doc.element.body.iter(qn('w:t')))
+    package = io.BytesIO()
+    doc.save(package)
+    base = io.BytesIO()
+    with zipfile.ZipFile(package) as archive, zipfile.ZipFile(base, 'w', zipfile.ZIP_DEFLATED) as out:
+        for name in archive.namelist():
+            if name == 'word/document.xml':
+                xml = archive.read(name).decode('utf-8')
+            else:
+                out.writestr(name, archive.read(name))
+    if len(pattern.findall(xml)) != in_text:
+        raise ValueError('a {{placeholder}} of the template is split across runs or sits outside text')
+    return base.getvalue(), xml
+
+def _write_package(path, base, document_xml):
+    """Write base (from _template_package) with document_xml (bytes) added to path"""
+    import zipfile
+
+    package = io.BytesIO(base)
+    with zipfile.ZipFile(package, 'a', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('word/document.xml', document_xml)
+    _write_atomic(path, [package.getvalue()])
+
+def _merge_parts(doc):
+    """(base, pieces) of a merge skeleton: pieces alternates literal XML and placeholder names"""
+    import re
+
+    base, xml = _template_package(doc)
+    return base, re.split(MERGE_PLACEHOLDER, xml)
+
+def _write_merged(path, base, pieces, values):
+    """Write one personalized copy of the skeleton to path"""
+    from sections.common import _escape_all
+
+    names = pieces[1::2]
+    escaped = dict(zip(names, _escape_all([values[name] for name in names])))
+    xml = ''.join(piece if i % 2 == 0 else escaped[piece] for i, piece in enumerate(pieces))
+    _write_package(path, base, xml.encode('utf-8'))
+
+def _merge_output(recipient, index, taken):
+    """File name for a recipient: its 'output' field, else a slug of its name, made unique"""
+    import re
+
+    if recipient.get('output'):
+        name = os.path.basename(recipient['output'])
+    else:
+        label = recipient.get('name') or recipient.get('church') or f'recipient-{index + 1}'
+        name = re.sub(r'[^A-Za-z0-9]+', '-', label).strip('-').lower() + '.docx'
+    stem, suffix = os.path.splitext(name)
+    candidate, n = name, 2
+    while candidate in taken:
+        candidate, n = f'{stem}-{n}{suffix}', n + 1
+    taken.add(candidate)
+    return candidate
+
+def run_merge(recipients_path, template='proposal', out_dir=None, jobs=None):
+    """Write one personalized copy of a MERGE_TEMPLATES document per recipient
+
+    The skeleton is rendered, saved and compressed once; every copy reuses
+    its compressed parts and splices the recipient's escaped values into the
+    serialized document.xml at the placeholders, all of which sit inside
+    text nodes.
+    Copies are compressed and written on a thread pool (zlib and file I/O
+    release the GIL).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    recipients = _load_recipients(recipients_path)
+    out_dir = out_dir or DEFAULT_MERGE_DIR
+    jobs = jobs or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    skeleton, defaults = _merge_skeleton(template)
+    base, pieces = _merge_parts(skeleton)
+    fields = set(pieces[1::2])
+    print(f"Primed {template} template in {(time.perf_counter() - start) * 1000:.0f}ms "
+          f"(fields: {', '.join(sorted(fields)) or 'none'}); merging {len(recipients)} recipients...")
+
+    jobs_args, failures, taken = [], [], set()
+    for i, recipient in enumerate(recipients):
+        output = os.path.join(out_dir, _merge_output(recipient, i, taken))
+        values = {**defaults, **{key: value for key, value in recipient.items() if value}}
+        missing = fields - values.keys()
+        if missing:
+            failures.append(f"{output} (missing {', '.join(sorted(missing))})")
+            continue
+        jobs_args.append((output, values))
+
+    os.makedirs(out_dir, exist_ok=True)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(_write_merged, output, base, pieces, values): output
+                   for output, values in jobs_args}
+    for future, output in futures.items():
+        if future.exception() is not None:
+            failures.append(f'{output} ({future.exception()})')
+    elapsed = time.perf_counter() - start
+
+    done = len(recipients) - len(failures)
+    print(f"Merged {done}/{len(recipients)} documents into {out_dir} in {elapsed:.2f}s "
+          f"({done / elapsed if elapsed else 0:.1f} docs/s, {jobs} workers)")
+    for output in failures:
+        print(f"  FAILED: {output}")
+    return 1 if failures else 0
+
+# Issuer details as src/pages/InvoiceView.tsx prints them
+INVOICE_ISSUER = {
+    'name': 'VibeLink Event',
+    'tagline': 'Premium Digital Invitations',
+    'phone': '0245817973 / 0244147594',
+    'email': 'hello@vibelinkevent.com',
+    'address': 'Accra, Ghana',
+}
+INVOICE_CHUNK = 64          # invoices per worker task
+DEFAULT_INVOICE_DIR = os.path.join(REPO_ROOT, 'docs', 'invoices')
+# payments with one of these statuses (payments exports that carry one) are not money received
+UNPAID_STATUSES = ('pending', 'failed', 'cancelled', 'refunded', 'abandoned')
+
+def _iter_records(path):
+    """Stream the rows of a CSV export (header row) or a JSONL export as dicts"""
+    import csv
+    import json
+
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            yield from csv.DictReader(f)
+        else:
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as exc:
+                        raise ValueError(f'{path}:{number}: {exc}') from exc
+
+def _money(value):
+    """Decimal of an exported amount (number, numeric string or empty)"""
+    from decimal import Decimal, InvalidOperation
+
+    try:
+        return Decimal(str(value).strip() or 0)
+    except InvalidOperation:
+        return Decimal(0)
+
+def _cedis(amount):
+    """An amount as InvoiceView prints it"""
+    return f'GH₵{amount:,.2f}'
+
+def _long_date(value):
+    """'March 5, 2026' for an exported date or timestamp; other values unchanged"""
+    if not value:
+        return ''
+    try:
+        day = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return str(value)
+    return f'{day:%B} {day.day}, {day.year}'
+
+def payment_index(path):
+    """{order id: [payment, ...]} of a payments export, the build side of the invoice hash join
+
+    Accepts payment_history rows (payment_type, reference) and the payments
+    layout described in the database section (status, provider_reference,
+    completed_at); payments not yet received are left out, and so are rows
+    without an order_id, with a warning.
+    """
+    index = {}
+    orphans = 0
+    for row in _iter_records(path):
+        if str(row.get('status') or '').lower() in UNPAID_STATUSES:
+            continue
+        if not str(row.get('order_id') or '').strip():
+            orphans += 1
+            continue
+        index.setdefault(str(row['order_id']).strip(), []).append((
+            row.get('completed_at') or row.get('created_at') or '',
+            row.get('payment_type') or '',
+            row.get('payment_method') or '',
+            row.get('reference') or row.get('provider_reference') or '',
+            _money(row.get('amount')),
+        ))
+    if orphans:
+        print(f"Warning: skipped {orphans} payments without an order_id in {path}")
+    return index
+
+def _order_payments(order):
+    """Payments recorded on the order row itself (deposit and balance columns)"""
+    payments = []
+    for kind in ('deposit', 'balance'):
+        if str(order.get(f'{kind}_paid') or '').lower() in ('true', 't', '1'):
+            payments.append((order.get(f'{kind}_paid_at') or '', kind, '',
+                             order.get(f'{kind}_reference') or '', _money(order.get(f'{kind}_amount'))))
+    return payments
+
+def invoice_from_order(order, payments, add_ons, rush_fee):
+    """Template values for one order of an orders export and its joined payments
+
+    add_ons maps add-on ids to (name, price) for exports that store ids only;
+    without joined payments the order's deposit/balance columns are used.
+    Raises ValueError for an order with neither an order_number nor an id,
+    or choosing an add-on id that add_ons does not know.
+    """
+    import json
+
+    order_id = str(order.get('id') or order.get('order_id') or '').strip()
+    number = str(order.get('order_number') or '').strip()
+    if not number and not order_id:
+        raise ValueError('order has neither an order_number nor an id')
+    number = number or f'INV-{order_id[:8].upper()}'
+    package_price = _money(order.get('package_price'))
+    items = [(f"{order.get('package_name') or order.get('package_id') or 'Package'} package",
+              package_price)]
+    chosen = order.get('add_ons') or []
+    if isinstance(chosen, str):
+        chosen = json.loads(chosen) if chosen.strip().startswith('[') else []
+    for add_on in chosen:
+        if isinstance(add_on, dict):
+            items.append((add_on.get('name') or add_on.get('id'), _money(add_on.get('price'))))
+        elif add_on in add_ons:
+            name, price = add_ons[add_on]
+            items.append((name, _money(price)))
+        else:
+            raise ValueError(f'unknown add-on {add_on!r}')
+    if order.get('delivery_type') == 'rush':
+        items.append(('Rush delivery', _money(rush_fee)))
+
+    subtotal = sum((price for _, price in items), _money(0))
+    total = _money(order.get('total_price')) if order.get('total_price') not in (None, '') else subtotal
+    payments = sorted(payments or _order_payments(order))
+    paid = sum((amount for *_, amount in payments), _money(0))
+    balance = max(total - paid, _money(0))
+    return {
+        'file': f"{''.join(c if c.isalnum() or c in '-_' else '-' for c in number)}.docx",
+        'title': 'RECEIPT' if total and not balance else 'INVOICE',
+        'number': number,
+        'issued': _long_date(order.get('created_at')),
+        'status': 'Paid' if not balance else 'Part paid' if paid else 'Awaiting payment',
+        'customer_name': order.get('client_name') or order.get('customer_name') or '',
+        'customer_email': order.get('client_email') or order.get('customer_email') or '',
+        'customer_phone': order.get('client_phone') or order.get('customer_phone') or '',
+        'event': ', '.join(part for part in (order.get('event_title'), order.get('event_type'),
+                                             _long_date(order.get('event_date'))) if part),
+        'subtotal': _cedis(subtotal),
+        'discount': _cedis(subtotal - total) if subtotal > total else '',
+        'total': _cedis(total),
+        'paid': _cedis(paid),
+        'balance': _cedis(balance),
+        'due': bool(balance),
+        'items': [{'description': name, 'quantity': '1', 'unit_price': _cedis(price), 'total': _cedis(price)}
+                  for name, price in items],
+        'payments': [{'date': _long_date(date), 'type': kind.title(), 'method': method,
+                      'reference': reference, 'amount': _cedis(amount)}
+                     for date, kind, method, reference, amount in payments]
+                    or [{'date': 'No payments recorded', 'type': '', 'method': '', 'reference': '', 'amount': ''}],
+    }
 
-    print("Adding appendices...")
-    add_appendices(doc)
+def _invoice_skeleton():
+    """The invoice template: {{field}} placeholders, {{item.x}}/{{payment.x}} rows, {{if_x}} paragraphs"""
+    from sections.common import add_labeled_paragraphs
+
+    issuer = INVOICE_ISSUER
+    doc = new_document()
+    doc.add_heading('{{title}}', level=1)
+    doc.add_paragraph().add_run(f"{issuer['name']} - {issuer['tagline']}").bold = True
+    doc.add_paragraph(f"{issuer['phone']} | {issuer['email']} | {issuer['address']}")
+    add_labeled_paragraphs(doc, [('Invoice', '{{number}}'), ('Issued', '{{issued}}'),
+                                 ('Status', '{{status}}'), ('{{if_event}}Event', '{{event}}')])
+
+    doc.add_heading('Bill To', level=2)
+    for field in ('customer_name', 'customer_email', '{{if_customer_phone}}{{customer_phone}}'):
+        doc.add_paragraph(field if field.startswith('{{') else '{{%s}}' % field)
+
+    for heading, columns, row in (
+            ('Items', ('Description', 'Qty', 'Price', 'Total'), 'item'),
+            ('Payments', ('Date', 'Type', 'Method', 'Reference', 'Amount'), 'payment')):
+        doc.add_heading(heading, level=2)
+        table = doc.add_table(rows=2, cols=len(columns))
+        table.style = 'Light Grid Accent 1'
+        keys = {'Qty': 'quantity', 'Price': 'unit_price'}
+        for header, template, column in zip(table.rows[0].cells, table.rows[1].cells, columns):
+            header.text = column
+            template.text = '{{%s.%s}}' % (row, keys.get(column, column.lower()))
+
+    doc.add_heading('Totals', level=2)
+    add_labeled_paragraphs(doc, [('Subtotal', '{{subtotal}}'), ('{{if_discount}}Discount', '-{{discount}}'),
+                                 ('Total', '{{total}}'), ('Paid', '{{paid}}'), ('Balance Due', '{{balance}}')])
+    doc.add_paragraph('{{if_due}}Please pay the balance by Mobile Money or bank transfer, '
+                      'quoting {{number}} as the reference.')
+    doc.add_paragraph(f"Thank you for choosing {issuer['name']}! Questions? Contact us at {issuer['email']}.")
+    return doc
+
+# Per worker process: (base package, parsed document.xml) of the invoice template
+_INVOICE_TEMPLATE = None
+
+def _init_invoice_worker(base, xml):
+    """Pool initializer: parse the template once per worker"""
+    global _INVOICE_TEMPLATE
+    from lxml import etree
+
+    _INVOICE_TEMPLATE = (base, etree.fromstring(xml.encode('utf-8')))
+
+def _render_invoice(template, invoice):
+    """document.xml bytes of one invoice, from a deep copy of the parsed template"""
+    import copy
+    import re
+    from lxml import etree
+
+    w = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+    pattern = re.compile(MERGE_PLACEHOLDER)
+    root = copy.deepcopy(template)
+
+    def fill(element, values):
+        for text in element.iter(f'{w}t'):
+            if text.text and '{{' in text.text:
+                text.text = pattern.sub(lambda match: str(values[match.group(1)]), text.text)
+
+    # Repeat each {{item.x}} / {{payment.x}} row once per entry
+    for row in list(root.iter(f'{w}tr')):
+        match = re.search(r'\{\{\s*(\w+)\.', ''.join(row.itertext()))
+        if match:
+            prefix = match.group(1)
+            for entry in invoice[prefix + 's']:
+                clone = copy.deepcopy(row)
+                fill(clone, {f'{prefix}.{key}': value for key, value in entry.items()})
+                row.addprevious(clone)
+            row.getparent().remove(row)
+    # Keep an {{if_x}} paragraph only when x is set
+    for paragraph in list(root.iter(f'{w}p')):
+        first = paragraph.find(f'.//{w}t')
+        match = re.match(r'\{\{if_(\w+)\}\}', first.text or '') if first is not None else None
+        if match:
+            if invoice.get(match.group(1)):
+                first.text = first.text[match.end():]
+            else:
+                paragraph.getparent().remove(paragraph)
+    fill(root, invoice)
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+def _write_invoices(chunk, out_dir, fmt):
+    """Worker task: write a chunk of invoices; returns [(file, error), ...]"""
+    import tempfile
+
+    base, template = _INVOICE_TEMPLATE
+    failures = []
+    workdir = tempfile.mkdtemp() if fmt == 'pdf' else out_dir
+    for invoice in chunk:
+        try:
+            _write_package(os.path.join(workdir, invoice['file']), base, _render_invoice(template, invoice))
+        except Exception as exc:
+            failures.append((invoice['file'], str(exc)))
+    if fmt == 'pdf':
+        import shutil
+        import subprocess
+
+        try:
+            soffice = shutil.which('soffice') or shutil.which('libreoffice')
+            if soffice is None:
+                raise RuntimeError('PDF output needs LibreOffice (soffice) on PATH')
+            # One LibreOffice start per chunk rather than per invoice
+            written = sorted(name for name in os.listdir(workdir) if name.endswith('.docx'))
+            subprocess.run([soffice, '--headless', '--convert-to', 'pdf', '--outdir', out_dir, *written],
+                           cwd=workdir, check=True, capture_output=True)
+        except (RuntimeError, OSError, subprocess.CalledProcessError) as exc:
+            failures += [(invoice['file'], str(exc)) for invoice in chunk]
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return failures
+
+def run_invoices(orders_path, payments_path=None, out_dir=None, fmt='docx', jobs=None):
+    """Write an invoice (a receipt once fully paid) per order of an orders export
+
+    Orders stream from the export and are hash-joined with the payments
+    export, whose index is the only part held in memory (and shrinks as
+    orders claim their payments). Invoices are rendered from a deep copy of
+    the pre-saved template in a process pool, at most 2 * jobs chunks of
+    INVOICE_CHUNK in flight, so memory stays flat whatever the number of
+    orders (bar the names of the invoices already written). Orders whose
+    invoice cannot be made (see invoice_from_order) or whose invoice number
+    repeats an earlier one are reported and skipped, never overwritten.
+    """
+    import itertools
+    import multiprocessing
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    from sources.catalog import CATALOG_PATH, load_catalog, load_rush_fee
+    from sources import repo_path
+
+    out_dir = out_dir or DEFAULT_INVOICE_DIR
+    jobs = jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    index = payment_index(payments_path) if payments_path else {}
+    catalog = load_catalog(repo_path(*CATALOG_PATH))
+    add_ons = {entry['id']: (entry['name'], entry['price']) for entry in catalog['add_ons']}
+    rush_fee = load_rush_fee()
+    base, xml = _template_package(_invoice_skeleton())
+    print(f"Primed invoice template in {(time.perf_counter() - start) * 1000:.0f}ms "
+          f"({sum(map(len, index.values()))} payments indexed); rendering invoices...")
+
+    rejected = []
+    written = set()
+
+    def iter_invoices():
+        for row, order in enumerate(_iter_records(orders_path), 1):
+            order_id = str(order.get('id') or order.get('order_id') or '').strip()
+            try:
+                invoice = invoice_from_order(order, index.pop(order_id, None), add_ons, rush_fee)
+            except ValueError as exc:
+                rejected.append((f'order {order_id or f"#{row}"}', str(exc)))
+                continue
+            if invoice['file'] in written:
+                rejected.append((f'order {order_id or f"#{row}"}',
+                                 f"invoice number {invoice['number']} already used; not overwritten"))
+                continue
+            written.add(invoice['file'])
+            yield invoice
+
+    invoices = iter_invoices()
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    os.makedirs(out_dir, exist_ok=True)
+    count, failures, running = 0, [], set()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(jobs, mp_context=context, initializer=_init_invoice_worker,
+                             initargs=(base, xml)) as pool:
+        while True:
+            chunk = list(itertools.islice(invoices, INVOICE_CHUNK))
+            if chunk:
+                count += len(chunk)
+                running.add(pool.submit(_write_invoices, chunk, out_dir, fmt))
+            if running and (not chunk or len(running) >= 2 * jobs):
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    failures += future.result()
+            if not chunk and not running:
+                break
+    elapsed = time.perf_counter() - start
+
+    done = count - len(failures)
+    print(f"Wrote {done}/{count + len(rejected)} invoices into {out_dir} in {elapsed:.2f}s "
+          f"({done / elapsed if elapsed else 0:.1f} docs/s, {jobs} workers)")
+    unmatched = sum(map(len, index.values()))
+    if unmatched:
+        print(f"  {unmatched} payments belong to orders missing from {orders_path}")
+    for name, error in rejected + failures:
+        print(f"  FAILED: {name} ({error})")
+    return 1 if rejected or failures else 0
+
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_ISDIR = 0x40000000
+_INOTIFY_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+def _watch_dirs():
+    """(directory, recursive) pairs covering the script and every collector input"""
+    dirs = {(os.path.dirname(os.path.abspath(__file__)), True)}
+    for source in COLLECTORS.values():
+        for path in source.inputs:
+            full = os.path.join(REPO_ROOT, path)
+            if os.path.isdir(full):
+                dirs.add((full, True))
+            elif os.path.isdir(os.path.dirname(full)):
+                dirs.add((os.path.dirname(full), False))
+    return dirs
+
+def _inotify_watcher(dirs):
+    """Return poll(timeout) -> set of changed paths, backed by Linux inotify"""
+    import ctypes
+    import ctypes.util
+    import select
+    import struct
+
+    libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    fd = libc.inotify_init1(os.O_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+    watches = {}
+
+    def add_watch(path):
+        wd = libc.inotify_add_watch(fd, os.fsencode(path), _INOTIFY_MASK)
+        if wd >= 0:
+            watches[wd] = path
+
+    for directory, recursive in dirs:
+        if not recursive:
+            add_watch(directory)
+            continue
+        for root, _, _ in os.walk(directory):
+            add_watch(root)
+
+    def poll(timeout=None):
+        if not select.select([fd], [], [], timeout)[0]:
+            return set()
+        data = os.read(fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = struct.unpack_from('iIII', data, offset)
+            name = os.fsdecode(data[offset + 16:offset + 16 + length].rstrip(b'\0'))
+            offset += 16 + length
+            path = os.path.join(watches.get(wd, ''), name)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                add_watch(path)
+            changed.add(path)
+        return changed
+
+    return poll
+
+def _polling_watcher(dirs, interval=0.5):
+    """Return poll(timeout) -> set of changed paths, by rescanning mtimes"""
+    def snapshot():
+        state = {}
+        for directory, recursive in dirs:
+            for root, subdirs, files in os.walk(directory):
+                for name in files:
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    state[path] = (st.st_mtime_ns, st.st_size)
+                if not recursive:
+                    subdirs.clear()
+        return state
+
+    previous = snapshot()
+
+    def poll(timeout=None):
+        nonlocal previous
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(interval if deadline is None else max(0, min(interval, deadline - time.monotonic())))
+            current = snapshot()
+            changed = {path for path in previous.keys() | current.keys()
+                       if previous.get(path) != current.get(path)}
+            previous = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    return poll
+
+def stale_collectors(changed):
+    """Names of the collectors reading any of the changed file paths"""
+    names = set()
+    for path in changed:
+        name = os.path.basename(path)
+        if name.startswith('.#') or name.endswith(('~', '.swp', '.tmp')):
+            continue
+        rel = os.path.relpath(path, REPO_ROOT).replace(os.sep, '/')
+        for source in COLLECTORS.values():
+            if any(rel == source_path or rel.startswith(source_path + '/')
+                   for source_path in source.inputs):
+                names.add(source.name)
+    return names
+
+def watch(keys, stubs, output_path, fmt, debounce=0.3, budgets=None):
+    """Rebuild whenever an input changes, re-collecting and re-rendering only what it affects"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    dirs = _watch_dirs()
+    try:
+        poll = _inotify_watcher(dirs)
+        backend = 'inotify'
+    except (OSError, AttributeError):
+        poll = _polling_watcher(dirs)
+        backend = 'polling'
+
+    scratch = new_document()
+    selected = [section for section in SECTIONS if section.key in keys]
+    budget = gather_budget(budgets, selected)
+    data = gather_data({name for section in selected for name in section.needs}, budget=budget)
+    titles = _titles(keys)
+    fragments = {}
+    index = {}
+    fallen_back = set()  # keys of the sections standing in with a fallback
+
+    def rebuild(dirty):
+        for section in SECTIONS:
+            if section.key in stubs and section.key not in fragments:
+                fragments[section.key] = render_fragment(scratch, load(STUBS[section.key]), titles)
+            elif section.key in keys and section.key in dirty:
+                inputs = {name: data[name] for name in section.needs}
+                error = next((value for value in inputs.values() if isinstance(value, CollectorError)), None)
+                if error is not None or STALLED in inputs.values():
+                    reason = fallback_reason(error, section_budget(budgets, section.key))
+                    fragments[section.key], stale_as_of = fallback_fragment(scratch, section, reason)
+                    index[section.key] = index_section(section.key, fragments[section.key])
+                    fallen_back.add(section.key)
+                    _report_fallbacks({section.key: (stale_as_of, reason)})
+                    continue
+                fragments[section.key] = render_fragment(scratch, section.render, **inputs)
+                index[section.key] = index_section(section.key, fragments[section.key])
+                fallen_back.discard(section.key)
+                if section.needs:
+                    save_cached_fragment(section.key, fragments[section.key])
+        strict = len(keys) == len(SECTIONS) and not fallen_back
+        save_document(assemble_document(fragments, index, strict), output_path, fmt)
+
+    start = time.perf_counter()
+    rebuild(set(keys))
+    print(f"Built {output_path} in {time.perf_counter() - start:.2f}s; "
+          f"watching for changes ({backend}, Ctrl+C to stop)...")
+
+    try:
+        while True:
+            changed = poll(None)
+            while True:
+                more = poll(debounce)
+                if not more:
+                    break
+                changed |= more
+            if any(path.endswith('.py') and path.startswith(script_dir) for path in changed):
+                print("Generator changed; restarting...")
+                os.execv(sys.executable, [sys.executable] + sys.argv)
+            stale = dependents(stale_collectors(changed)) & set(data)
+            dirty = {section.key for section in selected if stale & set(section.needs)}
+            if not dirty:
+                continue
+            start = time.perf_counter()
+            try:
+                data.update(gather_data(stale, budget=budget, known={
+                    name: value for name, value in data.items() if name not in stale}))
+                rebuild(dirty)
+            except Exception as exc:
+                print(f"Rebuild failed: {exc}")
+                continue
+            ordered = [section.key for section in SECTIONS if section.key in dirty]
+            print(f"Rebuilt {', '.join(ordered)} in {time.perf_counter() - start:.2f}s")
+    except KeyboardInterrupt:
+        return 0
+
+def list_sections():
+    """Print the section keys in document order"""
+    for section in SECTIONS:
+        print(f"{section.key:<14}{section.label}")
+
+def explain(keys, stubs):
+    """Print what a build of keys would render and which collectors it would run, in order"""
+    selected = [section for section in SECTIONS if section.key in keys]
+    width = max(len(section.key) for section in SECTIONS) + 2
+    print("Sections:")
+    for section in SECTIONS:
+        if section.key in keys:
+            print(f"  {section.key:<{width}}needs: {', '.join(section.needs) or '-'}")
+        elif section.key in stubs:
+            print(f"  {section.key:<{width}}stub")
+    needed = dependency_order({name for section in selected for name in section.needs})
+    width = max(len(name) for name in COLLECTORS) + 2
+    print("Collectors (dependencies first):")
+    for name in dependency_order(COLLECTORS):
+        source = COLLECTORS[name]
+        users = [section.key for section in selected if name in section.needs]
+        users += [other for other in needed if name in COLLECTORS[other].needs]
+        status = f"used by {', '.join(users)}" if name in needed else 'not needed'
+        print(f"  {name:<{width}}{status}")
+        print(f"  {'':<{width}}needs: {', '.join(source.needs) or '-'}; "
+              f"reads: {', '.join(source.inputs) or '-'}")
+
+def check_sources():
+    """Report which collector inputs exist, and the collectors reading each; returns the number missing"""
+    readers = {}
+    for source in COLLECTORS.values():
+        for path in source.inputs:
+            readers.setdefault(path, []).append(source.name)
+    width = max(len(path) for path in readers) + 2
+    missing = 0
+    for path in sorted(readers):
+        exists = os.path.exists(os.path.join(REPO_ROOT, path))
+        missing += not exists
+        print(f"{'ok' if exists else 'MISSING':<9}{path:<{width}}{', '.join(readers[path])}")
+    print(f"{len(readers) - missing}/{len(readers)} data sources present")
+    return missing
+
+def _section_list(value):
+    """argparse type for comma-separated section keys"""
+    keys = [key.strip() for key in value.split(',') if key.strip()]
+    known = {section.key for section in SECTIONS}
+    unknown = [key for key in keys if key not in known]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown section(s): {', '.join(unknown)} (see --list-sections)")
+    return keys
+
+def _budget(value):
+    """argparse type for --budget: SECONDS (every section) or KEY=SECONDS"""
+    key, _, seconds = value.rpartition('=')
+    if key and key not in {section.key for section in SECTIONS}:
+        raise argparse.ArgumentTypeError(f"unknown section: {key} (see --list-sections)")
+    try:
+        seconds = float(seconds)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid budget: {value!r} (expected SECONDS or KEY=SECONDS)")
+    return key or None, seconds
+
+def resolve_output(out=None, fmt=None):
+    """Work out the (path, format) to write from --out and --format"""
+    if fmt is None:
+        suffix = os.path.splitext(out)[1].lstrip('.').lower() if out else ''
+        fmt = suffix if suffix in OUTPUT_FORMATS else 'docx'
+    if out is None:
+        out = os.path.splitext(DEFAULT_OUTPUT)[0] + '.' + fmt
+    return out, fmt
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Generate the VibeLink Ghana technical documentation')
+    parser.add_argument('--only', type=_section_list, metavar='KEYS',
+                        help='build only these comma-separated sections (cover and TOC become stubs)')
+    parser.add_argument('--skip', type=_section_list, metavar='KEYS',
+                        help='leave out these comma-separated sections')
+    parser.add_argument('--out', metavar='PATH',
+                        help='output file (default: docs/VibeLink_Technical_Documentation.docx)')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS,
+                        help='output format (default: from --out suffix, else docx)')
+    parser.add_argument('--watch', action='store_true',
+                        help='rebuild on changes to the generator or its data sources')
+    parser.add_argument('--budget', type=_budget, action='append', default=[], metavar='[KEY=]SECONDS',
+                        help='how long a section may wait for its data before its last cached '
+                             f'output is used instead (default: {DEFAULT_BUDGET:g}s; repeatable)')
+    parser.add_argument('--bench-lists', type=int, metavar='N',
+                        help='benchmark the fast list emitter with N items and exit')
+    parser.add_argument('--batch', metavar='VARIANTS_JSON',
+                        help='generate every variant listed in a JSON file '
+                             '([{"output": ..., "sections": [...], "cover": {...}}, ...])')
+    parser.add_argument('--merge', metavar='RECIPIENTS',
+                        help='write one personalized --merge-template document per recipient '
+                             '(CSV with a header row, or a JSON list of objects) into the --out directory')
+    parser.add_argument('--merge-template', choices=sorted(MERGE_TEMPLATES), default='proposal',
+                        help='document to personalize with --merge (default: proposal)')
+    parser.add_argument('--invoices', metavar='ORDERS',
+                        help='write an invoice per order of an orders export (CSV or JSONL) '
+                             'into the --out directory, as docx or --format pdf')
+    parser.add_argument('--payments', metavar='PAYMENTS',
+                        help='payments export (CSV or JSONL) joined into --invoices by order_id')
+    parser.add_argument('--jobs', type=int, metavar='N',
+                        help='parallel workers for --batch, --merge and --invoices (default: CPU count)')
+    parser.add_argument('--list-sections', action='store_true',
+                        help='list section keys and exit')
+    parser.add_argument('--check', action='store_true',
+                        help='check that the repository data sources exist and exit')
+    parser.add_argument('--explain', action='store_true',
+                        help='show the selected sections and the collectors they would run, and exit')
+    parser.add_argument('--print-output', action='store_true',
+                        help='print the planned output path and exit')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main function to create the document"""
+    args = parse_args(argv)
+    if args.list_sections:
+        list_sections()
+        return 0
+    if args.check:
+        return 1 if check_sources() else 0
+    try:
+        # Unreadable or malformed input files (recipients, orders, payments)
+        if args.merge:
+            return run_merge(args.merge, args.merge_template, args.out, args.jobs)
+        if args.invoices:
+            return run_invoices(args.invoices, args.payments, args.out, args.format or 'docx', args.jobs)
+    except (ValueError, OSError) as exc:
+        print(f"Error: {exc}")
+        return 1
+    output_path, fmt = resolve_output(args.out, args.format)
+    if args.print_output:
+        print(output_path)
+        return 0
+    if args.bench_lists:
+        return 0 if benchmark_list_emitter(args.bench_lists) else 1
+    budgets = dict(args.budget)
+    if args.batch:
+        try:
+            return run_batch(args.batch, args.jobs, budgets)
+        except (ValueError, OSError) as exc:  # unreadable or malformed variants file
+            print(f"Error: {exc}")
+            return 1
+
+    keys, stubs = select_sections(args.only, args.skip)
+    if args.explain:
+        explain(keys, stubs)
+        return 0
+    from sections.xref import UnresolvedReferenceError
+
+    try:
+        if args.watch:
+            return watch(keys, stubs, output_path, fmt, budgets=budgets)
+
+        print("Creating VibeLink Ghana Technical Documentation...")
+        start = time.perf_counter()
+
+        doc = build_document(new_document(), keys=keys, stubs=stubs, budgets=budgets)
+    except UnresolvedReferenceError as exc:
+        print(f"Error: {exc}")
+        return 1
 
     # Save document
-    output_path = r'C:\Users\CyberAware\OneDrive - Government of Ghana - CAGD\ZeroTrust\Visual Studio Code Workspace\vibelink\docs\VibeLink_Technical_Documentation.docx'
     print(f"Saving document to {output_path}...")
-    doc.save(output_path)
+    try:
+        save_document(doc, output_path, fmt)
+    except (RuntimeError, OSError) as exc:
+        print(f"Error: {exc}")
+        return 1
 
-    print("Documentation created successfully!")
+    print(f"Documentation created successfully in {time.perf_counter() - start:.2f}s!")
     print(f"Location: {output_path}")
     print("\nNext steps:")
     print("1. Open the document in Microsoft Word")
-    print("2. Generate table of contents (References > Table of Contents)")
+    print("2. Update fields (Ctrl+A, F9) to fill in the table of contents page numbers")
     print("3. Add page numbers (Insert > Page Number)")
     print("4. Add headers (Insert > Header)")
     print("5. Create diagrams for architecture sections")
     print("6. Review and customize as needed")
 
 if __name__ == '__main__':
-    main()
+    raise SystemExit(main())
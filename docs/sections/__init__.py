@@ -0,0 +1,122 @@
+"""
+Section registry for the VibeLink Ghana documentation generator
+
+The built-in sections live in the modules of this package, one per section
+key, and are listed in BUILTIN_SECTIONS in document order. A module is only
+imported when its section is rendered, so partial builds, --batch variants
+and metadata commands never load (or pay for) the sections they skip.
+
+Other packages can add sections through the `vibelink_docs.sections` entry
+point group: the entry point name is the section key and its object is the
+render function, which may carry `label` and `needs` attributes with the
+same meaning as below. Plugin sections are placed before the appendices, in
+key order, and are only imported when one of those attributes or the
+function itself is first used.
+"""
+
+from importlib import import_module
+import sys
+
+ENTRY_POINT_GROUP = 'vibelink_docs.sections'
+
+
+def load(target):
+    """Import 'module:function' (module relative to this package) and return the function"""
+    module, _, name = target.partition(':')
+    return getattr(import_module(f'.{module}', __name__), name)
+
+
+class Section:
+    """A documentation section; the render function is resolved on first use
+
+    `needs` names the collectors (see sources/) whose data is passed to the
+    render function as keyword arguments; collectors are only run when a
+    selected section (or another needed collector) depends on them.
+    """
+
+    def __init__(self, key, label, render, needs=()):
+        self.key = key
+        self._label = label
+        self._target = render  # 'module:function', or an entry point
+        self._render = None
+        self._needs = None if needs is None else tuple(needs)
+
+    @property
+    def render(self):
+        if self._render is None:
+            target = self._target
+            self._render = target.load() if hasattr(target, 'load') else load(target)
+        return self._render
+
+    @property
+    def label(self):
+        if self._label is None:
+            self._label = getattr(self.render, 'label', self.key)
+        return self._label
+
+    @property
+    def needs(self):
+        if self._needs is None:
+            self._needs = tuple(getattr(self.render, 'needs', ()))
+        return self._needs
+
+    def __repr__(self):
+        return f'Section({self.key!r})'
+
+
+# In document order
+BUILTIN_SECTIONS = [
+    Section('cover', 'cover page', 'cover:add_cover_page'),
+    Section('toc', 'table of contents', 'toc:add_table_of_contents'),
+    Section('summary', 'executive summary', 'summary:add_executive_summary'),
+    Section('overview', 'project overview', 'overview:add_project_overview'),
+    Section('architecture', 'technical architecture', 'architecture:add_technical_architecture',
+            ('migrations', 'lockfile', 'schema', 'import_graph')),
+    Section('workflow', 'development workflow', 'workflow:add_development_workflow',
+            ('git_history', 'git_activity')),
+    Section('features', 'features and specifications', 'features:add_features_specifications',
+            ('event_pages', 'order_catalog')),
+    Section('ui', 'user interface', 'ui:add_user_interface', ('design_tokens', 'component_inventory')),
+    Section('database', 'database schema', 'database:add_database_schema',
+            ('migrations', 'schema', 'er_diagram', 'index_advice')),
+    Section('consistency', 'schema consistency', 'consistency:add_schema_consistency',
+            ('schema_drift',)),
+    Section('api', 'API and integrations', 'api:add_api_integrations', ('edge_functions',)),
+    Section('deployment', 'deployment and infrastructure',
+            'deployment:add_deployment_infrastructure', ('assets', 'docx_sections')),
+    Section('security', 'security', 'security:add_security', ('schema',)),
+    Section('maintenance', 'maintenance and support', 'maintenance:add_maintenance_support'),
+    Section('future', 'future enhancements', 'future:add_future_enhancements'),
+    Section('marketing', 'marketing strategy', 'marketing:add_marketing_strategy',
+            ('markdown_docs', 'docx_sections')),
+    Section('appendices', 'appendices', 'appendices:add_appendices',
+            ('lockfile', 'migrations', 'env_vars', 'markdown_docs')),
+]
+
+# Stand-ins for the cover and TOC in partial builds
+STUBS = {
+    'cover': 'cover:add_cover_stub',
+    'toc': 'toc:add_toc_stub',
+}
+
+
+def plugin_sections(builtin_keys):
+    """Sections registered by installed packages under ENTRY_POINT_GROUP"""
+    from importlib.metadata import entry_points
+
+    plugins = []
+    for ep in sorted(entry_points(group=ENTRY_POINT_GROUP), key=lambda ep: ep.name):
+        if ep.name in builtin_keys:
+            print(f"Ignoring plugin section {ep.name!r} from {ep.value}: "
+                  "the key is already taken by a built-in section", file=sys.stderr)
+            continue
+        plugins.append(Section(ep.name, None, ep, needs=None))
+    return plugins
+
+
+def all_sections():
+    """Built-in and plugin sections in document order"""
+    builtin_keys = {section.key for section in BUILTIN_SECTIONS}
+    sections = list(BUILTIN_SECTIONS)
+    sections[-1:-1] = plugin_sections(builtin_keys)  # before the appendices
+    return sections
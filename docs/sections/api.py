@@ -0,0 +1,264 @@
+"""
+API and integrations section
+"""
+
+from .common import add_bullets, add_labeled_paragraphs
+
+
+def add_api_integrations(doc, edge_functions):
+    """Add API and integrations section"""
+    doc.add_heading('API & INTEGRATIONS', level=1)
+
+    doc.add_heading('Supabase API Usage', level=2)
+    doc.add_paragraph(
+        'Supabase provides auto-generated RESTful API and real-time subscriptions for all '
+        'database tables. The frontend communicates with Supabase using the official '
+        'JavaScript client library.'
+    )
+
+    doc.add_heading('Edge Functions', level=3)
+    doc.add_paragraph(
+        f'{len(edge_functions)} Supabase Edge Functions (Deno) in supabase/functions/ handle '
+        'server-side logic that needs secrets:'
+    )
+    functions_table = doc.add_table(rows=len(edge_functions) + 1, cols=2)
+    functions_table.style = 'Light List Accent 1'
+    functions_table.cell(0, 0).text = 'Function'
+    functions_table.cell(0, 1).text = 'Lines (index.ts)'
+    for i, function in enumerate(edge_functions, 1):
+        functions_table.cell(i, 0).text = function['name']
+        functions_table.cell(i, 1).text = str(function['lines'])
+
+    doc.add_heading('Authentication API', level=3)
+    auth_endpoints = [
+        ('signUp()', 'Create new user account with email/password'),
+        ('signIn()', 'Authenticate user and receive session token'),
+        ('signOut()', 'End user session'),
+        ('resetPassword()', 'Send password reset email'),
+        ('updateUser()', 'Update user profile information'),
+        ('getSession()', 'Retrieve current session information'),
+        ('onAuthStateChange()', 'Subscribe to authentication state changes')
+    ]
+
+    add_labeled_paragraphs(doc, auth_endpoints)
+
+    doc.add_heading('Database API', level=3)
+    doc.add_paragraph('CRUD operations via Supabase client:')
+
+    crud_example = '''
+// Query orders
+const { data, error } = await supabase
+  .from('orders')
+  .select('*')
+  .eq('customer_id', userId)
+  .order('created_at', { ascending: false })
+
+// Insert new order
+const { data, error } = await supabase
+  .from('orders')
+  .insert({
+    customer_id: userId,
+    event_type: 'wedding',
+    package_name: 'premium',
+    total_price: 500
+  })
+
+// Update order status
+const { data, error } = await supabase
+  .from('orders')
+  .update({ status: 'completed' })
+  .eq('id', orderId)
+
+// Delete (soft delete preferred)
+const { data, error } = await supabase
+  .from('orders')
+  .update({ deleted_at: new Date() })
+  .eq('id', orderId)
+'''
+
+    p = doc.add_paragraph(crud_example)
+    p.style = 'No Spacing'
+
+    doc.add_heading('Real-time Subscriptions', level=3)
+    doc.add_paragraph('Subscribe to database changes for real-time updates:')
+
+    realtime_example = '''
+// Subscribe to new orders
+const subscription = supabase
+  .channel('orders')
+  .on('postgres_changes',
+    {
+      event: 'INSERT',
+      schema: 'public',
+      table: 'orders'
+    },
+    (payload) => {
+      console.log('New order:', payload.new)
+      // Update UI with new order
+    }
+  )
+  .subscribe()
+'''
+
+    p = doc.add_paragraph(realtime_example)
+    p.style = 'No Spacing'
+
+    doc.add_heading('Storage API', level=3)
+    storage_operations = [
+        ('upload()', 'Upload files to Supabase Storage buckets'),
+        ('download()', 'Download files from storage'),
+        ('createSignedUrl()', 'Generate temporary URL for private files'),
+        ('list()', 'List files in a bucket'),
+        ('remove()', 'Delete files from storage'),
+        ('getPublicUrl()', 'Get public URL for public bucket files')
+    ]
+
+    add_labeled_paragraphs(doc, storage_operations)
+
+    doc.add_heading('Paystack Payment Integration', level=2)
+    doc.add_paragraph(
+        'Paystack is integrated for payment processing with support for multiple payment '
+        'methods popular in Ghana.'
+    )
+
+    doc.add_heading('Payment Flow', level=3)
+    payment_flow = [
+        '1. Customer completes order form',
+        '2. Frontend initiates payment with Paystack',
+        '3. Paystack popup opens with payment options',
+        '4. Customer selects payment method (card/mobile money)',
+        '5. Customer completes payment on Paystack',
+        '6. Paystack sends webhook to backend',
+        '7. Backend verifies payment with Paystack API',
+        '8. Order status updated to "Paid"',
+        '9. Customer receives confirmation email',
+        '10. Admin receives new order notification'
+    ]
+
+    add_bullets(doc, payment_flow)
+
+    doc.add_heading('Paystack API Endpoints', level=3)
+    paystack_endpoints = [
+        ('Initialize Transaction', 'POST /transaction/initialize - Create payment session'),
+        ('Verify Transaction', 'GET /transaction/verify/:reference - Confirm payment'),
+        ('List Transactions', 'GET /transaction - Retrieve transaction history'),
+        ('Refund Transaction', 'POST /refund - Process refund'),
+        ('Mobile Money', 'POST /charge - Charge mobile money accounts')
+    ]
+
+    add_labeled_paragraphs(doc, paystack_endpoints)
+
+    doc.add_heading('Payment Methods Supported', level=3)
+    payment_methods = [
+        'Visa/Mastercard credit and debit cards',
+        'MTN Mobile Money',
+        'Vodafone Cash',
+        'AirtelTigo Money',
+        'Bank transfer',
+        'USSD'
+    ]
+
+    add_bullets(doc, payment_methods)
+
+    doc.add_heading('WhatsApp Integration', level=2)
+    doc.add_paragraph(
+        'WhatsApp Business API integration enables direct delivery of invitations and '
+        'notifications to customers.'
+    )
+
+    doc.add_heading('WhatsApp Features', level=3)
+    whatsapp_features = [
+        'Send invitation links directly to customer WhatsApp',
+        'Order status notifications',
+        'Payment confirmations',
+        'Design ready notifications',
+        'Support message delivery',
+        'Bulk WhatsApp messaging for campaigns',
+        'Message templates for compliance',
+        'Delivery status tracking'
+    ]
+
+    add_bullets(doc, whatsapp_features)
+
+    doc.add_heading('Implementation', level=3)
+    doc.add_paragraph(
+        'WhatsApp integration uses the WhatsApp Business API with message templates '
+        'approved by Meta. Messages are sent via Supabase Edge Functions to maintain '
+        'security and comply with WhatsApp policies.'
+    )
+
+    doc.add_heading('Google Gemini AI Integration', level=2)
+    doc.add_paragraph(
+        'Google Gemini AI powers the intelligent chatbot providing 24/7 customer support.'
+    )
+
+    doc.add_heading('Chatbot Capabilities', level=3)
+    chatbot_capabilities = [
+        'Answer frequently asked questions',
+        'Explain pricing and packages',
+        'Guide users through ordering process',
+        'Check order status',
+        'Provide design recommendations',
+        'Troubleshoot common issues',
+        'Escalate to human support when needed',
+        'Multi-turn conversations with context',
+        'Natural language understanding',
+        'Response in English and local languages'
+    ]
+
+    add_bullets(doc, chatbot_capabilities)
+
+    doc.add_heading('Implementation', level=3)
+    doc.add_paragraph(
+        'The chatbot is implemented as a floating widget (ChatWidget.tsx) that appears on '
+        'all pages. It communicates with Google Gemini AI via Supabase Edge Functions '
+        'to protect API keys.'
+    )
+
+    gemini_flow = [
+        '1. User types message in chat widget',
+        '2. Frontend sends message to Supabase Edge Function',
+        '3. Edge Function calls Gemini AI API with message and context',
+        '4. Gemini AI processes message and generates response',
+        '5. Response sent back to Edge Function',
+        '6. Edge Function returns response to frontend',
+        '7. Chat widget displays response to user',
+        '8. Conversation history maintained for context'
+    ]
+
+    add_bullets(doc, gemini_flow)
+
+    doc.add_heading('Email Services', level=2)
+    doc.add_paragraph(
+        'Email notifications are sent for various events throughout the customer journey.'
+    )
+
+    doc.add_heading('Email Types', level=3)
+    email_types = [
+        ('Welcome Email', 'Sent when customer creates account'),
+        ('Order Confirmation', 'Sent after successful order placement'),
+        ('Payment Confirmation', 'Sent after successful payment'),
+        ('Order Status Update', 'Sent when order status changes'),
+        ('Design Ready', 'Sent when design is ready for review'),
+        ('Order Completed', 'Sent when order is finalized'),
+        ('Abandoned Cart', 'Reminder for incomplete orders'),
+        ('Password Reset', 'Password reset link'),
+        ('Invoice', 'Order invoice attached'),
+        ('Referral Notifications', 'Referral commission updates')
+    ]
+
+    add_labeled_paragraphs(doc, email_types)
+
+    doc.add_heading('Email Templates', level=3)
+    doc.add_paragraph(
+        'Email templates are stored in the database and support dynamic content insertion. '
+        'Templates are designed to be mobile-responsive with consistent branding.'
+    )
+
+    doc.add_heading('Sending Method', level=3)
+    doc.add_paragraph(
+        'Emails are sent via Supabase Edge Functions using SMTP or a transactional email '
+        'service like SendGrid or Mailgun.'
+    )
+
+    doc.add_page_break()
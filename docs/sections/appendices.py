@@ -0,0 +1,306 @@
+"""
+Appendices
+"""
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+from .common import add_bullets, add_labeled_paragraphs, package_version
+from .markdown import add_markdown
+from .xref import add_bookmarks, term_bookmark
+
+
+ORIGIN_LABELS = {'client': 'client', 'edge': 'edge functions', 'script': 'scripts'}
+
+# Appendix E; the text links each term where a section first uses it (see xref.py)
+GLOSSARY = [
+    ('API', 'Application Programming Interface - Set of protocols for software communication'),
+    ('CDN', 'Content Delivery Network - Distributed server network for fast content delivery'),
+    ('CI/CD', 'Continuous Integration/Continuous Deployment - Automated software delivery'),
+    ('CRUD', 'Create, Read, Update, Delete - Basic database operations'),
+    ('DNS', 'Domain Name System - Translates domain names to IP addresses'),
+    ('HMR', 'Hot Module Replacement - Live code updates without full page reload'),
+    ('JWT', 'JSON Web Token - Secure token-based authentication'),
+    ('ORM', 'Object-Relational Mapping - Database abstraction layer'),
+    ('PWA', 'Progressive Web App - Web app with native-like features'),
+    ('RLS', 'Row Level Security - Database-level access control'),
+    ('RSVP', 'Répondez s\'il vous plaît - Please respond (invitation response)'),
+    ('SaaS', 'Software as a Service - Cloud-based software delivery'),
+    ('SEO', 'Search Engine Optimization - Improving search visibility'),
+    ('SPA', 'Single Page Application - Web app that loads once and updates dynamically'),
+    ('SQL', 'Structured Query Language - Database query language'),
+    ('SSL/TLS', 'Secure Sockets Layer/Transport Layer Security - Encryption protocols'),
+    ('UI/UX', 'User Interface/User Experience - Design and usability'),
+    ('Webhook', 'HTTP callback - Automated message from one system to another')
+]
+
+# Markdown files from docs/ reproduced after the glossary, in order
+INCLUDED_DOCUMENTS = [
+    ('F', 'Changelog', 'CHANGELOG_2026-02-16.md'),
+    ('G', 'Security & QA Report', 'SECURITY_QA_DOCUMENTATION.md'),
+    ('H', 'SSL Setup Guide', 'SSL_SETUP_GUIDE.md'),
+]
+
+
+def add_env_var_reference(doc, documented, env_vars):
+    """Add the environment variable table built from the code, and its drift from the documented list"""
+    variables = env_vars['variables']
+    descriptions = {name: (description, required, visibility)
+                    for name, description, required, visibility in documented}
+    read = [name for name, entry in variables.items() if entry['files']]
+    doc.add_paragraph(
+        f"Variables read through import.meta.env (client), Deno.env.get (edge functions) or "
+        f"process.env (scripts), found in {env_vars['files']} files. VITE_ variables are bundled "
+        'into the client and visible to every visitor.'
+    )
+
+    env_table = doc.add_table(rows=len(read) + 1, cols=5)
+    env_table.style = 'Light Grid Accent 1'
+    for cell, header in zip(env_table.rows[0].cells,
+                            ('Variable Name', 'Description', 'Required', 'Visibility', 'Read In')):
+        cell.text = header
+    for row, name in zip(env_table.rows[1:], read):
+        entry = variables[name]
+        description, required, _ = descriptions.get(name, ('Not documented', '-', None))
+        cells = row.cells
+        cells[0].text = name
+        cells[1].text = description
+        cells[2].text = required
+        cells[3].text = ('Public' if entry['client'] else
+                         'Secret - Server only' if entry['secret'] else 'Server only')
+        more = len(entry['files']) - 1
+        cells[4].text = entry['first_use'] + (f' (+{more} more)' if more else '') + \
+            f" [{', '.join(ORIGIN_LABELS[origin] for origin in entry['origins'])}]"
+
+    drift = []
+    for name, (_, _, visibility) in descriptions.items():
+        entry = variables.get(name)
+        if entry is None or not entry['files']:
+            defined = entry['defined_in'] if entry else []
+            drift.append(f'{name}: documented but never read'
+                         + (f" (defined in {', '.join(defined)})" if defined else ''))
+        elif (visibility.startswith('Public') != entry['client']
+              or ('Secret' in visibility) != entry['secret']):
+            drift.append(f"{name}: documented as {visibility}, but "
+                         f"{'read by client code' if entry['client'] else 'only read server-side'}")
+    drift += [f"{name}: read at {variables[name]['first_use']} but not documented"
+              for name in read if name not in descriptions]
+    drift += [f"{name}: defined in {', '.join(entry['defined_in'])} but never read"
+              for name, entry in variables.items()
+              if not entry['files'] and entry['defined_in'] and name not in descriptions]
+    if drift:
+        doc.add_paragraph().add_run('Drift from the documented variables:').bold = True
+        add_bullets(doc, drift)
+
+    warnings = [f"{name} looks like a secret but is "
+                f"{'read by client code' if entry['origins'] else 'VITE_ prefixed'} "
+                f"({entry['first_use'] or ', '.join(entry['defined_in'])}); it ships in the public bundle"
+                for name, entry in variables.items() if entry['secret'] and entry['client']]
+    warnings += [f"{name} falls back to a hard-coded value at {', '.join(entry['fallbacks'])}; anyone "
+                 'with the source can use it when the variable is unset'
+                 for name, entry in variables.items() if entry['secret'] and entry['fallbacks']]
+    warnings += [f"{name} is a secret committed in {', '.join(entry['defined_in'])}"
+                 for name, entry in variables.items() if entry['secret'] and entry['defined_in']]
+    if warnings:
+        doc.add_paragraph().add_run('Warnings:').bold = True
+        add_bullets(doc, warnings)
+
+
+def add_included_documents(doc, markdown_docs):
+    """Add one appendix per INCLUDED_DOCUMENTS entry found in docs/"""
+    for letter, title, name in INCLUDED_DOCUMENTS:
+        document = markdown_docs.get(name)
+        if document is None:
+            continue
+        doc.add_heading(f'Appendix {letter}: {title}', level=2)
+        doc.add_paragraph(f'Reproduced from docs/{name}: {document["title"]}.')
+        add_markdown(doc, document['blocks'], level=3)
+
+
+def add_appendices(doc, lockfile, migrations, env_vars, markdown_docs):
+    """Add appendices section"""
+    doc.add_heading('APPENDICES', level=1)
+
+    # Appendix A: Package Dependencies
+    doc.add_heading('Appendix A: Package Dependencies List', level=2)
+
+    doc.add_heading('Production Dependencies', level=3)
+    prod_deps = [
+        ('@dnd-kit/core', 'Drag and drop functionality'),
+        ('@hookform/resolvers', 'Form validation resolvers'),
+        ('@radix-ui/react-*', 'Accessible UI components'),
+        ('@supabase/supabase-js', 'Supabase client'),
+        ('@tanstack/react-query', 'Data fetching and state management'),
+        ('@tiptap/react', 'Rich text editor'),
+        ('react', 'UI library'),
+        ('react-dom', 'React DOM renderer'),
+        ('react-router-dom', 'Client-side routing'),
+        ('tailwindcss', 'CSS framework'),
+        ('framer-motion', 'Animation library'),
+        ('recharts', 'Chart library'),
+        ('zod', 'Schema validation'),
+        ('date-fns', 'Date utilities'),
+        ('lucide-react', 'Icon library')
+    ]
+
+    add_bullets(doc, [
+        f"{name}: {'Various' if name.endswith('*') else package_version(lockfile, name)} - {purpose}"
+        for name, purpose in prod_deps
+    ])
+
+    doc.add_heading('Development Dependencies', level=3)
+    dev_deps = [
+        ('typescript', 'TypeScript compiler'),
+        ('vite', 'Build tool'),
+        ('@vitejs/plugin-react-swc', 'Vite React plugin'),
+        ('eslint', 'Code linting'),
+        ('autoprefixer', 'CSS autoprefixer'),
+        ('postcss', 'CSS processor'),
+        ('@types/react', 'React TypeScript definitions'),
+        ('@types/node', 'Node.js TypeScript definitions')
+    ]
+
+    add_bullets(doc, [f'{name}: {package_version(lockfile, name)} - {purpose}' for name, purpose in dev_deps])
+
+    # Appendix B: File Structure
+    doc.add_heading('Appendix B: File Structure', level=2)
+
+    file_structure = f'''
+vibelink/app/
+├── public/                      # Static assets
+│   ├── images/                  # Image files
+│   ├── favicon.ico
+│   └── robots.txt
+├── src/
+│   ├── components/              # React components
+│   │   ├── admin/               # Admin-specific components
+│   │   ├── auth/                # Authentication components
+│   │   ├── customer/            # Customer portal components
+│   │   ├── layout/              # Layout components (Header, Footer)
+│   │   ├── order-form/          # Order form components
+│   │   ├── payment/             # Payment components
+│   │   ├── ui/                  # Base UI components (shadcn-ui)
+│   │   ├── ChatWidget.tsx       # AI chatbot widget
+│   │   ├── FloatingWhatsApp.tsx # WhatsApp button
+│   │   └── SEO.tsx              # SEO component
+│   ├── pages/                   # Page components (32 pages)
+│   │   ├── Index.tsx            # Homepage
+│   │   ├── About.tsx
+│   │   ├── Services.tsx
+│   │   ├── GetStarted.tsx       # Order form
+│   │   ├── Admin.tsx            # Admin dashboard
+│   │   └── ...
+│   ├── integrations/
+│   │   └── supabase/
+│   │       ├── client.ts        # Supabase client
+│   │       └── types.ts         # Database type definitions
+│   ├── hooks/                   # Custom React hooks
+│   ├── data/                    # Static data
+│   ├── lib/                     # Utility functions
+│   ├── assets/                  # Images, fonts
+│   ├── App.tsx                  # Main app component
+│   ├── main.tsx                 # Entry point
+│   └── index.css                # Global styles
+├── supabase/
+│   └── migrations/              # {len(migrations)} database migration files
+├── dist/                        # Production build output
+├── package.json                 # Dependencies
+├── tsconfig.json                # TypeScript config
+├── tailwind.config.ts           # Tailwind config
+├── vite.config.ts               # Vite config
+├── .env                         # Environment variables
+└── README.md                    # Project documentation
+'''
+
+    p = doc.add_paragraph(file_structure)
+    p.style = 'No Spacing'
+
+    # Appendix C: Environment Variables
+    doc.add_heading('Appendix C: Environment Variables', level=2)
+
+    documented = [
+        ('VITE_SUPABASE_URL', 'Supabase project URL', 'Required', 'Public'),
+        ('VITE_SUPABASE_PUBLISHABLE_KEY', 'Supabase anon/public key', 'Required', 'Public'),
+        ('VITE_SUPABASE_PROJECT_ID', 'Supabase project ID', 'Required', 'Public'),
+        ('PAYSTACK_PUBLIC_KEY', 'Paystack public key', 'Required', 'Public'),
+        ('PAYSTACK_SECRET_KEY', 'Paystack secret key', 'Required', 'Secret - Server only'),
+        ('GEMINI_API_KEY', 'Google Gemini AI key', 'Required', 'Secret - Server only'),
+        ('WHATSAPP_API_KEY', 'WhatsApp Business API key', 'Optional', 'Secret - Server only'),
+        ('SMTP_HOST', 'Email SMTP host', 'Optional', 'Server only'),
+        ('SMTP_USER', 'Email SMTP username', 'Optional', 'Server only'),
+        ('SMTP_PASS', 'Email SMTP password', 'Optional', 'Secret - Server only'),
+        ('SUPABASE_URL', 'Supabase project URL in edge functions (set by Supabase)', 'Required', 'Server only'),
+        ('SUPABASE_ANON_KEY', 'Supabase anon key in edge functions (set by Supabase)', 'Required', 'Server only'),
+        ('SUPABASE_SERVICE_ROLE_KEY', 'Service role key, bypasses RLS (set by Supabase)', 'Required',
+         'Secret - Server only'),
+        ('RESEND_API_KEY', 'Resend API key for transactional email', 'Required', 'Secret - Server only'),
+        ('GROQ_API_KEY', 'Groq API key for the customer chatbot', 'Required', 'Secret - Server only'),
+        ('RECAPTCHA_SECRET_KEY', 'Google reCAPTCHA secret for verify-captcha', 'Optional',
+         'Secret - Server only'),
+        ('TOTP_ENCRYPTION_KEY', 'Key encrypting stored two-factor secrets', 'Required', 'Secret - Server only'),
+        ('TELEGRAM_BOT_TOKEN', 'Telegram bot for admin notifications', 'Optional', 'Secret - Server only'),
+        ('TELEGRAM_CHAT_ID', 'Telegram chat receiving admin notifications', 'Optional', 'Server only'),
+        ('WEBHOOK_SECRET', 'Shared secret of the deploy webhook', 'Required', 'Secret - Server only'),
+    ]
+    add_env_var_reference(doc, documented, env_vars)
+
+    # Appendix D: Deployment Checklist
+    doc.add_heading('Appendix D: Deployment Checklist', level=2)
+
+    doc.add_heading('Pre-Deployment', level=3)
+    pre_deploy = [
+        '☐ All features tested in development',
+        '☐ Code reviewed and approved',
+        '☐ TypeScript compilation successful (no errors)',
+        '☐ All environment variables configured',
+        '☐ Database migrations tested',
+        '☐ Security audit completed',
+        '☐ Performance optimization done',
+        '☐ SEO meta tags updated',
+        '☐ Backup current production',
+        '☐ Notify stakeholders of deployment'
+    ]
+
+    add_bullets(doc, pre_deploy)
+
+    doc.add_heading('During Deployment', level=3)
+    during_deploy = [
+        '☐ Run production build: npm run build',
+        '☐ Test build locally: npm run preview',
+        '☐ Upload dist/ to server',
+        '☐ Apply database migrations if any',
+        '☐ Update environment variables on server',
+        '☐ Clear server cache',
+        '☐ Restart web server if needed',
+        '☐ Verify SSL certificate valid'
+    ]
+
+    add_bullets(doc, during_deploy)
+
+    doc.add_heading('Post-Deployment', level=3)
+    post_deploy = [
+        '☐ Verify website loads (https://vibelinkgh.com)',
+        '☐ Test user registration and login',
+        '☐ Place test order',
+        '☐ Test payment flow',
+        '☐ Verify email notifications sent',
+        '☐ Check admin dashboard accessible',
+        '☐ Test mobile responsiveness',
+        '☐ Monitor error logs for 1 hour',
+        '☐ Check analytics tracking',
+        '☐ Update documentation',
+        '☐ Notify team of successful deployment'
+    ]
+
+    add_bullets(doc, post_deploy)
+
+    # Appendix E: Glossary
+    doc.add_heading('Appendix E: Glossary', level=2)
+
+    add_labeled_paragraphs(doc, GLOSSARY)
+    add_bookmarks(doc, [term_bookmark(term) for term, _ in GLOSSARY])
+
+    # Appendices F-H: documents kept as Markdown in docs/
+    add_included_documents(doc, markdown_docs)
+
+    doc.add_paragraph('\n\n')
+    doc.add_paragraph('--- End of Document ---').alignment = WD_ALIGN_PARAGRAPH.CENTER
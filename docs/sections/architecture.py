@@ -0,0 +1,218 @@
+"""
+Technical architecture section
+"""
+
+from docx.shared import Inches
+
+from .common import add_bullets, add_labeled_paragraphs, package_version
+
+
+def add_page_weights(doc, import_graph):
+    """Add the per-page import weight table and the heavy dependencies loaded up front"""
+    doc.add_heading('Page Weight', level=3)
+    pages = [page for page in import_graph['pages'] if page['routed']]
+    eager = [page for page in pages if not page['lazy']]
+    doc.add_paragraph(
+        f"A static import graph of src/ ({import_graph['modules']} modules, {import_graph['edges']} "
+        f'imports, @/ resolved through tsconfig.json) gives the code each route page pulls in. '
+        f'{len(eager)} of {len(pages)} routed pages are imported eagerly by src/App.tsx, so their '
+        'code ships in the initial bundle whichever page is opened. Own KB is code no other page uses.'
+    )
+
+    weight_table = doc.add_table(rows=len(pages) + 1, cols=6)
+    weight_table.style = 'Light Grid Accent 1'
+    for col, header in enumerate(('Page', 'Route', 'Modules', 'Code KB', 'Own KB', 'Heavy Dependencies')):
+        weight_table.cell(0, col).text = header
+    for i, page in enumerate(pages, 1):
+        weight_table.cell(i, 0).text = page['name'] + ('' if page['lazy'] else ' *')
+        weight_table.cell(i, 1).text = ', '.join(page['paths'])
+        weight_table.cell(i, 2).text = str(page['modules'])
+        weight_table.cell(i, 3).text = f"{page['bytes'] / 1024:,.0f}"
+        weight_table.cell(i, 4).text = f"{page['own_bytes'] / 1024:,.0f}"
+        weight_table.cell(i, 5).text = ', '.join(page['heavy'])
+    note = doc.add_paragraph('* loaded eagerly. ')
+    note.add_run('Sizes are source bytes before minification; imported images are not counted.')
+
+    heavy = import_graph['heavy_eager']
+    if heavy:
+        doc.add_paragraph('Heavy dependencies in the initial bundle, and the eager pages pulling them in:')
+        add_bullets(doc, [f"{label}: {', '.join(pages) if len(pages) <= 5 else f'{len(pages)} pages'}"
+                          for label, pages in sorted(heavy.items(), key=lambda item: len(item[1]))])
+        doc.add_paragraph(
+            'Loading the pages that use them with React.lazy() and a Suspense boundary moves '
+            'these libraries into per-page chunks.'
+        )
+    if import_graph['unresolved']:
+        add_bullets(doc, [f'Unresolved import: {entry}' for entry in import_graph['unresolved']])
+
+
+def add_technical_architecture(doc, migrations, lockfile, schema, import_graph):
+    """Add technical architecture section"""
+    doc.add_heading('TECHNICAL ARCHITECTURE', level=1)
+
+    doc.add_heading('System Architecture Overview', level=2)
+    doc.add_paragraph(
+        'VibeLink Ghana follows a modern, cloud-based architecture pattern with clear separation '
+        'of concerns between frontend presentation, backend business logic, and data persistence.'
+    )
+
+    # Architecture diagram description
+    doc.add_paragraph().add_run('[DIAGRAM: System Architecture]').bold = True
+    diagram_desc = doc.add_paragraph()
+    diagram_desc.add_run('Create a diagram showing:\n')
+    diagram_points = [
+        'Client Layer: Web Browser (React SPA)',
+        'CDN Layer: Static asset delivery',
+        'Application Layer: Vite-built React application',
+        'API Layer: Supabase Edge Functions',
+        'Database Layer: PostgreSQL (Supabase)',
+        'External Integrations: Paystack, WhatsApp, Gemini AI, Email Services',
+        'Storage: Supabase Storage for images and documents'
+    ]
+    add_bullets(doc, diagram_points, left_indent=Inches(0.5))
+
+    doc.add_heading('Technology Stack Breakdown', level=2)
+
+    # Frontend Stack Table
+    doc.add_heading('Frontend Technologies', level=3)
+    frontend_table = doc.add_table(rows=9, cols=3)
+    frontend_table.style = 'Light List Accent 1'
+
+    # Versions are the ones resolved in package-lock.json
+    frontend_data = [
+        ('Technology', 'Version', 'Purpose'),
+        ('React', package_version(lockfile, 'react'), 'UI framework for building component-based interfaces'),
+        ('TypeScript', package_version(lockfile, 'typescript'), 'Type safety and enhanced developer experience'),
+        ('Vite', package_version(lockfile, 'vite'), 'Fast build tool and development server'),
+        ('Tailwind CSS', package_version(lockfile, 'tailwindcss'), 'Utility-first CSS framework'),
+        ('shadcn-ui', 'Latest', 'Accessible UI component library'),
+        ('React Router', package_version(lockfile, 'react-router-dom'), 'Client-side routing'),
+        ('TanStack Query', package_version(lockfile, '@tanstack/react-query'), 'Data fetching and state management'),
+        ('Framer Motion', package_version(lockfile, 'framer-motion'), 'Animation library')
+    ]
+
+    for i, (tech, version, purpose) in enumerate(frontend_data):
+        frontend_table.cell(i, 0).text = tech
+        frontend_table.cell(i, 1).text = version
+        frontend_table.cell(i, 2).text = purpose
+
+    # Backend Stack Table
+    doc.add_heading('Backend Technologies', level=3)
+    backend_table = doc.add_table(rows=7, cols=2)
+    backend_table.style = 'Light List Accent 1'
+
+    backend_data = [
+        ('Technology', 'Purpose'),
+        ('Supabase', 'Backend-as-a-Service platform'),
+        ('PostgreSQL 14.1', 'Relational database'),
+        ('Supabase Auth', 'Authentication and authorization'),
+        ('Supabase Edge Functions', 'Serverless functions'),
+        ('Supabase Storage', 'File storage'),
+        ('Row Level Security (RLS)', 'Database-level security')
+    ]
+
+    for i, (tech, purpose) in enumerate(backend_data):
+        backend_table.cell(i, 0).text = tech
+        backend_table.cell(i, 1).text = purpose
+
+    # Integration Stack
+    doc.add_heading('Third-Party Integrations', level=3)
+    integration_table = doc.add_table(rows=5, cols=2)
+    integration_table.style = 'Light List Accent 1'
+
+    integration_data = [
+        ('Service', 'Purpose'),
+        ('Paystack', 'Payment processing for Ghana'),
+        ('Google Gemini AI', 'AI chatbot for customer support'),
+        ('Email Service', 'Transactional emails and notifications'),
+        ('WhatsApp Business API', 'Direct WhatsApp invitation delivery')
+    ]
+
+    for i, (service, purpose) in enumerate(integration_data):
+        integration_table.cell(i, 0).text = service
+        integration_table.cell(i, 1).text = purpose
+
+    doc.add_heading('Frontend Architecture', level=2)
+    doc.add_paragraph(
+        'The frontend follows a component-based architecture with clear separation of concerns:'
+    )
+
+    architecture_components = [
+        ('Pages (src/pages/)', f"{len(import_graph['pages'])} page components, "
+                               f"{sum(page['routed'] for page in import_graph['pages'])} of them routed"),
+        ('Components (src/components/)', 'Reusable UI components organized by feature'),
+        ('UI Components (src/components/ui/)', 'Base shadcn-ui components'),
+        ('Hooks (src/hooks/)', 'Custom React hooks for shared logic'),
+        ('Integrations (src/integrations/)', 'Supabase client and type definitions'),
+        ('Data (src/data/)', 'Static data and configuration'),
+        ('Assets (src/assets/)', 'Images, icons, and static files')
+    ]
+
+    add_labeled_paragraphs(doc, architecture_components)
+
+    add_page_weights(doc, import_graph)
+
+    doc.add_heading('Backend Architecture (Supabase)', level=2)
+    doc.add_paragraph(
+        'Supabase provides a complete backend infrastructure with the following components:'
+    )
+
+    backend_components = [
+        f'PostgreSQL Database with {len(migrations)} migration files for schema versioning',
+        'Automatic REST API generation from database schema',
+        'Real-time subscriptions for live data updates',
+        'Row Level Security (RLS) policies for fine-grained access control',
+        'Edge Functions for custom business logic',
+        'Storage buckets for file management',
+        'Built-in authentication with email, social providers'
+    ]
+
+    add_bullets(doc, backend_components)
+
+    doc.add_heading('Database Structure Overview', level=2)
+    doc.add_paragraph(
+        f'The database consists of {len(schema["tables"])} interconnected tables (see Database '
+        'Schema section for details). Key tables include:'
+    )
+
+    key_tables = [
+        'orders: Core order management',
+        'customers: Customer information',
+        'order_items: Individual items within orders',
+        'invitations: Digital invitation data',
+        'payments: Payment transaction records',
+        'referrals: Referral program tracking',
+        'blog_posts: Content management for blog',
+        'portfolio_items: Portfolio showcase',
+        'surveys: Customer feedback collection',
+        'abandoned_carts: Cart abandonment tracking',
+        'ai_generated_content: AI-generated content management',
+        'analytics_events: User interaction tracking'
+    ]
+
+    add_bullets(doc, key_tables)
+
+    doc.add_heading('Deployment Architecture', level=2)
+    doc.add_paragraph(
+        'The deployment follows a modern CI/CD pattern with three distinct environments:'
+    )
+
+    # Deployment table
+    deploy_table = doc.add_table(rows=4, cols=3)
+    deploy_table.style = 'Medium Grid 1 Accent 1'
+
+    deploy_data = [
+        ('Environment', 'Location', 'Purpose'),
+        ('Development', 'C:\\Users\\CyberAware\\OneDrive\\...\\vibelink\\app\\',
+         'Local development and testing'),
+        ('Version Control', 'https://github.com/xboggg/vibe-link-ghana-3e5cfc20',
+         'Central repository and collaboration'),
+        ('Production', '/var/www/vibelinkgh.com/', 'Live production server')
+    ]
+
+    for i, (env, loc, purpose) in enumerate(deploy_data):
+        deploy_table.cell(i, 0).text = env
+        deploy_table.cell(i, 1).text = loc
+        deploy_table.cell(i, 2).text = purpose
+
+    doc.add_page_break()
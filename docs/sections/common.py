@@ -0,0 +1,103 @@
+"""
+Shared helpers for section modules: fast paragraph emitters and small lookups
+"""
+
+import re
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_RUN_SPLIT = re.compile(r'([\t\n\r])')
+
+
+def _run_xml(text, bold=False, rpr=''):
+    """Build a w:r element string for already-escaped text, matching python-docx output
+
+    rpr, if given, is the run's w:rPr content and takes the place of bold.
+    """
+    parts = ['<w:r>']
+    if rpr or bold:
+        parts.append(f'<w:rPr>{rpr or "<w:b/>"}</w:rPr>')
+    for chunk in _RUN_SPLIT.split(text):
+        if chunk == '\t':
+            parts.append('<w:tab/>')
+        elif chunk in ('\n', '\r'):
+            parts.append('<w:br/>')
+        elif chunk:
+            if len(chunk.strip()) < len(chunk):
+                parts.append(f'<w:t xml:space="preserve">{chunk}</w:t>')
+            else:
+                parts.append(f'<w:t>{chunk}</w:t>')
+    parts.append('</w:r>')
+    return ''.join(parts)
+
+
+def _ppr_xml(doc, style, line_spacing, left_indent):
+    """Build the shared w:pPr string once per list"""
+    props = []
+    if style is not None:
+        props.append(f'<w:pStyle w:val="{doc.styles[style].style_id}"/>')
+    if line_spacing is not None:
+        props.append(f'<w:spacing w:line="{int(line_spacing * 240)}" w:lineRule="auto"/>')
+    if left_indent is not None:
+        props.append(f'<w:ind w:left="{left_indent.twips}"/>')
+    return f'<w:pPr>{"".join(props)}</w:pPr>' if props else ''
+
+
+def _escape_all(texts):
+    """Escape a batch of strings for XML text in one pass"""
+    # NUL cannot occur in XML text, so it is a safe separator. Same result as
+    # xml.sax.saxutils.escape, which would pull in urllib at import time.
+    if not texts:
+        return []
+    joined = '\x00'.join(texts).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    return joined.split('\x00')
+
+
+def _append_paragraphs(doc, paragraphs_xml):
+    """Parse pre-templated w:p strings in one go and append them before sectPr"""
+    if not paragraphs_xml:
+        return
+    body = doc.element.body
+    fragment = parse_xml(f'<w:body xmlns:w="{W_NS}">{"".join(paragraphs_xml)}</w:body>')
+    sect_pr = body.find(qn('w:sectPr'))
+    for p in list(fragment):
+        if sect_pr is not None:
+            sect_pr.addprevious(p)
+        else:
+            body.append(p)
+
+
+def add_bullets(doc, items, style='List Bullet', line_spacing=None, left_indent=None):
+    """Add a whole bullet list as raw paragraphs (fast path for doc.add_paragraph)"""
+    ppr = _ppr_xml(doc, style, line_spacing, left_indent)
+    _append_paragraphs(doc, [
+        f'<w:p>{ppr}{_run_xml(text) if text else ""}</w:p>' for text in _escape_all(items)
+    ])
+
+
+def add_labeled_paragraphs(doc, pairs, line_spacing=None):
+    """Add 'Label: description' paragraphs with a bold label in one batch"""
+    ppr = _ppr_xml(doc, None, line_spacing, None)
+    escaped = _escape_all([part for pair in pairs for part in pair])
+    _append_paragraphs(doc, [
+        f'<w:p>{ppr}{_run_xml(label + ": ", bold=True)}{_run_xml(description)}</w:p>'
+        for label, description in zip(escaped[::2], escaped[1::2])
+    ])
+
+
+def package_version(lockfile, package):
+    """Resolved version of a direct dependency, or '-' if it is not declared"""
+    return lockfile[package]['version'] if package in lockfile else '-'
+
+
+def shade_cell(cell, hex_color, text=None):
+    """Fill a table cell with hex_color ('#RRGGBB'), writing text in black or white for contrast"""
+    fill = hex_color.lstrip('#').upper()
+    cell._tc.get_or_add_tcPr().append(parse_xml(
+        f'<w:shd xmlns:w="{W_NS}" w:val="clear" w:color="auto" w:fill="{fill}"/>'))
+    red, green, blue = (int(fill[i:i + 2], 16) for i in (0, 2, 4))
+    ink = '000000' if 0.299 * red + 0.587 * green + 0.114 * blue > 150 else 'FFFFFF'
+    run = cell.paragraphs[0].add_run(hex_color.upper() if text is None else text)
+    run._r.get_or_add_rPr().append(parse_xml(f'<w:color xmlns:w="{W_NS}" w:val="{ink}"/>'))
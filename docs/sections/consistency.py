@@ -0,0 +1,56 @@
+"""
+Schema consistency section: drift between the migrations and types.ts
+"""
+
+from .common import add_bullets
+
+KIND_LABELS = {'table': 'Table', 'column': 'Column', 'enum': 'Enum'}
+
+
+def add_schema_consistency(doc, schema_drift):
+    """Add schema consistency section"""
+    doc.add_heading('SCHEMA CONSISTENCY', level=1)
+    doc.add_paragraph(
+        'The frontend is typed against src/integrations/supabase/types.ts, which is generated '
+        'from the live database, while this manual describes the schema built by replaying '
+        'supabase/migrations. When the two disagree, queries can fail at runtime even though '
+        'they type-check, and a fresh database built from the migrations will not match '
+        'production.'
+    )
+
+    findings = schema_drift['findings']
+    add_bullets(doc, [
+        f"{schema_drift['tables_compared']} tables, {schema_drift['columns_compared']} columns and "
+        f"{schema_drift['enums_compared']} enums compared",
+        f"{sum(kind == 'table' for kind, _, _ in findings)} table, "
+        f"{sum(kind == 'column' for kind, _, _ in findings)} column and "
+        f"{sum(kind == 'enum' for kind, _, _ in findings)} enum differences found",
+    ])
+
+    if not findings:
+        doc.add_paragraph('types.ts matches the migrations.')
+        doc.add_page_break()
+        return
+
+    doc.add_heading('Differences', level=2)
+    drift_table = doc.add_table(rows=len(findings) + 1, cols=3)
+    drift_table.style = 'Light Grid Accent 1'
+    drift_table.cell(0, 0).text = 'Kind'
+    drift_table.cell(0, 1).text = 'Name'
+    drift_table.cell(0, 2).text = 'Difference'
+    for i, (kind, subject, detail) in enumerate(findings, 1):
+        drift_table.cell(i, 0).text = KIND_LABELS[kind]
+        drift_table.cell(i, 1).text = subject
+        drift_table.cell(i, 2).text = detail
+
+    doc.add_heading('Resolving Drift', level=2)
+    add_bullets(doc, [
+        'Missing from types.ts: regenerate the types (supabase gen types typescript) after '
+        'applying the latest migrations',
+        'Missing from the migrations: the change was made directly in the dashboard; capture it '
+        'in a new migration (supabase db diff) so fresh environments get it',
+        'Tables created twice with CREATE TABLE IF NOT EXISTS keep the first definition, so '
+        'later column changes need an ALTER TABLE',
+    ])
+
+    doc.add_page_break()
@@ -0,0 +1,71 @@
+"""
+Cover page, and the one-line cover used by partial builds
+"""
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt, RGBColor
+
+
+def add_cover_page(doc, subtitle='Technical Documentation', prepared_for=None):
+    """Add professional cover page"""
+    # Title
+    title = doc.add_paragraph()
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    title_run = title.add_run('VibeLink Ghana\n')
+    title_run.font.size = Pt(36)
+    title_run.font.bold = True
+    title_run.font.color.rgb = doc.styles['Heading 1'].font.color.rgb
+
+    # Subtitle
+    subtitle_par = doc.add_paragraph()
+    subtitle_par.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    subtitle_run = subtitle_par.add_run(f'{subtitle}\n\n')
+    subtitle_run.font.size = Pt(24)
+    subtitle_run.font.color.rgb = RGBColor(63, 81, 181)
+
+    # Description
+    desc = doc.add_paragraph()
+    desc.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    desc_run = desc.add_run('Digital Event Invitation Platform\n\n\n\n')
+    desc_run.font.size = Pt(18)
+    desc_run.font.italic = True
+
+    # Version info
+    info = doc.add_paragraph()
+    info.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    info_text = info.add_run(f'Version 1.0\n')
+    info_text.font.size = Pt(14)
+
+    date_text = info.add_run(f'January 28, 2026\n\n')
+    date_text.font.size = Pt(14)
+
+    if prepared_for:
+        recipient = info.add_run(f'Prepared for {prepared_for}\n\n')
+        recipient.font.size = Pt(14)
+        recipient.font.bold = True
+
+    logo_placeholder = info.add_run('[Logo Placeholder]\n\n')
+    logo_placeholder.font.size = Pt(12)
+    logo_placeholder.font.italic = True
+
+    website = info.add_run('https://vibelinkgh.com/')
+    website.font.size = Pt(12)
+    website.font.color.rgb = RGBColor(33, 150, 243)
+
+    doc.add_page_break()
+
+
+def add_cover_stub(doc, titles):
+    """Add a one-line cover for partial (preview) builds"""
+    title = doc.add_paragraph()
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    title_run = title.add_run('VibeLink Ghana Technical Documentation - Preview')
+    title_run.font.size = Pt(18)
+    title_run.font.bold = True
+    title_run.font.color.rgb = doc.styles['Heading 1'].font.color.rgb
+
+    note = doc.add_paragraph()
+    note.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    note_run = note.add_run(f'Partial build: {len(titles)} section(s)')
+    note_run.font.italic = True
+    note_run.font.size = Pt(10)
@@ -0,0 +1,200 @@
+"""
+Database schema section
+"""
+
+import struct
+
+from docx.shared import Inches
+
+from .common import add_bullets, add_labeled_paragraphs
+
+# Tables documented column by column, with what they hold; the other tables
+# are listed under Supporting Tables
+CORE_TABLES = {
+    'orders': 'Core table for managing customer orders.',
+    'profiles': 'Stores customer account information.',
+    'payment_history': 'Tracks all payment transactions.',
+}
+
+
+def add_columns_table(doc, columns):
+    """Add a Field / Type / Constraints table of one table's columns (as in collect_schema)"""
+    columns_table = doc.add_table(rows=len(columns) + 1, cols=3)
+    columns_table.style = 'Medium Grid 1 Accent 1'
+    for cell, header in zip(columns_table.rows[0].cells, ('Field', 'Type', 'Constraints')):
+        cell.text = header
+    for row, (name, column) in zip(columns_table.rows[1:], columns.items()):
+        constraints = ['not null'] if not column['nullable'] else []
+        constraints += ['default'] if column['default'] else []
+        constraints += [f"references {column['references']}"] if column['references'] else []
+        cells = row.cells
+        cells[0].text = name
+        cells[1].text = column['type']
+        cells[2].text = ', '.join(constraints) or '-'
+
+
+def _png_size(path):
+    """(width, height) in pixels, from the PNG header"""
+    with open(path, 'rb') as f:
+        return struct.unpack('>II', f.read(24)[16:24])
+
+
+def add_database_schema(doc, migrations, schema, er_diagram, index_advice):
+    """Add database schema section"""
+    doc.add_heading('DATABASE SCHEMA', level=1)
+
+    doc.add_heading('Database Overview', level=2)
+    doc.add_paragraph(
+        f'VibeLink Ghana uses PostgreSQL 14.1 via Supabase with {len(migrations)} migration files tracking '
+        'schema evolution. The database implements Row Level Security (RLS) for fine-grained '
+        'access control and uses foreign key constraints to maintain referential integrity.'
+    )
+
+    doc.add_heading('Core Tables', level=2)
+    doc.add_paragraph('Columns as left by the migrations, in definition order.')
+    for table, description in CORE_TABLES.items():
+        if table not in schema['columns']:
+            continue
+        doc.add_heading(table, level=3)
+        doc.add_paragraph(description)
+        add_columns_table(doc, schema['columns'][table])
+
+    doc.add_heading('Supporting Tables', level=2)
+    add_labeled_paragraphs(doc, [(table, ', '.join(schema['columns'][table]) or '-')
+                                 for table in schema['tables'] if table not in CORE_TABLES])
+
+    doc.add_heading('Key Relationships', level=2)
+    doc.add_paragraph(
+        f"Foreign keys link {er_diagram['tables']} tables, drawn below from the migrations. "
+        'Each table hangs under the table its first foreign key references; grey lines show '
+        'further references. An SVG version is written next to the image in docs/.cache/er/.'
+    )
+    width, height = _png_size(er_diagram['png'])
+    doc.add_picture(er_diagram['png'], width=Inches(min(6.5, 8.5 * width / height)))
+
+    # A foreign key on the primary key itself makes the relationship one-to-one
+    add_bullets(doc, [f"{parent} {'1:1' if column == 'id' else '1:N'} {child} ({child}.{column})"
+                      for child, column, parent in sorted(er_diagram['edges'], key=lambda e: (e[2], e[0]))])
+
+    doc.add_heading('Migration Strategy', level=2)
+    doc.add_paragraph(
+        f'Database schema changes are managed through Supabase migrations with {len(migrations)} migration '
+        'files tracking the evolution of the database schema.'
+    )
+
+    doc.add_heading('Migration Process', level=3)
+    migration_steps = [
+        'Create new migration file: supabase migration new migration_name',
+        'Write SQL DDL statements in migration file',
+        'Test migration in local development environment',
+        'Review migration for potential data loss or performance issues',
+        'Apply migration to staging environment',
+        'Verify migration success and data integrity',
+        'Apply migration to production environment',
+        'Monitor for errors and performance degradation',
+        'Document migration in changelog'
+    ]
+
+    for i, step in enumerate(migration_steps, 1):
+        doc.add_paragraph(f'{i}. {step}')
+
+    doc.add_heading('Example Migration Files', level=3)
+    example_migrations = [
+        '20241230_order_priority.sql - Added priority field to orders table',
+        '20241230_rate_limit_table.sql - Created rate limiting table',
+        '20251225000923_*.sql - Various schema enhancements'
+    ]
+    example_migrations += [f"{migration['name']} - Latest migration" for migration in migrations[-3:]]
+
+    add_bullets(doc, example_migrations)
+
+    doc.add_heading('Row Level Security (RLS)', level=3)
+    policy_count = sum(len(policies) for policies in schema['policies'].values())
+    doc.add_paragraph(
+        f'RLS policies ensure users can only access data they are authorized to see. The '
+        f'{schema["policy_statements"]} CREATE/ALTER/DROP POLICY statements in the migration '
+        f'history leave {policy_count} policies in effect. Who each operation is open to:'
+    )
+
+    add_labeled_paragraphs(doc, [
+        ('anyone', 'no restriction (USING true / WITH CHECK true)'),
+        ('anyone (filtered)', 'everyone, limited to matching rows (e.g. published = true)'),
+        ('owner', "the signed-in user the row belongs to (auth.uid() matches)"),
+        ('signed-in', 'any authenticated user'),
+        ('admin', "users holding the 'admin' role"),
+        ('service role', 'server-side calls with the service role key'),
+        ('-', 'no policy: denied to everyone except the service role, which bypasses RLS'),
+    ])
+
+    matrix = schema['policy_matrix']
+    operations = ('SELECT', 'INSERT', 'UPDATE', 'DELETE')
+    matrix_table = doc.add_table(rows=len(matrix) + 1, cols=len(operations) + 1)
+    matrix_table.style = 'Light Grid Accent 1'
+    for cell, header in zip(matrix_table.rows[0].cells, ('Table',) + operations):
+        cell.text = header
+    for row, (table, access) in zip(matrix_table.rows[1:], matrix.items()):
+        cells = row.cells
+        cells[0].text = table
+        for cell, operation in zip(cells[1:], operations):
+            cell.text = ', '.join(access[operation]) or '-'
+
+    doc.add_heading('Table Inventory', level=3)
+    doc.add_paragraph(
+        f'Tables present after all {len(migrations)} migrations, with the migration that '
+        'created each one:'
+    )
+    rls_enabled = set(schema['rls_enabled'])
+    inventory_table = doc.add_table(rows=len(schema['tables']) + 1, cols=3)
+    inventory_table.style = 'Light Grid Accent 1'
+    for cell, header in zip(inventory_table.rows[0].cells, ('Table', 'Created In', 'RLS')):
+        cell.text = header
+    for row, table in zip(inventory_table.rows[1:], schema['tables']):
+        cells = row.cells
+        cells[0].text = table
+        cells[1].text = schema['created_in'][table]
+        cells[2].text = 'Enabled' if table in rls_enabled else 'Disabled'
+
+    add_missing_indexes(doc, index_advice)
+
+    doc.add_page_break()
+
+
+def add_missing_indexes(doc, index_advice, limit=15):
+    """Add the ranked report of indexes the app's queries lack"""
+    doc.add_heading('Missing Indexes', level=3)
+    missing = index_advice['missing']
+    doc.add_paragraph(
+        f"{index_advice['chains']} Supabase query chains in {index_advice['files']} source files "
+        f"touch {index_advice['tables']} tables. {index_advice['covered']} of the columns they filter "
+        f'or sort on lead an index declared in the migrations; {len(missing)} do not. The '
+        'suggestions below are ranked by call sites, filters counting double:'
+    )
+    if not missing:
+        return
+
+    shown = missing[:limit]
+    advice_table = doc.add_table(rows=len(shown) + 1, cols=5)
+    advice_table.style = 'Light Grid Accent 1'
+    for cell, header in zip(advice_table.rows[0].cells,
+                            ('Table', 'Index Columns', 'Filters', 'Sorts', 'Example Call Site')):
+        cell.text = header
+    for row, suggestion in zip(advice_table.rows[1:], shown):
+        cells = row.cells
+        cells[0].text = suggestion['table']
+        cells[1].text = ', '.join(suggestion['columns'])
+        cells[2].text = str(suggestion['filters'])
+        cells[3].text = str(suggestion['sorts'])
+        cells[4].text = suggestion['sites'][0]
+
+    notes = [f"{s['table']}.{s['columns'][0]}: {s['note']}" for s in shown if s['note']]
+    if len(missing) > limit:
+        notes.append(f'{len(missing) - limit} lower-ranked suggestions are not shown')
+    if notes:
+        add_bullets(doc, notes)
+
+    top = missing[:5]
+    if len(missing) > len(top):
+        doc.add_paragraph(f'A migration adding the top {len(top)}:')
+    else:
+        doc.add_paragraph('A migration adding it:' if len(top) == 1 else f'A migration adding all {len(top)}:')
+    add_bullets(doc, [suggestion['ddl'] for suggestion in top], style='List Number')
@@ -0,0 +1,243 @@
+"""
+Deployment and infrastructure section
+"""
+
+from .common import add_bullets
+from .markdown import add_imported_section
+
+
+def add_deployment_infrastructure(doc, assets, docx_sections):
+    """Add deployment and infrastructure section"""
+    doc.add_heading('DEPLOYMENT & INFRASTRUCTURE', level=1)
+
+    doc.add_heading('Server Setup', level=2)
+    doc.add_paragraph(
+        'The production server hosts the VibeLink Ghana application with optimized '
+        'configuration for performance and security.'
+    )
+
+    doc.add_heading('Server Specifications', level=3)
+    server_specs = [
+        'Operating System: Linux (Ubuntu/Debian recommended)',
+        'Web Server: Nginx or Apache',
+        'Node.js: Not required (static site)',
+        'SSL/TLS: Let\'s Encrypt certificate',
+        'Document Root: /var/www/vibelinkgh.com/',
+        'Gzip Compression: Enabled',
+        'Caching: Browser caching headers configured'
+    ]
+
+    add_bullets(doc, server_specs)
+
+    doc.add_heading('Static Assets', level=3)
+    doc.add_paragraph('Files shipped from public/ and src/assets/ by type:')
+    assets_table = doc.add_table(rows=len(assets) + 1, cols=3)
+    assets_table.style = 'Light List Accent 1'
+    assets_table.cell(0, 0).text = 'Type'
+    assets_table.cell(0, 1).text = 'Files'
+    assets_table.cell(0, 2).text = 'Size'
+    for i, (ext, totals) in enumerate(assets.items(), 1):
+        assets_table.cell(i, 0).text = ext
+        assets_table.cell(i, 1).text = str(totals['files'])
+        assets_table.cell(i, 2).text = f"{totals['bytes'] / 1024 / 1024:.1f} MB"
+
+    doc.add_heading('Nginx Configuration Example', level=3)
+    nginx_config = '''
+server {
+    listen 80;
+    listen [::]:80;
+    server_name vibelinkgh.com www.vibelinkgh.com;
+    return 301 https://$server_name$request_uri;
+}
+
+server {
+    listen 443 ssl http2;
+    listen [::]:443 ssl http2;
+    server_name vibelinkgh.com www.vibelinkgh.com;
+
+    root /var/www/vibelinkgh.com;
+    index index.html;
+
+    ssl_certificate /etc/letsencrypt/live/vibelinkgh.com/fullchain.pem;
+    ssl_certificate_key /etc/letsencrypt/live/vibelinkgh.com/privkey.pem;
+
+    # Gzip compression
+    gzip on;
+    gzip_types text/css application/javascript application/json image/svg+xml;
+    gzip_comp_level 6;
+
+    # Security headers
+    add_header X-Frame-Options "SAMEORIGIN" always;
+    add_header X-Content-Type-Options "nosniff" always;
+    add_header X-XSS-Protection "1; mode=block" always;
+
+    # Cache static assets
+    location ~* \\.(js|css|png|jpg|jpeg|gif|svg|ico|woff|woff2)$ {
+        expires 1y;
+        add_header Cache-Control "public, immutable";
+    }
+
+    # SPA routing - redirect all to index.html
+    location / {
+        try_files $uri $uri/ /index.html;
+    }
+}
+'''
+
+    p = doc.add_paragraph(nginx_config)
+    p.style = 'No Spacing'
+
+    doc.add_heading('Domain Configuration', level=2)
+    doc.add_paragraph('DNS records configuration for vibelinkgh.com:')
+
+    dns_table = doc.add_table(rows=5, cols=4)
+    dns_table.style = 'Light Grid Accent 1'
+
+    dns_data = [
+        ('Type', 'Name', 'Value', 'TTL'),
+        ('A', '@', 'Server IP Address', '3600'),
+        ('A', 'www', 'Server IP Address', '3600'),
+        ('CNAME', 'www', 'vibelinkgh.com', '3600'),
+        ('TXT', '@', 'SPF/DKIM records', '3600')
+    ]
+
+    for i, (record_type, name, value, ttl) in enumerate(dns_data):
+        dns_table.cell(i, 0).text = record_type
+        dns_table.cell(i, 1).text = name
+        dns_table.cell(i, 2).text = value
+        dns_table.cell(i, 3).text = ttl
+
+    doc.add_heading('SSL Certificates', level=2)
+    doc.add_paragraph(
+        'SSL/TLS certificates are obtained from Let\'s Encrypt for free, automatically '
+        'renewed HTTPS encryption.'
+    )
+
+    doc.add_heading('SSL Setup Steps', level=3)
+    ssl_steps = [
+        '1. Install Certbot: sudo apt install certbot python3-certbot-nginx',
+        '2. Run Certbot: sudo certbot --nginx -d vibelinkgh.com -d www.vibelinkgh.com',
+        '3. Follow prompts to configure certificate',
+        '4. Test renewal: sudo certbot renew --dry-run',
+        '5. Auto-renewal cron job: Certbot installs this automatically',
+        '6. Verify HTTPS: Visit https://vibelinkgh.com',
+        '7. Check SSL rating: Use SSL Labs test'
+    ]
+
+    add_bullets(doc, ssl_steps)
+    doc.add_paragraph(
+        'On the production server SSH listens on port 80, so certbot needs the socket stopped '
+        'while it runs; Appendix H: SSL Setup Guide gives the exact procedure.'
+    )
+
+    doc.add_heading('Backup Strategy', level=2)
+    doc.add_paragraph(
+        'Comprehensive backup strategy ensures data protection and disaster recovery.'
+    )
+
+    doc.add_heading('Database Backups', level=3)
+    db_backups = [
+        'Supabase automatic daily backups (retained for 7 days on free tier)',
+        'Manual backups before major migrations',
+        'Export database to SQL file weekly',
+        'Store backups in separate location (cloud storage)',
+        'Test backup restoration quarterly',
+        'Point-in-time recovery available (paid tier)'
+    ]
+
+    add_bullets(doc, db_backups)
+
+    doc.add_heading('Code Backups', level=3)
+    code_backups = [
+        'GitHub repository serves as primary code backup',
+        'Local git repository on development PC',
+        'Tagged releases for version milestones',
+        'Branch protection on main branch',
+        'Regular commits with meaningful messages'
+    ]
+
+    add_bullets(doc, code_backups)
+
+    doc.add_heading('File Storage Backups', level=3)
+    storage_backups = [
+        'Supabase Storage automatic replication',
+        'Export uploaded files monthly',
+        'Store backups in AWS S3 or similar',
+        'Verify file integrity periodically'
+    ]
+
+    add_bullets(doc, storage_backups)
+
+    doc.add_heading('Monitoring', level=2)
+    doc.add_paragraph(
+        'Proactive monitoring ensures system health and quick issue detection.'
+    )
+
+    doc.add_heading('Application Monitoring', level=3)
+    app_monitoring = [
+        'Supabase Dashboard: Database performance, API usage',
+        'Error tracking: Console errors logged',
+        'Performance metrics: Page load times, API response times',
+        'User analytics: Google Analytics or similar',
+        'Real-time user activity',
+        'Uptime monitoring: UptimeRobot or Pingdom'
+    ]
+
+    add_bullets(doc, app_monitoring)
+
+    doc.add_heading('Server Monitoring', level=3)
+    server_monitoring = [
+        'CPU and memory usage',
+        'Disk space utilization',
+        'Network bandwidth',
+        'Web server logs (access and error logs)',
+        'SSL certificate expiration',
+        'Security scan alerts'
+    ]
+
+    add_bullets(doc, server_monitoring)
+
+    doc.add_heading('Key Metrics to Monitor', level=3)
+    metrics_table = doc.add_table(rows=9, cols=3)
+    metrics_table.style = 'Light List Accent 1'
+
+    metrics_data = [
+        ('Metric', 'Target', 'Alert Threshold'),
+        ('Uptime', '>99.5%', '<99%'),
+        ('Page Load Time', '<2 seconds', '>3 seconds'),
+        ('API Response Time', '<500ms', '>1000ms'),
+        ('Error Rate', '<0.1%', '>1%'),
+        ('Database Connections', 'Normal range', '>80% capacity'),
+        ('Disk Space', '>20% free', '<10% free'),
+        ('SSL Expiry', '>30 days', '<14 days')
+    ]
+
+    for i, (metric, target, threshold) in enumerate(metrics_data):
+        metrics_table.cell(i, 0).text = metric
+        metrics_table.cell(i, 1).text = target
+        metrics_table.cell(i, 2).text = threshold
+
+    doc.add_heading('Deployment Checklist', level=2)
+    checklist = [
+        '☐ Code tested in development environment',
+        '☐ All tests passing',
+        '☐ Environment variables configured',
+        '☐ Build production bundle: npm run build',
+        '☐ Test production build locally: npm run preview',
+        '☐ Backup current production deployment',
+        '☐ Backup database',
+        '☐ Upload dist/ folder to server',
+        '☐ Clear server cache',
+        '☐ Verify website loads correctly',
+        '☐ Test critical user flows (order, payment)',
+        '☐ Check all integrations working',
+        '☐ Monitor error logs for 1 hour',
+        '☐ Update documentation',
+        '☐ Notify team of deployment'
+    ]
+
+    add_bullets(doc, checklist)
+
+    add_imported_section(doc, docx_sections['launch_readiness'], 'Launch Readiness')
+
+    doc.add_page_break()
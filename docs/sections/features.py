@@ -0,0 +1,329 @@
+"""
+Features and specifications section
+"""
+
+from .common import add_bullets, add_labeled_paragraphs
+
+
+def _ghs(amount):
+    """An amount formatted as the order form shows it"""
+    return f'GHS {amount:,.0f}'
+
+
+def add_packages_pricing(doc, order_catalog):
+    """Add the package, add-on and price spread tables generated from orderFormData.ts"""
+    doc.add_heading('Packages & Pricing', level=2)
+    doc.add_paragraph(
+        'Generated from src/data/orderFormData.ts, the data behind the Get Started order form. '
+        f"Rush delivery adds {_ghs(order_catalog['rush_fee'])} and a "
+        f"{order_catalog['deposit_share']:.0%} deposit is due when the order is placed."
+    )
+
+    packages = sorted(order_catalog['packages'], key=lambda package: package['price'])
+    package_table = doc.add_table(rows=len(packages) + 1, cols=6)
+    package_table.style = 'Light Grid Accent 1'
+    for col, header in enumerate(('Package', 'Price', 'Hero Images', 'Hosting', 'Revisions', 'Best For')):
+        package_table.cell(0, col).text = header
+    for i, package in enumerate(packages, 1):
+        package_table.cell(i, 0).text = package['name'] + (' (most popular)' if package['popular'] else '')
+        package_table.cell(i, 1).text = _ghs(package['price'])
+        package_table.cell(i, 2).text = str(package['heroImages'])
+        package_table.cell(i, 3).text = package['hosting']
+        package_table.cell(i, 4).text = package['revisions']
+        package_table.cell(i, 5).text = package['description'].removeprefix('Best for ')
+
+    doc.add_heading('Add-ons', level=3)
+    names = {package['id']: package['name'] for package in packages}
+    add_ons = order_catalog['add_ons']
+    add_on_table = doc.add_table(rows=len(add_ons) + 1, cols=4)
+    add_on_table.style = 'Light Grid Accent 1'
+    for col, header in enumerate(('Category', 'Add-on', 'Price', 'Already In')):
+        add_on_table.cell(0, col).text = header
+    for i, add_on in enumerate(add_ons, 1):
+        add_on_table.cell(i, 0).text = add_on['category'].capitalize()
+        add_on_table.cell(i, 1).text = add_on['name']
+        add_on_table.cell(i, 2).text = add_on['priceLabel']
+        included = order_catalog['included'].get(add_on['id'], [])
+        add_on_table.cell(i, 3).text = ', '.join(names[package] for package in included)
+    if order_catalog['included']:
+        doc.add_paragraph(
+            f"{len(order_catalog['included'])} add-ons duplicate a feature of the packages listed under "
+            'Already In. The calculator still charges for them, so the add-ons step should hide or '
+            'disable those for the selected package.'
+        )
+
+    doc.add_heading('Price Spread', level=3)
+    doc.add_paragraph(
+        f"Totals of all {order_catalog['combinations']:,} orders with up to "
+        f"{order_catalog['max_add_ons']} add-ons, with and without rush delivery, priced as "
+        'PriceCalculator does (package + add-ons + rush fee). '
+        'The last column is the share of those orders costing more than the next package up.'
+    )
+    spread = order_catalog['spread']
+    spread_table = doc.add_table(rows=len(spread) + 1, cols=6)
+    spread_table.style = 'Light Grid Accent 1'
+    for col, header in enumerate(('Package', 'Base', 'With Rush', 'Median', 'Highest', 'Above Next Package')):
+        spread_table.cell(0, col).text = header
+    for i, row in enumerate(spread, 1):
+        spread_table.cell(i, 0).text = names[row['package']]
+        spread_table.cell(i, 1).text = _ghs(row['base'])
+        spread_table.cell(i, 2).text = _ghs(row['rush'])
+        spread_table.cell(i, 3).text = _ghs(row['median'])
+        spread_table.cell(i, 4).text = _ghs(row['max'])
+        spread_table.cell(i, 5).text = '' if row['above_next'] is None else f"{row['above_next']:.0%}"
+
+    doc.add_heading('Event Types & Palettes', level=3)
+    add_labeled_paragraphs(doc, [(event['name'], event['description'])
+                                 for event in order_catalog['event_types']])
+    add_bullets(doc, [f"{palette['name']} ({palette['mood']}): {', '.join(palette['colors'])}"
+                      for palette in order_catalog['palettes']])
+
+
+def add_features_specifications(doc, event_pages, order_catalog):
+    """Add features and specifications section"""
+    doc.add_heading('FEATURES & SPECIFICATIONS', level=1)
+
+    doc.add_heading('Customer-Facing Features', level=2)
+
+    doc.add_heading('1. Digital Invitation Creation', level=3)
+    doc.add_paragraph(
+        'Customers can create beautiful, customized digital invitations through an intuitive '
+        'form-based interface:'
+    )
+    invitation_features = [
+        f"Event type selection ({', '.join(event['name'] for event in order_catalog['event_types'])})",
+        'Template gallery with culturally appropriate designs',
+        'Custom text and messaging',
+        'Event details: date, time, venue with map integration',
+        'Guest list management',
+        'RSVP tracking',
+        'Photo upload for personalization',
+        'Color scheme customization',
+        'Font selection',
+        'Preview before finalizing'
+    ]
+    add_bullets(doc, invitation_features)
+
+    doc.add_heading('2. Order Management', level=3)
+    order_features = [
+        'Order placement through "Get Started" page',
+        f"Package selection ({', '.join(package['name'] for package in order_catalog['packages'])})",
+        'Add-on services selection',
+        'Real-time price calculation',
+        'Order summary review',
+        'Secure payment processing',
+        'Order confirmation email',
+        'Order tracking with unique ID',
+        'Order history in customer portal',
+        'Invoice generation and download'
+    ]
+    add_bullets(doc, order_features)
+
+    doc.add_heading('3. Customer Portal', level=3)
+    doc.add_paragraph('Authenticated customers access a personalized dashboard featuring:')
+    portal_features = [
+        'Overview of all orders',
+        'Active orders with status tracking',
+        'Completed orders archive',
+        'Order details view',
+        'Invoice download',
+        'Payment history',
+        'Profile management',
+        'Saved templates',
+        'Referral code and earnings',
+        'Support ticket system'
+    ]
+    add_bullets(doc, portal_features)
+
+    doc.add_heading('4. Order Tracking', level=3)
+    tracking_features = [
+        'Track order by Order ID or Email',
+        'Real-time status updates',
+        'Status stages: Pending, Processing, Design Review, Completed',
+        'Estimated completion time',
+        'Email notifications on status changes',
+        'WhatsApp notifications (optional)',
+        'Design preview when ready',
+        'Revision request capability'
+    ]
+    add_bullets(doc, tracking_features)
+
+    doc.add_heading('5. Referral Program', level=3)
+    doc.add_paragraph(
+        'Customers can earn rewards by referring others to VibeLink Ghana:'
+    )
+    referral_features = [
+        'Unique referral code generation',
+        'Shareable referral link',
+        'Social media sharing buttons',
+        'Track referrals and conversions',
+        'Earnings dashboard',
+        'Automatic commission calculation',
+        'Withdrawal request system',
+        'Referral leaderboard',
+        'Bonus incentives for milestones'
+    ]
+    add_bullets(doc, referral_features)
+
+    doc.add_heading('6. Hosted Event Pages', level=3)
+    doc.add_paragraph(
+        f'{len(event_pages)} live event microsites are served from the events/ directory:'
+    )
+    add_labeled_paragraphs(doc, [(f"events/{page['slug']}", page['title']) for page in event_pages])
+
+    add_packages_pricing(doc, order_catalog)
+
+    doc.add_heading('Admin Features', level=2)
+
+    doc.add_heading('1. Admin Dashboard', level=3)
+    doc.add_paragraph('Comprehensive admin panel with real-time analytics and management:')
+    admin_dashboard = [
+        'Overview statistics (orders, revenue, customers)',
+        'Real-time order notifications',
+        'Quick action buttons',
+        'Recent orders list',
+        'Revenue charts and graphs',
+        'Customer growth metrics',
+        'Popular packages analysis',
+        'Peak usage times',
+        'Conversion rate tracking'
+    ]
+    add_bullets(doc, admin_dashboard)
+
+    doc.add_heading('2. Order Management System', level=3)
+    admin_orders = [
+        'All orders view with filtering',
+        'Order status management',
+        'Customer information access',
+        'Design upload and management',
+        'Revision handling',
+        'Communication with customers',
+        'Order priority setting',
+        'Bulk actions',
+        'Export to CSV/Excel',
+        'Print packing slips'
+    ]
+    add_bullets(doc, admin_orders)
+
+    doc.add_heading('3. Customer Management', level=3)
+    admin_customers = [
+        'Customer database with search',
+        'Customer profiles and history',
+        'Lifetime value calculation',
+        'Customer segmentation',
+        'Email customer directly',
+        'Add notes to customer profiles',
+        'Block/unblock customers',
+        'Export customer data',
+        'Customer activity logs'
+    ]
+    add_bullets(doc, admin_customers)
+
+    doc.add_heading('4. Content Management', level=3)
+    admin_content = [
+        'Blog post creation and editing (with TipTap rich text editor)',
+        'Portfolio item management',
+        'Image upload and gallery',
+        'SEO meta data editing',
+        'Publish/draft status',
+        'Scheduling capabilities',
+        'Categories and tags',
+        'Featured posts',
+        'Analytics per post'
+    ]
+    add_bullets(doc, admin_content)
+
+    doc.add_heading('5. Analytics & Reports', level=3)
+    admin_analytics = [
+        'Revenue reports (daily, weekly, monthly)',
+        'Order statistics',
+        'Customer acquisition reports',
+        'Referral program performance',
+        'Popular templates/packages',
+        'Conversion funnel analysis',
+        'Abandoned cart reports',
+        'Traffic source analytics',
+        'User behavior tracking',
+        'Export reports to PDF/Excel'
+    ]
+    add_bullets(doc, admin_analytics)
+
+    doc.add_heading('Payment Processing', level=2)
+    doc.add_paragraph(
+        'Integration with Paystack provides secure and reliable payment processing:'
+    )
+    payment_features = [
+        'Paystack payment gateway integration',
+        'Support for mobile money (MTN, Vodafone, AirtelTigo)',
+        'Card payments (Visa, Mastercard)',
+        'Bank transfer option',
+        'Secure payment page (PCI DSS compliant)',
+        'Automatic payment verification',
+        'Payment confirmation emails',
+        'Transaction history',
+        'Refund processing',
+        'Payment webhooks for real-time updates',
+        'Multi-currency support (GHS primary)',
+        'Test mode for development'
+    ]
+    add_bullets(doc, payment_features)
+
+    doc.add_heading('AI Chatbot Integration', level=2)
+    doc.add_paragraph(
+        'Google Gemini AI powers an intelligent chatbot for customer support:'
+    )
+    chatbot_features = [
+        'Natural language understanding',
+        '24/7 availability',
+        'Instant responses to common questions',
+        'Multi-language support',
+        'Contextual conversations',
+        'FAQs and knowledge base integration',
+        'Escalation to human support',
+        'Order status inquiries',
+        'Package recommendations',
+        'Troubleshooting assistance',
+        'Chat history',
+        'Feedback collection'
+    ]
+    add_bullets(doc, chatbot_features)
+
+    doc.add_heading('SEO Features', level=2)
+    seo_features = [
+        'React Helmet for dynamic meta tags',
+        'SEO-friendly URLs',
+        'Open Graph tags for social sharing',
+        'Twitter Card integration',
+        'Sitemap generation',
+        'Robots.txt configuration',
+        'Canonical URLs',
+        'Structured data (Schema.org)',
+        'Image optimization with alt tags',
+        'Fast page load times',
+        'Mobile responsiveness',
+        'HTTPS security',
+        'Internal linking structure'
+    ]
+    add_bullets(doc, seo_features)
+
+    doc.add_heading('Integration Points', level=2)
+
+    # Integration table
+    integration_table = doc.add_table(rows=6, cols=3)
+    integration_table.style = 'Light Grid Accent 1'
+
+    integration_data = [
+        ('Integration', 'Technology', 'Purpose'),
+        ('Payment Gateway', 'Paystack API', 'Process payments securely'),
+        ('AI Chatbot', 'Google Gemini AI', 'Intelligent customer support'),
+        ('Email Service', 'Supabase Email/SMTP', 'Transactional emails'),
+        ('WhatsApp', 'WhatsApp Business API', 'Direct message delivery'),
+        ('Analytics', 'Custom + Google Analytics', 'User behavior tracking')
+    ]
+
+    for i, (integration, tech, purpose) in enumerate(integration_data):
+        integration_table.cell(i, 0).text = integration
+        integration_table.cell(i, 1).text = tech
+        integration_table.cell(i, 2).text = purpose
+
+    doc.add_page_break()
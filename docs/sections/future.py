@@ -0,0 +1,134 @@
+"""
+Future enhancements section
+"""
+
+from .common import add_bullets
+
+
+def add_future_enhancements(doc):
+    """Add future enhancements section"""
+    doc.add_heading('FUTURE ENHANCEMENTS', level=1)
+
+    doc.add_heading('Planned Features', level=2)
+
+    doc.add_heading('Short-term (3-6 months)', level=3)
+    short_term = [
+        'Mobile app (React Native) for iOS and Android',
+        'Advanced invitation editor with drag-and-drop',
+        'Video invitations',
+        'Live RSVP dashboard for event organizers',
+        'Guest list CSV import/export',
+        'SMS notifications for events',
+        'Integration with calendar apps (Google Calendar, Outlook)',
+        'Multi-language expansion (Twi, Ga, Ewe)',
+        'Social media auto-posting',
+        'Advanced analytics for admins'
+    ]
+
+    add_bullets(doc, short_term)
+
+    doc.add_heading('Medium-term (6-12 months)', level=3)
+    medium_term = [
+        'Event management features (seating charts, gift registries)',
+        'Vendor marketplace (photographers, caterers, decorators)',
+        'E-commerce for event supplies',
+        'Ticketing system for paid events',
+        'Live streaming integration for virtual events',
+        'Photo sharing and album creation',
+        'Guest check-in app with QR codes',
+        'Automated reminder system',
+        'Integration with event planning tools',
+        'White-label solution for event planners'
+    ]
+
+    add_bullets(doc, medium_term)
+
+    doc.add_heading('Long-term (12+ months)', level=3)
+    long_term = [
+        'AI-powered design generator',
+        'Voice invitations with AI text-to-speech',
+        'Augmented Reality (AR) invitations',
+        'Blockchain-based digital collectible invitations',
+        'International expansion to other African countries',
+        'Multi-vendor platform',
+        'Franchise model for regional partners',
+        'Corporate event management suite',
+        'Integration with government event registries',
+        'B2B SaaS offering for enterprises'
+    ]
+
+    add_bullets(doc, long_term)
+
+    doc.add_heading('Scalability Considerations', level=2)
+
+    doc.add_heading('Performance Optimization', level=3)
+    performance = [
+        'Implement CDN for static assets (Cloudflare, AWS CloudFront)',
+        'Image optimization and lazy loading',
+        'Code splitting for faster initial load',
+        'Caching strategies (Redis, service workers)',
+        'Database query optimization',
+        'API response caching',
+        'Bundle size reduction',
+        'Server-side rendering (SSR) consideration'
+    ]
+
+    add_bullets(doc, performance)
+
+    doc.add_heading('Infrastructure Scaling', level=3)
+    infrastructure = [
+        'Auto-scaling for traffic spikes',
+        'Load balancing across multiple servers',
+        'Database read replicas',
+        'Horizontal scaling of application servers',
+        'Queue system for background jobs (email, notifications)',
+        'Microservices architecture for specific features',
+        'Containerization with Docker',
+        'Kubernetes for orchestration'
+    ]
+
+    add_bullets(doc, infrastructure)
+
+    doc.add_heading('Database Scaling', level=3)
+    database_scaling = [
+        'Database connection pooling',
+        'Query optimization and indexing (see Missing Indexes in the Database Schema section)',
+        'Partitioning large tables',
+        'Archive old data to separate storage',
+        'Consider NoSQL for specific use cases',
+        'Implement caching layer (Redis)',
+        'Database monitoring and performance tuning',
+        'Upgrade to higher Supabase tier or self-hosted PostgreSQL'
+    ]
+
+    add_bullets(doc, database_scaling)
+
+    doc.add_heading('Business Growth Features', level=3)
+    business_features = [
+        'Subscription model for unlimited invitations',
+        'Premium templates marketplace',
+        'Partnership program with event venues',
+        'Affiliate marketing program expansion',
+        'Corporate packages with volume discounts',
+        'API for third-party integrations',
+        'Custom domain for premium customers',
+        'Dedicated account manager for enterprise clients'
+    ]
+
+    add_bullets(doc, business_features)
+
+    doc.add_heading('Technology Upgrades', level=3)
+    tech_upgrades = [
+        'Migrate to Next.js for SSR/SSG capabilities',
+        'Implement GraphQL for more efficient data fetching',
+        'Add TypeScript strict mode',
+        'Upgrade to latest React version with concurrent features',
+        'Implement micro-frontends for team autonomy',
+        'Add E2E testing with Playwright or Cypress',
+        'CI/CD pipeline automation',
+        'Feature flags for gradual rollouts'
+    ]
+
+    add_bullets(doc, tech_upgrades)
+
+    doc.add_page_break()
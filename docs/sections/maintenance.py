@@ -0,0 +1,207 @@
+"""
+Maintenance and support section
+"""
+
+from .common import add_bullets, add_labeled_paragraphs
+
+
+def add_maintenance_support(doc):
+    """Add maintenance and support section"""
+    doc.add_heading('MAINTENANCE & SUPPORT', level=1)
+
+    doc.add_heading('Update Procedures', level=2)
+
+    doc.add_heading('Application Updates', level=3)
+    doc.add_paragraph('Process for updating the VibeLink Ghana application:')
+
+    update_steps = [
+        '1. Review update requirements and plan changes',
+        '2. Create feature branch: git checkout -b feature/update-name',
+        '3. Make code changes in development environment',
+        '4. Test changes thoroughly locally',
+        '5. Commit changes: git commit -m "Description"',
+        '6. Push to GitHub: git push origin feature/update-name',
+        '7. Create pull request for review',
+        '8. Merge to main branch after approval',
+        '9. Build production: npm run build',
+        '10. Test production build: npm run preview',
+        '11. Deploy to production server',
+        '12. Monitor for issues post-deployment',
+        '13. Update documentation as needed'
+    ]
+
+    add_bullets(doc, update_steps)
+
+    doc.add_heading('Dependency Updates', level=3)
+    dependency_updates = [
+        'Check for updates weekly: npm outdated',
+        'Read changelogs before updating',
+        'Update patch versions: npm update',
+        'Test after each update',
+        'Update minor versions with caution',
+        'Major version updates require thorough testing',
+        'Security updates prioritized',
+        'Lock file committed after updates'
+    ]
+
+    add_bullets(doc, dependency_updates)
+
+    doc.add_heading('Database Updates', level=3)
+    db_update_process = [
+        '1. Plan schema changes carefully',
+        '2. Create migration file: supabase migration new migration_name',
+        '3. Write SQL in migration file',
+        '4. Test in development: supabase db reset',
+        '5. Review for data loss or performance impact',
+        '6. Backup production database',
+        '7. Apply to production during low-traffic period',
+        '8. Verify migration success',
+        '9. Monitor database performance',
+        '10. Rollback if issues occur'
+    ]
+
+    add_bullets(doc, db_update_process)
+
+    doc.add_heading('Backup Procedures', level=2)
+
+    doc.add_heading('Automated Backups', level=3)
+    auto_backups = [
+        'Supabase daily database backups (automatic)',
+        'GitHub commits for code versioning',
+        'Weekly database export to external storage',
+        'Monthly full system backup',
+        'Retention: Keep 7 daily, 4 weekly, 12 monthly backups'
+    ]
+
+    add_bullets(doc, auto_backups)
+
+    doc.add_heading('Manual Backup Process', level=3)
+    manual_backup = '''
+1. Database Backup:
+   - Login to Supabase Dashboard
+   - Navigate to Database > Backups
+   - Click "Create Backup"
+   - Download SQL export
+   - Store in secure location
+
+2. Code Backup:
+   - Ensure all changes committed to Git
+   - git push origin main
+   - Create tagged release: git tag v1.0.0
+   - git push --tags
+
+3. File Storage Backup:
+   - Navigate to Supabase Storage
+   - Download all buckets
+   - Store in external backup location
+
+4. Configuration Backup:
+   - Export .env file (securely)
+   - Document configuration changes
+   - Store in encrypted location
+'''
+
+    p = doc.add_paragraph(manual_backup)
+    p.style = 'No Spacing'
+
+    doc.add_heading('Restore Procedures', level=3)
+    restore_steps = [
+        '1. Identify scope of restoration needed',
+        '2. Retrieve appropriate backup files',
+        '3. For database: Use Supabase restore or SQL import',
+        '4. For code: git checkout <tag> or deploy from backup',
+        '5. For files: Re-upload to Supabase Storage',
+        '6. Verify data integrity after restore',
+        '7. Test critical functionality',
+        '8. Monitor for issues',
+        '9. Document incident and restoration'
+    ]
+
+    add_bullets(doc, restore_steps)
+
+    doc.add_heading('Troubleshooting', level=2)
+
+    doc.add_heading('Common Issues and Solutions', level=3)
+
+    # Issues table
+    issues_table = doc.add_table(rows=9, cols=2)
+    issues_table.style = 'Light Grid Accent 1'
+
+    issues_data = [
+        ('Issue', 'Solution'),
+        ('Build fails', 'Check for TypeScript errors, run npm install, clear cache'),
+        ('Page not loading', 'Check browser console, verify API connection, check RLS policies'),
+        ('Payment not processing', 'Verify Paystack credentials, check webhook configuration'),
+        ('Images not displaying', 'Check Supabase Storage permissions, verify file paths'),
+        ('Slow page load', 'Optimize images, check bundle size, enable caching'),
+        ('Database connection error', 'Verify Supabase credentials, check network, check quota'),
+        ('Authentication issues', 'Clear cookies, check session expiry, verify auth configuration'),
+        ('Deploy fails', 'Check server permissions, verify file paths, check disk space')
+    ]
+
+    for i, (issue, solution) in enumerate(issues_data):
+        issues_table.cell(i, 0).text = issue
+        issues_table.cell(i, 1).text = solution
+
+    doc.add_heading('Debugging Process', level=3)
+    debugging = [
+        '1. Reproduce the issue',
+        '2. Check browser console for errors',
+        '3. Check network tab for failed requests',
+        '4. Review server/database logs',
+        '5. Verify configuration settings',
+        '6. Test in isolation',
+        '7. Search for similar issues online',
+        '8. Consult documentation',
+        '9. Ask for help if stuck',
+        '10. Document solution for future reference'
+    ]
+
+    add_bullets(doc, debugging)
+
+    doc.add_heading('Log Files', level=3)
+    log_files = [
+        'Browser Console: Frontend errors and warnings',
+        'Network Tab: API requests and responses',
+        'Supabase Logs: Database queries and errors',
+        'Server Logs: Web server access and error logs (/var/log/nginx/)',
+        'Build Logs: Vite build output',
+        'Git Logs: Code change history (git log)'
+    ]
+
+    add_bullets(doc, log_files)
+
+    doc.add_heading('Support Channels', level=2)
+
+    support_channels = [
+        ('Technical Documentation', 'This document and inline code comments'),
+        ('GitHub Issues', 'Track bugs and feature requests'),
+        ('Team Communication', 'Slack, email, or team chat'),
+        ('Supabase Documentation', 'https://supabase.com/docs'),
+        ('React Documentation', 'https://react.dev'),
+        ('Community Forums', 'Stack Overflow, Reddit, Discord'),
+        ('Paystack Support', 'https://paystack.com/support'),
+        ('Vendor Support', 'Contact respective service providers')
+    ]
+
+    add_labeled_paragraphs(doc, support_channels)
+
+    doc.add_heading('Maintenance Schedule', level=2)
+
+    maintenance_table = doc.add_table(rows=6, cols=2)
+    maintenance_table.style = 'Medium Grid 1 Accent 1'
+
+    maintenance_data = [
+        ('Frequency', 'Tasks'),
+        ('Daily', 'Monitor error logs, check uptime, respond to support tickets'),
+        ('Weekly', 'Review analytics, check for dependency updates, backup database'),
+        ('Monthly', 'Security audit, performance review, update documentation'),
+        ('Quarterly', 'Test backup restoration, penetration testing, user feedback review'),
+        ('Annually', 'Comprehensive security audit, architecture review, renewal of SSL/domains')
+    ]
+
+    for i, (freq, tasks) in enumerate(maintenance_data):
+        maintenance_table.cell(i, 0).text = freq
+        maintenance_table.cell(i, 1).text = tasks
+
+    doc.add_page_break()
@@ -0,0 +1,129 @@
+"""
+Rendering of the Markdown block IR (see sources/markdown.py) into the document
+
+Used by the sections that include the Markdown files and the Word document
+sections (sources/docx_reader.py) kept in docs/; not a section of its own.
+"""
+
+from .common import _append_paragraphs, _escape_all, _ppr_xml, _run_xml
+
+CODE_FONT = 'Consolas'
+CODE_SIZE = 18  # half-points
+
+# Markdown tables of contents only link to anchors; the document has its own TOC
+SKIPPED_HEADINGS = ('table of contents', 'contents')
+
+_CODE_RPR = f'<w:rFonts w:ascii="{CODE_FONT}" w:hAnsi="{CODE_FONT}" w:cs="{CODE_FONT}"/>'
+_CODE_BLOCK_RPR = f'{_CODE_RPR}<w:sz w:val="{CODE_SIZE}"/>'
+_SPAN_RPR = {
+    '': '',
+    'bold': '<w:b/>',
+    'italic': '<w:i/>',
+    'code': _CODE_RPR,
+    'link': '<w:color w:val="0563C1"/><w:u w:val="single"/>',
+}
+_BULLET_STYLES = ('List Bullet', 'List Bullet 2', 'List Bullet 3')
+_NUMBER_STYLES = ('List Continue', 'List Continue 2', 'List Continue 3')
+
+
+def _spans_xml(spans):
+    """w:r strings for IR spans; external links keep their URL after the text"""
+    spans = [[text, style, url] for text, style, url in spans if text]
+    for span in spans:
+        text, style, url = span
+        if style == 'link' and not url.startswith(('http://', 'https://', 'mailto:')):
+            span[1] = ''  # anchors and relative .md links lead nowhere in the document
+        elif style == 'link' and url.split(':', 1)[-1].strip('/') != text.strip('/'):
+            span[0] = f'{text} ({url})'
+    escaped = _escape_all([text for text, _, _ in spans])
+    return ''.join(_run_xml(text, rpr=_SPAN_RPR[style]) for text, (_, style, _) in zip(escaped, spans))
+
+
+def _fill_cell(cell, spans):
+    """Write IR spans into a table cell"""
+    if all(style == '' for _, style, _ in spans):
+        cell.text = ''.join(text for text, _, _ in spans)
+        return
+    paragraph = cell.paragraphs[0]
+    for text, style, _ in spans:
+        run = paragraph.add_run(text)
+        run.bold = style == 'bold' or None
+        run.italic = style == 'italic' or None
+        if style == 'code':
+            run.font.name = CODE_FONT
+
+
+def add_markdown(doc, blocks, level=2):
+    """Add IR blocks to doc, with the document's ## headings at `level`
+
+    Level-1 headings (the document title) are left to the caller, and
+    Markdown tables of contents are dropped.
+    """
+    pending = []  # w:p strings not yet appended, flushed before python-docx adds anything
+    skipping = None
+
+    def flush():
+        _append_paragraphs(doc, pending)
+        pending.clear()
+
+    plain = _ppr_xml(doc, None, None, None)
+    quote = _ppr_xml(doc, 'Quote', None, None)
+    code = _ppr_xml(doc, 'No Spacing', None, None)
+    bullets = [_ppr_xml(doc, style, None, None) for style in _BULLET_STYLES]
+    numbers = [_ppr_xml(doc, style, None, None) for style in _NUMBER_STYLES]
+
+    for block in blocks:
+        kind = block[0]
+        if kind == 'heading':
+            if skipping is not None and block[1] > skipping:
+                continue
+            skipping = block[1] if block[2].strip().lower() in SKIPPED_HEADINGS else None
+            if skipping is not None or block[1] == 1:
+                continue
+            flush()
+            doc.add_heading(block[2], level=min(level + block[1] - 2, 9))
+        elif skipping is not None:
+            continue
+        elif kind == 'paragraph':
+            pending.append(f'<w:p>{plain}{_spans_xml(block[1])}</w:p>')
+        elif kind == 'quote':
+            pending.append(f'<w:p>{quote}{_spans_xml(block[1])}</w:p>')
+        elif kind == 'list':
+            for depth, marker, spans in block[1]:
+                depth = min(depth, len(_BULLET_STYLES) - 1)
+                if marker is None:
+                    pending.append(f'<w:p>{bullets[depth]}{_spans_xml(spans)}</w:p>')
+                else:
+                    spans = [[marker + ' ', '', None]] + spans
+                    pending.append(f'<w:p>{numbers[depth]}{_spans_xml(spans)}</w:p>')
+        elif kind == 'code':
+            text = _escape_all([block[2]])[0]
+            pending.append(f'<w:p>{code}{_run_xml(text, rpr=_CODE_BLOCK_RPR)}</w:p>')
+        elif kind == 'table':
+            flush()
+            header, rows = block[1], block[2]
+            columns = max([len(header)] + [len(row) for row in rows])
+            table = doc.add_table(rows=len(rows) + 1, cols=columns)
+            table.style = 'Light Grid Accent 1'
+            for cell, spans in zip(table.rows[0].cells, header):
+                _fill_cell(cell, spans)
+            for row, cells in zip(table.rows[1:], rows):
+                for cell, spans in zip(row.cells, cells):
+                    _fill_cell(cell, spans)
+        # 'rule': headings already separate the parts of the document
+    flush()
+
+
+def add_imported_section(doc, section, heading, level=2):
+    """Add a section imported from a Word document (see sources/docx_reader.py) under heading
+
+    section is an entry of the docx_sections collector; a missing one (None)
+    is noted in the text instead.
+    """
+    doc.add_heading(heading, level=level)
+    if section is None:
+        doc.add_paragraph('The source document or its section was not found in docs/.')
+        return
+    doc.add_paragraph(f'From docs/{section["source"]}, section "{section["title"]}".')
+    # The section's subheadings land one level below heading
+    add_markdown(doc, section['blocks'], level=level - section['level'] + 2)
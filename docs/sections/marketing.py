@@ -0,0 +1,20 @@
+"""
+Marketing strategy section, included from docs/VIBELINK_MARKETING_STRATEGY.md
+"""
+
+from .markdown import add_imported_section, add_markdown
+
+SOURCE = 'VIBELINK_MARKETING_STRATEGY.md'
+
+
+def add_marketing_strategy(doc, markdown_docs, docx_sections):
+    """Add the marketing strategy section from its Markdown document and the partnership proposal"""
+    doc.add_heading('MARKETING STRATEGY', level=1)
+    document = markdown_docs.get(SOURCE)
+    if document is None:
+        doc.add_paragraph(f'docs/{SOURCE} was not found; the marketing strategy is not included.')
+    else:
+        doc.add_paragraph(f'Reproduced from docs/{SOURCE}: {document["title"]}.')
+        add_markdown(doc, document['blocks'], level=2)
+
+    add_imported_section(doc, docx_sections['church_partnership'], 'Church Partnership Model')
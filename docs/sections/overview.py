@@ -0,0 +1,61 @@
+"""
+Project overview section
+"""
+
+from .common import add_bullets, add_labeled_paragraphs
+
+
+def add_project_overview(doc):
+    """Add project overview section"""
+    doc.add_heading('PROJECT OVERVIEW', level=1)
+
+    doc.add_heading('Business Purpose', level=2)
+    doc.add_paragraph(
+        'VibeLink Ghana addresses a critical need in the Ghanaian event planning ecosystem by '
+        'digitizing the invitation process. Traditional paper invitations are costly, time-consuming, '
+        'and environmentally unfriendly. VibeLink Ghana provides an eco-friendly, cost-effective, '
+        'and efficient alternative that allows event organizers to create beautiful digital '
+        'invitations, track RSVPs, and manage guest lists seamlessly.'
+    )
+
+    doc.add_heading('Target Market', level=2)
+    market_segments = [
+        ('Individual Event Planners', 'Couples planning weddings, families organizing funerals, '
+         'parents hosting naming ceremonies and graduations'),
+        ('Corporate Clients', 'Companies organizing product launches, conferences, team building '
+         'events, and corporate celebrations'),
+        ('Event Planning Agencies', 'Professional event planners managing multiple clients and '
+         'events simultaneously'),
+        ('Educational Institutions', 'Schools and universities for graduation ceremonies, '
+         'award nights, and institutional events')
+    ]
+
+    add_labeled_paragraphs(doc, market_segments, line_spacing=1.15)
+
+    doc.add_heading('Unique Value Proposition', level=2)
+    uvp_points = [
+        'Culturally Relevant: Designed specifically for Ghanaian events with appropriate templates '
+        'and cultural considerations',
+        'Affordable Pricing: Competitive pricing structure accessible to various market segments',
+        'Easy to Use: Intuitive interface requiring no technical expertise',
+        'Instant Delivery: Digital invitations delivered immediately via email and WhatsApp',
+        'Track Engagement: Real-time tracking of invitation views and RSVP responses',
+        'Professional Templates: Beautifully designed templates for all event types',
+        'Secure Payments: Integrated with Paystack for safe and reliable payment processing',
+        'Customer Support: AI-powered chatbot for 24/7 assistance'
+    ]
+
+    add_bullets(doc, uvp_points, line_spacing=1.15)
+
+    doc.add_heading('Website Access', level=2)
+    table = doc.add_table(rows=3, cols=2)
+    table.style = 'Light Grid Accent 1'
+
+    table.cell(0, 0).text = 'Website URL'
+    table.cell(0, 1).text = 'https://vibelinkgh.com/'
+    table.cell(1, 0).text = 'GitHub Repository'
+    table.cell(1, 1).text = 'https://github.com/xboggg/vibe-link-ghana-3e5cfc20'
+    table.cell(2, 0).text = 'Production Server'
+    table.cell(2, 1).text = '/var/www/vibelinkgh.com/'
+
+    doc.add_page_break()
@@ -0,0 +1,217 @@
+"""
+Security section
+"""
+
+from .common import add_bullets
+
+
+def add_security(doc, schema):
+    """Add security section"""
+    doc.add_heading('SECURITY', level=1)
+    doc.add_paragraph(
+        'The hardening shipped on 16 February 2026 (session timeout, signup password policy, '
+        '2FA rate limiting, Nginx security headers) is documented in Appendix G: Security & QA Report.'
+    )
+
+    doc.add_heading('Authentication', level=2)
+    doc.add_paragraph(
+        'Supabase Auth provides secure authentication with industry-standard practices.'
+    )
+
+    doc.add_heading('Authentication Methods', level=3)
+    auth_methods = [
+        'Email/Password authentication with secure password hashing (bcrypt)',
+        'Email verification required for new accounts',
+        'Password strength requirements enforced',
+        'Rate limiting on login attempts',
+        'Account lockout after failed attempts',
+        'Session management with JWT tokens',
+        'Token expiration and refresh mechanism',
+        'Secure password reset flow'
+    ]
+
+    add_bullets(doc, auth_methods)
+
+    doc.add_heading('Password Requirements', level=3)
+    password_reqs = [
+        'Minimum 8 characters',
+        'At least one uppercase letter',
+        'At least one lowercase letter',
+        'At least one number',
+        'At least one special character (recommended)',
+        'Not a commonly used password',
+        'Not the same as email address'
+    ]
+
+    add_bullets(doc, password_reqs)
+
+    doc.add_heading('Session Management', level=3)
+    session_mgmt = [
+        'JWT tokens stored in httpOnly cookies',
+        'Access token expires after 1 hour',
+        'Refresh token used to obtain new access token',
+        'Logout clears all session data',
+        'Automatic logout on token expiration',
+        'Session tracking in database',
+        'Device/browser fingerprinting (optional)'
+    ]
+
+    add_bullets(doc, session_mgmt)
+
+    doc.add_heading('Authorization', level=2)
+    doc.add_paragraph(
+        'Role-based access control (RBAC) ensures users can only access authorized resources.'
+    )
+
+    doc.add_heading('User Roles', level=3)
+    roles_table = doc.add_table(rows=4, cols=2)
+    roles_table.style = 'Medium Grid 1 Accent 1'
+
+    roles_data = [
+        ('Role', 'Permissions'),
+        ('Guest', 'View public pages, create account, place order'),
+        ('Customer', 'View own orders, update profile, access customer portal, track orders'),
+        ('Admin', 'Full access to all data, manage orders, manage customers, view analytics')
+    ]
+
+    for i, (role, permissions) in enumerate(roles_data):
+        roles_table.cell(i, 0).text = role
+        roles_table.cell(i, 1).text = permissions
+
+    doc.add_heading('Row Level Security (RLS)', level=3)
+    doc.add_paragraph(
+        'Database-level security ensures users can only access data they are allowed to. '
+        'Admins bypass RLS with the service role key (server-side only). The full policy '
+        'matrix is in the Database Schema section; in summary:'
+    )
+
+    matrix = schema['policy_matrix']
+    open_writes = [f'{table} ({", ".join(op for op in ("UPDATE", "DELETE") if "anyone" in row[op])})'
+                   for table, row in matrix.items() if 'anyone' in row['UPDATE'] or 'anyone' in row['DELETE']]
+    add_bullets(doc, [
+        f'{len(matrix)} tables are governed by RLS policies',
+        f'{sum(row["SELECT"] == ["admin"] for row in matrix.values())} tables can only be read by '
+        f'admins; {sum("anyone" in row["SELECT"] for row in matrix.values())} can be read by anyone',
+        f'{sum("owner" in cell for row in matrix.values() for cell in row.values())} table '
+        'operations are open to the owning user (auth.uid() checks)',
+        f'{sum(not cell for row in matrix.values() for cell in row.values())} table operations have '
+        'no policy and are reachable only through the service role',
+    ])
+
+    if open_writes:
+        review = doc.add_paragraph()
+        review.add_run('Review: ').bold = True
+        review.add_run('these tables let anyone update or delete rows without a condition: '
+                       f'{", ".join(open_writes)}.')
+
+    unprotected = [table for table in schema['tables'] if table not in schema['rls_enabled']]
+    coverage = doc.add_paragraph()
+    coverage.add_run('RLS coverage: ').bold = True
+    coverage.add_run(f"enabled on {len(schema['tables']) - len(unprotected)} of "
+                     f"{len(schema['tables'])} tables" +
+                     (f" (not enabled: {', '.join(unprotected)})" if unprotected else '') + '.')
+
+    doc.add_heading('Data Protection', level=2)
+
+    doc.add_heading('Data Encryption', level=3)
+    encryption = [
+        'All data in transit encrypted with TLS 1.3 (HTTPS)',
+        'Database connections encrypted',
+        'Supabase encrypts data at rest',
+        'Sensitive fields (passwords) hashed with bcrypt',
+        'Payment data never stored (handled by Paystack)',
+        'API keys stored in environment variables, never in code'
+    ]
+
+    add_bullets(doc, encryption)
+
+    doc.add_heading('Data Privacy', level=3)
+    privacy = [
+        'GDPR compliance considerations',
+        'Privacy policy clearly stated',
+        'Cookie consent implementation',
+        'User data deletion on request',
+        'Data export capability',
+        'Minimal data collection',
+        'No selling of user data',
+        'Third-party data sharing limited to necessary services'
+    ]
+
+    add_bullets(doc, privacy)
+
+    doc.add_heading('Input Validation', level=3)
+    validation = [
+        'Client-side validation with Zod schema',
+        'Server-side validation in database constraints',
+        'SQL injection prevention via parameterized queries',
+        'XSS protection via React\'s built-in escaping',
+        'CSRF protection with token validation',
+        'File upload validation (type, size)',
+        'Email format validation',
+        'Phone number format validation'
+    ]
+
+    add_bullets(doc, validation)
+
+    doc.add_heading('Payment Security', level=2)
+    doc.add_paragraph(
+        'Payment processing security is critical for customer trust and regulatory compliance.'
+    )
+
+    doc.add_heading('PCI DSS Compliance', level=3)
+    pci_compliance = [
+        'No card data stored on VibeLink servers',
+        'Paystack handles all card data (PCI DSS Level 1 certified)',
+        'Payment form hosted on Paystack domain',
+        'Tokenization of payment methods',
+        'Secure payment gateway connection',
+        'Regular security audits by Paystack'
+    ]
+
+    add_bullets(doc, pci_compliance)
+
+    doc.add_heading('Payment Flow Security', level=3)
+    payment_security = [
+        '1. Customer initiates payment',
+        '2. Frontend calls Paystack API with public key',
+        '3. Paystack popup opens (on Paystack domain)',
+        '4. Customer enters payment details on Paystack',
+        '5. Paystack processes payment',
+        '6. Paystack sends webhook to backend with transaction reference',
+        '7. Backend verifies transaction with Paystack API using secret key',
+        '8. Order status updated only after verification',
+        '9. Customer receives confirmation'
+    ]
+
+    add_bullets(doc, payment_security)
+
+    doc.add_heading('API Security', level=3)
+    api_security = [
+        'API keys stored in environment variables',
+        'Supabase RLS policies protect database access',
+        'Rate limiting on API endpoints',
+        'CORS configured to allow only vibelinkgh.com',
+        'API authentication required for sensitive endpoints',
+        'Webhook signature verification',
+        'IP whitelisting for admin API access (optional)'
+    ]
+
+    add_bullets(doc, api_security)
+
+    doc.add_heading('Security Best Practices', level=2)
+    best_practices = [
+        'Regular security audits',
+        'Keep dependencies up to date (npm audit)',
+        'Monitor for security vulnerabilities',
+        'Secure server configuration',
+        'Regular backups',
+        'Incident response plan',
+        'Security training for team',
+        'Logging and monitoring',
+        'Penetration testing (annually)',
+        'Bug bounty program (future consideration)'
+    ]
+
+    add_bullets(doc, best_practices)
+
+    doc.add_page_break()
@@ -0,0 +1,73 @@
+"""
+Table of contents, and the section list used by partial builds
+
+The TOC is a real Word TOC field whose result is written at build time:
+each section's headings are bookmarked and indexed as the section is
+rendered (sections/xref.py), and fill_table_of_contents() swaps the empty
+field for one entry per indexed heading once every fragment is in.
+"""
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+
+from .common import W_NS, _append_paragraphs, _escape_all, _ppr_xml, _run_xml, add_bullets
+
+TOC_LEVELS = 3
+TOC_STYLES = tuple(f'toc {level}' for level in range(1, TOC_LEVELS + 1))
+TOC_INSTRUCTION = f' TOC \\o "1-{TOC_LEVELS}" \\h \\z \\u '
+_FIELD_END = '<w:r><w:fldChar w:fldCharType="end"/></w:r>'
+
+
+def _field_start(instruction):
+    """w:r strings opening a complex field, up to where its result starts"""
+    return (f'<w:r><w:fldChar w:fldCharType="begin"/></w:r>'
+            f'<w:r><w:instrText xml:space="preserve">{instruction}</w:instrText></w:r>'
+            f'<w:r><w:fldChar w:fldCharType="separate"/></w:r>')
+
+
+def add_table_of_contents(doc):
+    """Add the table of contents: a TOC field, filled in by fill_table_of_contents"""
+    heading = doc.add_heading('TABLE OF CONTENTS', level=1)
+    heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    # Shown only if the field is never filled (no headings to list)
+    placeholder = _run_xml('Right-click and choose Update Field to build the table of contents.')
+    _append_paragraphs(doc, [f'<w:p>{_field_start(TOC_INSTRUCTION)}{placeholder}{_FIELD_END}</w:p>'])
+
+    doc.add_page_break()
+
+
+def add_toc_stub(doc, titles):
+    """List the sections included in a partial (preview) build"""
+    doc.add_heading('TABLE OF CONTENTS', level=1)
+    add_bullets(doc, titles)
+    doc.add_page_break()
+
+
+def fill_table_of_contents(doc, fragment, entries):
+    """fragment with its TOC field's result replaced by entries (see xref.index_fragment)
+
+    fragment itself is left alone, so a kept fragment can be filled again
+    with a later index. Entries below TOC_LEVELS are left out; each entry
+    links to its heading and carries a PAGEREF field for the page number,
+    which Word and LibreOffice compute when the document is laid out.
+    """
+    entries = [entry for entry in entries if entry[0] <= TOC_LEVELS]
+    position = next((i for i, el in enumerate(fragment) if el.tag == qn('w:p') and any(
+        (text.text or '').startswith(TOC_INSTRUCTION) for text in el.iter(qn('w:instrText')))), None)
+    if position is None or not entries:
+        return list(fragment)
+
+    ppr = [_ppr_xml(doc, style, None, None) for style in TOC_STYLES]
+    paragraphs = []
+    for i, ((level, _, name), text) in enumerate(zip(entries, _escape_all([entry[1] for entry in entries]))):
+        page = _field_start(f' PAGEREF {name} \\h ') + _FIELD_END
+        link = (f'<w:hyperlink w:anchor="{name}" w:history="1">'
+                f'{_run_xml(text)}<w:r><w:tab/></w:r>{page}</w:hyperlink>')
+        # The TOC field opens in the first entry and closes in a paragraph of its own
+        begin = _field_start(TOC_INSTRUCTION) if i == 0 else ''
+        paragraphs.append(f'<w:p>{ppr[level - 1]}{begin}{link}</w:p>')
+    paragraphs.append(f'<w:p>{_FIELD_END}</w:p>')
+    filled = list(parse_xml(f'<w:body xmlns:w="{W_NS}">{"".join(paragraphs)}</w:body>'))
+    return list(fragment[:position]) + filled + list(fragment[position + 1:])
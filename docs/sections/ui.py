@@ -0,0 +1,260 @@
+"""
+User interface section
+"""
+
+from docx.shared import Inches
+
+from .common import add_bullets, add_labeled_paragraphs, shade_cell
+
+
+def add_design_tokens(doc, design_tokens):
+    """Add the colour and typography tables generated from tailwind.config.ts and src/index.css"""
+    doc.add_heading('Color Palette', level=3)
+    if not design_tokens:
+        doc.add_paragraph('tailwind.config.ts or src/index.css was not found.')
+        return
+    doc.add_paragraph(
+        'Tailwind colours from tailwind.config.ts, resolved to hex through the CSS variables in '
+        'src/index.css. The dark column is filled where the .dark theme overrides the colour.'
+    )
+    colors = [color for color in design_tokens['colors'] if color['light']]
+    color_table = doc.add_table(rows=len(colors) + 1, cols=4)
+    color_table.style = 'Light Grid Accent 1'
+    for cell, header in zip(color_table.rows[0].cells, ('Token', 'CSS Variable', 'Light', 'Dark')):
+        cell.text = header
+    for row, color in zip(color_table.rows[1:], colors):
+        cells = row.cells
+        cells[0].text = color['name']
+        cells[1].text = color['variable'] or ''
+        shade_cell(cells[2], color['light'])
+        if color['dark']:
+            shade_cell(cells[3], color['dark'])
+
+    doc.add_heading('Typography', level=3)
+    font_table = doc.add_table(rows=len(design_tokens['fonts']) + 1, cols=4)
+    font_table.style = 'Light Grid Accent 1'
+    for cell, header in zip(font_table.rows[0].cells, ('Font Family', 'Tailwind Class', 'Used For', 'Weights')):
+        cell.text = header
+    for row, font in zip(font_table.rows[1:], design_tokens['fonts']):
+        cells = row.cells
+        cells[0].text = f"{font['family']} ({font['fallback']})" if font['fallback'] else font['family']
+        cells[1].text = f"font-{font['key']}"
+        cells[2].text = '; '.join(font['used_for']) or 'utility class only'
+        cells[3].text = ', '.join(map(str, font['weights']))
+    if design_tokens['radius']:
+        doc.add_paragraph(f"Corner radius (--radius): {design_tokens['radius']}.")
+
+
+def _imported_by(record):
+    """Importer count of a component file, flagging files the app never loads"""
+    return str(record['importers']) if record['reachable'] else f"{record['importers']} (unused)"
+
+
+def add_component_library(doc, component_inventory):
+    """Add the component reference generated from src/components"""
+    doc.add_heading('Component Library', level=3)
+    folders = component_inventory['folders']
+    files = sum(len(records) for records in folders.values())
+    doc.add_paragraph(
+        f"{files} files under src/components export {component_inventory['components']} components. "
+        'Imported By counts the modules importing each file; files marked unused are not reached '
+        'by any chain of imports from src/main.tsx and are left out of the bundle.'
+    )
+
+    ui = folders.get('ui', [])
+    doc.add_paragraph().add_run('Base components (src/components/ui, shadcn-ui on Radix UI):').bold = True
+    ui_table = doc.add_table(rows=len(ui) + 1, cols=4)
+    ui_table.style = 'Light Grid Accent 1'
+    for cell, header in zip(ui_table.rows[0].cells, ('File', 'Components', 'Imported', 'Imported By')):
+        cell.text = header
+    for row, record in zip(ui_table.rows[1:], ui):
+        cells = row.cells
+        cells[0].text = record['file'].removeprefix('ui/')
+        cells[1].text = ', '.join(name for name, _ in record['exports'])
+        cells[2].text = f"{sum(users > 0 for _, users in record['exports'])} of {len(record['exports'])}"
+        cells[3].text = _imported_by(record)
+
+    features = [record for folder, records in sorted(folders.items()) if folder != 'ui' for record in records]
+    doc.add_paragraph().add_run('Feature and shared components:').bold = True
+    feature_table = doc.add_table(rows=len(features) + 1, cols=3)
+    feature_table.style = 'Light Grid Accent 1'
+    for cell, header in zip(feature_table.rows[0].cells, ('Component', 'Props', 'Imported By')):
+        cell.text = header
+    for row, record in zip(feature_table.rows[1:], features):
+        cells = row.cells
+        name = record['file'].rsplit('.', 1)[0]
+        props = record['props'].get(name.rsplit('/', 1)[-1] + 'Props')
+        if props is None:
+            props = dict.fromkeys(member for members in record['props'].values() for member in members)
+        cells[0].text = name
+        cells[1].text = ', '.join(props)
+        cells[2].text = _imported_by(record)
+
+    unused = component_inventory['unused_files']
+    if unused:
+        doc.add_paragraph(
+            f"{len(unused)} component files ({component_inventory['unused_bytes'] / 1024:,.0f} KB of "
+            'source) are never loaded and can be deleted; the ui/ ones can be added back with the '
+            'shadcn-ui CLI when needed:'
+        )
+        add_bullets(doc, [f'src/components/{file}' for file in unused])
+
+
+def add_user_interface(doc, design_tokens, component_inventory):
+    """Add user interface section"""
+    doc.add_heading('USER INTERFACE', level=1)
+
+    doc.add_heading('Page Descriptions', level=2)
+
+    # Public Pages
+    doc.add_heading('Public Pages', level=3)
+    public_pages = [
+        ('Index (Home)', 'Landing page with hero section, features showcase, testimonials, '
+         'pricing preview, call-to-action buttons, and recent portfolio items'),
+        ('About', 'Company story, mission, vision, team members, and values'),
+        ('Services', 'Detailed description of invitation services, event types covered, '
+         'customization options, and delivery methods'),
+        ('Pricing', 'Package comparison (see Packages & Pricing), pricing table, '
+         'add-on services, and clear call-to-action'),
+        ('Portfolio', 'Gallery of past invitation designs, filterable by event type, '
+         'searchable, with pagination'),
+        ('Portfolio Detail', 'Full view of individual portfolio items with multiple images, '
+         'description, and related items'),
+        ('How It Works', 'Step-by-step explanation of the process from order to delivery, '
+         'with visual timeline'),
+        ('Blog', 'Blog listing page with featured posts, categories, search, and pagination'),
+        ('Blog Detail', 'Individual blog post with rich content, sharing buttons, comments, '
+         'and related posts'),
+        ('Contact', 'Contact form, office location map, phone numbers, email, social media links'),
+        ('Get Started', 'Order form with package selection, event details input, '
+         'customization options, and checkout'),
+        ('Track Order', 'Order tracking by ID or email, status display, timeline view')
+    ]
+
+    add_labeled_paragraphs(doc, public_pages, line_spacing=1.15)
+
+    # Customer Portal Pages
+    doc.add_heading('Customer Portal Pages (Authenticated)', level=3)
+    customer_pages = [
+        ('Customer Portal Dashboard', 'Overview of orders, recent activity, quick stats, '
+         'referral earnings, and navigation to other portal sections'),
+        ('Order Details', 'Complete order information, status timeline, design preview, '
+         'invoice download, revision request'),
+        ('Invoice View', 'Professional invoice with company details, order breakdown, '
+         'payment information, printable format')
+    ]
+
+    add_labeled_paragraphs(doc, customer_pages, line_spacing=1.15)
+
+    # Admin Pages
+    doc.add_heading('Admin Pages (Admin Access Only)', level=3)
+    admin_pages = [
+        ('Admin Auth', 'Secure admin login with email/password, optional 2FA'),
+        ('Admin Dashboard', 'Comprehensive admin overview with analytics, charts, '
+         'recent orders, quick actions, and system health')
+    ]
+
+    add_labeled_paragraphs(doc, admin_pages, line_spacing=1.15)
+
+    # Legal Pages
+    doc.add_heading('Legal & Policy Pages', level=3)
+    legal_pages = [
+        ('Privacy Policy', 'Data collection, usage, protection, and user rights'),
+        ('Terms of Service', 'User agreements, service terms, limitations, and disclaimers'),
+        ('Cookie Policy', 'Cookie usage, types, and user controls'),
+        ('Refund Policy', 'Refund conditions, process, and timelines')
+    ]
+
+    add_labeled_paragraphs(doc, legal_pages, line_spacing=1.15)
+
+    # Other Pages
+    doc.add_heading('Other Pages', level=3)
+    other_pages = [
+        ('Survey', 'Customer feedback and satisfaction survey'),
+        ('Thank You', 'Order confirmation and thank you message'),
+        ('Multi-Language Support', 'Language selection interface'),
+        ('Not Found (404)', 'Custom 404 error page with navigation options')
+    ]
+
+    add_labeled_paragraphs(doc, other_pages, line_spacing=1.15)
+
+    doc.add_heading('User Journeys', level=2)
+
+    doc.add_heading('Customer Journey: Ordering an Invitation', level=3)
+    customer_journey = [
+        '1. Visitor lands on homepage (Index.tsx)',
+        '2. Explores services and views portfolio',
+        '3. Checks pricing packages',
+        '4. Clicks "Get Started" CTA button',
+        '5. Fills out order form with event details',
+        '6. Selects package and customization options',
+        '7. Reviews order summary',
+        '8. Proceeds to payment',
+        '9. Completes payment via Paystack',
+        '10. Receives order confirmation email',
+        '11. Gets order tracking ID',
+        '12. Can track order status',
+        '13. Receives design for review',
+        '14. Approves or requests revisions',
+        '15. Receives final invitation',
+        '16. Downloads invoice from customer portal'
+    ]
+
+    add_bullets(doc, customer_journey)
+
+    doc.add_heading('Admin Journey: Processing an Order', level=3)
+    admin_journey = [
+        '1. Admin logs in via AdminAuth.tsx',
+        '2. Sees new order notification on dashboard',
+        '3. Clicks to view order details',
+        '4. Reviews customer requirements',
+        '5. Changes order status to "Processing"',
+        '6. Creates invitation design',
+        '7. Uploads design to order',
+        '8. Changes status to "Design Review"',
+        '9. Customer receives notification',
+        '10. Customer reviews and provides feedback',
+        '11. Admin makes revisions if needed',
+        '12. Customer approves final design',
+        '13. Admin marks order as "Completed"',
+        '14. System sends final invitation to customer',
+        '15. Admin monitors customer satisfaction'
+    ]
+
+    add_bullets(doc, admin_journey)
+
+    doc.add_heading('Navigation Structure', level=2)
+    doc.add_paragraph('The site navigation is organized hierarchically:')
+
+    doc.add_paragraph().add_run('Main Navigation:').bold = True
+    main_nav = ['Home', 'About', 'Services', 'Portfolio', 'Pricing', 'Blog',
+                'How It Works', 'Contact', 'Get Started', 'Track Order']
+    add_bullets(doc, main_nav, left_indent=Inches(0.5))
+
+    doc.add_paragraph().add_run('Footer Navigation:').bold = True
+    footer_nav = ['About Us', 'Services', 'Contact', 'Privacy Policy', 'Terms of Service',
+                  'Cookie Policy', 'Refund Policy', 'Blog', 'FAQ']
+    add_bullets(doc, footer_nav, left_indent=Inches(0.5))
+
+    doc.add_paragraph().add_run('Customer Portal Navigation:').bold = True
+    portal_nav = ['Dashboard', 'My Orders', 'Profile', 'Referrals', 'Support', 'Logout']
+    add_bullets(doc, portal_nav, left_indent=Inches(0.5))
+
+    doc.add_paragraph().add_run('Admin Panel Navigation:').bold = True
+    admin_nav = ['Dashboard', 'Orders', 'Customers', 'Content', 'Analytics',
+                 'Settings', 'Logout']
+    add_bullets(doc, admin_nav, left_indent=Inches(0.5))
+
+    doc.add_heading('Design System', level=2)
+
+    add_design_tokens(doc, design_tokens)
+
+    doc.add_heading('Spacing System', level=3)
+    doc.add_paragraph('Consistent spacing using Tailwind CSS spacing scale:')
+    spacing = ['4px (1)', '8px (2)', '12px (3)', '16px (4)', '24px (6)',
+               '32px (8)', '48px (12)', '64px (16)', '96px (24)']
+    add_bullets(doc, spacing)
+
+    add_component_library(doc, component_inventory)
+
+    doc.add_page_break()
@@ -0,0 +1,219 @@
+"""
+Development workflow section
+"""
+
+from datetime import datetime
+import io
+
+from docx.shared import Inches
+
+from sources.raster import sparkline
+
+from .common import add_bullets
+
+
+def _date(timestamp):
+    return datetime.fromtimestamp(timestamp).strftime('%B %d, %Y')
+
+
+def add_repository_activity(doc, git_activity):
+    """Add commit, churn and deploy statistics from the git history"""
+    doc.add_heading('Repository Activity', level=2)
+    weekly = git_activity['weekly']
+    intro = doc.add_paragraph(
+        f"{git_activity['commits']} commits on the main line between {_date(git_activity['first'])} "
+        f"and {_date(git_activity['latest'])}; {sum(weekly)} in the last {len(weekly)} weeks "
+        f'({sum(weekly) / len(weekly):.1f} a week). Commits per week: '
+    )
+    intro.add_run().add_picture(io.BytesIO(sparkline(weekly, width=4 * len(weekly))),
+                                height=Inches(0.2))
+
+    deploys = git_activity['deploys']
+    gap = deploys['median_gap_days']
+    add_bullets(doc, [
+        f"Deploy days (a push to main triggers the Build and Deploy workflow): {deploys['days']}, "
+        f"{deploys['recent_days']} of them in the last 12 weeks",
+        'Typical gap between deploys: ' + (f'{gap} day{"s" if gap != 1 else ""} (median)'
+                                            if gap is not None else 'n/a (one deploy day so far)'),
+        f"Last deploy day: {datetime.fromisoformat(deploys['last']).strftime('%B %d, %Y')}",
+    ])
+
+    doc.add_heading('Churn by Directory', level=3)
+    churn_table = doc.add_table(rows=len(git_activity['directories']) + 1, cols=5)
+    churn_table.style = 'Light Grid Accent 1'
+    for col, header in enumerate(('Directory', 'Commits', 'Lines Added', 'Lines Removed',
+                                  'Last 12 Weeks')):
+        churn_table.cell(0, col).text = header
+    for i, directory in enumerate(git_activity['directories'], 1):
+        churn_table.cell(i, 0).text = directory['path']
+        churn_table.cell(i, 1).text = str(directory['commits'])
+        churn_table.cell(i, 2).text = f"{directory['added']:,}"
+        churn_table.cell(i, 3).text = f"{directory['deleted']:,}"
+        churn_table.cell(i, 4).paragraphs[0].add_run().add_picture(
+            io.BytesIO(sparkline(directory['weekly'], width=6 * len(directory['weekly']))),
+            height=Inches(0.15))
+
+    doc.add_heading('Most Changed Files', level=3)
+    files_table = doc.add_table(rows=len(git_activity['files']) + 1, cols=3)
+    files_table.style = 'Light Grid Accent 1'
+    for col, header in enumerate(('File', 'Commits', 'Lines Changed')):
+        files_table.cell(0, col).text = header
+    for i, changed in enumerate(git_activity['files'], 1):
+        files_table.cell(i, 0).text = changed['path']
+        files_table.cell(i, 1).text = str(changed['commits'])
+        files_table.cell(i, 2).text = f"{changed['added'] + changed['deleted']:,}"
+
+
+def add_development_workflow(doc, git_history, git_activity):
+    """Add development workflow section"""
+    doc.add_heading('DEVELOPMENT WORKFLOW', level=1)
+
+    doc.add_heading('Three-Location Setup', level=2)
+    doc.add_paragraph(
+        'The development workflow is organized across three strategic locations, each serving '
+        'a specific purpose in the software development lifecycle:'
+    )
+
+    doc.add_heading('1. Local Development (PC)', level=3)
+    pc_details = [
+        'Location: C:\\Users\\CyberAware\\OneDrive - Government of Ghana - CAGD\\ZeroTrust\\Visual Studio Code Workspace\\vibelink\\app\\',
+        'Purpose: Active development, testing, and debugging',
+        'Tools: Visual Studio Code, Node.js, npm/bun, Git',
+        'Server: Vite dev server on localhost:8080',
+        'Hot Module Replacement (HMR) for instant feedback',
+        'Access to .env file for environment configuration'
+    ]
+
+    add_bullets(doc, pc_details)
+
+    doc.add_heading('2. Version Control (GitHub)', level=3)
+    github_details = [
+        'Repository: https://github.com/xboggg/vibe-link-ghana-3e5cfc20',
+        'Purpose: Code versioning, collaboration, and backup',
+        'Branch Strategy: Main branch for production-ready code',
+        'Commit History: Complete audit trail of changes',
+        'Collaboration: Code reviews and team coordination',
+        'CI/CD Integration: Automated testing and deployment triggers'
+    ]
+    if git_history:
+        github_details[3] = (f"Commit History: {git_history['commits']} commits, "
+                             f"latest on {_date(git_history['latest'])}")
+
+    add_bullets(doc, github_details)
+
+    doc.add_heading('3. Production Server', level=3)
+    server_details = [
+        'Location: /var/www/vibelinkgh.com/',
+        'Purpose: Live production environment',
+        'Web Server: Nginx/Apache serving static files',
+        'Domain: https://vibelinkgh.com/',
+        'SSL Certificate: HTTPS encryption enabled',
+        'Optimization: Minified and bundled production build'
+    ]
+
+    add_bullets(doc, server_details)
+
+    if git_activity:
+        add_repository_activity(doc, git_activity)
+
+    doc.add_heading('Git Workflow Diagram', level=2)
+    doc.add_paragraph().add_run('[DIAGRAM: Git Workflow]').bold = True
+    workflow_desc = doc.add_paragraph()
+    workflow_desc.add_run('Create a flowchart showing:\n')
+    workflow_steps = [
+        '1. Developer writes code on Local PC',
+        '2. Git add and commit changes locally',
+        '3. Git push to GitHub repository',
+        '4. GitHub receives and stores code',
+        '5. GitHub Actions or deployment script triggers',
+        '6. Build process: npm run build creates optimized dist/ folder',
+        '7. Deployment script transfers dist/ contents to server',
+        '8. Server updates /var/www/vibelinkgh.com/',
+        '9. Website live with latest changes'
+    ]
+
+    add_bullets(doc, workflow_steps, left_indent=Inches(0.5))
+
+    doc.add_heading('Build and Deployment Process', level=2)
+
+    doc.add_heading('Development Build', level=3)
+    doc.add_paragraph('Command: npm run dev or bun run dev')
+    dev_process = [
+        'Vite starts development server on port 8080',
+        'Hot Module Replacement (HMR) enabled',
+        'Source maps for debugging',
+        'Fast refresh for instant updates',
+        'Environment: Development mode'
+    ]
+    add_bullets(doc, dev_process)
+
+    doc.add_heading('Production Build', level=3)
+    doc.add_paragraph('Command: npm run build or bun run build')
+    prod_process = [
+        'TypeScript compilation and type checking',
+        'React component tree shaking',
+        'CSS purging and minification',
+        'JavaScript minification and uglification',
+        'Asset optimization (images, fonts)',
+        'Bundle splitting for optimal loading',
+        'Output: dist/ directory with production-ready files',
+        'Build time: ~30-60 seconds'
+    ]
+    add_bullets(doc, prod_process)
+
+    doc.add_heading('Deployment Steps', level=3)
+    deploy_steps = [
+        'Build the production bundle locally or in CI/CD',
+        'Test the build with: npm run preview',
+        'Transfer dist/ contents to /var/www/vibelinkgh.com/',
+        'Update file permissions on server',
+        'Clear server cache if applicable',
+        'Verify deployment by visiting vibelinkgh.com',
+        'Monitor error logs for any issues'
+    ]
+
+    for i, step in enumerate(deploy_steps, 1):
+        doc.add_paragraph(f'{i}. {step}')
+
+    doc.add_heading('Environment Setup', level=2)
+
+    doc.add_heading('Prerequisites', level=3)
+    prereqs = [
+        'Node.js (v18 or higher)',
+        'npm or bun package manager',
+        'Git for version control',
+        'Visual Studio Code (recommended IDE)',
+        'Supabase account and project',
+        'Paystack merchant account'
+    ]
+    add_bullets(doc, prereqs)
+
+    doc.add_heading('Initial Setup', level=3)
+    setup_code = '''
+1. Clone repository:
+   git clone https://github.com/xboggg/vibe-link-ghana-3e5cfc20
+
+2. Navigate to project:
+   cd vibe-link-ghana-3e5cfc20/app
+
+3. Install dependencies:
+   npm install
+   (or: bun install)
+
+4. Configure environment:
+   Create .env file with:
+   VITE_SUPABASE_URL=your_supabase_url
+   VITE_SUPABASE_PUBLISHABLE_KEY=your_supabase_key
+   VITE_SUPABASE_PROJECT_ID=your_project_id
+
+5. Start development server:
+   npm run dev
+
+6. Open browser to:
+   http://localhost:8080
+'''
+
+    p = doc.add_paragraph(setup_code)
+    p.style = 'No Spacing'
+
+    doc.add_page_break()
@@ -0,0 +1,273 @@
+"""
+Cross-references: bookmarks on every heading and glossary term, and the
+"see X section" references and glossary terms in the text turned into
+internal links to them
+
+Two passes. index_fragment() runs once on each section's fragment as it is
+rendered: it bookmarks the headings, numbers the bookmarks the section
+placed itself (add_bookmarks, used by the glossary) and notes which
+paragraphs hold a reference and where. resolve_references() runs once
+every fragment is in and rewrites only the noted paragraphs; the rest of
+the document is never looked at again. A reference matching no heading is
+reported back, and the build fails on it (UnresolvedReferenceError).
+
+References are read from paragraphs at the top level of a section (not
+from table cells), in these forms:
+
+    see [the] Database Schema section
+    see Missing Indexes in the Database Schema section
+    (see Packages & Pricing)
+    Appendix G[: Security & QA Report]
+
+and each glossary term is linked where a section first uses it.
+"""
+
+import copy
+import functools
+import re
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+# Word's own prefix for TOC bookmarks, which it hides from the bookmark list
+BOOKMARK_PREFIX = '_Toc'
+TERM_PREFIX = '_Term_'
+BOOKMARK_NAME_LIMIT = 40
+LINK_STYLE = 'Hyperlink'
+
+_HEADING_STYLE = re.compile(r'Heading(\d)$')
+_REFERENCE = re.compile(
+    r"\b[Ss]ee (?:the )?(?P<title>[A-Z][\w&/' -]*?) section\b"
+    r"|\(see (?![^()]*\bsection\b)(?P<heading>[A-Z][^()]*)\)"
+    r"|\bAppendix (?P<appendix>[A-Z])\b"
+)
+_APPENDIX_HEADING = re.compile(r'Appendix ([A-Z]):')
+_WITHIN = ' in the '
+_TEXT_CHILDREN = {qn('w:rPr'), qn('w:t'), qn('w:tab'), qn('w:br'), qn('w:cr')}
+
+
+class UnresolvedReferenceError(ValueError):
+    """References in the text that match no heading of the document"""
+
+    def __init__(self, unresolved):
+        self.unresolved = unresolved
+        super().__init__('unresolved cross-references:\n  ' + '\n  '.join(unresolved))
+
+
+def term_bookmark(term):
+    """Bookmark name of a glossary term"""
+    return (TERM_PREFIX + re.sub(r'\W', '_', term))[:BOOKMARK_NAME_LIMIT]
+
+
+def add_bookmarks(doc, names):
+    """Bookmark the last len(names) paragraphs of doc, in order; index_fragment numbers them"""
+    body = doc.element.body
+    paragraphs = [el for el in body if el.tag == qn('w:p')][-len(names):]
+    for paragraph, name in zip(paragraphs, names):
+        _bookmark(paragraph, name)
+
+
+def _bookmark(paragraph, name):
+    """Wrap the content of a paragraph in a bookmark called name; returns its w:bookmarkStart"""
+    start, end = OxmlElement('w:bookmarkStart'), OxmlElement('w:bookmarkEnd')
+    start.set(qn('w:id'), '0')
+    start.set(qn('w:name'), name)
+    end.set(qn('w:id'), '0')
+    properties = paragraph.find(qn('w:pPr'))
+    if properties is not None:
+        properties.addnext(start)
+    else:
+        paragraph.insert(0, start)
+    paragraph.append(end)
+    return start
+
+
+def _runs(paragraph):
+    """The top-level runs of a paragraph (not those already inside a hyperlink)"""
+    return [child for child in paragraph if child.tag == qn('w:r')]
+
+
+def _text(paragraph):
+    """Text of a paragraph's top-level runs; offsets into it are what references record"""
+    return ''.join(run.text for run in _runs(paragraph))
+
+
+@functools.lru_cache(maxsize=None)
+def _term_pattern(terms):
+    """Regex matching any of terms as a whole word, longest first"""
+    if not terms:
+        return None
+    alternatives = '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return re.compile(rf'(?<![\w/])(?:{alternatives})(?![\w/])')
+
+
+def index_fragment(fragment, key, first_id, terms=()):
+    """First pass over a section's fragment: {'headings', 'anchors', 'references'}
+
+    Every heading paragraph gets a _Toc bookmark named after the section key,
+    and every bookmark in the fragment an id counted from first_id, so names
+    and ids are unique in the assembled document without looking at the
+    other sections; a cached fragment's bookmarks are renumbered in place.
+    headings lists (level, text, bookmark name), anchors the names of the
+    other bookmarks, and references (position in fragment, text, [(start,
+    end, kind, target), ...]) the paragraphs to link, with kind 'heading'
+    (target (title, within title or None)), 'appendix' (letter) or 'term'.
+    """
+    slug = re.sub(r'\W', '_', key)[:BOOKMARK_NAME_LIMIT - len(BOOKMARK_PREFIX) - 8]
+    record = {'headings': [], 'anchors': [], 'references': []}
+    used = set()
+    pattern = _term_pattern(tuple(terms))
+    next_id = first_id
+    for position, el in enumerate(fragment):
+        if el.tag != qn('w:p'):
+            continue
+        style = el.find(f'{qn("w:pPr")}/{qn("w:pStyle")}')
+        heading = _HEADING_STYLE.match(style.get(qn('w:val'))) if style is not None else None
+        text = _text(el)
+        if heading is not None and text.strip():
+            name = f'{BOOKMARK_PREFIX}_{slug}_{len(record["headings"]) + 1}'
+            start = next((start for start in el.iter(qn('w:bookmarkStart'))
+                          if start.get(qn('w:name'), '').startswith(BOOKMARK_PREFIX)), None)
+            if start is None:
+                start = _bookmark(el, name)
+            start.set(qn('w:name'), name)
+            record['headings'].append((int(heading.group(1)), text.strip(), name))
+
+        starts = el.findall(qn('w:bookmarkStart'))
+        ends = {end.get(qn('w:id')): end for end in el.findall(qn('w:bookmarkEnd'))}
+        for start in starts:
+            end = ends.pop(start.get(qn('w:id')), None)
+            start.set(qn('w:id'), str(next_id))
+            if end is not None:
+                end.set(qn('w:id'), str(next_id))
+            next_id += 1
+            if not start.get(qn('w:name')).startswith(BOOKMARK_PREFIX):
+                record['anchors'].append(start.get(qn('w:name')))
+        if heading is not None or starts:
+            continue  # never link a heading or a link target to itself
+
+        matches = []
+        for match in _REFERENCE.finditer(text):
+            if match.group('appendix'):
+                matches.append((match.start(), match.end(), 'appendix', match.group('appendix')))
+            elif match.group('title'):
+                title, _, within = match.group('title').partition(_WITHIN)
+                matches.append((match.start('title'), match.end('title'), 'heading', (title, within or None)))
+            else:
+                matches.append((match.start('heading'), match.end('heading'), 'heading',
+                                (match.group('heading'), None)))
+        if pattern is not None:
+            for match in pattern.finditer(text):
+                overlaps = any(start < match.end() and match.start() < end for start, end, _, _ in matches)
+                if match.group(0) not in used and not overlaps:
+                    used.add(match.group(0))
+                    matches.append((match.start(), match.end(), 'term', match.group(0)))
+        if matches:
+            record['references'].append((position, text, sorted(matches)))
+    return record
+
+
+def _key(text):
+    """Heading text reduced for matching: case and spacing ignored"""
+    return ' '.join(text.split()).casefold()
+
+
+def _resolve_heading(headings, by_text, title, within):
+    """Bookmark of the heading titled title (under the heading titled within, if given), or None"""
+    if within is None:
+        found = by_text.get(_key(title), ())
+        return headings[min(found, key=lambda i: headings[i][1])][3] if found else None
+    for i in by_text.get(_key(within), ()):
+        key, level = headings[i][:2]
+        for other_key, other_level, text, name in headings[i + 1:]:
+            if other_key != key or other_level <= level:
+                break
+            if _key(text) == _key(title):
+                return name
+    return None
+
+
+def _link_runs(paragraph, links):
+    """Wrap the text spans of links [(start, end, anchor), ...] in internal hyperlinks
+
+    Runs crossing a span boundary are split, keeping their formatting; a
+    span covering anything but text (a picture, a field) is left as it is.
+    """
+    for start, end, anchor in reversed(links):
+        # Offsets before start are unchanged by the links already made after it
+        spans = []
+        position = 0
+        for run in _runs(paragraph):
+            text = run.text
+            spans.append((run, position, position + len(text), text))
+            position += len(text)
+        covered = [span for span in spans if span[1] < end and start < span[2]]
+        if not covered or any(child.tag not in _TEXT_CHILDREN for span in covered for child in span[0]):
+            continue
+        hyperlink = OxmlElement('w:hyperlink')
+        hyperlink.set(qn('w:anchor'), anchor)
+        hyperlink.set(qn('w:history'), '1')
+        for run, run_start, run_end, text in covered:
+            pieces = (text[:max(start - run_start, 0)],
+                      text[max(start - run_start, 0):min(end, run_end) - run_start],
+                      text[min(end, run_end) - run_start:])
+            for i, piece in enumerate(pieces):
+                if not piece:
+                    continue
+                new = OxmlElement('w:r')
+                if run.rPr is not None:
+                    new.append(copy.deepcopy(run.rPr))
+                new.text = piece
+                if i == 1:
+                    new.get_or_add_rPr().style = LINK_STYLE
+                    hyperlink.append(new)
+                    if len(hyperlink) == 1:
+                        run.addprevious(hyperlink)
+                else:
+                    run.addprevious(new)
+            paragraph.remove(run)
+
+
+def resolve_references(sections):
+    """Second pass: link the references index_fragment noted; returns the unresolved ones
+
+    sections lists (key, fragment, record) in document order, record being
+    the fragment's index_fragment result; positions refer to fragment as it
+    was indexed (or an unchanged copy of it). Only the noted paragraphs are
+    touched. A glossary term whose entry is not in the document is simply
+    left unlinked; an unresolved reference is returned as 'key: "text"'.
+    """
+    headings = [(key, level, text, name) for key, _, record in sections
+                for level, text, name in record['headings']]
+    by_text = {}
+    appendices = {}
+    for i, (_, _, text, _) in enumerate(headings):
+        by_text.setdefault(_key(text), []).append(i)
+        if (match := _APPENDIX_HEADING.match(text)) is not None:
+            appendices.setdefault(match.group(1), i)
+    anchors = {name for _, _, record in sections for name in record['anchors']}
+    unresolved = []
+    for key, fragment, record in sections:
+        for position, text, matches in record['references']:
+            links = []
+            for start, end, kind, target in matches:
+                if kind == 'term':
+                    anchor = term_bookmark(target) if term_bookmark(target) in anchors else None
+                    if anchor is not None:
+                        links.append((start, end, anchor))
+                    continue
+                if kind == 'appendix':
+                    anchor = headings[appendices[target]][3] if target in appendices else None
+                    if anchor is not None:
+                        # Link the title too when the text spells it out
+                        title = headings[appendices[target]][2][len(f'Appendix {target}'):]
+                        end += len(title) if text.startswith(title, end) else 0
+                else:
+                    anchor = _resolve_heading(headings, by_text, *target)
+                if anchor is None:
+                    unresolved.append(f'{key}: "{text[start:end]}"')
+                else:
+                    links.append((start, end, anchor))
+            if links:
+                _link_runs(fragment[position], links)
+    return unresolved
@@ -0,0 +1,169 @@
+"""
+Data collectors for the VibeLink Ghana documentation generator
+
+Each collector is a plain blocking function that reads part of the repository
+and returns the facts a section renders. Collectors are listed in
+BUILTIN_COLLECTORS under the name of the data they produce, together with the
+collectors whose results they take as keyword arguments (`needs`) and the
+repository paths they read (used by --watch to know what to re-collect and by
+--check to know what must exist). Like sections, a collector's module is only
+imported when the collector runs, so metadata commands never load them.
+"""
+
+from importlib import import_module
+import json
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Generator caches (last-good section output, parse results); safe to delete
+CACHE_DIR = os.path.join(REPO_ROOT, 'docs', '.cache')
+
+
+
+class Collector:
+    """A data collector; its function ('module:function' in this package) is imported on first use"""
+
+    def __init__(self, name, target, needs=(), inputs=()):
+        self.name = name
+        self._target = target
+        self._func = None
+        self.needs = tuple(needs)
+        self.inputs = tuple(inputs)
+
+    @property
+    def func(self):
+        if self._func is None:
+            module, _, name = self._target.partition(':')
+            self._func = getattr(import_module(f'.{module}', __name__), name)
+        return self._func
+
+    def __repr__(self):
+        return f'Collector({self.name!r})'
+
+
+BUILTIN_COLLECTORS = [
+    Collector('migrations', 'repo:collect_migrations', inputs=('supabase/migrations',)),
+    Collector('edge_functions', 'repo:collect_edge_functions', inputs=('supabase/functions',)),
+    Collector('lockfile', 'repo:collect_lockfile', inputs=('package.json', 'package-lock.json')),
+    Collector('assets', 'repo:collect_assets', inputs=('public', 'src/assets')),
+    Collector('git_history', 'repo:collect_git_history', inputs=('.git/logs/HEAD',)),
+    Collector('event_pages', 'repo:collect_event_pages', inputs=('events',)),
+    Collector('schema', 'schema:collect_schema', needs=('migrations',), inputs=('supabase/migrations',)),
+    Collector('er_diagram', 'er_diagram:collect_er_diagram', needs=('schema',),
+              inputs=('supabase/migrations',)),
+    Collector('db_types', 'db_types:collect_db_types', inputs=('src/integrations/supabase/types.ts',)),
+    Collector('schema_drift', 'db_types:collect_schema_drift', needs=('schema', 'db_types'),
+              inputs=('supabase/migrations', 'src/integrations/supabase/types.ts')),
+    Collector('query_patterns', 'queries:collect_query_patterns', inputs=('src', 'supabase/functions')),
+    Collector('index_advice', 'queries:collect_index_advice', needs=('schema', 'query_patterns'),
+              inputs=('supabase/migrations', 'src', 'supabase/functions')),
+    Collector('git_activity', 'git_activity:collect_git_activity', inputs=('.git/logs/HEAD',)),
+    Collector('source_index', 'frontend:collect_source_index', inputs=('src', 'tsconfig.json')),
+    Collector('import_graph', 'frontend:collect_import_graph', needs=('source_index',),
+              inputs=('src', 'tsconfig.json')),
+    Collector('component_inventory', 'frontend:collect_component_inventory', needs=('source_index',),
+              inputs=('src', 'tsconfig.json')),
+    Collector('order_catalog', 'catalog:collect_order_catalog',
+              inputs=('src/data/orderFormData.ts', 'src/components/order-form/PriceCalculator.tsx')),
+    Collector('design_tokens', 'design_tokens:collect_design_tokens',
+              inputs=('tailwind.config.ts', 'src/index.css')),
+    Collector('env_vars', 'env_vars:collect_env_vars',
+              inputs=('src', 'supabase/functions', '.env', 'deploy-webhook.cjs')),
+    # inputs: markdown.DOCUMENTS and the files of docx_reader.IMPORTS
+    Collector('markdown_docs', 'markdown:collect_markdown_docs',
+              inputs=('docs/CHANGELOG_2026-02-16.md', 'docs/SECURITY_QA_DOCUMENTATION.md',
+                      'docs/SSL_SETUP_GUIDE.md', 'docs/VIBELINK_MARKETING_STRATEGY.md')),
+    Collector('docx_sections', 'docx_reader:collect_docx_sections',
+              inputs=('docs/Church Partnership Proposal.docx', 'docs/WhatsApp Pitches.docx')),
+]
+
+COLLECTORS = {source.name: source for source in BUILTIN_COLLECTORS}
+
+
+def dependency_order(names):
+    """The named collectors plus everything they need, dependencies first"""
+    order = []
+    visiting = set()
+
+    def visit(name, path):
+        if name in order:
+            return
+        if name in visiting:
+            raise ValueError(f"collector dependency cycle: {' -> '.join(path + (name,))}")
+        if name not in COLLECTORS:
+            raise KeyError(f"unknown collector {name!r} (needed by {path[-1] if path else 'a section'})")
+        visiting.add(name)
+        for dep in COLLECTORS[name].needs:
+            visit(dep, path + (name,))
+        visiting.discard(name)
+        order.append(name)
+
+    for name in sorted(names):
+        visit(name, ())
+    return order
+
+
+def dependents(names):
+    """The named collectors plus every collector that (transitively) needs them"""
+    result = set(names)
+    changed = True
+    while changed:
+        changed = False
+        for source in COLLECTORS.values():
+            if source.name not in result and result.intersection(source.needs):
+                result.add(source.name)
+                changed = True
+    return result
+
+
+def repo_path(*parts):
+    """Absolute path of a file inside the repository"""
+    return os.path.join(REPO_ROOT, *parts)
+
+
+def cached_parse(cache_name, version, paths, parse, workers=None):
+    """{path: parse(path)} for each path, reusing the results kept in the JSON
+    cache file `cache_name` for files whose size and mtime are unchanged
+
+    Results must be JSON-serializable; bump version whenever parse changes
+    what it returns. Only new or modified files are read, on a pool of
+    `workers` threads if given.
+    """
+    cache_path = os.path.join(CACHE_DIR, f'{cache_name}.json')
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    entries = cache.get('files', {}) if cache.get('version') == version else {}
+
+    fresh = {}
+    stale = []
+    for path in paths:
+        stat = os.stat(path)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        key = os.path.relpath(path, REPO_ROOT)
+        entry = entries.get(key)
+        if entry is None or entry['stamp'] != stamp:
+            entry = {'stamp': stamp, 'result': None}
+            stale.append((path, entry))
+        fresh[key] = entry
+    if workers and len(stale) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(workers) as pool:
+            parsed = list(pool.map(parse, [path for path, _ in stale]))
+    else:
+        parsed = [parse(path) for path, _ in stale]
+    for (_, entry), result in zip(stale, parsed):
+        entry['result'] = result
+    results = {path: fresh[os.path.relpath(path, REPO_ROOT)]['result'] for path in paths}
+
+    if fresh != entries:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f'{cache_path}.{os.getpid()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'version': version, 'files': fresh}, f)
+        os.replace(tmp, cache_path)
+    return results
@@ -0,0 +1,213 @@
+"""
+The order catalog (packages, add-ons, event types, palettes) from
+src/data/orderFormData.ts, and order prices computed as the order form's
+PriceCalculator does
+
+The exported array and object literals are read with ts_literal;
+identifiers (the lucide icons) are kept as their names. The extraction is
+cached under the file's content hash, so touching the file without changing
+it does not re-parse it.
+
+price_matrix() prices many orders at once: with numpy installed as one
+matrix product over a package/add-on incidence matrix, otherwise in a plain
+loop giving the same totals.
+"""
+
+from itertools import combinations
+import hashlib
+import json
+import os
+import re
+
+from . import CACHE_DIR, repo_path
+from .ts_literal import parse_literals
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+CATALOG_PATH = ('src', 'data', 'orderFormData.ts')
+CALCULATOR_PATH = ('src', 'components', 'order-form', 'PriceCalculator.tsx')
+
+# Bump when the result of _parse_catalog changes
+PARSE_VERSION = 1
+
+DEFAULT_RUSH_FEE = 300      # used if PriceCalculator.tsx no longer states it
+DEPOSIT_SHARE = 0.5         # PriceCalculator: "50% deposit"
+MAX_ADD_ONS = 3             # add-ons per order enumerated for the price matrix
+
+_RUSH_FEE = re.compile(r'deliveryUrgency\s*===\s*["\']rush["\']\s*\?\s*(\d+)')
+_EVERYTHING_IN = re.compile(r'Everything in (\w+)')
+_PARENTHETICAL = re.compile(r'\s*\(.*?\)')
+
+
+def _parse_catalog(text):
+    """Packages, add-ons, event types and colour palettes of orderFormData.ts"""
+    literals = parse_literals(text)
+    return {
+        'packages': literals.get('packages', []),
+        'add_ons': literals.get('addOns', []),
+        'event_types': [{key: value for key, value in event.items() if key != 'icon'}
+                        for event in literals.get('eventTypes', [])],
+        'palettes': literals.get('colorPalettes', []),
+        'styles': literals.get('stylePreferences', []),
+    }
+
+
+def load_catalog(path):
+    """_parse_catalog(path), cached under the file's SHA-1"""
+    with open(path, 'rb') as f:
+        text = f.read()
+    digest = hashlib.sha1(text).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, 'order_catalog.json')
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache['version'] == PARSE_VERSION and cache['sha1'] == digest:
+            return cache['catalog']
+    except (OSError, ValueError, KeyError):
+        pass
+    catalog = _parse_catalog(text.decode('utf-8'))
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = f'{cache_path}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'version': PARSE_VERSION, 'sha1': digest, 'catalog': catalog}, f)
+    os.replace(tmp, cache_path)
+    return catalog
+
+
+def load_rush_fee():
+    """The rush delivery fee charged by PriceCalculator.tsx"""
+    try:
+        with open(repo_path(*CALCULATOR_PATH), encoding='utf-8') as f:
+            match = _RUSH_FEE.search(f.read())
+    except OSError:
+        match = None
+    return int(match.group(1)) if match else DEFAULT_RUSH_FEE
+
+
+def package_features(packages):
+    """{package id: [feature, ...]} with "Everything in X" expanded to X's features"""
+    by_word = {package['name'].split()[0]: package for package in packages}
+    resolved = {}
+
+    def expand(package):
+        if package['id'] not in resolved:
+            resolved[package['id']] = []
+            features = []
+            for feature in package['features']:
+                match = _EVERYTHING_IN.match(feature)
+                if match and match.group(1) in by_word:
+                    features += expand(by_word[match.group(1)])
+                else:
+                    features.append(feature)
+            resolved[package['id']] = features
+        return resolved[package['id']]
+
+    for package in packages:
+        expand(package)
+    return resolved
+
+
+def included_add_ons(catalog):
+    """{add-on id: [package id, ...]} for add-ons a package already lists as a feature"""
+    features = package_features(catalog['packages'])
+    included = {}
+    for add_on in catalog['add_ons']:
+        name = _PARENTHETICAL.sub('', add_on['name']).lower()
+        for package in catalog['packages']:
+            if any(name in feature.lower() for feature in features[package['id']]):
+                included.setdefault(add_on['id'], []).append(package['id'])
+    return included
+
+
+def order_total(catalog, package, add_ons=(), rush=False):
+    """Total of an order the way PriceCalculator computes it; unknown ids count as 0"""
+    packages = {entry['id']: entry['price'] for entry in catalog['packages']}
+    prices = {entry['id']: entry['price'] for entry in catalog['add_ons']}
+    return (packages.get(package, 0) + sum(prices.get(add_on, 0) for add_on in add_ons)
+            + (catalog['rush_fee'] if rush else 0))
+
+
+def order_combinations(catalog, max_add_ons=MAX_ADD_ONS):
+    """(package id, add-on ids, rush) for every order with up to max_add_ons add-ons"""
+    add_on_ids = [add_on['id'] for add_on in catalog['add_ons']]
+    for package in catalog['packages']:
+        for count in range(max_add_ons + 1):
+            for chosen in combinations(add_on_ids, count):
+                yield package['id'], chosen, False
+                yield package['id'], chosen, True
+
+
+def price_matrix(catalog, orders):
+    """Totals of (package id, add-on ids, rush) orders, in order; vectorized when numpy is available"""
+    orders = list(orders)
+    if numpy is None:
+        packages = {entry['id']: entry['price'] for entry in catalog['packages']}
+        prices = {entry['id']: entry['price'] for entry in catalog['add_ons']}
+        fee = catalog['rush_fee']
+        return [packages.get(package, 0) + sum(prices.get(add_on, 0) for add_on in add_ons)
+                + (fee if rush else 0) for package, add_ons, rush in orders]
+    package_index = {entry['id']: i for i, entry in enumerate(catalog['packages'])}
+    add_on_index = {entry['id']: i for i, entry in enumerate(catalog['add_ons'])}
+    package_prices = numpy.array([entry['price'] for entry in catalog['packages']] + [0])
+    add_on_prices = numpy.array([entry['price'] for entry in catalog['add_ons']] + [0])
+    incidence = numpy.zeros((len(orders), len(add_on_prices)), dtype=numpy.int64)
+    rows, cols = [], []
+    for row, (_, add_ons, _) in enumerate(orders):
+        for add_on in add_ons:
+            rows.append(row)
+            cols.append(add_on_index.get(add_on, len(add_on_prices) - 1))
+    numpy.add.at(incidence, (numpy.array(rows, dtype=numpy.int64),
+                             numpy.array(cols, dtype=numpy.int64)), 1)
+    packages = numpy.array([package_index.get(package, len(package_prices) - 1)
+                            for package, _, _ in orders], dtype=numpy.int64)
+    rush = numpy.array([bool(order[2]) for order in orders])
+    totals = package_prices[packages] + incidence @ add_on_prices + rush * catalog['rush_fee']
+    return totals.tolist()
+
+
+def _median(values):
+    """Median of a sorted list"""
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+
+def collect_order_catalog():
+    """The order catalog with the rush fee, included add-ons and per-package price spread
+
+    'spread' has one entry per package: {package, base, rush, min, median,
+    max, above_next} over every order with up to MAX_ADD_ONS add-ons, with
+    and without rush delivery; above_next is the share of those orders
+    costing more than the next package's base price.
+    """
+    catalog = dict(load_catalog(repo_path(*CATALOG_PATH)))
+    catalog['rush_fee'] = load_rush_fee()
+    catalog['deposit_share'] = DEPOSIT_SHARE
+    catalog['included'] = included_add_ons(catalog)
+
+    orders = list(order_combinations(catalog))
+    totals = price_matrix(catalog, orders)
+    by_package = {}
+    for (package, _, _), total in zip(orders, totals):
+        by_package.setdefault(package, []).append(total)
+    packages = sorted(catalog['packages'], key=lambda entry: entry['price'])
+    spread = []
+    for i, package in enumerate(packages):
+        values = sorted(by_package.get(package['id'], [package['price']]))
+        upgrade = packages[i + 1]['price'] if i + 1 < len(packages) else None
+        spread.append({
+            'package': package['id'],
+            'base': package['price'],
+            'rush': package['price'] + catalog['rush_fee'],
+            'min': values[0],
+            'median': _median(values),
+            'max': values[-1],
+            'above_next': (sum(value > upgrade for value in values) / len(values)
+                           if upgrade is not None else None),
+        })
+    catalog['max_add_ons'] = MAX_ADD_ONS
+    catalog['combinations'] = len(orders)
+    catalog['spread'] = spread
+    return catalog
@@ -0,0 +1,184 @@
+"""
+The generated Supabase types (src/integrations/supabase/types.ts) and their
+drift from the schema the migrations define
+
+types.ts is regenerated by hand, so it can lag behind (or run ahead of) the
+migrations. The generator's output is regular enough to read line by line:
+every object member sits on its own line and nested objects open at the end
+of a line and close at the start of one.
+"""
+
+import re
+
+from . import cached_parse, repo_path
+
+TYPES_PATH = ('src', 'integrations', 'supabase', 'types.ts')
+
+# Bump when the result of _parse_types changes
+PARSE_VERSION = 1
+
+_MEMBER = re.compile(r'\s*(\w+)(\?)?:\s*(.*?)\s*$')
+_EXPORT = re.compile(r'export\s+type\s+(\w+)\s*=\s*\{\s*$')
+_STRING = re.compile(r'"((?:[^"\\]|\\.)*)"')
+_ENUM_REF = re.compile(r'Database\["public"\]\["Enums"\]\["(\w+)"\]')
+
+# SQL column type (without length or precision) -> TypeScript type in types.ts
+_TS_TYPES = {
+    'text': 'string', 'varchar': 'string', 'character varying': 'string', 'char': 'string',
+    'character': 'string', 'citext': 'string', 'uuid': 'string', 'date': 'string',
+    'time': 'string', 'timetz': 'string', 'timestamp': 'string', 'timestamptz': 'string',
+    'timestamp with time zone': 'string', 'timestamp without time zone': 'string',
+    'interval': 'string', 'inet': 'string', 'bytea': 'string',
+    'smallint': 'number', 'integer': 'number', 'int': 'number', 'int2': 'number',
+    'int4': 'number', 'int8': 'number', 'bigint': 'number', 'serial': 'number',
+    'bigserial': 'number', 'numeric': 'number', 'decimal': 'number', 'real': 'number',
+    'double precision': 'number', 'float4': 'number', 'float8': 'number',
+    'boolean': 'boolean', 'bool': 'boolean',
+    'json': 'Json', 'jsonb': 'Json',
+}
+
+
+def _parse_types(path):
+    """Tables (Row and Insert columns), views and enums of the public schema in types.ts
+
+    Returns {'tables': {table: {'row': {column: ts type}, 'insert': {column:
+    optional}}}, 'views': [...], 'enums': {enum: [value, ...]}}.
+    """
+    tables = {}
+    views = []
+    enums = {}
+    stack = []
+    enum = None
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            stripped = line.strip()
+            if not stack:
+                match = _EXPORT.match(stripped)
+                if match and match.group(1) == 'Database':
+                    stack.append('Database')
+                continue
+            if stripped[:1] in ('}', ']'):
+                stack.pop()
+                if not stack:
+                    break  # end of the Database type
+                continue
+            where = stack[1:]
+            if where == ['public', 'Enums']:
+                if stripped.startswith('|') and enum:
+                    enums[enum] += _STRING.findall(stripped)
+                    continue
+            match = _MEMBER.match(line)
+            if match is None:
+                if stripped.endswith(('{', '[')):
+                    stack.append(None)
+                continue
+            name, optional, value = match.groups()
+            if value in ('{', '['):
+                stack.append(name)
+                if where == ['public', 'Tables']:
+                    tables[name] = {'row': {}, 'insert': {}}
+                elif where == ['public', 'Views'] and name != '_':
+                    views.append(name)
+                continue
+            if where == ['public', 'Enums']:
+                enum = name
+                enums[name] = _STRING.findall(value)
+            elif len(where) == 4 and where[:2] == ['public', 'Tables']:
+                if where[3] == 'Row':
+                    tables[where[2]]['row'][name] = value
+                elif where[3] == 'Insert':
+                    tables[where[2]]['insert'][name] = bool(optional)
+    return {'tables': tables, 'views': views, 'enums': enums}
+
+
+def collect_db_types():
+    """Tables, views and enums declared in the generated Supabase types"""
+    path = repo_path(*TYPES_PATH)
+    return cached_parse('types_ts', PARSE_VERSION, [path], _parse_types)[path]
+
+
+def expected_ts_type(sql_type, enums):
+    """The TypeScript type types.ts should give a column of sql_type, or None if unknown"""
+    base = sql_type[:-2] if sql_type.endswith('[]') else sql_type
+    base = re.sub(r'\s*\(.*\)', '', base)
+    base = base[len('public.'):] if base.startswith('public.') else base
+    if base in enums:
+        ts_type = f'Database["public"]["Enums"]["{base}"]'
+    elif base in _TS_TYPES:
+        ts_type = _TS_TYPES[base]
+    else:
+        return None
+    return ts_type + '[]' if sql_type.endswith('[]') else ts_type
+
+
+def _split_nullable(ts_type):
+    """(type, nullable) for a Row member type such as 'string | null'"""
+    if ts_type.endswith(' | null'):
+        return ts_type[:-len(' | null')], True
+    return ts_type, False
+
+
+def collect_schema_drift(schema, db_types):
+    """Differences between the migration schema and types.ts
+
+    Each finding is [kind, subject, detail]: kinds are 'table' and 'enum'
+    (present on one side only, or enum values differing) and 'column'
+    (missing on one side, or a type, nullability or insert-optionality
+    mismatch). Views are compared by name only, as the migration model does
+    not track them.
+    """
+    findings = []
+    migration_tables = set(schema['columns'])
+    typed_tables = set(db_types['tables'])
+    for table in sorted(migration_tables - typed_tables):
+        findings.append(['table', table, 'in the migrations but missing from types.ts'])
+    for table in sorted(typed_tables - migration_tables):
+        findings.append(['table', table, 'in types.ts but not created by any migration'])
+
+    checked = 0
+    for table in sorted(migration_tables & typed_tables):
+        columns = schema['columns'][table]
+        row = db_types['tables'][table]['row']
+        insert = db_types['tables'][table]['insert']
+        for name in columns.keys() - row.keys():
+            findings.append(['column', f'{table}.{name}', 'in the migrations but missing from types.ts'])
+        for name in row.keys() - columns.keys():
+            findings.append(['column', f'{table}.{name}', 'in types.ts but not in the migrations'])
+        for name, column in columns.items():
+            if name not in row:
+                continue
+            checked += 1
+            ts_type, nullable = _split_nullable(row[name])
+            expected = expected_ts_type(column['type'], schema['enums'])
+            if expected is not None and expected != ts_type:
+                findings.append(['column', f'{table}.{name}',
+                                 f"type {column['type']} should be {expected}, types.ts has {ts_type}"])
+            if nullable != column['nullable']:
+                findings.append(['column', f'{table}.{name}',
+                                 f"{'nullable' if column['nullable'] else 'NOT NULL'} in the migrations, "
+                                 f"{'nullable' if nullable else 'required'} in types.ts"])
+            optional = column['nullable'] or column['default']
+            if name in insert and insert[name] != optional:
+                findings.append(['column', f'{table}.{name}',
+                                 f"{'optional' if optional else 'required'} on insert per the migrations, "
+                                 f"{'optional' if insert[name] else 'required'} in types.ts"])
+
+    for enum in sorted(schema['enums'].keys() | db_types['enums'].keys()):
+        sql_values = schema['enums'].get(enum)
+        ts_values = db_types['enums'].get(enum)
+        if ts_values is None:
+            findings.append(['enum', enum, 'in the migrations but missing from types.ts'])
+        elif sql_values is None:
+            findings.append(['enum', enum, 'in types.ts but not created by any migration'])
+        elif sql_values != ts_values:
+            findings.append(['enum', enum, f"values {', '.join(sql_values)} in the migrations, "
+                                           f"{', '.join(ts_values)} in types.ts"])
+
+    findings.sort(key=lambda finding: (['table', 'column', 'enum'].index(finding[0]), finding[1]))
+    return {
+        'tables_compared': len(migration_tables & typed_tables),
+        'columns_compared': checked,
+        'enums_compared': len(schema['enums'].keys() & db_types['enums'].keys()),
+        'views': db_types['views'],
+        'findings': findings,
+    }
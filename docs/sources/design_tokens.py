@@ -0,0 +1,151 @@
+"""
+Design tokens of the site: the Tailwind colours and font families from
+tailwind.config.ts, resolved through the CSS custom properties of
+src/index.css (light and dark themes) to hex
+
+Both files are parsed through cached_parse, so the tokens cost a stat per
+build until one of them changes. load_design_tokens() is usable outside the
+collectors: setup_styles takes the document fonts and heading colour from it.
+"""
+
+import colorsys
+import re
+import threading
+
+from . import cached_parse, repo_path
+from .ts_literal import parse_literal
+
+TAILWIND_CONFIG = ('tailwind.config.ts',)
+STYLESHEET = ('src', 'index.css')
+
+# Bump when the result of _parse_token_file changes
+PARSE_VERSION = 1
+
+# Token giving the document's heading colour, first one defined wins
+HEADING_COLOR_TOKENS = ('navy', 'foreground')
+
+# setup_styles and the collector may load the tokens at the same time
+_LOCK = threading.Lock()
+
+_THEME_BLOCK = re.compile(r'(:root|\.dark)\s*\{([^{}]*)\}')
+_CUSTOM_PROPERTY = re.compile(r'(--[\w-]+)\s*:\s*([^;]+);')
+_APPLY = re.compile(r'([^{}]+?)\s*\{[^{}]*?@apply\s+([^;]*);')
+_FONT_IMPORT = re.compile(r'family=([^:&\'")]+)(?::wght@([\d;]+))?')
+_CONFIG_KEY = re.compile(r'\b(colors|fontFamily)\s*:\s*(?=\{)')
+_HSL_VAR = re.compile(r'hsl\(\s*var\((--[\w-]+)\)\s*\)')
+_HSL = re.compile(r'(-?[\d.]+)(?:deg)?\s+([\d.]+)%\s+([\d.]+)%')
+
+
+def _parse_token_file(path):
+    """Raw tokens of tailwind.config.ts ({'colors', 'fontFamily'}) or of a stylesheet
+
+    A stylesheet gives {'themes': {':root' or '.dark': {property: value}},
+    'applies': [[selector, classes], ...], 'font_weights': {family: [weight,
+    ...]}} from its custom properties, @apply rules and Google Fonts import.
+    """
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    if path.endswith('.css'):
+        themes = {}
+        for selector, body in _THEME_BLOCK.findall(text):
+            themes.setdefault(selector, {}).update(
+                (name, value.strip()) for name, value in _CUSTOM_PROPERTY.findall(body))
+        return {
+            'themes': themes,
+            'applies': [[' '.join(selector.split()), classes.split()]
+                        for selector, classes in _APPLY.findall(text)],
+            'font_weights': {family.replace('+', ' '): [int(weight) for weight in weights.split(';') if weight]
+                             for family, weights in _FONT_IMPORT.findall(text)},
+        }
+    return {match.group(1): parse_literal(text, match.end()) for match in _CONFIG_KEY.finditer(text)}
+
+
+def hsl_to_hex(value):
+    """'#RRGGBB' for a CSS HSL triple such as '262 83% 58%' (an alpha part is ignored), or None"""
+    match = _HSL.match(value.strip())
+    if match is None:
+        return None
+    hue, saturation, lightness = (float(part) for part in match.groups())
+    red, green, blue = colorsys.hls_to_rgb((hue % 360) / 360, lightness / 100, saturation / 100)
+    return '#' + ''.join(f'{round(channel * 255):02X}' for channel in (red, green, blue))
+
+
+def _flatten(colors, prefix=''):
+    """[(tailwind name, value), ...] with nested DEFAULT keys collapsed onto their parent"""
+    flat = []
+    for key, value in colors.items():
+        name = prefix if key == 'DEFAULT' else f'{prefix}-{key}' if prefix else key
+        if isinstance(value, dict):
+            flat += _flatten(value, name)
+        else:
+            flat.append((name, value))
+    return flat
+
+
+def _resolve(value, theme):
+    """(CSS variable or None, hex or None) of a Tailwind colour value in a theme"""
+    match = _HSL_VAR.fullmatch(value.strip())
+    if match is None:
+        return None, value.upper() if re.fullmatch(r'#[0-9a-fA-F]{6}', value) else None
+    variable = match.group(1)
+    return variable, hsl_to_hex(theme[variable]) if variable in theme else None
+
+
+def load_design_tokens():
+    """Colours and fonts of the site, or None if tailwind.config.ts or index.css is missing
+
+    Returns {'colors': [{name, variable, light, dark}, ...], 'fonts': [{key,
+    family, fallback, weights, used_for}, ...], 'radius': str or None} where
+    light and dark are hex (dark None when the dark theme keeps the light
+    value) and used_for lists the selectors applying the font class.
+    """
+    config_path = repo_path(*TAILWIND_CONFIG)
+    css_path = repo_path(*STYLESHEET)
+    try:
+        with _LOCK:
+            parsed = cached_parse('design_tokens', PARSE_VERSION, [config_path, css_path], _parse_token_file)
+    except OSError:
+        return None
+    config, css = parsed[config_path], parsed[css_path]
+    light = css['themes'].get(':root', {})
+    dark = {**light, **css['themes'].get('.dark', {})}
+
+    colors = []
+    for name, value in _flatten(config.get('colors', {})):
+        variable, light_hex = _resolve(value, light)
+        dark_hex = _resolve(value, dark)[1]
+        colors.append({'name': name, 'variable': variable, 'light': light_hex,
+                       'dark': dark_hex if dark_hex != light_hex else None})
+
+    fonts = []
+    for key, stack in config.get('fontFamily', {}).items():
+        stack = stack if isinstance(stack, list) else [stack]
+        fonts.append({
+            'key': key,
+            'family': stack[0],
+            'fallback': ', '.join(stack[1:]),
+            'weights': css['font_weights'].get(stack[0], []),
+            'used_for': [selector for selector, classes in css['applies'] if f'font-{key}' in classes],
+        })
+    return {'colors': colors, 'fonts': fonts, 'radius': light.get('--radius')}
+
+
+def document_theme(tokens):
+    """{'body_font', 'heading_font', 'heading_color'} for setup_styles; entries are None if unknown"""
+    theme = {'body_font': None, 'heading_font': None, 'heading_color': None}
+    if not tokens:
+        return theme
+    for font in tokens['fonts']:
+        for selector in font['used_for']:
+            if selector == 'body':
+                theme['body_font'] = font['family']
+            elif selector.split(',')[0].strip() == 'h1':
+                theme['heading_font'] = font['family']
+    by_name = {color['name']: color['light'] for color in tokens['colors']}
+    theme['heading_color'] = next((by_name[name] for name in HEADING_COLOR_TOKENS if by_name.get(name)), None)
+    return theme
+
+
+def collect_design_tokens():
+    """The site's colour and font tokens (see load_design_tokens)"""
+    return load_design_tokens()
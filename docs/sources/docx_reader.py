@@ -0,0 +1,217 @@
+"""
+Content of the Word documents kept in docs/ (the church partnership proposal,
+the WhatsApp pitches), read as the same block IR as the Markdown documents
+(see sources/markdown.py) so the sections render both the same way
+
+iter_docx() opens word/document.xml straight from the zip and iterparses
+it, yielding each heading, paragraph run, list and table as soon as it ends
+and clearing the elements it has consumed, so memory stays flat however big
+the document is. read_section() stops reading at the end of the section it
+was asked for; the rest of the file is never parsed.
+
+Headings are paragraphs with a heading style or a direct outline level
+(the proposal uses the latter); Preformatted/Code styled paragraphs become
+code blocks and numbered or List-styled paragraphs list items. lxml is
+imported only when a document is actually read.
+"""
+
+import re
+import zipfile
+
+from . import repo_path
+from .markdown import plain_text
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Sections of the Word documents imported into the build: key -> (file in docs/, heading);
+# the files are also the inputs of docx_sections in BUILTIN_COLLECTORS (sources/__init__.py)
+IMPORTS = {
+    'church_partnership': ('Church Partnership Proposal.docx', 'Partnership Model'),
+    'launch_readiness': ('WhatsApp Pitches.docx', 'Launch Readiness Confirmed'),
+}
+
+_HEADING_NAME = re.compile(r'heading (\d)$', re.I)
+_LIST_NAME = re.compile(r'list (?:bullet|number)(?: (\d))?$', re.I)
+_CODE_NAME = re.compile(r'preformatted|code', re.I)
+# Leading numbering and symbols ignored when matching a heading: '6. ', '📖 ', '1️⃣ '
+_HEADING_PREFIX = re.compile(r'^[\W\d_]+(?=\w)')
+
+
+def _style_kinds(archive):
+    """{style id: ('heading', level) | ('list', depth) | ('code', 0)} from word/styles.xml"""
+    from lxml import etree
+
+    try:
+        root = etree.fromstring(archive.read('word/styles.xml'))
+    except KeyError:
+        return {}
+    kinds = {}
+    for style in root.iter(f'{W}style'):
+        name_element = style.find(f'{W}name')
+        name = name_element.get(f'{W}val', '') if name_element is not None else ''
+        outline = style.find(f'{W}pPr/{W}outlineLvl')
+        if (match := _HEADING_NAME.match(name)) is not None:
+            kinds[style.get(f'{W}styleId')] = ('heading', int(match.group(1)))
+        elif outline is not None and int(outline.get(f'{W}val')) < 9:
+            kinds[style.get(f'{W}styleId')] = ('heading', int(outline.get(f'{W}val')) + 1)
+        elif (match := _LIST_NAME.match(name)) is not None:
+            kinds[style.get(f'{W}styleId')] = ('list', int(match.group(1) or 1) - 1)
+        elif _CODE_NAME.search(name):
+            kinds[style.get(f'{W}styleId')] = ('code', 0)
+    return kinds
+
+
+def _spans(paragraph):
+    """IR spans of a w:p, adjacent runs of the same style merged"""
+    spans = []
+    for run in paragraph.iter(f'{W}r'):
+        properties = run.find(f'{W}rPr')
+        style = ''
+        if properties is not None:
+            for tag, name in (('b', 'bold'), ('i', 'italic')):
+                flag = properties.find(f'{W}{tag}')
+                if flag is not None and flag.get(f'{W}val', 'true') not in ('0', 'false'):
+                    style = name
+                    break
+        text = ''.join('\t' if child.tag == f'{W}tab' else
+                       '\n' if child.tag in (f'{W}br', f'{W}cr') else child.text or ''
+                       for child in run if child.tag in (f'{W}t', f'{W}tab', f'{W}br', f'{W}cr'))
+        if not text:
+            continue
+        if spans and spans[-1][1] == style:
+            spans[-1][0] += text
+        else:
+            spans.append([text, style, None])
+    return spans
+
+
+def _paragraph_kind(paragraph, kinds):
+    """('heading', level), ('list', depth), ('code', 0) or ('paragraph', 0) for a w:p"""
+    properties = paragraph.find(f'{W}pPr')
+    if properties is None:
+        return 'paragraph', 0
+    outline = properties.find(f'{W}outlineLvl')
+    if outline is not None and int(outline.get(f'{W}val')) < 9:
+        return 'heading', int(outline.get(f'{W}val')) + 1
+    style = properties.find(f'{W}pStyle')
+    kind = kinds.get(style.get(f'{W}val')) if style is not None else None
+    if kind is not None:
+        return kind
+    level = properties.find(f'{W}numPr/{W}ilvl')
+    if properties.find(f'{W}numPr') is not None:
+        return 'list', int(level.get(f'{W}val')) if level is not None else 0
+    return 'paragraph', 0
+
+
+def _release(element):
+    """Free a consumed element and the already-consumed siblings before it"""
+    element.clear()
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def iter_docx(path):
+    """Yield the IR blocks of a .docx body in document order (see sources/markdown.py)"""
+    from lxml import etree
+
+    with zipfile.ZipFile(path) as archive:
+        kinds = _style_kinds(archive)
+        items = []      # [depth, None, spans] of the open list
+        code = []       # lines of the open code block
+        depth = 0       # w:tbl nesting
+
+        def flush():
+            if items:
+                yield ['list', list(items)]
+                items.clear()
+            if code:
+                yield ['code', '', '\n'.join(code)]
+                code.clear()
+
+        with archive.open('word/document.xml') as stream:
+            for event, element in etree.iterparse(stream, events=('start', 'end'),
+                                                  tag=(f'{W}p', f'{W}tbl')):
+                if element.tag == f'{W}tbl':
+                    depth += 1 if event == 'start' else -1
+                    if event == 'end' and depth == 0:
+                        yield from flush()
+                        rows = [[_spans(cell) for cell in row.iterchildren(f'{W}tc')]
+                                for row in element.iterchildren(f'{W}tr')]
+                        if rows:
+                            yield ['table', rows[0], rows[1:]]
+                        _release(element)
+                    continue
+                if event == 'start' or depth:
+                    continue  # table paragraphs are read with their table
+                spans = _spans(element)
+                kind, level = _paragraph_kind(element, kinds)
+                _release(element)
+                if kind != 'code' and not plain_text(spans).strip():
+                    continue
+                if kind == 'list':
+                    if code:
+                        yield from flush()
+                    items.append([level, None, spans])
+                    continue
+                if kind == 'code':
+                    if items:
+                        yield from flush()
+                    code.append(plain_text(spans))
+                    continue
+                yield from flush()
+                if kind == 'heading':
+                    yield ['heading', level, plain_text(spans).strip()]
+                else:
+                    yield ['paragraph', spans]
+        yield from flush()
+
+
+def heading_key(text):
+    """Heading text reduced for matching: numbering, symbols and case ignored"""
+    return ' '.join(_HEADING_PREFIX.sub('', text.strip()).split()).casefold()
+
+
+def read_section(path, heading):
+    """(heading text, level, blocks) of the section of a .docx titled heading, or None
+
+    blocks run up to the next heading of the same or a higher level; reading
+    stops there, so the rest of the document is never parsed.
+    """
+    wanted = heading_key(heading)
+    found = None
+    blocks = []
+    reader = iter_docx(path)
+    try:
+        for block in reader:
+            if block[0] == 'heading':
+                if found is not None and block[1] <= found[1]:
+                    break
+                if found is None and heading_key(block[2]) == wanted:
+                    found = (block[2], block[1])
+                    continue
+            if found is not None:
+                blocks.append(block)
+    finally:
+        reader.close()
+    return None if found is None else (found[0], found[1], blocks)
+
+
+def collect_docx_sections():
+    """{key: {'source', 'title', 'level', 'blocks'} or None} for each of IMPORTS
+
+    A key maps to None when its document or its heading is missing. Heading
+    levels inside blocks are the document's own; title's level is `level`.
+    """
+    from lxml import etree
+
+    sections = {}
+    for key, (name, heading) in IMPORTS.items():
+        try:
+            section = read_section(repo_path('docs', name), heading)
+        except (OSError, zipfile.BadZipFile, KeyError, etree.XMLSyntaxError):
+            section = None
+        sections[key] = None if section is None else {
+            'source': name, 'title': section[0], 'level': section[1], 'blocks': section[2]}
+    return sections
@@ -0,0 +1,135 @@
+"""
+Environment variables referenced by the app, the edge functions and the
+Node scripts, and the ones the committed .env files define
+
+Every file is scanned with one combined regex for import.meta.env.X
+(client, bundled by Vite), Deno.env.get("X") (edge functions) and
+process.env.X (Node scripts); .env files contribute the names they define.
+Only names are kept, never values. Files are scanned on a thread pool and
+the per-file results cached like the migration parse.
+"""
+
+import os
+import re
+
+from . import cached_parse, repo_path
+
+CLIENT_ROOT = ('src',)
+EDGE_ROOT = ('supabase', 'functions')
+SCRIPT_EXTENSIONS = ('.js', '.cjs', '.mjs', '.ts')
+CODE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.cjs', '.mjs')
+SCAN_WORKERS = 8
+
+# Bump when the result of _scan_file changes
+SCAN_VERSION = 1
+
+# Vite only exposes variables with this prefix to client code
+CLIENT_PREFIX = 'VITE_'
+
+_REFERENCE = re.compile(
+    r"""import\.meta\.env\.(?P<vite>\w+)"""
+    r"""|Deno\.env\.get\(\s*(?P<q1>['"`])(?P<deno>\w+)(?P=q1)\s*\)"""
+    r"""|process\.env(?:\.(?P<node>\w+)|\[\s*(?P<q2>['"`])(?P<node_key>\w+)(?P=q2)\s*\])"""
+    r"""(?P<fallback>\s*(?:\|\||\?\?)\s*['"`])?"""
+    r"""|^\s*(?:export\s+)?(?P<dotenv>[A-Za-z_]\w*)\s*=""",
+    re.M,
+)
+_SECRET_NAME = re.compile(r'SECRET|PASSWORD|PASS\b|PRIVATE|TOKEN|SERVICE_ROLE|KEY\b')
+_PUBLIC_NAME = re.compile(r'PUBLISHABLE|ANON|PUBLIC')
+
+
+def is_secret(name):
+    """Whether a variable name looks like a credential (keys, tokens, passwords)"""
+    return bool(_SECRET_NAME.search(name)) and not _PUBLIC_NAME.search(name)
+
+
+def _is_dotenv(path):
+    """Whether path is a .env file (.env, .env.local, .env.production, ...)"""
+    name = os.path.basename(path)
+    return name == '.env' or name.startswith('.env.')
+
+
+def _scan_file(path):
+    """[[kind, name, line, fallback], ...] for each reference in path
+
+    kind is 'vite', 'deno', 'node' or 'dotenv' (a definition); fallback is
+    True when a process.env read falls back to a string literal.
+    """
+    with open(path, encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    dotenv = _is_dotenv(path)
+    references = []
+    line, counted = 1, 0
+    for match in _REFERENCE.finditer(text):
+        kind = 'dotenv' if match.group('dotenv') else next(
+            (kind for kind in ('vite', 'deno', 'node') if match.group(kind)), 'node')
+        if (kind == 'dotenv') != dotenv:
+            continue
+        line += text.count('\n', counted, match.start())
+        counted = match.start()
+        name = next(match.group(group) for group in ('dotenv', 'vite', 'deno', 'node', 'node_key')
+                    if match.group(group))
+        references.append([kind, name, line, bool(match.group('fallback'))])
+    return references
+
+
+def _file_index():
+    """Files that may reference or define environment variables, in a stable order"""
+    paths = []
+    for root in (CLIENT_ROOT, EDGE_ROOT):
+        for directory, dirs, files in os.walk(repo_path(*root)):
+            dirs[:] = sorted(d for d in dirs if d != 'node_modules')
+            paths += [os.path.join(directory, name) for name in sorted(files)
+                      if name.endswith(CODE_EXTENSIONS)]
+    for name in sorted(os.listdir(repo_path())):
+        path = repo_path(name)
+        if os.path.isfile(path) and (_is_dotenv(path) or name.endswith(SCRIPT_EXTENSIONS)):
+            paths.append(path)
+    return paths
+
+
+def _origin(path):
+    """'client', 'edge', 'script' or 'dotenv' for a scanned file"""
+    if _is_dotenv(path):
+        return 'dotenv'
+    if path.startswith(repo_path(*CLIENT_ROOT) + os.sep):
+        return 'client'
+    if path.startswith(repo_path(*EDGE_ROOT) + os.sep):
+        return 'edge'
+    return 'script'
+
+
+def collect_env_vars():
+    """Variable -> where it is read and defined, whether it is secret and who can see it
+
+    Returns {'files': n, 'variables': {name: {'origins': [...], 'files':
+    [...], 'first_use': 'path:line' or None, 'defined_in': [...], 'secret':
+    bool, 'client': bool, 'fallbacks': ['path:line', ...]}}}. origins lists
+    where the variable is read ('client', 'edge', 'script'); client is True
+    when it is read by client code or, carrying the VITE_ prefix, bundled
+    into it.
+    """
+    paths = _file_index()
+    scanned = cached_parse('env_refs', SCAN_VERSION, paths, _scan_file, workers=SCAN_WORKERS)
+    variables = {}
+    for path in paths:
+        rel = os.path.relpath(path, repo_path()).replace(os.sep, '/')
+        origin = _origin(path)
+        for kind, name, line, fallback in scanned[path]:
+            entry = variables.setdefault(name, {'origins': [], 'files': [], 'first_use': None,
+                                                'defined_in': [], 'secret': is_secret(name),
+                                                'client': name.startswith(CLIENT_PREFIX),
+                                                'fallbacks': []})
+            if kind == 'dotenv':
+                if rel not in entry['defined_in']:
+                    entry['defined_in'].append(rel)
+                continue
+            if origin not in entry['origins']:
+                entry['origins'].append(origin)
+            if rel not in entry['files']:
+                entry['files'].append(rel)
+            entry['first_use'] = entry['first_use'] or f'{rel}:{line}'
+            entry['client'] = entry['client'] or origin == 'client'
+            if fallback:
+                entry['fallbacks'].append(f'{rel}:{line}')
+    return {'files': len(paths), 'variables': dict(sorted(variables.items()))}
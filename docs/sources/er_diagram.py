@@ -0,0 +1,267 @@
+"""
+Entity-relationship diagram of the tables linked by foreign keys, laid out
+and drawn in pure Python as PNG (embedded in the document) and SVG
+
+Layout is the expensive part, so both images are cached under a hash of the
+diagram model and only redrawn when tables, keys or references change.
+"""
+
+import hashlib
+import json
+import os
+
+from . import CACHE_DIR
+from .raster import GLYPH_HEIGHT, Canvas, text_width
+
+# Bump when the layout or drawing changes, to invalidate cached images
+RENDER_VERSION = 1
+
+SCALE = 2               # font scale: 12x14 pixel glyphs
+LINE_HEIGHT = 20
+PADDING = 8
+H_GAP = 40
+V_GAP = 50
+MARGIN = 20
+TRUNK = 24              # gutter left of each column of children, holding its connector
+V_TREE = 30             # gap between a table and the first row of its children
+ROW_GAP = 24
+
+WHITE, NAVY, BODY, TEXT, EDGE, EXTERNAL, LINK = range(7)
+PALETTE = [(255, 255, 255), (26, 35, 126), (232, 234, 246), (33, 33, 33),
+           (90, 90, 90), (97, 97, 97), (190, 190, 190)]
+
+
+def diagram_model(schema):
+    """Tables taking part in a foreign key, with their key columns, and the edges
+
+    Returns {'tables': {name: {'lines': [...], 'external': bool}},
+    'edges': [[child, column, parent], ...]}; referenced tables outside the
+    public schema (auth.users) are included as external boxes.
+    """
+    edges = []
+    for table, columns in schema['columns'].items():
+        for name, column in columns.items():
+            if column['references']:
+                parent = column['references'].rsplit('.', 1)[0]
+                edges.append([table, name, parent])
+    linked = sorted({table for child, _, parent in edges for table in (child, parent)})
+
+    tables = {}
+    for table in linked:
+        columns = schema['columns'].get(table)
+        if columns is None:
+            tables[table] = {'lines': ['PK id'], 'external': True}
+            continue
+        lines = [f'PK {name}' for name, column in columns.items()
+                 if name == 'id' and not column['references']]
+        lines += [f"FK {name} > {column['references'].rsplit('.', 1)[0]}"
+                  for name, column in columns.items() if column['references']]
+        others = len(columns) - len(lines)
+        if others:
+            lines.append(f'+ {others} more columns')
+        tables[table] = {'lines': lines, 'external': False}
+    return {'tables': tables, 'edges': edges}
+
+
+def _forest(model):
+    """Children per table under each child's first foreign key, and the root tables
+
+    The first reference of a table (in column order) places it in the tree;
+    any further references are drawn as plain lines across the diagram.
+    """
+    children = {table: [] for table in model['tables']}
+    placed = set()
+    for child, _, parent in model['edges']:
+        if child != parent and child not in placed:
+            children[parent].append(child)
+            placed.add(child)
+    # A reference cycle leaves no root to hang it from; break it at its first table
+    roots = [table for table in model['tables'] if table not in placed]
+    reachable = set()
+    stack = list(roots)
+    while stack:
+        table = stack.pop()
+        reachable.add(table)
+        stack += children[table]
+    for table in model['tables']:
+        if table not in reachable:
+            for kids in children.values():
+                if table in kids:
+                    kids.remove(table)
+            roots.append(table)
+            stack = [table]
+            while stack:
+                current = stack.pop()
+                reachable.add(current)
+                stack += children[current]
+    return children, roots
+
+
+def _box_size(model, table):
+    """(width, height) of the box for table"""
+    info = model['tables'][table]
+    widest = max(text_width(text, SCALE) for text in [table] + info['lines'])
+    return widest + 2 * PADDING, (len(info['lines']) + 1) * LINE_HEIGHT + 2 * PADDING
+
+
+def _grid(kids):
+    """Kids split into columns for a roughly square block"""
+    columns = max(1, min(len(kids), round((len(kids) * 1.5) ** 0.5)))
+    return [kids[i::columns] for i in range(columns)]
+
+
+def layout(model):
+    """Place every table; returns (boxes, connectors, width, height)
+
+    boxes maps table to (x, y, width, height). connectors are axis-aligned
+    (x0, y0, x1, y1) segments linking each table to its tree children,
+    with the parent end first.
+    """
+    children, roots = _forest(model)
+    sizes = {table: _box_size(model, table) for table in model['tables']}
+    blocks = {}
+
+    def measure(table):
+        width, height = sizes[table]
+        if children[table]:
+            columns = _grid(children[table])
+            widths = [max(measure(kid)[0] for kid in column) for column in columns]
+            rows = [max(measure(column[row])[1] for column in columns if row < len(column))
+                    for row in range(len(columns[0]))]
+            width = max(width, sum(widths) + TRUNK * len(columns) + H_GAP * (len(columns) - 1))
+            height += V_TREE + sum(rows) + ROW_GAP * (len(rows) - 1)
+        blocks[table] = (width, height)
+        return blocks[table]
+
+    boxes = {}
+    connectors = []
+
+    def place(table, x, y):
+        boxes[table] = (x, y) + sizes[table]
+        if not children[table]:
+            return
+        columns = _grid(children[table])
+        widths = [max(blocks[kid][0] for kid in column) for column in columns]
+        rows = [max(blocks[column[row]][1] for column in columns if row < len(column))
+                for row in range(len(columns[0]))]
+        drop_x = x + TRUNK // 2
+        bus_y = y + sizes[table][1] + V_TREE // 2
+        connectors.append((drop_x, y + sizes[table][1], drop_x, bus_y))
+        column_x = x
+        for column, column_width in zip(columns, widths):
+            trunk_x = column_x + TRUNK // 2
+            if trunk_x != drop_x:
+                connectors.append((drop_x, bus_y, trunk_x, bus_y))
+            kid_y = y + sizes[table][1] + V_TREE
+            for row, kid in enumerate(column):
+                place(kid, column_x + TRUNK, kid_y)
+                branch_y = kid_y + (LINE_HEIGHT + PADDING) // 2
+                connectors.append((trunk_x, bus_y, trunk_x, branch_y))
+                connectors.append((trunk_x, branch_y, column_x + TRUNK, branch_y))
+                kid_y += rows[row] + ROW_GAP
+            column_x += TRUNK + column_width + H_GAP
+
+    for root in roots:
+        measure(root)
+    # Pack the trees into bands, biggest first, aiming for a landscape page
+    area = sum(w * h for w, h in (blocks[root] for root in roots))
+    target = max(max(blocks[root][0] for root in roots), int((area * 1.6) ** 0.5))
+    x = y = MARGIN
+    band_height = width = 0
+    for root in sorted(roots, key=lambda root: -blocks[root][1]):
+        block_width, block_height = blocks[root]
+        if x > MARGIN and x + block_width > target + MARGIN:
+            x, y = MARGIN, y + band_height + V_GAP
+            band_height = 0
+        place(root, x, y)
+        x += block_width + H_GAP
+        width = max(width, x - H_GAP)
+        band_height = max(band_height, block_height)
+    return boxes, connectors, width + MARGIN, y + band_height + MARGIN
+
+
+def _cross_links(model, boxes):
+    """Straight (x0, y0, x1, y1) lines for references that are not tree edges"""
+    children, _ = _forest(model)
+    lines = []
+    for child, _, parent in model['edges']:
+        if child == parent or child in children[parent]:
+            continue
+        cx, cy, cw, ch = boxes[child]
+        px, py, pw, ph = boxes[parent]
+        lines.append((px + pw // 2, py + ph // 2, cx + cw // 2, cy + ch // 2))
+    return lines
+
+
+def render_png(model, boxes, connectors, width, height):
+    """Draw the diagram as PNG bytes"""
+    canvas = Canvas(width, height, PALETTE, WHITE)
+    for x0, y0, x1, y1 in _cross_links(model, boxes):
+        canvas.line(x0, y0, x1, y1, LINK)
+    for x0, y0, x1, y1 in connectors:
+        canvas.line(x0, y0, x1, y1, EDGE, 2)
+    for table, (x, y, box_width, box_height) in boxes.items():
+        header = EXTERNAL if model['tables'][table]['external'] else NAVY
+        canvas.rect(x, y, box_width, box_height, BODY)
+        canvas.rect(x, y, box_width, LINE_HEIGHT + PADDING, header)
+        canvas.outline(x, y, box_width, box_height, header, 2)
+        text_top = (LINE_HEIGHT - GLYPH_HEIGHT * SCALE) // 2
+        canvas.text(x + PADDING, y + PADDING // 2 + text_top, table, WHITE, SCALE)
+        for i, line in enumerate(model['tables'][table]['lines'], 1):
+            canvas.text(x + PADDING, y + PADDING + i * LINE_HEIGHT + text_top, line, TEXT, SCALE)
+    return canvas.png()
+
+
+def render_svg(model, boxes, connectors, width, height):
+    """Draw the diagram as an SVG document"""
+    def rgb(index):
+        return '#%02x%02x%02x' % PALETTE[index]
+
+    font = GLYPH_HEIGHT * SCALE + 2
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+             f'font-family="monospace" font-size="{font}">',
+             f'<rect width="{width}" height="{height}" fill="{rgb(WHITE)}"/>']
+    for x0, y0, x1, y1 in _cross_links(model, boxes):
+        parts.append(f'<line x1="{x0}" y1="{y0}" x2="{x1}" y2="{y1}" stroke="{rgb(LINK)}"/>')
+    for x0, y0, x1, y1 in connectors:
+        parts.append(f'<line x1="{x0}" y1="{y0}" x2="{x1}" y2="{y1}" '
+                     f'stroke="{rgb(EDGE)}" stroke-width="2" stroke-linecap="square"/>')
+    for table, (x, y, box_width, box_height) in boxes.items():
+        header = rgb(EXTERNAL if model['tables'][table]['external'] else NAVY)
+        parts.append(f'<rect x="{x}" y="{y}" width="{box_width}" height="{box_height}" '
+                     f'fill="{rgb(BODY)}" stroke="{header}" stroke-width="2"/>')
+        parts.append(f'<rect x="{x}" y="{y}" width="{box_width}" height="{LINE_HEIGHT + PADDING}" '
+                     f'fill="{header}"/>')
+        parts.append(f'<text x="{x + PADDING}" y="{y + PADDING // 2 + LINE_HEIGHT - 4}" '
+                     f'fill="{rgb(WHITE)}">{table}</text>')
+        for i, line in enumerate(model['tables'][table]['lines'], 1):
+            text = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            parts.append(f'<text x="{x + PADDING}" y="{y + PADDING + (i + 1) * LINE_HEIGHT - 4}" '
+                         f'fill="{rgb(TEXT)}">{text}</text>')
+    parts.append('</svg>')
+    return '\n'.join(parts)
+
+
+def collect_er_diagram(schema):
+    """PNG and SVG paths of the ER diagram, redrawn only when the diagram model changes"""
+    model = diagram_model(schema)
+    digest = hashlib.sha1(json.dumps([RENDER_VERSION, model], sort_keys=True).encode()).hexdigest()
+    base = os.path.join(CACHE_DIR, 'er', digest[:16])
+    result = {
+        'png': base + '.png',
+        'svg': base + '.svg',
+        'tables': len(model['tables']),
+        'edges': model['edges'],
+    }
+    if os.path.exists(result['png']) and os.path.exists(result['svg']):
+        return result
+
+    boxes, connectors, width, height = layout(model)
+    os.makedirs(os.path.dirname(base), exist_ok=True)
+    for path, content in ((result['png'], render_png(model, boxes, connectors, width, height)),
+                          (result['svg'], render_svg(model, boxes, connectors, width, height).encode())):
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(content)
+        os.replace(tmp, path)
+    return result
@@ -0,0 +1,389 @@
+"""
+Static import graph of the frontend (src/), the weight of each route page
+and the inventory of components under src/components
+
+Every file is parsed once into its imports (with the names taken from each
+module), exports and props interfaces, with combined regexes on a thread
+pool, cached per file. The source_index collector then resolves the imports
+(relative paths, tsconfig `paths` aliases such as @/, extension and index
+lookup) on every build, as that depends on which files exist; the import
+graph and the component inventory are both derived from it.
+
+A page's weight is everything it reaches through static imports; dynamic
+import() and React.lazy() edges start a separate chunk and are not followed.
+"""
+
+import json
+import os
+import re
+
+from . import cached_parse, repo_path
+
+SOURCE_ROOT = 'src'
+ENTRY = ('src', 'main.tsx')
+ROUTER = ('src', 'App.tsx')
+PAGES = ('src', 'pages')
+COMPONENTS = ('src', 'components')
+SCAN_WORKERS = 8
+
+# Bump when the result of _parse_source changes
+PARSE_VERSION = 2
+
+CODE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.mjs')
+STYLE_EXTENSIONS = ('.css',)
+RESOLVE_SUFFIXES = ('', '.ts', '.tsx', '.js', '.jsx', '.mjs', '/index.ts', '/index.tsx', '/index.js')
+
+# Packages worth keeping out of the initial bundle: package prefix -> label
+HEAVY_PACKAGES = {'recharts': 'recharts', 'framer-motion': 'framer-motion', '@tiptap/': 'tiptap'}
+
+_IMPORT = re.compile(
+    r"""\b(?:import|export)\s+(?P<type>type\s+)?(?P<clause>[\w*{}\s,$]*?)\s*\bfrom\s*(?P<q1>['"])(?P<static>[^'"]+)(?P=q1)"""
+    r"""|\bimport\s*(?P<q2>['"])(?P<bare>[^'"]+)(?P=q2)"""                  # side-effect import
+    r"""|\bimport\(\s*(?P<q3>['"])(?P<dynamic>[^'"]+)(?P=q3)\s*\)"""
+)
+_EXPORT = re.compile(
+    r"""^export\s+(?P<default>default\s+)?(?:async\s+)?(?:const|let|var|function\*?|class|enum)\s+(?P<name>\w+)"""
+    r"""|^export\s+default\s+(?P<bare>\w+)\s*;?\s*$"""
+    r"""|^export\s*\{(?P<list>[^}]*)\}""",
+    re.M,
+)
+_PROPS = re.compile(r'^(?:export\s+)?(?:interface\s+(\w*Props)\b[^{=]*|type\s+(\w*Props)\s*=[^{;]*)\{', re.M)
+_NESTED = re.compile(r'\{[^{}]*\}|\([^()]*\)')
+_MEMBER = re.compile(r'(?:^|[;,\n])\s*(?:readonly\s+)?(\w+)\??\s*:')
+_ROUTE = re.compile(r'<Route\s+path=["\']([^"\']+)["\']\s+element=\{\s*<(\w+)')
+_EAGER_PAGE = re.compile(r'import\s+(\w+)\s+from\s+["\']\./pages/(\w+)["\']')
+_LAZY_PAGE = re.compile(r'(?:const|let)\s+(\w+)\s*=\s*(?:React\.)?lazy\(\s*\(\)\s*=>\s*import\(\s*["\']\./pages/(\w+)["\']')
+_JSON_COMMENT = re.compile(r'"(?:[^"\\]|\\.)*"|//[^\n]*|/\*.*?\*/', re.S)
+
+
+def _imported_names(clause):
+    """Names an import or re-export clause takes: 'default', '*' or the exported names"""
+    names = []
+    head, _, braces = clause.partition('{')
+    for part in head.split(','):
+        part = part.strip()
+        if part.startswith('*'):
+            names.append('*')
+        elif part:
+            names.append('default')
+    for part in braces.rstrip('} \n').split(','):
+        part = part.strip()
+        if part and not part.startswith('type '):
+            names.append(part.split(' as ')[0].strip())
+    return names
+
+
+def _props_members(text, start):
+    """Top-level member names of the object type whose opening brace is at start"""
+    depth = 0
+    for end in range(start, len(text)):
+        depth += {'{': 1, '}': -1}.get(text[end], 0)
+        if depth == 0:
+            break
+    body = text[start + 1:end]
+    while True:
+        flat = _NESTED.sub('', body)
+        if flat == body:
+            break
+        body = flat
+    return _MEMBER.findall(body)
+
+
+def _parse_source(path):
+    """Imports, exports and props interfaces of a source file
+
+    Returns {'imports': [[kind, specifier, [name, ...]], ...], 'exports':
+    [[name, is default], ...], 'props': {interface: [member, ...]}} where
+    kind is 'static' or 'dynamic'. Type-only imports are left out: they
+    vanish at compile time.
+    """
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    imports = []
+    for match in _IMPORT.finditer(text):
+        if match.group('static'):
+            if not match.group('type'):
+                imports.append(['static', match.group('static'), _imported_names(match.group('clause'))])
+        elif match.group('bare'):
+            imports.append(['static', match.group('bare'), []])
+        else:
+            imports.append(['dynamic', match.group('dynamic'), ['*']])
+    if path.endswith(STYLE_EXTENSIONS):
+        return {'imports': imports, 'exports': [], 'props': {}}
+
+    exports = []
+    default = None
+    for match in _EXPORT.finditer(text):
+        if match.group('name'):
+            exports.append([match.group('name'), bool(match.group('default'))])
+        elif match.group('bare'):
+            default = match.group('bare')
+        else:
+            for part in match.group('list').split(','):
+                part = part.strip()
+                if part and not part.startswith('type '):
+                    exports.append([part.split(' as ')[-1].strip(), False])
+    if default:
+        exports = [[name, is_default or name == default] for name, is_default in exports]
+        if not any(name == default for name, _ in exports):
+            exports.append([default, True])
+    props = {(match.group(1) or match.group(2)): _props_members(text, match.end() - 1)
+             for match in _PROPS.finditer(text)}
+    return {'imports': imports, 'exports': exports, 'props': props}
+
+
+def _read_tsconfig(path):
+    """A tsconfig file as a dict (comments and trailing commas allowed), or {}"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+    except OSError:
+        return {}
+    text = _JSON_COMMENT.sub(lambda m: m.group(0) if m.group(0).startswith('"') else '', text)
+    try:
+        return json.loads(re.sub(r',(\s*[}\]])', r'\1', text))
+    except ValueError:
+        return {}
+
+
+def path_aliases():
+    """[(prefix, [target directory, ...]), ...] from tsconfig.json `paths` (or a referenced config)"""
+    config = _read_tsconfig(repo_path('tsconfig.json'))
+    configs = [(repo_path(), config)]
+    configs += [(repo_path(), _read_tsconfig(repo_path(ref['path'])))
+                for ref in config.get('references', [])]
+    for base, config in configs:
+        options = config.get('compilerOptions', {})
+        if options.get('paths'):
+            root = os.path.normpath(os.path.join(base, options.get('baseUrl', '.')))
+            return [(pattern.rstrip('*'), [os.path.normpath(os.path.join(root, target.rstrip('*')))
+                                           for target in targets])
+                    for pattern, targets in options['paths'].items()]
+    return []
+
+
+def _package(specifier):
+    """npm package name of a bare specifier"""
+    parts = specifier.split('/')
+    return '/'.join(parts[:2]) if specifier.startswith('@') else parts[0]
+
+
+def _heavy_label(package):
+    """The HEAVY_PACKAGES label of an npm package, or None"""
+    for prefix, label in HEAVY_PACKAGES.items():
+        if package == prefix or prefix.endswith('/') and package.startswith(prefix):
+            return label
+    return None
+
+
+def _resolve(specifier, importer, aliases):
+    """Absolute path of a local import, ('package', name) for a bare one, or None if unresolved"""
+    if specifier.startswith('.'):
+        candidates = [os.path.join(os.path.dirname(importer), specifier)]
+    else:
+        candidates = [os.path.join(target, specifier[len(prefix):])
+                      for prefix, targets in aliases if specifier.startswith(prefix) for target in targets]
+        if not candidates:
+            return ('package', _package(specifier))
+    for candidate in candidates:
+        candidate = os.path.normpath(candidate)
+        for suffix in RESOLVE_SUFFIXES:
+            if os.path.isfile(candidate + suffix):
+                return candidate + suffix
+    return None
+
+
+def _source_files():
+    """Code and stylesheet files under src/"""
+    paths = []
+    for directory, dirs, files in os.walk(repo_path(SOURCE_ROOT)):
+        dirs.sort()
+        paths += [os.path.join(directory, name) for name in sorted(files)
+                  if name.endswith(CODE_EXTENSIONS + STYLE_EXTENSIONS)]
+    return paths
+
+
+def _routes():
+    """{page module name: {'paths': [...], 'lazy': bool}} from the router in App.tsx"""
+    try:
+        with open(repo_path(*ROUTER), encoding='utf-8') as f:
+            text = f.read()
+    except OSError:
+        return {}
+    modules = {name: (module, False) for name, module in _EAGER_PAGE.findall(text)}
+    modules.update({name: (module, True) for name, module in _LAZY_PAGE.findall(text)})
+    routes = {}
+    for path, component in _ROUTE.findall(text):
+        if component in modules:
+            module, lazy = modules[component]
+            routes.setdefault(module, {'paths': [], 'lazy': lazy})['paths'].append(path)
+    return routes
+
+
+def collect_source_index():
+    """Every code and stylesheet file under src/ with its resolved imports, exports and props
+
+    Returns {path: {'imports': [{kind, specifier, names, path, package}, ...],
+    'exports': [[name, is default], ...], 'props': {interface: [member, ...]}}}
+    keyed by absolute path; an import has either the resolved path or the npm
+    package set, or neither when it could not be resolved.
+    """
+    aliases = path_aliases()
+    paths = _source_files()
+    parsed = cached_parse('imports', PARSE_VERSION, paths, _parse_source, workers=SCAN_WORKERS)
+    index = {}
+    for path in paths:
+        imports = []
+        for kind, specifier, names in parsed[path]['imports']:
+            resolved = _resolve(specifier, path, aliases)
+            imports.append({
+                'kind': kind,
+                'specifier': specifier,
+                'names': names,
+                'path': resolved if isinstance(resolved, str) else None,
+                'package': resolved[1] if isinstance(resolved, tuple) else None,
+            })
+        index[path] = {'imports': imports, 'exports': parsed[path]['exports'], 'props': parsed[path]['props']}
+    return index
+
+
+def _reach(index, start, kinds=('static',)):
+    """Files reachable from start through local imports of the given kinds"""
+    seen = {start}
+    stack = [start]
+    while stack:
+        for entry in index.get(stack.pop(), {'imports': ()})['imports']:
+            target = entry['path']
+            if entry['kind'] in kinds and target and target not in seen:
+                seen.add(target)
+                stack.append(target)
+    return seen
+
+
+def collect_import_graph(source_index):
+    """Per route page: modules and source bytes reached through static imports
+
+    Returns {'modules': n, 'edges': n, 'unresolved': [...], 'pages': [{name,
+    paths, lazy, routed, modules, bytes, asset_bytes, own_modules, own_bytes,
+    packages, heavy}, ...]} heaviest first, and 'heavy_eager': {label: [page,
+    ...]} for pages loaded with the app shell. modules and bytes cover code
+    and stylesheets; imported images and other files count as asset_bytes.
+    own_* cover the modules no other page reaches, and heavy lists the
+    HEAVY_PACKAGES labels the page pulls in.
+    """
+    unresolved = []
+    edges = 0
+    for path, entry in source_index.items():
+        for target in entry['imports']:
+            if target['kind'] != 'static':
+                continue
+            edges += 1
+            if target['path'] is None and target['package'] is None:
+                unresolved.append(f"{os.path.relpath(path, repo_path())}: {target['specifier']}")
+
+    routes = _routes()
+    page_dir = repo_path(*PAGES)
+    pages = {}
+    for name in sorted(os.listdir(page_dir)):
+        stem, ext = os.path.splitext(name)
+        if ext in CODE_EXTENSIONS:
+            pages[stem] = _reach(source_index, os.path.join(page_dir, name))
+
+    seen_by = {}
+    for stem, modules in pages.items():
+        for module in modules:
+            seen_by[module] = seen_by.get(module, 0) + 1
+
+    results = []
+    heavy_eager = {}
+    for stem, modules in pages.items():
+        route = routes.get(stem)
+        packages = sorted({target['package'] for module in modules
+                           for target in source_index.get(module, {'imports': ()})['imports']
+                           if target['kind'] == 'static' and target['package']})
+        heavy = sorted({label for label in map(_heavy_label, packages) if label})
+        code = [module for module in modules if module.endswith(CODE_EXTENSIONS + STYLE_EXTENSIONS)]
+        own = [module for module in code if seen_by[module] == 1]
+        results.append({
+            'name': stem,
+            'paths': route['paths'] if route else [],
+            'routed': route is not None,
+            'lazy': bool(route and route['lazy']),
+            'modules': len(code),
+            'bytes': sum(os.path.getsize(module) for module in code),
+            'asset_bytes': sum(os.path.getsize(module) for module in modules if module not in code),
+            'own_modules': len(own),
+            'own_bytes': sum(os.path.getsize(module) for module in own),
+            'packages': packages,
+            'heavy': heavy,
+        })
+        if route and not route['lazy']:
+            for label in heavy:
+                heavy_eager.setdefault(label, []).append(stem)
+    results.sort(key=lambda page: (-page['bytes'], page['name']))
+    return {
+        'modules': len(source_index),
+        'edges': edges,
+        'unresolved': unresolved,
+        'pages': results,
+        'heavy_eager': heavy_eager,
+    }
+
+
+def collect_component_inventory(source_index):
+    """Components under src/components with their props, importers and unused exports
+
+    Returns {'folders': {folder: [{file, bytes, exports: [[name, used by]],
+    props: {interface: [member, ...]}, importers, reachable}, ...]},
+    'components': n, 'unused_files': [file, ...], 'unused_bytes': n}.
+    Component exports are the capitalized ones; used by counts the modules
+    importing that name (or the whole module). reachable is False for files
+    no chain of imports from src/main.tsx reaches, lazy imports included:
+    those can be deleted outright. Top-level components are under ''.
+    """
+    # Reverse import index: file -> imported name -> importing files
+    importers = {}
+    for path, entry in source_index.items():
+        for target in entry['imports']:
+            if target['path']:
+                names = importers.setdefault(target['path'], {})
+                for name in target['names'] or ['*']:
+                    names.setdefault(name, set()).add(path)
+    reachable = _reach(source_index, repo_path(*ENTRY), kinds=('static', 'dynamic'))
+
+    root = repo_path(*COMPONENTS)
+    folders = {}
+    unused_files = []
+    unused_bytes = 0
+    components = 0
+    for path, entry in sorted(source_index.items()):
+        if not path.startswith(root + os.sep) or not path.endswith(CODE_EXTENSIONS):
+            continue
+        rel = os.path.relpath(path, root).replace(os.sep, '/')
+        folder = rel.split('/')[0] if '/' in rel else ''
+        names = importers.get(path, {})
+        whole = names.get('*', set())
+        exports = []
+        for name, is_default in entry['exports']:
+            if name[:1].isupper():
+                users = names.get(name, set()) | whole | (names.get('default', set()) if is_default else set())
+                exports.append([name, len(users)])
+        components += len(exports)
+        record = {
+            'file': rel,
+            'bytes': os.path.getsize(path),
+            'exports': exports,
+            'props': entry['props'],
+            'importers': len(set().union(*names.values())) if names else 0,
+            'reachable': path in reachable,
+        }
+        folders.setdefault(folder, []).append(record)
+        if not record['reachable']:
+            unused_files.append(rel)
+            unused_bytes += record['bytes']
+    return {
+        'folders': folders,
+        'components': components,
+        'unused_files': unused_files,
+        'unused_bytes': unused_bytes,
+    }
@@ -0,0 +1,192 @@
+"""
+Repository activity from the mainline git history: commits per week, churn
+per directory, the most frequently changed files and the deploy cadence
+
+`git log --numstat` is streamed once and folded into an aggregate kept in
+docs/.cache/git_activity.json together with the last commit it covers; later
+builds only read the commits after that one, so the cost tracks new history
+rather than total history. A rewritten history (the last seen commit is no
+longer an ancestor of HEAD) rebuilds the aggregate from scratch.
+
+Deploys: .github/workflows/deploy.yml builds and ships every push to main,
+so each day with a mainline commit is counted as a deploy day. Only the
+first-parent history is walked; a merge contributes its whole diff once.
+"""
+
+from datetime import datetime, timedelta, timezone
+import json
+import os
+import subprocess
+
+from . import CACHE_DIR, repo_path
+
+# Bump when the aggregate layout changes
+AGGREGATE_VERSION = 1
+
+WEEKS = 26          # commits-per-week window
+DIR_WEEKS = 12      # per-directory churn window
+TOP = 10            # directories and files reported
+DIR_DEPTH = 2       # src/components/ui/button.tsx counts towards src/components
+
+
+def _git(*args, **kwargs):
+    """Run a git command in the repository and capture its output"""
+    return subprocess.run(['git', '-C', repo_path(), *args], capture_output=True, text=True, **kwargs)
+
+
+def _week(timestamp):
+    """ISO date of the Monday (UTC) starting the week of timestamp"""
+    day = datetime.fromtimestamp(timestamp, timezone.utc).date()
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+def _numstat_path(path):
+    """The new path of a --numstat entry, resolving 'a/{b => c}/d' and 'a => b' renames"""
+    if ' => ' not in path:
+        return path
+    if '{' in path:
+        head, rest = path.split('{', 1)
+        inner, tail = rest.split('}', 1)
+        new = inner.split(' => ', 1)[1]
+        return (head + new + tail).replace('//', '/')
+    return path.split(' => ', 1)[1]
+
+
+def _directory(path):
+    """The directory (at most DIR_DEPTH levels deep) that path's churn counts towards"""
+    parts = path.split('/')[:-1][:DIR_DEPTH]
+    return '/'.join(parts) or '.'
+
+
+def _empty_aggregate():
+    """Aggregate covering no commits"""
+    return {'version': AGGREGATE_VERSION, 'head': None, 'commits': 0, 'first': None,
+            'latest': None, 'weeks': {}, 'dirs': {}, 'files': {}, 'deploy_days': []}
+
+
+def _ingest(aggregate, revisions):
+    """Stream `git log --numstat` over revisions into aggregate; returns commits read"""
+    deploy_days = set(aggregate['deploy_days'])
+    process = subprocess.Popen(
+        ['git', '-C', repo_path(), 'log', '--first-parent', '--numstat', '--format=%x00%H %ct',
+         revisions],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding='utf-8',
+        errors='replace',
+    )
+    read = 0
+    week = None
+    touched = set()
+    for line in process.stdout:
+        if line.startswith('\0'):
+            sha, timestamp = line[1:].split()
+            timestamp = int(timestamp)
+            read += 1
+            aggregate['latest'] = max(aggregate['latest'] or timestamp, timestamp)
+            aggregate['first'] = min(aggregate['first'] or timestamp, timestamp)
+            week = _week(timestamp)
+            aggregate['weeks'][week] = aggregate['weeks'].get(week, 0) + 1
+            deploy_days.add(datetime.fromtimestamp(timestamp, timezone.utc).date().isoformat())
+            touched = set()
+            continue
+        fields = line.rstrip('\n').split('\t', 2)
+        if len(fields) != 3 or week is None:
+            continue
+        added, deleted, path = fields
+        added = int(added) if added.isdigit() else 0  # '-' for binary files
+        deleted = int(deleted) if deleted.isdigit() else 0
+        path = _numstat_path(path)
+        entry = aggregate['files'].setdefault(path, [0, 0, 0])
+        entry[0] += 1
+        entry[1] += added
+        entry[2] += deleted
+        directory = _directory(path)
+        stats = aggregate['dirs'].setdefault(directory, {'commits': 0, 'added': 0, 'deleted': 0,
+                                                         'weeks': {}})
+        if directory not in touched:
+            touched.add(directory)
+            stats['commits'] += 1
+        stats['added'] += added
+        stats['deleted'] += deleted
+        stats['weeks'][week] = stats['weeks'].get(week, 0) + added + deleted
+    if process.wait() != 0:
+        raise subprocess.CalledProcessError(process.returncode, 'git log')
+    aggregate['commits'] += read
+    aggregate['deploy_days'] = sorted(deploy_days)
+    return read
+
+
+def _load_aggregate(path):
+    """The persisted aggregate, or an empty one if missing, unreadable or outdated"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            aggregate = json.load(f)
+    except (OSError, ValueError):
+        return _empty_aggregate()
+    return aggregate if aggregate.get('version') == AGGREGATE_VERSION else _empty_aggregate()
+
+
+def update_aggregate():
+    """The persisted aggregate brought up to HEAD, or None outside a git checkout"""
+    try:
+        head = _git('rev-parse', 'HEAD', check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    path = os.path.join(CACHE_DIR, 'git_activity.json')
+    aggregate = _load_aggregate(path)
+    if aggregate['head'] == head:
+        return aggregate
+    if aggregate['head'] and _git('merge-base', '--is-ancestor', aggregate['head'], head).returncode == 0:
+        _ingest(aggregate, f"{aggregate['head']}..{head}")
+    else:
+        aggregate = _empty_aggregate()
+        _ingest(aggregate, head)
+    aggregate['head'] = head
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(aggregate, f)
+    os.replace(tmp, path)
+    return aggregate
+
+
+def _series(counts, end, weeks):
+    """Values of {week: n} for the `weeks` weeks ending with the week of timestamp end"""
+    last = datetime.fromisoformat(_week(end)).date()
+    return [counts.get((last - timedelta(weeks=weeks - 1 - i)).isoformat(), 0) for i in range(weeks)]
+
+
+def collect_git_activity():
+    """Weekly commits, directory churn, hottest files and deploy cadence, or None without git
+
+    weekly and each directory's 'weekly' are oldest-first series ending with
+    the week of the latest commit (WEEKS and DIR_WEEKS long); files and
+    directories are the TOP most changed, by commits.
+    """
+    aggregate = update_aggregate()
+    if not aggregate or not aggregate['commits']:
+        return None
+    latest = aggregate['latest']
+    dirs = sorted(aggregate['dirs'].items(), key=lambda item: (-item[1]['commits'], item[0]))[:TOP]
+    files = sorted(aggregate['files'].items(), key=lambda item: (-item[1][0], item[0]))[:TOP]
+    days = [datetime.fromisoformat(day).date() for day in aggregate['deploy_days']]
+    gaps = sorted((b - a).days for a, b in zip(days, days[1:]))
+    recent = datetime.fromtimestamp(latest, timezone.utc).date() - timedelta(weeks=DIR_WEEKS)
+    return {
+        'commits': aggregate['commits'],
+        'first': aggregate['first'],
+        'latest': latest,
+        'weekly': _series(aggregate['weeks'], latest, WEEKS),
+        'directories': [{'path': path, 'commits': stats['commits'], 'added': stats['added'],
+                         'deleted': stats['deleted'],
+                         'weekly': _series(stats['weeks'], latest, DIR_WEEKS)}
+                        for path, stats in dirs],
+        'files': [{'path': path, 'commits': commits, 'added': added, 'deleted': deleted}
+                  for path, (commits, added, deleted) in files],
+        'deploys': {
+            'days': len(days),
+            'recent_days': sum(day > recent for day in days),
+            'median_gap_days': gaps[len(gaps) // 2] if gaps else None,
+            'last': days[-1].isoformat(),
+        },
+    }
@@ -0,0 +1,241 @@
+"""
+Markdown documents kept next to the generator (changelog, security QA
+report, SSL guide, marketing strategy), converted to a small block IR that
+the sections render into the document
+
+iter_blocks() reads a file line by line and yields each block as soon as it
+ends, holding only the block being built, so a long changelog never has to
+fit in memory as text. Blocks are JSON lists:
+
+    ['heading', level, text]
+    ['paragraph', spans]
+    ['list', [[depth, marker, spans], ...]]     marker is '3.' or None (bullet)
+    ['table', header cells, [row cells, ...]]   cells are spans
+    ['code', language, text]
+    ['quote', spans]
+    ['rule']
+
+and spans are [text, style, url] with style '', 'bold', 'italic', 'code' or
+'link' (url is None except for links). Each document's blocks are cached as
+JSON lines under its SHA-1, so an unchanged file is neither re-parsed nor
+re-read beyond hashing.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from . import CACHE_DIR, repo_path
+
+# Also the inputs of markdown_docs in BUILTIN_COLLECTORS (sources/__init__.py)
+DOCUMENTS = (
+    'CHANGELOG_2026-02-16.md',
+    'SECURITY_QA_DOCUMENTATION.md',
+    'SSL_SETUP_GUIDE.md',
+    'VIBELINK_MARKETING_STRATEGY.md',
+)
+
+# Bump when the IR produced by iter_blocks changes
+IR_VERSION = 1
+
+HASH_CHUNK = 1 << 20
+
+_FENCE = re.compile(r'\s*(```|~~~)\s*([\w+-]*)')
+_HEADING = re.compile(r'(#{1,6})\s+(.*?)(?:\s+#+)?\s*$')
+_LIST_ITEM = re.compile(r'(\s*)([-*+]|\d+[.)])\s+(.*)')
+_TASK = re.compile(r'\[([ xX])\]\s+')
+_RULE = re.compile(r'\s{0,3}([-*_])(?:\s*\1){2,}\s*$')
+_SETEXT = re.compile(r'(=+|-+)\s*$')
+_TABLE_SEPARATOR = re.compile(r'\s*:?-+:?\s*')
+_INLINE = re.compile(
+    r'`(?P<code>[^`]+)`'
+    r'|\*\*(?P<bold>.+?)\*\*|__(?P<bold2>.+?)__'
+    r'|\*(?P<italic>[^*\s](?:.*?[^*\s])?)\*'
+    r'|!?\[(?P<label>[^\]]*)\]\((?P<url>[^)\s]+)[^)]*\)'
+)
+
+
+def parse_inline(text):
+    """[[text, style, url], ...] for the inline markup of one block's text"""
+    spans = []
+    position = 0
+    for match in _INLINE.finditer(text):
+        if match.start() > position:
+            spans.append([text[position:match.start()], '', None])
+        if match.group('code') is not None:
+            spans.append([match.group('code'), 'code', None])
+        elif match.group('url') is not None:
+            spans.append([match.group('label') or match.group('url'), 'link', match.group('url')])
+        elif match.group('italic') is not None:
+            spans.append([match.group('italic'), 'italic', None])
+        else:
+            spans.append([match.group('bold') or match.group('bold2'), 'bold', None])
+        position = match.end()
+    if position < len(text):
+        spans.append([text[position:], '', None])
+    return spans
+
+
+def plain_text(spans):
+    """The text of spans without their markup"""
+    return ''.join(span[0] for span in spans)
+
+
+def _table_cells(line):
+    """Cell texts of a '| a | b |' row"""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in re.split(r'(?<!\\)\|', line)]
+
+
+def iter_blocks(lines):
+    """Yield the IR blocks of Markdown read from an iterable of lines, one block at a time"""
+    paragraph = []      # lines of the open paragraph
+    items = []          # [depth, marker, text] of the open list
+    indents = []        # indentation of each open list level
+    table = []          # rows of the open table
+    fence = None        # (marker, language, lines) of the open code fence
+    blank = False       # the previous line was blank
+
+    def flush():
+        if paragraph:
+            yield ['paragraph', parse_inline(' '.join(paragraph))]
+            paragraph.clear()
+        if items:
+            yield ['list', [[depth, marker, parse_inline(text)] for depth, marker, text in items]]
+            items.clear()
+            indents.clear()
+        if table:
+            header, rows = table[0], table[1:]
+            yield ['table', [parse_inline(cell) for cell in header],
+                   [[parse_inline(cell) for cell in row] for row in rows]]
+            table.clear()
+
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if fence is not None:
+            if line.strip().startswith(fence[0]):
+                yield ['code', fence[1], '\n'.join(fence[2])]
+                fence = None
+            else:
+                fence[2].append(line)
+            continue
+
+        stripped = line.strip()
+        if not stripped:
+            if paragraph or table:
+                yield from flush()
+            blank = True
+            continue
+
+        match = _FENCE.match(line)
+        if match:
+            yield from flush()
+            fence = (match.group(1), match.group(2), [])
+            blank = False
+            continue
+
+        if paragraph and not items and _SETEXT.match(line):
+            yield ['heading', 1 if line.lstrip().startswith('=') else 2, ' '.join(paragraph)]
+            paragraph.clear()
+            continue
+
+        match = _HEADING.match(line)
+        if match:
+            yield from flush()
+            yield ['heading', len(match.group(1)), plain_text(parse_inline(match.group(2)))]
+        elif _RULE.match(line):
+            yield from flush()
+            yield ['rule']
+        elif stripped.startswith('|'):
+            if not table:
+                yield from flush()
+            cells = _table_cells(stripped)
+            if len(table) == 1 and all(_TABLE_SEPARATOR.fullmatch(cell) for cell in cells):
+                pass  # the header/body separator
+            else:
+                table.append(cells)
+        elif stripped.startswith('>'):
+            yield from flush()
+            yield ['quote', parse_inline(stripped.lstrip('>').strip())]
+        elif (match := _LIST_ITEM.match(line)) is not None:
+            if paragraph or table:
+                yield from flush()
+            indent = len(match.group(1).expandtabs(4))
+            while indents and indents[-1] > indent:
+                indents.pop()
+            if not indents or indent > indents[-1]:
+                indents.append(indent)
+            marker = match.group(2)
+            text = match.group(3)
+            task = _TASK.match(text)
+            if task:
+                text = ('☑ ' if task.group(1) in 'xX' else '☐ ') + text[task.end():]
+            items.append([len(indents) - 1, None if marker in '-*+' else marker[:-1] + '.', text])
+        elif items and (line[:1].isspace() or not blank):
+            items[-1][2] += ' ' + stripped  # continuation of the last item
+        else:
+            if items:
+                yield from flush()
+            paragraph.append(stripped)
+        blank = False
+
+    if fence is not None:
+        yield ['code', fence[1], '\n'.join(fence[2])]
+    yield from flush()
+
+
+def _file_digest(path):
+    """SHA-1 of a file, read in HASH_CHUNK pieces"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def convert(path):
+    """The IR blocks of a Markdown file, from the cache when its SHA-1 is unchanged"""
+    digest = _file_digest(path)
+    cache_dir = os.path.join(CACHE_DIR, 'markdown')
+    cache_path = os.path.join(cache_dir, os.path.basename(path) + '.jsonl')
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            if header['version'] == IR_VERSION and header['sha1'] == digest:
+                return [json.loads(line) for line in f]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    # Parse and write the cache in the same pass, one block per line
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f'{cache_path}.{os.getpid()}.tmp'
+    blocks = []
+    with open(path, encoding='utf-8') as source, open(tmp, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'version': IR_VERSION, 'sha1': digest}) + '\n')
+        for block in iter_blocks(source):
+            f.write(json.dumps(block, ensure_ascii=False) + '\n')
+            blocks.append(block)
+    os.replace(tmp, cache_path)
+    return blocks
+
+
+def collect_markdown_docs():
+    """{file name: {'title', 'blocks'}} for each of DOCUMENTS present in docs/
+
+    title is the text of the first level-1 heading (or the file name) and
+    blocks the document's IR, see iter_blocks.
+    """
+    documents = {}
+    for name in DOCUMENTS:
+        try:
+            blocks = convert(repo_path('docs', name))
+        except OSError:
+            continue
+        title = next((block[2] for block in blocks if block[0] == 'heading' and block[1] == 1), name)
+        documents[name] = {'title': title, 'blocks': blocks}
+    return documents
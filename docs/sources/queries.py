@@ -0,0 +1,161 @@
+"""
+Supabase query patterns in the app and edge functions, and the indexes the
+migrations are missing for them
+
+Every `.from('table')` chain is reduced to the columns it filters on
+(.eq/.neq/.in/.is/.gt/.gte/.lt/.lte/.like/.ilike/.contains) and sorts by
+(.order). Each file is scanned with a single combined regex, on a thread
+pool, and the per-file results are cached like the migration parse.
+"""
+
+import os
+import re
+
+from . import cached_parse, repo_path
+
+SCAN_ROOTS = (('src',), ('supabase', 'functions'))
+EXTENSIONS = ('.ts', '.tsx')
+SCAN_WORKERS = 8
+
+# Bump when the result of _scan_file changes
+SCAN_VERSION = 1
+
+FILTERS = ('eq', 'neq', 'in', 'is', 'gt', 'gte', 'lt', 'lte', 'like', 'ilike', 'contains')
+
+_QUERY = re.compile(
+    r"""(?P<storage>\bstorage\s*\.\s*from\s*\([^)]*\))"""            # storage bucket, not a table
+    r"""|\.from\(\s*(?P<quote>['"`])(?P<table>\w+)(?P=quote)\s*\)"""
+    r"""|\.(?P<op>""" + '|'.join(FILTERS) + r"""|order|select|insert|upsert|update|delete)\(\s*"""
+    r"""(?:(?P<argquote>['"`])(?P<column>[\w.]*)(?P=argquote))?"""
+    r"""|(?P<end>;)"""
+)
+
+
+def _scan_file(path):
+    """[[table, line, [[op, column or None], ...]], ...] for each query chain in path"""
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    chains = []
+    chain = None
+    line, counted = 1, 0
+    for match in _QUERY.finditer(text):
+        kind = match.lastgroup
+        if match.group('table'):
+            line += text.count('\n', counted, match.start())
+            counted = match.start()
+            chain = [match.group('table'), line, []]
+            chains.append(chain)
+        elif match.group('op'):
+            if chain is not None:
+                chain[2].append([match.group('op'), match.group('column') or None])
+        elif kind in ('storage', 'end'):
+            chain = None
+    return chains
+
+
+def _source_files():
+    """TypeScript files under the scanned roots"""
+    paths = []
+    for root in SCAN_ROOTS:
+        for directory, dirs, files in os.walk(repo_path(*root)):
+            dirs[:] = sorted(d for d in dirs if d != 'node_modules')
+            paths += [os.path.join(directory, name) for name in sorted(files)
+                      if name.endswith(EXTENSIONS)]
+    return paths
+
+
+def collect_query_patterns():
+    """Per table: the call sites filtering and sorting on each column
+
+    Returns {'files': n, 'chains': n, 'tables': {table: {'chains': n,
+    'filters': {column: [site, ...]}, 'sorts': {column: [site, ...]},
+    'pairs': {(filter, sort): n}}}} where sites are 'path:line' strings and
+    pairs count chains that filter on one column and then sort on another;
+    files counts the scanned files holding at least one chain.
+    """
+    paths = _source_files()
+    scanned = cached_parse('queries', SCAN_VERSION, paths, _scan_file, workers=SCAN_WORKERS)
+    tables = {}
+    chains = 0
+    for path in paths:
+        rel = os.path.relpath(path, repo_path()).replace(os.sep, '/')
+        for table, line, ops in scanned[path]:
+            chains += 1
+            usage = tables.setdefault(table, {'chains': 0, 'filters': {}, 'sorts': {}, 'pairs': {}})
+            usage['chains'] += 1
+            filters = [column for op, column in ops if op in FILTERS and column]
+            sorts = [column for op, column in ops if op == 'order' and column]
+            for column in dict.fromkeys(filters):
+                usage['filters'].setdefault(column, []).append(f'{rel}:{line}')
+            for column in dict.fromkeys(sorts):
+                usage['sorts'].setdefault(column, []).append(f'{rel}:{line}')
+            for pair in {(f, s) for f in filters for s in sorts[:1] if f != s}:
+                usage['pairs'][pair] = usage['pairs'].get(pair, 0) + 1
+    return {'files': sum(1 for path in paths if scanned[path]), 'chains': chains, 'tables': tables}
+
+
+def _leading_columns(indexes):
+    """Columns that lead a full (non-partial) btree index, and the two-column prefixes"""
+    leading = set()
+    prefixes = set()
+    for index in indexes.values():
+        if index['method'] == 'btree' and not index['partial']:
+            leading.add(index['columns'][0])
+            prefixes.add(tuple(index['columns'][:2]))
+    return leading, prefixes
+
+
+def collect_index_advice(schema, query_patterns):
+    """Indexes the app's queries would use but the migrations do not declare, ranked
+
+    Each suggestion is {table, columns, filters, sorts, score, sites, ddl,
+    note}: filters and sorts count the call sites filtering or sorting on
+    the leading column, and score weights filters double. Columns that are
+    not in the migration schema (embedded relations, typos) are ignored.
+    """
+    suggestions = []
+    covered = 0
+    for table, usage in sorted(query_patterns['tables'].items()):
+        columns = schema['columns'].get(table)
+        if columns is None:
+            continue
+        leading, prefixes = _leading_columns(schema['indexes'].get(table, {}))
+        used = [column for column in {**usage['filters'], **usage['sorts']} if column in columns]
+        for column in used:
+            filters = usage['filters'].get(column, [])
+            sorts = usage['sorts'].get(column, [])
+            if column in leading:
+                covered += 1
+                continue
+            # A sort that always follows a filter belongs in that filter's index
+            after_filter = sum(n for (f, sort), n in usage['pairs'].items() if sort == column and f in columns)
+            if not filters and len(sorts) <= after_filter:
+                continue
+            key = [column]
+            paired = {sort: n for (f, sort), n in usage['pairs'].items() if f == column and sort in columns}
+            if paired:
+                sort, n = max(paired.items(), key=lambda item: (item[1], item[0]))
+                if n * 2 >= len(filters) and (column, sort) not in prefixes:
+                    key.append(sort)
+            note = ''
+            if columns[column]['type'] == 'boolean':
+                note = 'low selectivity (boolean); worth it only on a large table, or as a partial index'
+            suggestions.append({
+                'table': table,
+                'columns': key,
+                'filters': len(filters),
+                'sorts': len(sorts),
+                'score': 2 * len(filters) + len(sorts),
+                'sites': sorted(set(filters + sorts)),
+                'ddl': f"CREATE INDEX IF NOT EXISTS idx_{table}_{'_'.join(key)} "
+                       f"ON public.{table} ({', '.join(key)});",
+                'note': note,
+            })
+    suggestions.sort(key=lambda s: (-s['score'], bool(s['note']), s['table'], s['columns']))
+    return {
+        'files': query_patterns['files'],
+        'chains': query_patterns['chains'],
+        'tables': sum(table in schema['columns'] for table in query_patterns['tables']),
+        'covered': covered,
+        'missing': suggestions,
+    }
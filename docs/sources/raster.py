@@ -0,0 +1,132 @@
+"""
+Minimal pure-Python raster canvas with a built-in 5x7 bitmap font and a PNG
+encoder, for diagrams embedded in the document without needing Pillow
+"""
+
+import struct
+import zlib
+
+# 5x7 glyphs: each character is seven rows, top to bottom, every row a base-32
+# digit whose five bits are the pixels from left to right
+_FONT = {
+    'a': '00e1fhf', 'b': 'gguhhhu', 'c': '00egghe', 'd': '11fhhhf', 'e': '00ehvge',
+    'f': '698s888', 'g': '0fhhf1e', 'h': 'ggmphhh', 'i': '40c444e', 'j': '20622ic',
+    'k': 'ggikoki', 'l': 'c44444e', 'm': '00qllhh', 'n': '00mphhh', 'o': '00ehhhe',
+    'p': '00uhugg', 'q': '00fhf11', 'r': '00mpggg', 's': '00fge1u', 't': '88s8896',
+    'u': '00hhhjd', 'v': '00hhha4', 'w': '00hhlla', 'x': '00ha4ah', 'y': '00hhf1e',
+    'z': '00v248v', 'A': 'ehhvhhh', 'B': 'uhhuhhu', 'C': 'ehggghe', 'D': 'sihhhis',
+    'E': 'vgguggv', 'F': 'vgguggg', 'G': 'ehgnhhf', 'H': 'hhhvhhh', 'I': 'e44444e',
+    'J': '72222ic', 'K': 'hikokih', 'L': 'ggggggv', 'M': 'hrllhhh', 'N': 'hhpljhh',
+    'O': 'ehhhhhe', 'P': 'uhhuggg', 'Q': 'ehhhlid', 'R': 'uhhukih', 'S': 'fgge11u',
+    'T': 'v444444', 'U': 'hhhhhhe', 'V': 'hhhhha4', 'W': 'hhhllla', 'X': 'hha4ahh',
+    'Y': 'hhha444', 'Z': 'v1248gv', '0': 'ehjlphe', '1': '4c4444e', '2': 'eh1248v',
+    '3': 'v2421he', '4': '26aiv22', '5': 'vgu11he', '6': '68guhhe', '7': 'v124888',
+    '8': 'ehhehhe', '9': 'ehhf12c', '_': '000000v', '.': '00000cc', ',': '0000c48',
+    '-': '000v000', '+': '044v440', ':': '0cc0cc0', '(': '2488842', ')': '8422248',
+    '[': 'e88888e', ']': 'e22222e', '>': '8421248', '/': '01248g0', "'": '4480000',
+    '?': 'eh12404',
+}
+_BASE32 = '0123456789abcdefghijklmnopqrstuv'
+
+GLYPH_WIDTH = 6  # 5 pixels plus one of spacing
+GLYPH_HEIGHT = 7
+
+
+def _glyph_rows(char):
+    """Pixel rows of char as 5-bit ints ('?' for characters the font lacks)"""
+    glyph = _FONT.get(char) or _FONT.get(char.lower()) or _FONT['?']
+    return [_BASE32.index(row) for row in glyph]
+
+
+class Canvas:
+    """A paletted image: fill rectangles, draw lines and text, encode as PNG"""
+
+    def __init__(self, width, height, palette, background=0):
+        self.width = width
+        self.height = height
+        self.palette = palette  # [(r, g, b), ...]; pixels hold palette indexes
+        self.pixels = bytearray([background]) * (width * height)
+
+    def rect(self, x, y, width, height, color):
+        """Fill a rectangle, clipped to the canvas"""
+        x0, x1 = max(x, 0), min(x + width, self.width)
+        if x0 >= x1:
+            return
+        row = bytes([color]) * (x1 - x0)
+        for yy in range(max(y, 0), min(y + height, self.height)):
+            start = yy * self.width + x0
+            self.pixels[start:start + len(row)] = row
+
+    def outline(self, x, y, width, height, color, thickness=1):
+        """Draw the border of a rectangle"""
+        self.rect(x, y, width, thickness, color)
+        self.rect(x, y + height - thickness, width, thickness, color)
+        self.rect(x, y, thickness, height, color)
+        self.rect(x + width - thickness, y, thickness, height, color)
+
+    def line(self, x0, y0, x1, y1, color, thickness=1):
+        """Draw a straight line (Bresenham) with a square pen"""
+        dx, dy = abs(x1 - x0), -abs(y1 - y0)
+        sx, sy = (1 if x0 < x1 else -1), (1 if y0 < y1 else -1)
+        error = dx + dy
+        offset = thickness // 2
+        while True:
+            self.rect(x0 - offset, y0 - offset, thickness, thickness, color)
+            if x0 == x1 and y0 == y1:
+                return
+            doubled = 2 * error
+            if doubled >= dy:
+                error += dy
+                x0 += sx
+            if doubled <= dx:
+                error += dx
+                y0 += sy
+
+    def text(self, x, y, text, color, scale=1):
+        """Draw text with its top-left corner at (x, y)"""
+        for char in text:
+            if char != ' ':
+                for row, bits in enumerate(_glyph_rows(char)):
+                    for column in range(5):
+                        if bits & (0b10000 >> column):
+                            self.rect(x + column * scale, y + row * scale, scale, scale, color)
+            x += GLYPH_WIDTH * scale
+
+    def png(self):
+        """Encode the canvas as an 8-bit paletted PNG"""
+        def chunk(kind, data):
+            return (struct.pack('>I', len(data)) + kind + data +
+                    struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff))
+
+        raw = bytearray()
+        for y in range(self.height):
+            raw.append(0)  # filter type: none
+            raw += self.pixels[y * self.width:(y + 1) * self.width]
+        return b''.join([
+            b'\x89PNG\r\n\x1a\n',
+            chunk(b'IHDR', struct.pack('>IIBBBBB', self.width, self.height, 8, 3, 0, 0, 0)),
+            chunk(b'PLTE', b''.join(bytes(rgb) for rgb in self.palette)),
+            chunk(b'IDAT', zlib.compress(bytes(raw), 9)),
+            chunk(b'IEND', b''),
+        ])
+
+
+def text_width(text, scale=1):
+    """Width in pixels of text drawn at scale"""
+    return len(text) * GLYPH_WIDTH * scale
+
+
+def sparkline(values, width=120, height=24, color=(26, 35, 126), last=(192, 0, 0)):
+    """PNG bytes of a bar sparkline of values, the last bar highlighted"""
+    canvas = Canvas(width, height, [(255, 255, 255), color, last, (200, 200, 200)])
+    canvas.rect(0, height - 1, width, 1, 3)  # baseline
+    if values:
+        top = max(values) or 1
+        step = width / len(values)
+        bar = max(1, int(step) - 1)
+        for i, value in enumerate(values):
+            bar_height = round(value / top * (height - 2))
+            if bar_height:
+                canvas.rect(int(i * step), height - 1 - bar_height, bar, bar_height,
+                            2 if i == len(values) - 1 else 1)
+    return canvas.png()
@@ -0,0 +1,109 @@
+"""
+Collectors for basic repository facts: migrations, edge functions, the
+dependency lockfile, static assets, git history and hosted event pages
+"""
+
+import json
+import os
+import re
+import subprocess
+
+from . import repo_path
+
+_TITLE = re.compile(r'<title>\s*(.*?)\s*</title>', re.I | re.S)
+
+
+def collect_migrations():
+    """Migration files in apply order"""
+    directory = repo_path('supabase', 'migrations')
+    migrations = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.sql'):
+            migrations.append({
+                'name': name,
+                'version': name.split('_', 1)[0],
+                'bytes': os.path.getsize(os.path.join(directory, name)),
+            })
+    return migrations
+
+
+def collect_edge_functions():
+    """Supabase Edge Functions with the size of their entry point"""
+    directory = repo_path('supabase', 'functions')
+    functions = []
+    for name in sorted(os.listdir(directory)):
+        entry = os.path.join(directory, name, 'index.ts')
+        if os.path.isfile(entry):
+            with open(entry, encoding='utf-8') as f:
+                lines = sum(1 for _ in f)
+            functions.append({'name': name, 'lines': lines})
+    return functions
+
+
+def collect_lockfile():
+    """Direct dependencies with declared range and resolved lockfile version"""
+    with open(repo_path('package.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+    try:
+        with open(repo_path('package-lock.json'), encoding='utf-8') as f:
+            packages = json.load(f).get('packages', {})
+    except FileNotFoundError:
+        packages = {}
+
+    dependencies = {}
+    for field, dev in (('dependencies', False), ('devDependencies', True)):
+        for name, declared in manifest.get(field, {}).items():
+            resolved = packages.get(f'node_modules/{name}', {}).get('version')
+            dependencies[name] = {
+                'declared': declared,
+                'version': resolved or declared.lstrip('^~'),
+                'dev': dev,
+            }
+    return dependencies
+
+
+def collect_assets():
+    """Static asset count and size per file type"""
+    by_type = {}
+    for top in ('public', os.path.join('src', 'assets')):
+        for root, _, files in os.walk(repo_path(top)):
+            for name in files:
+                ext = os.path.splitext(name)[1].lower().lstrip('.') or '(none)'
+                entry = by_type.setdefault(ext, {'files': 0, 'bytes': 0})
+                entry['files'] += 1
+                entry['bytes'] += os.path.getsize(os.path.join(root, name))
+    return dict(sorted(by_type.items(), key=lambda item: -item[1]['bytes']))
+
+
+def collect_git_history():
+    """Commit count and first/latest commit, or None outside a git checkout"""
+    try:
+        result = subprocess.run(
+            ['git', '-C', repo_path(), 'log', '--format=%ct%x09%s'],
+            capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    commits = [line.split('\t', 1) for line in result.stdout.splitlines() if '\t' in line]
+    if not commits:
+        return None
+    return {
+        'commits': len(commits),
+        'latest': int(commits[0][0]),
+        'latest_subject': commits[0][1],
+        'first': int(commits[-1][0]),
+    }
+
+
+def collect_event_pages():
+    """Hosted event microsites under events/ with their page titles"""
+    directory = repo_path('events')
+    pages = []
+    for slug in sorted(os.listdir(directory)):
+        index = os.path.join(directory, slug, 'index.html')
+        if not os.path.isfile(index):
+            continue
+        with open(index, encoding='utf-8', errors='replace') as f:
+            match = _TITLE.search(f.read(64 * 1024))
+        pages.append({'slug': slug, 'title': match.group(1) if match else slug})
+    return pages
@@ -0,0 +1,541 @@
+"""
+Schema model derived from the SQL migrations: the tables, columns, foreign
+keys, indexes, enum types, RLS flags and row-level security policies in
+effect after the whole migration history has been applied
+
+Each migration is reduced to a list of schema events (table created, policy
+dropped, ...) that is cached per file, so a build only parses new or edited
+migrations and replays the events in order, linear in the number of files.
+"""
+
+import re
+
+from . import cached_parse, repo_path
+
+# Bump when the events produced by _parse_migration change
+PARSE_VERSION = 4
+
+OPERATIONS = ('SELECT', 'INSERT', 'UPDATE', 'DELETE')
+
+_TOKEN = re.compile(
+    r"--[^\n]*"                           # line comment
+    r"|/\*.*?\*/"                         # block comment
+    r"|'(?:[^']|'')*'"                    # string literal
+    r'|"(?:[^"]|"")*"'                    # quoted identifier
+    r"|(\$\w*\$).*?\1"                    # dollar-quoted body
+    r"|;",
+    re.S,
+)
+_NAME = r'("(?:[^"]|"")+"|[\w.]+)'
+_TABLE = r'((?:\w+\.)?"?\w+"?)'
+_CREATE_TABLE = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?' + _TABLE + r'\s*\(', re.I)
+_DROP_TABLE = re.compile(r'DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?' + _TABLE, re.I)
+_ALTER_TABLE = re.compile(r'ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?' + _TABLE + r'\s+', re.I)
+_TABLE_CONSTRAINT = re.compile(r'(?:CONSTRAINT\s+\S+\s+)?(PRIMARY\s+KEY|FOREIGN\s+KEY|UNIQUE|CHECK|EXCLUDE)\b', re.I)
+_COLUMN = re.compile(
+    r'("(?:[^"]|"")+"|\w+)\s+(.+?)'
+    r'(?=\s+(?:NOT|NULL|DEFAULT|PRIMARY|REFERENCES|UNIQUE|CHECK|CONSTRAINT|GENERATED|COLLATE)\b|$)',
+    re.I)
+_REFERENCES = re.compile(r'\bREFERENCES\s+' + _TABLE + r'\s*(?:\(\s*"?(\w+)"?\s*\))?', re.I)
+_FOREIGN_KEY = re.compile(r'(?:CONSTRAINT\s+\S+\s+)?FOREIGN\s+KEY\s*\(\s*"?(\w+)"?\s*\)\s*', re.I)
+_ADD_COLUMN = re.compile(r'ADD\s+(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?', re.I)
+_DROP_COLUMN = re.compile(r'DROP\s+(?:COLUMN\s+)?(?:IF\s+EXISTS\s+)?("(?:[^"]|"")+"|\w+)', re.I)
+_RENAME = re.compile(r'RENAME\s+(?:COLUMN\s+)?("(?:[^"]|"")+"|\w+)\s+TO\s+("(?:[^"]|"")+"|\w+)', re.I)
+_RENAME_TABLE = re.compile(r'RENAME\s+TO\s+' + _TABLE, re.I)
+_ALTER_COLUMN = re.compile(
+    r'ALTER\s+(?:COLUMN\s+)?("(?:[^"]|"")+"|\w+)\s+'
+    r'(?:(SET|DROP)\s+NOT\s+NULL|(SET|DROP)\s+DEFAULT|(?:SET\s+DATA\s+)?TYPE\s+(.+?)(?:\s+USING\b.*)?$)',
+    re.I)
+_CREATE_POLICY = re.compile(
+    r'CREATE\s+POLICY\s+' + _NAME + r'\s+ON\s+' + _TABLE +
+    r'(?:\s+AS\s+(PERMISSIVE|RESTRICTIVE))?'
+    r'(?:\s+FOR\s+(ALL|SELECT|INSERT|UPDATE|DELETE))?'
+    r'(?:\s+TO\s+(.+?))?(?=\s+USING\b|\s+WITH\s+CHECK\b|\s*$)', re.I | re.S)
+_ALTER_POLICY = re.compile(
+    r'ALTER\s+POLICY\s+' + _NAME + r'\s+ON\s+' + _TABLE +
+    r'(?:\s+RENAME\s+TO\s+' + _NAME + r'|(?:\s+TO\s+(.+?))?(?=\s+USING\b|\s+WITH\s+CHECK\b|\s*$))',
+    re.I | re.S)
+_DROP_POLICY = re.compile(r'DROP\s+POLICY\s+(?:IF\s+EXISTS\s+)?' + _NAME + r'\s+ON\s+' + _TABLE, re.I)
+_CREATE_INDEX = re.compile(
+    r'CREATE\s+(UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?(?:' + _NAME + r'\s+)?'
+    r'ON\s+(?:ONLY\s+)?' + _TABLE + r'\s*(?:USING\s+(\w+)\s*)?\(', re.I)
+_DROP_INDEX = re.compile(r'DROP\s+INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+EXISTS\s+)?(.*?)(?:\s+(?:CASCADE|RESTRICT))?$', re.I)
+_INDEX_KEY = re.compile(r'("(?:[^"]|"")+"|\w+)(?:\s+(?:ASC|DESC|NULLS\s+(?:FIRST|LAST)|\w+_ops))*$', re.I)
+_COLUMN_KEY = re.compile(r'\b(PRIMARY\s+KEY|UNIQUE)\b', re.I)
+_CREATE_ENUM = re.compile(r'CREATE\s+TYPE\s+' + _TABLE + r'\s+AS\s+ENUM\s*\(', re.I)
+_ALTER_TYPE = re.compile(
+    r'ALTER\s+TYPE\s+' + _TABLE + r'\s+(?:ADD\s+VALUE\s+(?:IF\s+NOT\s+EXISTS\s+)?'
+    r"'((?:[^']|'')*)'(?:\s+(BEFORE|AFTER)\s+'((?:[^']|'')*)')?"
+    r"|RENAME\s+VALUE\s+'((?:[^']|'')*)'\s+TO\s+'((?:[^']|'')*)')", re.I)
+_DROP_TYPE = re.compile(r'DROP\s+TYPE\s+(?:IF\s+EXISTS\s+)?' + _TABLE, re.I)
+_LITERAL = re.compile(r"'((?:[^']|'')*)'")
+_CLAUSE = re.compile(r'\s*(USING|WITH\s+CHECK)\s*\(', re.I)
+# has_role(auth.uid(), 'admin'), is_admin(...) or EXISTS (SELECT ... user_roles ... 'admin' ...)
+_ADMIN_CHECK = re.compile(
+    r"(?:public\.)?(?:has_role|is_admin)\s*\((?:[^()]|\([^()]*\))*\)"
+    r"|exists\s*\(\s*select\b(?:[^()]|\([^()]*\))*\buser_roles\b(?:[^()]|\([^()]*\))*'admin'(?:[^()]|\([^()]*\))*\)")
+
+
+def sql_statements(sql):
+    """Split SQL into statements with comments removed
+
+    Semicolons inside strings, quoted identifiers and dollar-quoted function
+    bodies do not end a statement.
+    """
+    start = 0
+    kept = []
+    for match in _TOKEN.finditer(sql):
+        token = match.group()
+        if token.startswith(('--', '/*')):
+            kept.append(sql[start:match.start()])
+            start = match.end()
+        elif token == ';':
+            kept.append(sql[start:match.start()])
+            statement = ' '.join(''.join(kept).split())
+            if statement:
+                yield statement
+            kept = []
+            start = match.end()
+    kept.append(sql[start:])
+    statement = ' '.join(''.join(kept).split())
+    if statement:
+        yield statement
+
+
+def _ident(name):
+    """Normalise a (possibly quoted, possibly public.-qualified) identifier"""
+    name = name.strip()
+    if name.startswith('"'):
+        return name[1:-1].replace('""', '"')
+    name = name.replace('"', '').lower()
+    return name[len('public.'):] if name.startswith('public.') else name
+
+
+def _closing_paren(text, start):
+    """Index of the parenthesis closing the one opened just before text[start], or None"""
+    depth = 1
+    quoted = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if char == "'":
+            quoted = not quoted
+        elif not quoted and char in '()':
+            depth += 1 if char == '(' else -1
+            if depth == 0:
+                return i
+    return None
+
+
+def _split_top_level(text):
+    """Split a comma-separated list, ignoring commas inside parentheses or strings"""
+    parts = []
+    depth = 0
+    quoted = False
+    start = 0
+    for i, char in enumerate(text):
+        if char == "'":
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(text[start:i].strip())
+            start = i + 1
+    parts.append(text[start:].strip())
+    return [part for part in parts if part]
+
+
+def _reference(text):
+    """'table.column' named by a REFERENCES clause in text, or None"""
+    match = _REFERENCES.search(text)
+    if match is None:
+        return None
+    return f'{_ident(match.group(1))}.{(match.group(2) or "id").lower()}'
+
+
+def _column(definition):
+    """[name, type, nullable, has default, references] for a column definition"""
+    match = _COLUMN.match(definition)
+    if match is None:
+        return None
+    name, column_type = match.groups()
+    rest = definition[match.end():].upper()
+    column_type = ' '.join(column_type.lower().split())
+    nullable = 'NOT NULL' not in rest and 'PRIMARY KEY' not in rest
+    has_default = ('DEFAULT' in rest or 'GENERATED' in rest or column_type in ('serial', 'bigserial'))
+    return [_ident(name), column_type, nullable, has_default, _reference(definition)]
+
+
+def _column_key_events(table, name, definition):
+    """primary_key/unique events for the inline constraints of a column definition"""
+    events = []
+    for match in _COLUMN_KEY.finditer(_LITERAL.sub("''", definition)):
+        kind = 'unique' if match.group(1).upper() == 'UNIQUE' else 'primary_key'
+        events.append([kind, table, [name]])
+    return events
+
+
+def _constraint_events(table, definition):
+    """add_fk, primary_key or unique event for a table constraint, if it is one of those"""
+    foreign_key = _FOREIGN_KEY.match(definition)
+    if foreign_key:
+        return [['add_fk', table, foreign_key.group(1).lower(), _reference(definition)]]
+    constraint = _TABLE_CONSTRAINT.match(definition)
+    kind = constraint.group(1).upper()
+    if kind.startswith('PRIMARY') or kind == 'UNIQUE':
+        end = _closing_paren(definition, definition.index('(') + 1) if '(' in definition else None
+        if end:
+            keys = [_ident(key) for key in definition[definition.index('(') + 1:end].split(',')]
+            return [['primary_key' if kind.startswith('PRIMARY') else 'unique', table, keys]]
+    return []
+
+
+def _table_events(table, body):
+    """Events for the column and constraint list of CREATE TABLE"""
+    columns = []
+    constraints = []
+    for definition in _split_top_level(body):
+        if _TABLE_CONSTRAINT.match(definition) is None:
+            column = _column(definition)
+            if column:
+                columns.append(column)
+                constraints += _column_key_events(table, column[0], definition)
+        else:
+            constraints += _constraint_events(table, definition)
+    return [['create_table', table, columns]] + constraints
+
+
+def _index_event(statement, match):
+    """create_index event for a CREATE INDEX statement"""
+    unique, name, table, method = match.groups()
+    end = _closing_paren(statement, match.end())
+    if end is None:
+        return None
+    keys = []
+    for key in _split_top_level(statement[match.end():end]):
+        plain = _INDEX_KEY.match(key)
+        keys.append(_ident(plain.group(1)) if plain else key)  # expressions are kept verbatim
+    return ['create_index', _ident(table), name and _ident(name), keys, {
+        'unique': bool(unique),
+        'method': (method or 'btree').lower(),
+        'partial': bool(re.search(r'\bWHERE\b', statement[end:], re.I)),
+    }]
+
+
+def _alter_table_events(table, actions):
+    """Events for the actions of one ALTER TABLE statement"""
+    events = []
+    for action in _split_top_level(actions):
+        upper = action.upper()
+        if upper.startswith('ENABLE ROW LEVEL SECURITY'):
+            events.append(['enable_rls', table])
+        elif upper.startswith('ADD'):
+            definition = action[_ADD_COLUMN.match(action).end():]
+            if _FOREIGN_KEY.match(definition) or _TABLE_CONSTRAINT.match(definition):
+                events += _constraint_events(table, definition)
+            else:
+                column = _column(definition)
+                if column:
+                    events.append(['add_column', table, column])
+                    events += _column_key_events(table, column[0], definition)
+        elif upper.startswith('DROP') and not upper.startswith(('DROP CONSTRAINT', 'DROP POLICY')):
+            match = _DROP_COLUMN.match(action)
+            if match:
+                events.append(['drop_column', table, _ident(match.group(1))])
+        elif upper.startswith('RENAME TO'):
+            match = _RENAME_TABLE.match(action)
+            if match:
+                events.append(['rename_table', table, _ident(match.group(1))])
+        elif upper.startswith('RENAME'):
+            match = _RENAME.match(action)
+            if match:
+                events.append(['rename_column', table, _ident(match.group(1)), _ident(match.group(2))])
+        elif upper.startswith('ALTER'):
+            match = _ALTER_COLUMN.match(action)
+            if match and (match.group(2) or match.group(4)):
+                name, not_null, _, new_type = match.groups()
+                changes = {'nullable': not_null.upper() == 'DROP'} if not_null else {}
+                if new_type:
+                    changes['type'] = ' '.join(new_type.lower().split())
+                events.append(['alter_column', table, _ident(name), changes])
+    return events
+
+
+def _clauses(rest):
+    """The USING and WITH CHECK expressions at the start of rest, without their parentheses"""
+    clauses = {}
+    while True:
+        match = _CLAUSE.match(rest)
+        if match is None:
+            return clauses
+        i = _closing_paren(rest, match.end())
+        if i is None:
+            return clauses  # unbalanced: leave the expression out
+        keyword = 'using' if match.group(1).upper() == 'USING' else 'check'
+        clauses[keyword] = rest[match.end():i].strip()
+        rest = rest[i + 1:]
+
+
+def _roles(text):
+    """Role names from a TO clause"""
+    return [role.strip().strip('"').lower() for role in text.split(',')] if text else []
+
+
+def _parse_migration(path):
+    """Schema events of one migration file, in statement order"""
+    with open(path, encoding='utf-8') as f:
+        sql = f.read()
+    events = []
+    for statement in sql_statements(sql):
+        keyword = statement[:12].upper()
+        if keyword == 'CREATE TABLE':
+            match = _CREATE_TABLE.match(statement)
+            end = match and _closing_paren(statement, match.end())
+            if end:
+                events += _table_events(_ident(match.group(1)), statement[match.end():end])
+        elif keyword.startswith('DROP TABLE'):
+            match = _DROP_TABLE.match(statement)
+            if match:
+                events.append(['drop_table', _ident(match.group(1))])
+        elif keyword.startswith('ALTER TABLE'):
+            match = _ALTER_TABLE.match(statement)
+            if match:
+                events += _alter_table_events(_ident(match.group(1)), statement[match.end():])
+        elif keyword in ('CREATE INDEX', 'CREATE UNIQU'):
+            match = _CREATE_INDEX.match(statement)
+            event = match and _index_event(statement, match)
+            if event:
+                events.append(event)
+        elif keyword.startswith('DROP INDEX'):
+            match = _DROP_INDEX.match(statement)
+            if match:
+                events += [['drop_index', None, _ident(name)] for name in match.group(1).split(',')]
+        elif keyword == 'CREATE TYPE ':
+            match = _CREATE_ENUM.match(statement)
+            end = match and _closing_paren(statement, match.end())
+            if end:
+                values = [value.replace("''", "'") for value in _LITERAL.findall(statement[match.end():end])]
+                events.append(['create_enum', _ident(match.group(1)), values])
+        elif keyword == 'ALTER TYPE ':
+            match = _ALTER_TYPE.match(statement)
+            if match:
+                name, value, position, anchor, old, new = match.groups()
+                if value is not None:
+                    events.append(['add_enum_value', _ident(name), value.replace("''", "'"),
+                                   (position or '').lower() or None, anchor and anchor.replace("''", "'")])
+                else:
+                    events.append(['rename_enum_value', _ident(name), old.replace("''", "'"),
+                                   new.replace("''", "'")])
+        elif keyword.startswith('DROP TYPE'):
+            match = _DROP_TYPE.match(statement)
+            if match:
+                events.append(['drop_enum', _ident(match.group(1))])
+        elif keyword == 'CREATE POLIC':
+            match = _CREATE_POLICY.match(statement)
+            if match:
+                name, table, kind, command, roles = match.groups()
+                events.append(['create_policy', _ident(table), _ident(name), {
+                    'command': (command or 'ALL').upper(),
+                    'restrictive': (kind or '').upper() == 'RESTRICTIVE',
+                    'roles': _roles(roles) or ['public'],
+                    **_clauses(statement[match.end():]),
+                }])
+        elif keyword == 'ALTER POLICY':
+            match = _ALTER_POLICY.match(statement)
+            if match:
+                name, table, new_name, roles = match.groups()
+                if new_name:
+                    events.append(['rename_policy', _ident(table), _ident(name), _ident(new_name)])
+                else:
+                    changes = _clauses(statement[match.end():])
+                    if roles:
+                        changes['roles'] = _roles(roles)
+                    events.append(['alter_policy', _ident(table), _ident(name), changes])
+        elif keyword.startswith('DROP POLICY'):
+            match = _DROP_POLICY.match(statement)
+            if match:
+                events.append(['drop_policy', _ident(match.group(2)), _ident(match.group(1))])
+    return events
+
+
+def _audiences(policy):
+    """Who a policy lets through, judged from its roles and its predicate"""
+    expression = ' '.join(filter(None, (policy.get('using'), policy.get('check'))))
+    expression = ' '.join(expression.lower().split())
+    found = []
+    if 'service_role' in expression:
+        found.append('service role')
+    admin_checks = _ADMIN_CHECK.findall(expression)
+    if admin_checks:
+        found.append('admin')
+    # auth.uid() inside an admin check identifies the admin, not the row owner
+    if 'auth.uid()' in _ADMIN_CHECK.sub('', expression):
+        found.append('owner')
+    if "auth.role() = 'authenticated'" in expression:
+        found.append('signed-in')
+    if not found:
+        found.append({'': 'anyone', 'true': 'anyone', 'false': 'nobody'}.get(expression, 'anyone (filtered)'))
+    roles = [role for role in policy['roles'] if role != 'public']
+    if roles and found[0].startswith('anyone'):
+        found = [{'anon': 'anonymous', 'authenticated': 'signed-in',
+                  'service_role': 'service role'}.get(role, role) for role in roles]
+    return found
+
+
+def _column_model(fields):
+    """Column dict from the [type, nullable, has default, references] of an event"""
+    column_type, nullable, has_default, references = fields
+    return {'type': column_type, 'nullable': nullable, 'default': has_default,
+            'references': references}
+
+
+def _index_model(columns, unique=False, method='btree', partial=False):
+    """Index dict for the key columns (or expressions) of an index"""
+    return {'columns': list(columns), 'unique': unique, 'method': method, 'partial': partial}
+
+
+def _apply_enum_event(enums, event):
+    """Apply a create/alter/drop enum event to {enum: [value, ...]}"""
+    kind, name = event[0], event[1]
+    if kind == 'create_enum':
+        enums.setdefault(name, list(event[2]))
+    elif kind == 'drop_enum':
+        enums.pop(name, None)
+    elif name not in enums:
+        return
+    elif kind == 'add_enum_value' and event[2] not in enums[name]:
+        value, position, anchor = event[2:]
+        values = enums[name]
+        if anchor in values:
+            values.insert(values.index(anchor) + (position == 'after'), value)
+        else:
+            values.append(value)
+    elif kind == 'rename_enum_value':
+        enums[name] = [event[3] if value == event[2] else value for value in enums[name]]
+
+
+def _policy_matrix(rls, policies):
+    """{table: {operation: [audience, ...]}} for every RLS-enabled table or table with policies
+
+    An operation with no permissive policy is denied to everyone but the
+    service role, which bypasses RLS.
+    """
+    matrix = {}
+    for table in sorted(set(rls) | set(policies)):
+        row = {operation: [] for operation in OPERATIONS}
+        for policy in policies.get(table, {}).values():
+            operations = OPERATIONS if policy['command'] == 'ALL' else (policy['command'],)
+            for operation in operations:
+                for audience in _audiences(policy):
+                    label = f'{audience} (restrictive)' if policy['restrictive'] else audience
+                    if label not in row[operation]:
+                        row[operation].append(label)
+        matrix[table] = row
+    return matrix
+
+
+def collect_schema(migrations):
+    """Tables, columns, enums, RLS flags and effective policies after all migrations
+
+    columns maps each table to {column: {type, nullable, default, references}}
+    in definition order, references being 'table.column' or None. indexes maps
+    each table to {index name: {columns, unique, method, partial}}, including
+    the implicit indexes of primary keys and unique constraints. enums maps
+    each enum type to its values in order.
+    policy_matrix maps each RLS-enabled table (or table with policies) to
+    {operation: [audience, ...]}.
+    """
+    paths = [repo_path('supabase', 'migrations', migration['name']) for migration in migrations]
+    parsed = cached_parse('migrations', PARSE_VERSION, paths, _parse_migration)
+
+    tables = {}
+    columns = {}
+    enums = {}
+    indexes = {}
+    primary_keys = {}
+    rls = set()
+    policies = {}
+    statements = 0
+    for migration, path in zip(migrations, paths):
+        for event in parsed[path]:
+            kind, table = event[0], event[1]
+            if kind.endswith('_enum') or kind.endswith('_enum_value'):
+                _apply_enum_event(enums, event)
+                continue
+            if kind == 'drop_index':
+                for named in indexes.values():
+                    named.pop(event[2], None)
+                continue
+            if kind == 'create_table':
+                if table not in tables:  # CREATE TABLE IF NOT EXISTS leaves an existing table alone
+                    tables[table] = migration['name']
+                    columns[table] = {name: _column_model(rest) for name, *rest in event[2]}
+            elif kind == 'drop_table':
+                tables.pop(table, None)
+                columns.pop(table, None)
+                indexes.pop(table, None)
+                rls.discard(table)
+                policies.pop(table, None)
+            elif kind == 'rename_table' and table in tables:
+                tables[event[2]] = tables.pop(table)
+                columns[event[2]] = columns.pop(table)
+                if table in indexes:
+                    indexes[event[2]] = indexes.pop(table)
+                if table in rls:
+                    rls.remove(table)
+                    rls.add(event[2])
+                if table in policies:
+                    policies[event[2]] = policies.pop(table)
+            elif table not in tables and not kind.endswith('_policy') and kind != 'enable_rls':
+                continue  # column change on a table this model does not track
+            elif kind == 'add_column':
+                columns[table].setdefault(event[2][0], _column_model(event[2][1:]))
+            elif kind == 'drop_column':
+                columns[table].pop(event[2], None)
+            elif kind == 'rename_column' and event[2] in columns[table]:
+                columns[table] = {event[3] if name == event[2] else name: column
+                                  for name, column in columns[table].items()}
+            elif kind == 'alter_column' and event[2] in columns[table]:
+                columns[table][event[2]].update(event[3])
+            elif kind == 'add_fk' and event[2] in columns[table]:
+                columns[table][event[2]]['references'] = event[3]
+            elif kind == 'primary_key':
+                primary_keys[table] = event[2]
+                for name in event[2]:
+                    if name in columns[table]:
+                        columns[table][name]['nullable'] = False
+                indexes.setdefault(table, {})[f'{table}_pkey'] = _index_model(event[2], unique=True)
+            elif kind == 'unique':
+                name = f"{table}_{'_'.join(event[2])}_key"
+                indexes.setdefault(table, {})[name] = _index_model(event[2], unique=True)
+            elif kind == 'create_index':
+                name = event[2] or f"{table}_{'_'.join(event[3])}_idx"
+                indexes.setdefault(table, {}).setdefault(name, _index_model(event[3], **event[4]))
+            elif kind == 'enable_rls':
+                rls.add(table)
+            elif kind == 'create_policy':
+                policies.setdefault(table, {})[event[2]] = dict(event[3], migration=migration['name'])
+            elif kind == 'alter_policy' and event[2] in policies.get(table, {}):
+                policies[table][event[2]].update(event[3])
+            elif kind == 'rename_policy' and event[2] in policies.get(table, {}):
+                policies[table][event[3]] = policies[table].pop(event[2])
+            elif kind == 'drop_policy':
+                policies.get(table, {}).pop(event[2], None)
+            statements += kind.endswith('_policy')
+
+    policies = {table: policies[table] for table in sorted(policies) if policies[table]}
+    rls_enabled = sorted(rls & tables.keys())
+    return {
+        'tables': list(tables),
+        'created_in': tables,
+        'columns': columns,
+        'indexes': {table: indexes[table] for table in tables if indexes.get(table)},
+        'enums': enums,
+        'rls_enabled': rls_enabled,
+        'policies': policies,
+        'policy_statements': statements,
+        'policy_matrix': _policy_matrix(rls_enabled, policies),
+    }
@@ -0,0 +1,74 @@
+"""
+A small parser for TypeScript array and object literals holding plain data
+
+Strings, numbers, booleans, null, nested arrays and objects and bare
+identifiers (kept as their names) are read; comments and trailing commas are
+skipped. Anything else (calls, spreads, template interpolation) raises
+ValueError.
+"""
+
+import ast
+import re
+
+_TOKEN = re.compile(
+    r"""(?P<space>\s+|//[^\n]*|/\*.*?\*/)"""
+    r"""|(?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|`[^`$]*`)"""
+    r"""|(?P<number>-?\d+(?:\.\d+)?)"""
+    r"""|(?P<name>[A-Za-z_$][\w$]*)"""
+    r"""|(?P<punct>[{}\[\],:])""",
+    re.S,
+)
+_EXPORT = re.compile(r'export\s+const\s+(\w+)\s*(?::\s*[\w.<>\[\]]+\s*)?=\s*(?=[\[{])')
+_LITERALS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+
+def _tokens(text, pos):
+    """(kind, value, end) for the tokens of text from pos, comments and whitespace skipped"""
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            raise ValueError(f'unsupported syntax at offset {pos}: {text[pos:pos + 20]!r}')
+        pos = match.end()
+        if match.lastgroup != 'space':
+            yield match.lastgroup, match.group(), pos
+
+
+def _value(tokens, token):
+    """The Python value of the literal starting with token, reading the rest from tokens"""
+    kind, value, _ = token
+    if kind == 'string':
+        return value[1:-1] if value[0] == '`' else ast.literal_eval(value)
+    if kind == 'number':
+        return float(value) if '.' in value else int(value)
+    if kind == 'name':
+        return _LITERALS.get(value, value)
+    if value == '[':
+        items = []
+        for token in tokens:
+            if token[1] == ']':
+                return items
+            if token[1] != ',':
+                items.append(_value(tokens, token))
+    elif value == '{':
+        members = {}
+        for token in tokens:
+            if token[1] == '}':
+                return members
+            if token[1] == ',':
+                continue
+            key = _value(tokens, token)
+            if next(tokens)[1] != ':':
+                raise ValueError(f'expected ":" after {key!r}')
+            members[key] = _value(tokens, next(tokens))
+    raise ValueError(f'unexpected {value!r}')
+
+
+def parse_literal(text, pos):
+    """The value of the literal starting at (or after whitespace from) text[pos]"""
+    tokens = _tokens(text, pos)
+    return _value(tokens, next(tokens))
+
+
+def parse_literals(text):
+    """{name: value} for each `export const name = [...]` or `{...}` literal in TypeScript source"""
+    return {match.group(1): parse_literal(text, match.end()) for match in _EXPORT.finditer(text)}
@@ -0,0 +1,12 @@
+"""
+Put docs/ on sys.path, so the generator's modules import whichever
+directory pytest is run from
+"""
+
+import os
+import sys
+
+DOCS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if DOCS_DIR not in sys.path:
+    sys.path.insert(0, DOCS_DIR)
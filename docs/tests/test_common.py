@@ -0,0 +1,26 @@
+"""
+Batch paragraph helpers of sections/common.py
+"""
+
+from docx import Document
+
+from sections.common import _escape_all, add_bullets
+
+
+def test_escape_all():
+    assert _escape_all(['a & b', '<c>', '']) == ['a &amp; b', '&lt;c&gt;', '']
+    assert _escape_all([]) == []
+
+
+def test_add_bullets_empty_list_adds_nothing():
+    doc = Document()
+    before = len(doc.paragraphs)
+    add_bullets(doc, [])
+    assert len(doc.paragraphs) == before
+
+
+def test_add_bullets():
+    doc = Document()
+    add_bullets(doc, ['one', 'two & three'])
+    assert [(p.style.name, p.text) for p in doc.paragraphs] == [
+        ('List Bullet', 'one'), ('List Bullet', 'two & three')]
@@ -0,0 +1,34 @@
+"""
+Malformed input files (--batch variants, --merge recipients, --invoices
+orders) end the run with an error message and status 1, not a traceback
+"""
+
+import json
+
+import pytest
+
+import create_documentation
+
+
+@pytest.mark.parametrize('option, content, message', [
+    ('--batch', [{'output': 'out.docx', 'cover': {'colour': 'red'}}], 'unknown cover parameters: colour'),
+    ('--batch', [{'output': 'out.docx', 'sections': ['nope']}], 'unknown sections: nope'),
+    ('--batch', {'output': 'out.docx'}, 'expected a JSON list of variants'),
+    ('--merge', {'name': 'Ama'}, 'expected a list of recipient objects'),
+])
+def test_invalid_input_file(tmp_path, capsys, option, content, message):
+    path = tmp_path / 'input.json'
+    path.write_text(json.dumps(content), encoding='utf-8')
+    assert create_documentation.main([option, str(path), '--out', str(tmp_path / 'out')]) == 1
+    out = capsys.readouterr().out
+    assert out.startswith('Error: ') and message in out
+
+
+@pytest.mark.parametrize('option', ['--batch', '--merge', '--invoices'])
+def test_unparsable_or_missing_input_file(tmp_path, capsys, option):
+    path = tmp_path / 'input.json'
+    path.write_text('not json', encoding='utf-8')
+    assert create_documentation.main([option, str(path), '--out', str(tmp_path / 'out')]) == 1
+    assert f'Error: {path}' in capsys.readouterr().out
+    assert create_documentation.main([option, str(tmp_path / 'missing.json'), '--out', str(tmp_path / 'out')]) == 1
+    assert 'No such file or directory' in capsys.readouterr().out
@@ -0,0 +1,125 @@
+"""
+Invoices from orders and payments exports (--invoices): the money on each
+invoice, and the orders and payments that are rejected rather than guessed at
+"""
+
+import json
+import os
+from decimal import Decimal
+
+import pytest
+from docx import Document
+
+from create_documentation import invoice_from_order, payment_index, run_invoices
+
+ADD_ONS = {'extra-photos': ('Extra Photos', 50)}
+RUSH_FEE = 100
+
+
+def _order(**fields):
+    order = {'id': 'a1b2c3d4-0000', 'order_number': 'VL-1001', 'package_name': 'Premium',
+             'package_price': '500', 'client_name': 'Ama', 'created_at': '2026-03-05T10:00:00Z'}
+    order.update(fields)
+    return order
+
+
+def _payment(amount, kind='deposit'):
+    return ('2026-03-06', kind, 'Mobile Money', f'REF-{amount}', Decimal(amount))
+
+
+def _write_jsonl(path, rows):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(json.dumps(row) + '\n' for row in rows)
+    return str(path)
+
+
+def test_subtotal_discount_paid_and_balance():
+    order = _order(add_ons=json.dumps(['extra-photos']), delivery_type='rush', total_price='600')
+    invoice = invoice_from_order(order, [_payment(200)], ADD_ONS, RUSH_FEE)
+    assert [item['description'] for item in invoice['items']] == [
+        'Premium package', 'Extra Photos', 'Rush delivery']
+    assert invoice['subtotal'] == 'GH₵650.00'
+    assert invoice['discount'] == 'GH₵50.00'
+    assert invoice['total'] == 'GH₵600.00'
+    assert invoice['paid'] == 'GH₵200.00'
+    assert invoice['balance'] == 'GH₵400.00'
+    assert invoice['due']
+
+
+def test_total_defaults_to_subtotal():
+    invoice = invoice_from_order(_order(add_ons=[{'name': 'Video', 'price': '75.50'}]), [], ADD_ONS, RUSH_FEE)
+    assert invoice['total'] == invoice['subtotal'] == 'GH₵575.50'
+    assert invoice['discount'] == ''
+
+
+@pytest.mark.parametrize('payments, title, status', [
+    ([], 'INVOICE', 'Awaiting payment'),
+    ([_payment(200)], 'INVOICE', 'Part paid'),
+    ([_payment(200), _payment(300, 'balance')], 'RECEIPT', 'Paid'),
+])
+def test_receipt_once_fully_paid(payments, title, status):
+    invoice = invoice_from_order(_order(), payments, ADD_ONS, RUSH_FEE)
+    assert (invoice['title'], invoice['status']) == (title, status)
+
+
+def test_payments_on_the_order_row():
+    order = _order(deposit_paid='true', deposit_amount='250', balance_paid='false', balance_amount='250')
+    invoice = invoice_from_order(order, None, ADD_ONS, RUSH_FEE)
+    assert (invoice['paid'], invoice['balance'], invoice['status']) == ('GH₵250.00', 'GH₵250.00', 'Part paid')
+
+
+def test_invoice_number_falls_back_to_the_order_id():
+    invoice = invoice_from_order(_order(order_number=''), [], ADD_ONS, RUSH_FEE)
+    assert (invoice['number'], invoice['file']) == ('INV-A1B2C3D4', 'INV-A1B2C3D4.docx')
+
+
+def test_unknown_add_on_is_rejected():
+    with pytest.raises(ValueError, match='gold-foil'):
+        invoice_from_order(_order(add_ons=['gold-foil']), [], ADD_ONS, RUSH_FEE)
+
+
+def test_order_without_identifier_is_rejected():
+    with pytest.raises(ValueError, match='neither'):
+        invoice_from_order(_order(id='', order_number=' '), [], ADD_ONS, RUSH_FEE)
+
+
+def test_payment_index_skips_unpaid_and_orphan_rows(tmp_path, capsys):
+    path = _write_jsonl(tmp_path / 'payments.jsonl', [
+        {'order_id': 'o1', 'amount': 100, 'payment_type': 'deposit', 'reference': 'R1'},
+        {'order_id': 'o1', 'amount': 100, 'status': 'failed'},
+        {'order_id': '', 'amount': 20},
+        {'amount': 30},
+    ])
+    assert payment_index(path) == {'o1': [('', 'deposit', '', 'R1', Decimal(100))]}
+    assert 'skipped 2 payments without an order_id' in capsys.readouterr().out
+
+
+def test_run_invoices_reports_rejected_orders(tmp_path, monkeypatch, capsys):
+    import sources.catalog
+
+    monkeypatch.setattr(sources.catalog, 'load_catalog', lambda path: {
+        'add_ons': [{'id': 'extra-photos', 'name': 'Extra Photos', 'price': 50}]})
+    monkeypatch.setattr(sources.catalog, 'load_rush_fee', lambda: RUSH_FEE)
+    orders = _write_jsonl(tmp_path / 'orders.jsonl', [
+        _order(id='o1', order_number='VL-1', add_ons=['extra-photos']),
+        _order(id='o2', order_number='VL-1'),
+        _order(id='', order_number=''),
+        _order(id='o4', order_number='VL-4', add_ons=['gold-foil']),
+        _order(id='o5', order_number='VL-5'),
+    ])
+    payments = _write_jsonl(tmp_path / 'payments.jsonl', [
+        {'order_id': 'o1', 'amount': 550, 'payment_type': 'balance'}])
+    out_dir = tmp_path / 'out'
+
+    assert run_invoices(orders, payments, str(out_dir), jobs=1) == 1
+    assert sorted(os.listdir(out_dir)) == ['VL-1.docx', 'VL-5.docx']
+    out = capsys.readouterr().out
+    assert 'Wrote 2/5 invoices' in out
+    assert 'FAILED: order o2 (invoice number VL-1 already used; not overwritten)' in out
+    assert 'FAILED: order #3 (order has neither an order_number nor an id)' in out
+    assert "FAILED: order o4 (unknown add-on 'gold-foil')" in out
+
+    # The first VL-1 (the paid one) is the invoice that was kept
+    text = '\n'.join(p.text for p in Document(str(out_dir / 'VL-1.docx')).paragraphs)
+    assert 'RECEIPT' in text
+
@@ -0,0 +1,141 @@
+"""
+Schema model replayed from small SQL migrations (sources/schema.py): RLS
+flags, policies as created, altered, renamed and dropped, and the
+per-table policy matrix
+"""
+
+import pytest
+
+from sources import schema
+
+
+@pytest.fixture
+def collect(tmp_path, monkeypatch):
+    """collect(sql, ...) -> collect_schema over one migration file per sql string, in order"""
+    monkeypatch.setattr(schema, 'repo_path', lambda *parts: str(tmp_path.joinpath(*parts)))
+    # Parse every time, leaving the build's migration cache alone
+    monkeypatch.setattr(schema, 'cached_parse', lambda name, version, paths, parse, **kwargs:
+                        {path: parse(path) for path in paths})
+    (tmp_path / 'supabase' / 'migrations').mkdir(parents=True)
+
+    def collect(*migrations):
+        names = []
+        for i, sql in enumerate(migrations, 1):
+            names.append(f'2026010{i}000000_step{i}.sql')
+            (tmp_path / 'supabase' / 'migrations' / names[-1]).write_text(sql, encoding='utf-8')
+        return schema.collect_schema([{'name': name} for name in names])
+
+    return collect
+
+
+ORDERS = """
+CREATE TABLE public.orders (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id uuid REFERENCES auth.users(id),
+    status text NOT NULL DEFAULT 'pending'
+);
+ALTER TABLE public.orders ENABLE ROW LEVEL SECURITY;
+"""
+
+POSTS = """
+CREATE TABLE public.posts (id uuid PRIMARY KEY, author_id uuid, published boolean);
+ALTER TABLE public.posts ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "Public read" ON public.posts FOR SELECT USING (published = true);
+CREATE POLICY "Authors edit" ON public.posts FOR UPDATE USING (auth.uid() = author_id);
+"""
+
+
+def test_sql_statements_ignore_semicolons_in_bodies_and_comments():
+    sql = """
+    -- a comment; not a statement
+    CREATE FUNCTION f() RETURNS trigger AS $$ BEGIN NEW.x := 'a;b'; RETURN NEW; END; $$ LANGUAGE plpgsql;
+    /* block; comment */ CREATE POLICY "It's; fine" ON t FOR SELECT USING (name <> ';');
+    """
+    statements = list(schema.sql_statements(sql))
+    assert len(statements) == 2
+    assert statements[1] == """CREATE POLICY "It's; fine" ON t FOR SELECT USING (name <> ';')"""
+
+
+def test_create_policy_events(tmp_path):
+    path = tmp_path / 'policies.sql'
+    path.write_text("""
+    CREATE POLICY "Signed in read" ON public.posts AS RESTRICTIVE FOR SELECT TO authenticated
+        USING (true);
+    CREATE POLICY "Own rows" ON posts USING (auth.uid() = author_id) WITH CHECK (auth.uid() = author_id);
+    """, encoding='utf-8')
+    assert schema._parse_migration(str(path)) == [
+        ['create_policy', 'posts', 'Signed in read',
+         {'command': 'SELECT', 'restrictive': True, 'roles': ['authenticated'], 'using': 'true'}],
+        ['create_policy', 'posts', 'Own rows',
+         {'command': 'ALL', 'restrictive': False, 'roles': ['public'],
+          'using': 'auth.uid() = author_id', 'check': 'auth.uid() = author_id'}],
+    ]
+
+
+def test_enable_rls_and_policy_matrix(collect):
+    model = collect(ORDERS + """
+    CREATE POLICY "Users view own orders" ON public.orders FOR SELECT USING (auth.uid() = user_id);
+    CREATE POLICY "Anyone can create orders" ON public.orders FOR INSERT WITH CHECK (true);
+    CREATE POLICY "Admins manage orders" ON public.orders FOR ALL
+        USING (public.has_role(auth.uid(), 'admin'));
+    CREATE POLICY "Service role reads" ON public.orders AS RESTRICTIVE FOR SELECT TO service_role USING (true);
+    CREATE TABLE public.app_settings (key text PRIMARY KEY, value jsonb);
+    ALTER TABLE public.app_settings ENABLE ROW LEVEL SECURITY;
+    CREATE TABLE public.page_views (id uuid PRIMARY KEY);
+    """)
+    assert model['rls_enabled'] == ['app_settings', 'orders']
+    assert model['policy_statements'] == 4
+    assert model['policy_matrix'] == {
+        'app_settings': {'SELECT': [], 'INSERT': [], 'UPDATE': [], 'DELETE': []},
+        'orders': {
+            'SELECT': ['owner', 'admin', 'service role (restrictive)'],
+            'INSERT': ['anyone', 'admin'],
+            'UPDATE': ['admin'],
+            'DELETE': ['admin'],
+        },
+    }
+
+
+def test_alter_rename_and_drop_policy(collect):
+    altered = """
+    ALTER POLICY "Public read" ON public.posts TO authenticated USING (true);
+    ALTER POLICY "Authors edit" ON public.posts RENAME TO "Owners edit";
+    DROP POLICY IF EXISTS "Never created" ON public.posts;
+    """
+    model = collect(POSTS)
+    assert model['policy_matrix']['posts']['SELECT'] == ['anyone (filtered)']
+    assert model['policy_matrix']['posts']['UPDATE'] == ['owner']
+
+    model = collect(POSTS, altered)
+    assert list(model['policies']['posts']) == ['Public read', 'Owners edit']
+    assert model['policies']['posts']['Public read']['roles'] == ['authenticated']
+    # A renamed policy keeps the migration that created it
+    assert model['policies']['posts']['Owners edit']['migration'] == '20260101000000_step1.sql'
+    assert model['policy_matrix']['posts']['SELECT'] == ['signed-in']
+    assert model['policy_matrix']['posts']['UPDATE'] == ['owner']
+
+    model = collect(POSTS, altered, 'DROP POLICY "Owners edit" ON public.posts;')
+    assert list(model['policies']['posts']) == ['Public read']
+    assert model['policy_matrix']['posts']['UPDATE'] == []
+    assert model['policy_statements'] == 6
+
+
+def test_rename_table_keeps_rls_and_policies(collect):
+    model = collect(POSTS, """
+    ALTER TABLE public.posts RENAME TO articles;
+    CREATE POLICY "Admins delete" ON public.articles FOR DELETE USING (has_role(auth.uid(), 'admin'));
+    """)
+    assert model['tables'] == ['articles']
+    assert model['rls_enabled'] == ['articles']
+    assert list(model['policies']) == ['articles']
+    assert list(model['policies']['articles']) == ['Public read', 'Authors edit', 'Admins delete']
+    assert model['policy_matrix'] == {'articles': {
+        'SELECT': ['anyone (filtered)'], 'INSERT': [], 'UPDATE': ['owner'], 'DELETE': ['admin']}}
+
+
+def test_drop_table_drops_rls_and_policies(collect):
+    model = collect(POSTS, 'DROP TABLE IF EXISTS public.posts CASCADE;')
+    assert model['tables'] == []
+    assert model['rls_enabled'] == []
+    assert model['policies'] == {}
+    assert model['policy_matrix'] == {}
@@ -0,0 +1,41 @@
+"""
+Metadata commands must start fast: --list-sections may not import
+python-docx, lxml or asyncio (see the note above _load_docx in
+create_documentation.py) and must finish within STARTUP_BUDGET
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+DOCS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds; --list-sections takes well under a second when nothing heavy is imported
+STARTUP_BUDGET = 2.0
+HEAVY_MODULES = ('docx', 'lxml', 'asyncio')
+
+_PROBE = f"""
+import contextlib, io, json, sys
+import create_documentation
+with contextlib.redirect_stdout(io.StringIO()):
+    status = create_documentation.main(['--list-sections'])
+print(json.dumps({{'status': status, 'loaded': sorted(
+    name for name in sys.modules if name.split('.')[0] in {HEAVY_MODULES!r})}}))
+"""
+
+
+def test_list_sections_imports_nothing_heavy():
+    result = subprocess.run([sys.executable, '-c', _PROBE], cwd=DOCS_DIR,
+                            capture_output=True, text=True, check=True)
+    report = json.loads(result.stdout)
+    assert not report['status']
+    assert report['loaded'] == []
+
+
+def test_list_sections_starts_within_budget():
+    start = time.perf_counter()
+    subprocess.run([sys.executable, os.path.join(DOCS_DIR, 'create_documentation.py'), '--list-sections'],
+                   cwd=DOCS_DIR, capture_output=True, check=True)
+    assert time.perf_counter() - start < STARTUP_BUDGET
@@ -0,0 +1,51 @@
+"""
+--watch rebuilds: a full rebuild after a change is as strict about
+cross-references as the first build
+"""
+
+import os
+
+import create_documentation
+from sources import REPO_ROOT
+
+
+def _poll_once(changed, before):
+    """poll(timeout) for watch(): changed once (after calling before()), then Ctrl+C"""
+    calls = []
+
+    def poll(timeout=None):
+        if timeout is not None:
+            return set()  # nothing more within the debounce
+        if calls:
+            raise KeyboardInterrupt
+        calls.append(timeout)
+        before()
+        return set(changed)
+
+    return poll
+
+
+def test_rebuild_after_change_fails_on_unresolved_reference(monkeypatch, tmp_path, capsys):
+    section = next(section for section in create_documentation.SECTIONS if section.key == 'features')
+    render = section.render
+
+    def render_with_reference(doc, **inputs):
+        render(doc, **inputs)
+        doc.add_paragraph('For the details, see the Nonexistent Topic section.')
+
+    def edit_features():
+        monkeypatch.setattr(section, '_render', render_with_reference)
+
+    changed = [os.path.join(REPO_ROOT, 'src', 'data', 'orderFormData.ts')]
+    monkeypatch.setattr(create_documentation, '_inotify_watcher',
+                        lambda dirs: _poll_once(changed, edit_features))
+    monkeypatch.setattr(create_documentation, 'save_cached_fragment', lambda key, fragment: None)
+
+    keys = {section.key for section in create_documentation.SECTIONS}
+    status = create_documentation.watch(keys, set(), str(tmp_path / 'out.docx'), 'docx')
+
+    assert status == 0
+    out = capsys.readouterr().out
+    assert 'Rebuild failed: unresolved cross-references' in out
+    assert 'features: "Nonexistent Topic"' in out
+    assert 'Rebuilt features' not in out